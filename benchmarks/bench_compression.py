@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+Latency / CPU / bandwidth trade-off of each response codec.
+
+    python benchmarks/bench_compression.py [--calls 50] [--size 100] [--mbps 100]
+
+Runs ``search_articles`` against the local stand-in server once per codec
+``ApiClient`` can negotiate here (``ApiClient(compression=[codec])``) plus
+uncompressed, and reports wall time and client CPU per call together with
+the wire / decoded byte counters from ``ApiClient.transfer``. ``--mbps``
+throttles the server so the bandwidth saving shows up in latency.
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import time
+from typing import List, Union
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.server import StandInServer  # noqa: E402
+from perigon import ApiClient, V1Api  # noqa: E402
+from perigon.compression import available_codecs  # noqa: E402
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--calls", type=int, default=50)
+    parser.add_argument("--size", type=int, default=100)
+    parser.add_argument("--mbps", type=float, default=None)
+    args = parser.parse_args()
+
+    choices: List[Union[bool, List[str]]] = [False]
+    choices += [[codec] for codec in available_codecs()]
+
+    with StandInServer(size=args.size, mbps=args.mbps) as url:
+        link = f"{args.mbps:g} Mbit/s" if args.mbps else "unthrottled loopback"
+        print(f"search_articles, {args.size} articles/page, {link}")
+        print(
+            f"  {'codec':<9} {'wall ms':>8} {'cpu ms':>8} "
+            f"{'wire KiB':>9} {'decoded KiB':>12} {'ratio':>6}"
+        )
+        for compression in choices:
+            client = ApiClient(api_key="bench", base_url=url, compression=compression)
+            api = V1Api(client)
+            api.search_articles(q="warm-up")
+            client.transfer.reset()
+
+            wall, cpu = time.perf_counter(), time.process_time()
+            for _ in range(args.calls):
+                api.search_articles(q="AI")
+            wall = (time.perf_counter() - wall) / args.calls
+            cpu = (time.process_time() - cpu) / args.calls
+            client.close()
+
+            stats = client.transfer.snapshot()
+            wire = stats["wire_bytes"] / args.calls / 1024  # type: ignore[operator]
+            decoded = stats["decoded_bytes"] / args.calls / 1024  # type: ignore[operator]
+            print(
+                f"  {client.accept_encoding:<9} {wall * 1e3:8.2f} {cpu * 1e3:8.2f} "
+                f"{wire:9.1f} {decoded:12.1f} {client.transfer.ratio:6.1f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Compare response decoding paths on 100-article ``QuerySearchResult`` pages.
+
+    python benchmarks/bench_deserialize.py [--size 100] [--repeat 50]
+
+Every case includes decoding the JSON body. ``model_validate`` is what the
+client did before ``ApiClient.deserialize`` and is the baseline the ratios
+are taken against; ``ApiClient.deserialize`` runs the client's own method
+on an ``httpx.Response``. ``model_construct (recursive)`` is a pure-Python,
+no-validation tree build, kept as the reference point for a "trusted"
+decoding mode.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+import timeit
+import typing
+from typing import Any, Callable, Dict, List, Optional, Tuple, Type
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import httpx  # noqa: E402
+from pydantic import BaseModel  # noqa: E402
+
+from benchmarks.fixtures import query_search_page  # noqa: E402
+from perigon.api_client import ApiClient  # noqa: E402
+from perigon.models import QuerySearchResult  # noqa: E402
+
+_PLANS: Dict[type, List[Tuple[str, str, Optional[Callable[[Any], Any]]]]] = {}
+
+
+def _construct(model: Type[BaseModel], data: Any) -> Any:
+    plan = _PLANS.get(model)
+    if plan is None:
+        plan = _PLANS[model] = [
+            (field.alias or name, name, _converter(field.annotation))
+            for name, field in model.model_fields.items()
+        ]
+    values = {}
+    for key, name, convert in plan:
+        if key in data:
+            value = data[key]
+            values[name] = value if convert is None or value is None else convert(value)
+    return model.model_construct(set(values), **values)
+
+
+def _converter(annotation: Any) -> Optional[Callable[[Any], Any]]:
+    origin, args = typing.get_origin(annotation), typing.get_args(annotation)
+    if origin is typing.Union:
+        found = [c for c in map(_converter, args) if c is not None]
+        return found[0] if found else None
+    if origin is list and args:
+        item = _converter(args[0])
+        return None if item is None else (lambda value: [item(v) for v in value])
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return lambda value: _construct(annotation, value)
+    return None
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--size", type=int, default=100)
+    parser.add_argument("--repeat", type=int, default=50)
+    args = parser.parse_args()
+
+    body = json.dumps(query_search_page(args.size)).encode()
+    client = ApiClient(api_key="bench")
+    resp = httpx.Response(200, content=body)
+    expected = QuerySearchResult.model_validate(json.loads(body))
+    assert client.deserialize(resp, QuerySearchResult) == expected
+
+    cases = {
+        "model_validate": lambda: QuerySearchResult.model_validate(json.loads(body)),
+        "ApiClient.deserialize": lambda: client.deserialize(resp, QuerySearchResult),
+        "model_validate_json": lambda: QuerySearchResult.model_validate_json(body),
+        "from_dict": lambda: QuerySearchResult.from_dict(json.loads(body)),
+        "model_construct (recursive)": lambda: _construct(
+            QuerySearchResult, json.loads(body)
+        ),
+    }
+
+    print(f"QuerySearchResult, {args.size} articles, {len(body) / 1024:.0f} KiB JSON")
+    baseline = None
+    for name, fn in cases.items():
+        best = min(timeit.repeat(fn, number=1, repeat=args.repeat))
+        baseline = baseline or best
+        print(f"  {name:<28} {best * 1e3:8.2f} ms  x{baseline / best:5.2f}")
+
+
+if __name__ == "__main__":
+    main()
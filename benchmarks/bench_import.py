@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+"""
+Measure the cost of loading the generated API modules.
+
+    python benchmarks/bench_import.py
+
+Reports source lines, marshalled bytecode size, compile time (paid when no
+``.pyc`` is cached) and module execution time for every ``perigon/api``
+module.
+"""
+
+from __future__ import annotations
+
+import glob
+import marshal
+import os
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import perigon.models  # noqa: E402,F401  (exclude model imports from timings)
+
+
+def main() -> None:
+    total = [0, 0, 0.0, 0.0]
+    for path in sorted(glob.glob(os.path.join(ROOT, "perigon", "api", "*_api.py"))):
+        with open(path) as fh:
+            src = fh.read()
+        start = time.perf_counter()
+        code = compile(src, path, "exec")
+        compiled = time.perf_counter() - start
+        start = time.perf_counter()
+        exec(code, {"__name__": "bench"})
+        executed = time.perf_counter() - start
+
+        row = [src.count("\n"), len(marshal.dumps(code)), compiled, executed]
+        total = [a + b for a, b in zip(total, row)]
+        print(_fmt(os.path.basename(path), row))
+    print(_fmt("total", total))
+
+
+def _fmt(name: str, row: list) -> str:
+    lines, size, compiled, executed = row
+    return (
+        f"{name:<24} {lines:6d} lines  {size / 1024:6.0f} KiB bytecode  "
+        f"compile {compiled * 1e3:6.1f} ms  exec {executed * 1e3:5.2f} ms"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+End-to-end SDK throughput from a recorded cassette, without a network.
+
+    python benchmarks/bench_throughput.py [--calls 200] [--cassette PATH]
+    python benchmarks/bench_throughput.py --latency recorded
+
+Without ``--cassette`` the script first records one page per query from the
+local stand-in server; with it, the given cassette is replayed as is, so
+runs are repeatable on machines without network access. Reports calls/s
+for sequential sync calls, ``V1Api.map`` and ``V1Api.gather``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+from typing import Any, Callable, Dict, List
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.server import StandInServer  # noqa: E402
+from perigon import ApiClient, V1Api  # noqa: E402
+from perigon.cassette import RecordingTransport, ReplayTransport  # noqa: E402
+
+QUERIES = [f"topic {n}" for n in range(20)]
+
+
+def record(path: str, size: int) -> None:
+    with StandInServer(size=size) as url:
+        client = ApiClient(
+            api_key="bench", base_url=url, transport=RecordingTransport(path)
+        )
+        api = V1Api(client)
+        for q in QUERIES:
+            api.search_articles(q=q)
+        client.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--calls", type=int, default=200)
+    parser.add_argument("--size", type=int, default=50)
+    parser.add_argument("--cassette", default=None)
+    parser.add_argument("--latency", choices=("none", "recorded"), default="none")
+    args = parser.parse_args()
+
+    path = args.cassette
+    if path is None:
+        path = os.path.join(tempfile.mkdtemp(), "throughput.cassette")
+        record(path, args.size)
+
+    client = ApiClient(
+        api_key="bench", transport=ReplayTransport(path, latency=args.latency)
+    )
+    api = V1Api(client)
+    jobs: List[Dict[str, Any]] = [
+        {"q": QUERIES[n % len(QUERIES)]} for n in range(args.calls)
+    ]
+
+    def sequential() -> None:
+        for kwargs in jobs:
+            api.search_articles(**kwargs)
+
+    def mapped() -> None:
+        for result in api.map(api.search_articles, jobs):
+            result.unwrap()
+
+    def gathered() -> None:
+        api.gather([(api.search_articles, kwargs) for kwargs in jobs])
+
+    runs: Dict[str, Callable[[], None]] = {
+        "sequential": sequential,
+        "map": mapped,
+        "gather": gathered,
+    }
+    print(f"search_articles replay, {args.calls} calls, latency={args.latency}")
+    for name, fn in runs.items():
+        started = time.perf_counter()
+        fn()
+        elapsed = time.perf_counter() - started
+        print(f"  {name:<11} {args.calls / elapsed:9.1f} calls/s")
+    client.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Decode time and memory of vector search pages by ``ApiClient(vectors=...)``.
+
+    python benchmarks/bench_vectors.py [--results 100] [--dim 1024]
+
+``default`` validates every embedding component with pydantic into boxed
+floats; ``numpy`` / ``array`` lift the embeddings out before validation.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+import timeit
+import tracemalloc
+from typing import Any, Dict, Optional
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import httpx  # noqa: E402
+
+from benchmarks.fixtures import article_payload  # noqa: E402
+from perigon import ApiClient  # noqa: E402
+from perigon.models import ArticlesVectorSearchResult  # noqa: E402
+
+
+def vector_page(results: int, dim: int) -> Dict[str, Any]:
+    return {
+        "status": 200,
+        "results": [
+            {
+                "score": 1.0 - i / results,
+                "data": article_payload(i, content_words=100),
+                "vectors": [
+                    {"data": [((i * dim + n) % 97) / 97 - 0.5 for n in range(dim)]}
+                ],
+            }
+            for i in range(results)
+        ],
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--results", type=int, default=100)
+    parser.add_argument("--dim", type=int, default=1024)
+    parser.add_argument("--number", type=int, default=10)
+    args = parser.parse_args()
+
+    resp = httpx.Response(200, content=json.dumps(vector_page(args.results, args.dim)))
+    print(f"vector_search_articles page, {args.results} results x {args.dim} dims")
+    fmt: Optional[str]
+    for fmt in (None, "numpy", "array"):
+        client = ApiClient(vectors=fmt)
+
+        def decode() -> Any:
+            return client.deserialize(resp, ArticlesVectorSearchResult)
+
+        best = min(timeit.repeat(decode, number=args.number, repeat=7))
+        tracemalloc.start()
+        page = decode()
+        retained = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        del page
+        print(
+            f"  {fmt or 'default':<8} {best / args.number * 1e3:8.2f} ms"
+            f"  {retained / 2**20:7.2f} MiB retained"
+        )
+
+
+if __name__ == "__main__":
+    main()
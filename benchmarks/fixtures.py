@@ -0,0 +1,75 @@
+"""Synthetic payloads shaped like real Perigon API responses."""
+
+from __future__ import annotations
+
+from typing import Any, Dict, List
+
+_WORDS = (
+    "market energy policy climate court election vaccine startup merger "
+    "inflation semiconductor wildfire satellite tariff earnings"
+).split()
+
+
+def _text(i: int, words: int) -> str:
+    return " ".join(_WORDS[(i * 7 + n) % len(_WORDS)] for n in range(words))
+
+
+def article_payload(i: int, content_words: int = 400) -> Dict[str, Any]:
+    """One article as returned by ``/v1/articles/all`` (camelCase keys)."""
+    return {
+        "url": f"https://example{i % 50}.com/news/{i}",
+        "authorsByline": "Jane Doe, John Roe",
+        "articleId": f"a{i:08x}",
+        "clusterId": f"c{i // 5:08x}",
+        "source": {
+            "domain": f"example{i % 50}.com",
+            "paywall": i % 3 == 0,
+            "location": {"country": "us", "state": "CA", "city": "San Francisco"},
+        },
+        "imageUrl": f"https://img.example.com/{i}.jpg",
+        "country": "us",
+        "language": "en",
+        "pubDate": f"2025-04-{1 + i % 28:02d}T{i % 24:02d}:15:00+00:00",
+        "addDate": f"2025-04-{1 + i % 28:02d}T{i % 24:02d}:20:00.123456+00:00",
+        "refreshDate": f"2025-04-{1 + i % 28:02d}T{i % 24:02d}:20:00.123456+00:00",
+        "score": 12.5 + i,
+        "title": _text(i, 12),
+        "description": _text(i + 1, 40),
+        "content": _text(i + 2, content_words),
+        "enContentWordCount": content_words,
+        "medium": "Article",
+        "links": [f"https://link{n}.example.com" for n in range(5)],
+        "labels": [{"name": "Opinion"}],
+        "eventTypes": [],
+        "matchedAuthors": [{"id": f"j{i}", "name": "Jane Doe"}],
+        "keywords": [{"name": w, "weight": 0.1 * n} for n, w in enumerate(_WORDS[:10])],
+        "topics": [{"name": "Markets"}, {"name": "Energy"}],
+        "categories": [{"name": "Business"}],
+        "taxonomies": [{"name": "/Finance/Investing", "score": 0.8}],
+        "entities": [
+            {"data": w.title(), "type": "ORG", "mentions": n}
+            for n, w in enumerate(_WORDS[:6])
+        ],
+        "companies": [
+            {"id": f"co{n}", "name": f"Company {n}", "domains": [], "symbols": []}
+            for n in range(3)
+        ],
+        "sentiment": {"positive": 0.2, "negative": 0.1, "neutral": 0.7},
+        "summary": _text(i + 3, 60),
+        "shortSummary": _text(i + 4, 20),
+        "translation": "",
+        "locations": [{"country": "us", "state": "CA"}],
+        "reprint": i % 4 == 0,
+        "reprintGroupId": f"r{i // 4:08x}",
+        "places": [],
+        "people": [{"wikidataId": f"Q{n}", "name": f"Person {n}"} for n in range(4)],
+        "journalists": [],
+    }
+
+
+def query_search_page(size: int = 100, content_words: int = 400) -> Dict[str, Any]:
+    """A ``QuerySearchResult`` payload with ``size`` articles."""
+    articles: List[Dict[str, Any]] = [
+        article_payload(i, content_words) for i in range(size)
+    ]
+    return {"status": 200, "numResults": 10_000, "articles": articles}
@@ -0,0 +1,97 @@
+"""
+Local stand-in for the Perigon API used by the network benchmarks.
+
+Serves a fixed ``QuerySearchResult`` page for every ``GET``, compressed with
+whichever codec the client prefers out of those it can encode, and can
+throttle responses to a given bandwidth so loopback numbers resemble a real
+link. Bodies are compressed once up front: the benchmarks measure the
+client's side of the trade-off, not the server's.
+"""
+
+from __future__ import annotations
+
+import gzip
+import json
+import threading
+import time
+import zlib
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Dict, Optional
+
+from benchmarks.fixtures import query_search_page
+
+
+def _encoders() -> Dict[str, Callable[[bytes], bytes]]:
+    encoders: Dict[str, Callable[[bytes], bytes]] = {
+        "gzip": lambda body: gzip.compress(body, compresslevel=6),
+        "deflate": zlib.compress,
+    }
+    try:
+        import brotli
+
+        encoders["br"] = lambda body: brotli.compress(body, quality=5)
+    except ImportError:
+        pass
+    try:
+        import zstandard
+
+        encoders["zstd"] = zstandard.ZstdCompressor(level=3).compress
+    except ImportError:
+        pass
+    return encoders
+
+
+class StandInServer:
+    """
+    ``with StandInServer(size=100) as url: ...`` runs the server on a thread.
+
+    ``mbps`` throttles each response body to that many megabits per second.
+    """
+
+    def __init__(
+        self, size: int = 100, content_words: int = 400, mbps: Optional[float] = None
+    ):
+        body = json.dumps(query_search_page(size, content_words)).encode()
+        self.bodies: Dict[str, bytes] = {"identity": body}
+        self.bodies.update(
+            (codec, encode(body)) for codec, encode in _encoders().items()
+        )
+        self.mbps = mbps
+        self._server: Optional[ThreadingHTTPServer] = None
+
+    def __enter__(self) -> str:
+        bodies, mbps = self.bodies, self.mbps
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            # Headers and a small body go out as separate writes
+            disable_nagle_algorithm = True
+
+            def do_GET(self) -> None:
+                offered = [
+                    part.split(";")[0].strip()
+                    for part in self.headers.get("Accept-Encoding", "").split(",")
+                ]
+                codec = next((c for c in offered if c in bodies), "identity")
+                body = bodies[codec]
+                if mbps:
+                    time.sleep(len(body) * 8 / (mbps * 1e6))
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                if codec != "identity":
+                    self.send_header("Content-Encoding", codec)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args: object) -> None:
+                pass
+
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+        return f"http://127.0.0.1:{self._server.server_address[1]}"
+
+    def __exit__(self, *exc: object) -> None:
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
@@ -25,6 +25,7 @@ from perigon.api_client import ApiClient
 
 # import ApiClient
 from perigon.api_response import ApiResponse
+from perigon.batch import Batch, BatchResult
 from perigon.exceptions import (
     ApiAttributeError,
     ApiException,
@@ -33,6 +34,7 @@ from perigon.exceptions import (
     ApiValueError,
     OpenApiException,
 )
+from perigon.instrumentation import CallReport, Observer
 
 # import models into sdk package
 from perigon.models.all_endpoint_sort_by import AllEndpointSortBy
@@ -0,0 +1,46 @@
+# Package : perigon
+"""
+Small helpers shared by the optional client-side modules::
+
+    np = require_numpy("perigon.dates.epochs")   # numpy, or a helpful ImportError
+    for article in articles(page.results):       # Article items or their ``.data``
+        ...
+"""
+
+from __future__ import annotations
+
+from typing import Any, Iterable, Iterator, Optional
+
+from perigon.models.article import Article
+
+
+def numpy_error(feature: str) -> ImportError:
+    """The ``ImportError`` raised when ``feature`` needs numpy but it is missing."""
+    return ImportError(
+        f'{feature} requires numpy; install it with `pip install "perigon[numpy]"`'
+    )
+
+
+def require_numpy(feature: str) -> Any:
+    """Import numpy for ``feature``, raising :func:`numpy_error` without it."""
+    try:
+        import numpy
+    except ImportError as exc:  # pragma: no cover - depends on extras
+        raise numpy_error(feature) from exc
+    return numpy
+
+
+def as_article(item: Any) -> Optional[Article]:
+    """``item`` if it is an ``Article``, else the ``Article`` on its ``.data``."""
+    if isinstance(item, Article):
+        return item
+    data = getattr(item, "data", None)
+    return data if isinstance(data, Article) else None
+
+
+def articles(items: Iterable[Any]) -> Iterator[Article]:
+    """The articles of ``items``, unwrapping ``ScoredDataArticle`` and friends."""
+    for item in items:
+        article = as_article(item)
+        if article is not None:
+            yield article
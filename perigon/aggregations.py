@@ -0,0 +1,286 @@
+# Package : perigon
+"""
+Facet counts, time histograms and sentiment averages over articles you
+already fetched, without extra API calls.
+
+:func:`to_columns` turns an iterable of ``Article`` items into a columnar
+export – one equal-length array per field, built in a single pass.
+:class:`Aggregates` accepts either and answers the usual dashboard facets
+with vectorised NumPy group-bys::
+
+    agg = Aggregates(paginate(api.search_articles, q="AI", size=100))
+    agg.counts("source", top=5)          # [("reuters.com", 41), ...]
+    agg.facets(["topics", "companies"])  # {"topics": [...], "companies": [...]}
+    agg.histogram("day")                 # [(datetime(...), 17), ...]
+    agg.sentiment(by="source", top=5)    # {"reuters.com": {"positive": 0.31, ...}}
+
+List-valued fields (``topics``, ``companies``, ...) count each article once
+per distinct value. Requires numpy (``pip install "perigon[numpy]"``).
+"""
+
+from __future__ import annotations
+
+from datetime import datetime, timezone
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
+
+from perigon._helpers import articles, numpy_error
+
+try:
+    import numpy as np
+except ImportError as exc:  # pragma: no cover - depends on extras
+    raise numpy_error("perigon.aggregations") from exc
+
+from perigon.dates import INTERVALS, MISSING, WEEK_ORIGIN, epochs
+from perigon.exceptions import ApiKeyError, ApiValueError
+
+Count = Tuple[str, int]
+
+SENTIMENT = ("positive", "negative", "neutral")
+
+
+def _names(attr: str) -> Callable[[Any], Tuple[str, ...]]:
+    def get(article: Any) -> Tuple[str, ...]:
+        holders = getattr(article, attr) or ()
+        # dict keeps first-seen order while dropping repeats
+        return tuple(dict.fromkeys(h.name for h in holders if h.name is not None))
+
+    return get
+
+
+SCALAR_FIELDS: Dict[str, Callable[[Any], Optional[str]]] = {
+    "source": lambda a: a.source.domain if a.source is not None else None,
+    "language": lambda a: a.language,
+    "country": lambda a: a.country,
+    "medium": lambda a: a.medium,
+    "cluster_id": lambda a: a.cluster_id,
+    "reprint_group_id": lambda a: a.reprint_group_id,
+}
+
+LIST_FIELDS: Dict[str, Callable[[Any], Tuple[str, ...]]] = {
+    name: _names(name)
+    for name in ("topics", "categories", "companies", "people", "labels", "keywords")
+}
+
+
+def to_columns(items: Iterable[Any]) -> Dict[str, Any]:
+    """
+    Columnar export of ``Article`` items (or ``ScoredDataArticle`` wrappers):
+
+    * ``pub_date`` – ``int64`` epoch seconds, :data:`MISSING` if absent;
+    * ``positive`` / ``negative`` / ``neutral`` – ``float64``, NaN if absent;
+    * each of :data:`SCALAR_FIELDS` – object array of ``str`` or ``None``;
+    * each of :data:`LIST_FIELDS` – object array of tuples of names.
+    """
+    scalars: Dict[str, List[Optional[str]]] = {name: [] for name in SCALAR_FIELDS}
+    lists: Dict[str, List[Tuple[str, ...]]] = {name: [] for name in LIST_FIELDS}
+    dates: List[Optional[str]] = []
+    sentiment: List[Tuple[float, ...]] = []
+    nan = float("nan")
+    for article in articles(items):
+        for name, get in SCALAR_FIELDS.items():
+            scalars[name].append(get(article))
+        for name, get_names in LIST_FIELDS.items():
+            lists[name].append(get_names(article))
+        dates.append(article.pub_date)
+        s = article.sentiment
+        values = (None,) * 3 if s is None else (s.positive, s.negative, s.neutral)
+        sentiment.append(tuple(nan if v is None else v for v in values))
+
+    columns: Dict[str, Any] = {"pub_date": epochs(dates)}
+    scores = np.array(sentiment, dtype=np.float64).reshape(-1, 3)
+    for n, name in enumerate(SENTIMENT):
+        columns[name] = scores[:, n].copy()
+    for name, cells in scalars.items():
+        columns[name] = _objects(cells)
+    for name, names in lists.items():
+        columns[name] = _objects(names)
+    return columns
+
+
+def _objects(cells: Sequence[Any]) -> "np.ndarray":
+    # np.array() would turn equal-length tuples into a 2-d array
+    column = np.empty(len(cells), dtype=object)
+    column[:] = cells
+    return column
+
+
+class _Facet:
+    # Dictionary-encoded field: ``values[codes[i]]`` belongs to article ``rows[i]``
+    __slots__ = ("values", "codes", "rows")
+
+    def __init__(self, column: Any, multi: bool):
+        index: Dict[str, int] = {}
+        codes: List[int] = []
+        rows: List[int] = []
+        for row, cell in enumerate(column):
+            if cell is None:
+                continue
+            for value in cell if multi else (cell,):
+                code = index.get(value)
+                if code is None:
+                    code = index[value] = len(index)
+                codes.append(code)
+                rows.append(row)
+        self.values = list(index)
+        self.codes = np.array(codes, dtype=np.intp)
+        self.rows = np.array(rows, dtype=np.intp)
+
+
+class Aggregates:
+    """
+    Vectorised facets over a set of articles; see the module docstring.
+
+    ``data`` is an iterable of articles or a mapping of columns as returned
+    by :func:`to_columns`. Columns may also come from elsewhere (a saved
+    export, a dataframe's ``to_dict("series")``) as long as they share one
+    length; ``pub_date`` may be ISO strings or epoch seconds.
+    """
+
+    def __init__(self, data: Union[Iterable[Any], Mapping[str, Any]]):
+        if not isinstance(data, Mapping):
+            data = to_columns(data)
+        self.columns: Dict[str, Any] = dict(data)
+        lengths = {len(column) for column in self.columns.values()}
+        if len(lengths) > 1:
+            raise ApiValueError(f"columns differ in length: {sorted(lengths)}")
+        self.size = lengths.pop() if lengths else 0
+        self._facets: Dict[str, _Facet] = {}
+
+    def __len__(self) -> int:
+        return self.size
+
+    def _column(self, field: str) -> Any:
+        column = self.columns.get(field)
+        if column is None:
+            raise ApiKeyError(f"no {field!r} column; have {sorted(self.columns)}")
+        return column
+
+    def _facet(self, field: str) -> _Facet:
+        facet = self._facets.get(field)
+        if facet is None:
+            column = self._column(field)
+            multi = field in LIST_FIELDS or any(
+                isinstance(cell, (list, tuple)) for cell in column
+            )
+            facet = self._facets[field] = _Facet(column, multi)
+        return facet
+
+    @staticmethod
+    def _ranked(totals: Any, top: Optional[int]) -> List[int]:
+        # Codes by descending total, ties by first appearance
+        order = np.argsort(-totals, kind="stable")
+        return [int(c) for c in order[:top] if totals[c] > 0]
+
+    # -- counts -------------------------------------------------------- #
+    def counts(self, field: str, top: Optional[int] = None) -> List[Count]:
+        """``(value, articles)`` pairs for ``field``, most frequent first."""
+        facet = self._facet(field)
+        totals = np.bincount(facet.codes, minlength=len(facet.values))
+        return [(facet.values[c], int(totals[c])) for c in self._ranked(totals, top)]
+
+    def facets(
+        self, fields: Optional[Iterable[str]] = None, top: Optional[int] = 10
+    ) -> Dict[str, List[Count]]:
+        """:meth:`counts` for several fields; by default every facet column present."""
+        if fields is None:
+            fields = [
+                name for name in (*SCALAR_FIELDS, *LIST_FIELDS) if name in self.columns
+            ]
+        return {field: self.counts(field, top) for field in fields}
+
+    # -- time ---------------------------------------------------------- #
+    def epochs(self, field: str = "pub_date") -> Any:
+        """``field`` as ``int64`` epoch seconds, :data:`MISSING` where absent."""
+        column = np.asarray(self._column(field))
+        if column.dtype.kind in "iu":
+            return column.astype(np.int64, copy=False)
+        return epochs(column)
+
+    def histogram(
+        self, interval: Union[str, int] = "day", field: str = "pub_date"
+    ) -> List[Tuple[datetime, int]]:
+        """
+        Article counts per ``interval`` (a name in :data:`perigon.dates.INTERVALS` or
+        seconds) from the earliest to the latest bucket, including empty
+        ones. Buckets are UTC; weeks start on Monday.
+        """
+        step = INTERVALS.get(interval) if isinstance(interval, str) else interval
+        if not step or step <= 0:
+            raise ApiValueError(
+                f"interval must be one of {tuple(INTERVALS)} or positive seconds"
+            )
+        origin = WEEK_ORIGIN if interval == "week" else 0
+        stamps = self.epochs(field)
+        stamps = stamps[stamps != MISSING]
+        if stamps.size == 0:
+            return []
+        buckets = (stamps - origin) // step
+        first = int(buckets.min())
+        totals = np.bincount(buckets - first)
+        return [
+            (
+                datetime.fromtimestamp((first + n) * step + origin, tz=timezone.utc),
+                int(count),
+            )
+            for n, count in enumerate(totals)
+        ]
+
+    # -- sentiment ----------------------------------------------------- #
+    def _scores(self) -> Any:
+        return np.column_stack(
+            [np.asarray(self._column(name), dtype=np.float64) for name in SENTIMENT]
+        ).reshape(-1, 3)
+
+    def sentiment(
+        self, by: Optional[str] = None, top: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """
+        Mean ``positive`` / ``negative`` / ``neutral`` scores and how many
+        articles had them (``count``). With ``by``, one such dict per value
+        of that field, for its ``top`` most frequent values.
+        """
+        scores = self._scores()
+        scored = ~np.isnan(scores).any(axis=1)
+        if by is None:
+            rows = scores[scored]
+            means = rows.mean(axis=0) if len(rows) else np.full(3, np.nan)
+            return self._means(means, len(rows))
+
+        facet = self._facet(by)
+        keep = scored[facet.rows]
+        codes, rows = facet.codes[keep], facet.rows[keep]
+        groups = len(facet.values)
+        totals = np.bincount(codes, minlength=groups)
+        sums = [
+            np.bincount(codes, weights=scores[rows, n], minlength=groups)
+            for n in range(3)
+        ]
+        out: Dict[str, Any] = {}
+        for c in self._ranked(totals, top):
+            means = [s[c] / totals[c] for s in sums]
+            out[facet.values[c]] = self._means(means, int(totals[c]))
+        return out
+
+    @staticmethod
+    def _means(means: Any, count: int) -> Dict[str, Any]:
+        out: Dict[str, Any] = {name: float(v) for name, v in zip(SENTIMENT, means)}
+        out["count"] = count
+        return out
+
+    def sentiment_buckets(self) -> Dict[str, int]:
+        """Articles per dominant sentiment label; unscored ones are left out."""
+        scores = self._scores()
+        scored = scores[~np.isnan(scores).any(axis=1)]
+        totals = np.bincount(np.argmax(scored, axis=1), minlength=3)
+        return {name: int(n) for name, n in zip(SENTIMENT, totals)}
@@ -1,12 +1,14 @@
-from enum import Enum
-from typing import Any, Dict, Iterable, List, Mapping, Optional
+from typing import Any, Callable, Iterable, Iterator, List, Mapping, Optional
 
 from pydantic import Field, StrictInt, StrictStr
 from typing_extensions import Annotated
 
 from perigon.api_client import ApiClient
+from perigon.batch import BatchResult, Call, gather_sync, map_sync
 from perigon.models.create_source_group_params import CreateSourceGroupParams
 from perigon.models.patch_source_group_params import PatchSourceGroupParams
+from perigon.operation import Operation
+from perigon.query import QuerySpec, encode_list, encode_scalar
 
 # Define API paths
 PATH_CREATE_SOURCE_GROUP = "/v1/api/sourceGroups"
@@ -17,52 +19,98 @@ PATH_RESOLVE_SOURCE_GROUPS = "/v1/api/sourceGroups/resolve"
 PATH_UPDATE_SOURCE_GROUP = "/v1/api/sourceGroups/{id}"
 
 
-def _normalise_query(params: Mapping[str, Any]) -> Dict[str, Any]:
-    """
-    • Convert Enum → Enum.value
-    • Convert list/tuple/set → CSV string (after Enum handling)
-    • Skip None values
-    """
-    out: Dict[str, Any] = {}
-    for key, value in params.items():
-        if value is None:  # ignore "unset"
-            continue
+# Define operations
+OP_CREATE_SOURCE_GROUP = Operation(
+    "POST",
+    PATH_CREATE_SOURCE_GROUP,
+    body="create_source_group_params",
+)
+OP_DELETE_SOURCE_GROUP = Operation(
+    "DELETE",
+    PATH_DELETE_SOURCE_GROUP,
+    path_params=(("id", "id"),),
+)
+OP_GET_SOURCE_GROUP = Operation(
+    "GET",
+    PATH_GET_SOURCE_GROUP,
+    path_params=(("id", "id"),),
+)
+OP_LIST_SOURCE_GROUPS = Operation(
+    "GET",
+    PATH_LIST_SOURCE_GROUPS,
+    query=QuerySpec(
+        ("name", "name", encode_scalar),
+        ("domain", "domain", encode_scalar),
+        ("page", "page", encode_scalar),
+        ("size", "size", encode_scalar),
+        ("sort_by", "sortBy", encode_scalar),
+        ("sort_order", "sortOrder", encode_scalar),
+    ),
+)
+OP_RESOLVE_SOURCE_GROUPS = Operation(
+    "GET",
+    PATH_RESOLVE_SOURCE_GROUPS,
+    query=QuerySpec(
+        ("name", "name", encode_list),
+    ),
+)
+OP_UPDATE_SOURCE_GROUP = Operation(
+    "PATCH",
+    PATH_UPDATE_SOURCE_GROUP,
+    path_params=(("id", "id"),),
+    body="patch_source_group_params",
+)
 
-        # Unwrap single Enum
-        if isinstance(value, Enum):  # Enum → str
-            value = value.value
 
-        # Handle datetime objects properly
-        from datetime import datetime
+class SourceGroupsApi:
+    """"""
 
-        if isinstance(value, datetime):
-            value = value.isoformat().split("+")[0]
+    def __init__(self, api_client: Optional[ApiClient] = None):
+        self.api_client = api_client or ApiClient()
 
-        # Handle collection (after possible Enum unwrap)
-        elif isinstance(value, (list, tuple, set)):
-            # unwrap Enum members inside the collection
-            items: Iterable[str] = (
-                (
-                    item.isoformat().replace(" ", "+")
-                    if isinstance(item, datetime)
-                    else str(item.value if isinstance(item, Enum) else item)
-                )
-                for item in value
-            )
-            value = ",".join(items)  # CSV join
-        else:
-            value = str(value)
+    def gather(
+        self,
+        calls: Iterable[Call],
+        max_concurrency: int = 8,
+        return_exceptions: bool = False,
+    ) -> List[Any]:
+        """
+        Run several ``(method, kwargs)`` calls concurrently from sync code.
 
-        out[key] = value
+        The ``_async`` variants run on the client's background event loop, so
+        no event loop is needed in the caller. Results come back in order.
 
-    return out
+        Example:
+            articles, topics = api.gather([
+                (api.search_articles, {"q": "AI"}),
+                (api.search_topics, {"name": "Markets"}),
+            ])
+        """
+        return gather_sync(
+            self.api_client,
+            calls,
+            max_concurrency=max_concurrency,
+            return_exceptions=return_exceptions,
+        )
 
+    def map(
+        self,
+        method: Callable[..., Any],
+        kwargs_list: Iterable[Mapping[str, Any]],
+        workers: Optional[int] = None,
+    ) -> Iterator[BatchResult[Any]]:
+        """
+        Call a sync method once per kwargs mapping on a thread pool.
 
-class SourceGroupsApi:
-    """"""
+        Workers share the client's connection pool and default to its
+        keep-alive size. Results are yielded as they complete; each carries
+        the ``index`` of its kwargs mapping.
 
-    def __init__(self, api_client: Optional[ApiClient] = None):
-        self.api_client = api_client or ApiClient()
+        Example:
+            for result in api.map(api.search_articles, [{"q": q} for q in queries]):
+                print(result.index, result.unwrap().num_results)
+        """
+        return map_sync(self.api_client, method, kwargs_list, workers=workers)
 
     # ----------------- create_source_group (sync) ----------------- #
     def create_source_group(self, create_source_group_params: CreateSourceGroupParams):
@@ -73,23 +121,7 @@ class SourceGroupsApi:
             create_source_group_params (CreateSourceGroupParams): Parameter create_source_group_params (required)
 
         """
-        # Get path template from class attribute
-        path = PATH_CREATE_SOURCE_GROUP
-
-        # --- build query dict on the fly ---
-        params: Dict[str, Any] = {}
-        params = _normalise_query(params)
-
-        resp = self.api_client.request(
-            "POST",
-            path,
-            params=params,
-            json=create_source_group_params.model_dump(
-                by_alias=True, exclude_none=True
-            ),
-        )
-        resp.raise_for_status()
-        return resp.json()
+        return self.api_client.call(OP_CREATE_SOURCE_GROUP, locals())
 
     # ----------------- create_source_group (async) ----------------- #
     async def create_source_group_async(
@@ -102,22 +134,7 @@ class SourceGroupsApi:
             create_source_group_params (CreateSourceGroupParams): Parameter create_source_group_params (required)
 
         """
-        # Get path template from class attribute
-        path = PATH_CREATE_SOURCE_GROUP
-
-        params: Dict[str, Any] = {}
-        params = _normalise_query(params)
-
-        resp = await self.api_client.request_async(
-            "POST",
-            path,
-            params=params,
-            json=create_source_group_params.model_dump(
-                by_alias=True, exclude_none=True
-            ),
-        )
-        resp.raise_for_status()
-        return resp.json()
+        return await self.api_client.call_async(OP_CREATE_SOURCE_GROUP, locals())
 
     # ----------------- delete_source_group (sync) ----------------- #
     def delete_source_group(self, id: int):
@@ -128,19 +145,7 @@ class SourceGroupsApi:
             id (int): Parameter id (required)
 
         """
-        # Get path template from class attribute
-        path = PATH_DELETE_SOURCE_GROUP
-
-        # Replace path parameters
-        path = path.format(id=str(id))
-
-        # --- build query dict on the fly ---
-        params: Dict[str, Any] = {}
-        params = _normalise_query(params)
-
-        resp = self.api_client.request("DELETE", path, params=params)
-        resp.raise_for_status()
-        return resp.json()
+        return self.api_client.call(OP_DELETE_SOURCE_GROUP, locals())
 
     # ----------------- delete_source_group (async) ----------------- #
     async def delete_source_group_async(self, id: int):
@@ -151,18 +156,7 @@ class SourceGroupsApi:
             id (int): Parameter id (required)
 
         """
-        # Get path template from class attribute
-        path = PATH_DELETE_SOURCE_GROUP
-
-        # Replace path parameters
-        path = path.format(id=str(id))
-
-        params: Dict[str, Any] = {}
-        params = _normalise_query(params)
-
-        resp = await self.api_client.request_async("DELETE", path, params=params)
-        resp.raise_for_status()
-        return resp.json()
+        return await self.api_client.call_async(OP_DELETE_SOURCE_GROUP, locals())
 
     # ----------------- get_source_group (sync) ----------------- #
     def get_source_group(self, id: int):
@@ -173,19 +167,7 @@ class SourceGroupsApi:
             id (int): Parameter id (required)
 
         """
-        # Get path template from class attribute
-        path = PATH_GET_SOURCE_GROUP
-
-        # Replace path parameters
-        path = path.format(id=str(id))
-
-        # --- build query dict on the fly ---
-        params: Dict[str, Any] = {}
-        params = _normalise_query(params)
-
-        resp = self.api_client.request("GET", path, params=params)
-        resp.raise_for_status()
-        return resp.json()
+        return self.api_client.call(OP_GET_SOURCE_GROUP, locals())
 
     # ----------------- get_source_group (async) ----------------- #
     async def get_source_group_async(self, id: int):
@@ -196,18 +178,7 @@ class SourceGroupsApi:
             id (int): Parameter id (required)
 
         """
-        # Get path template from class attribute
-        path = PATH_GET_SOURCE_GROUP
-
-        # Replace path parameters
-        path = path.format(id=str(id))
-
-        params: Dict[str, Any] = {}
-        params = _normalise_query(params)
-
-        resp = await self.api_client.request_async("GET", path, params=params)
-        resp.raise_for_status()
-        return resp.json()
+        return await self.api_client.call_async(OP_GET_SOURCE_GROUP, locals())
 
     # ----------------- list_source_groups (sync) ----------------- #
     def list_source_groups(
@@ -231,28 +202,7 @@ class SourceGroupsApi:
             size (Optional[str]): The number of items per page.   _Must be at least 1_.   _Default value 10_.
 
         """
-        # Get path template from class attribute
-        path = PATH_LIST_SOURCE_GROUPS
-
-        # --- build query dict on the fly ---
-        params: Dict[str, Any] = {}
-        if name is not None:
-            params["name"] = name
-        if domain is not None:
-            params["domain"] = domain
-        if page is not None:
-            params["page"] = page
-        if size is not None:
-            params["size"] = size
-        if sort_by is not None:
-            params["sortBy"] = sort_by
-        if sort_order is not None:
-            params["sortOrder"] = sort_order
-        params = _normalise_query(params)
-
-        resp = self.api_client.request("GET", path, params=params)
-        resp.raise_for_status()
-        return resp.json()
+        return self.api_client.call(OP_LIST_SOURCE_GROUPS, locals())
 
     # ----------------- list_source_groups (async) ----------------- #
     async def list_source_groups_async(
@@ -276,27 +226,7 @@ class SourceGroupsApi:
             size (Optional[str]): The number of items per page.   _Must be at least 1_.   _Default value 10_.
 
         """
-        # Get path template from class attribute
-        path = PATH_LIST_SOURCE_GROUPS
-
-        params: Dict[str, Any] = {}
-        if name is not None:
-            params["name"] = name
-        if domain is not None:
-            params["domain"] = domain
-        if page is not None:
-            params["page"] = page
-        if size is not None:
-            params["size"] = size
-        if sort_by is not None:
-            params["sortBy"] = sort_by
-        if sort_order is not None:
-            params["sortOrder"] = sort_order
-        params = _normalise_query(params)
-
-        resp = await self.api_client.request_async("GET", path, params=params)
-        resp.raise_for_status()
-        return resp.json()
+        return await self.api_client.call_async(OP_LIST_SOURCE_GROUPS, locals())
 
     # ----------------- resolve_source_groups (sync) ----------------- #
     def resolve_source_groups(self, name: Optional[List[str]] = None):
@@ -307,18 +237,7 @@ class SourceGroupsApi:
             name (Optional[List[str]]): Source group names to resolve (max 100)
 
         """
-        # Get path template from class attribute
-        path = PATH_RESOLVE_SOURCE_GROUPS
-
-        # --- build query dict on the fly ---
-        params: Dict[str, Any] = {}
-        if name is not None:
-            params["name"] = name
-        params = _normalise_query(params)
-
-        resp = self.api_client.request("GET", path, params=params)
-        resp.raise_for_status()
-        return resp.json()
+        return self.api_client.call(OP_RESOLVE_SOURCE_GROUPS, locals())
 
     # ----------------- resolve_source_groups (async) ----------------- #
     async def resolve_source_groups_async(self, name: Optional[List[str]] = None):
@@ -329,17 +248,7 @@ class SourceGroupsApi:
             name (Optional[List[str]]): Source group names to resolve (max 100)
 
         """
-        # Get path template from class attribute
-        path = PATH_RESOLVE_SOURCE_GROUPS
-
-        params: Dict[str, Any] = {}
-        if name is not None:
-            params["name"] = name
-        params = _normalise_query(params)
-
-        resp = await self.api_client.request_async("GET", path, params=params)
-        resp.raise_for_status()
-        return resp.json()
+        return await self.api_client.call_async(OP_RESOLVE_SOURCE_GROUPS, locals())
 
     # ----------------- update_source_group (sync) ----------------- #
     def update_source_group(
@@ -353,24 +262,7 @@ class SourceGroupsApi:
             patch_source_group_params (PatchSourceGroupParams): Parameter patch_source_group_params (required)
 
         """
-        # Get path template from class attribute
-        path = PATH_UPDATE_SOURCE_GROUP
-
-        # Replace path parameters
-        path = path.format(id=str(id))
-
-        # --- build query dict on the fly ---
-        params: Dict[str, Any] = {}
-        params = _normalise_query(params)
-
-        resp = self.api_client.request(
-            "PATCH",
-            path,
-            params=params,
-            json=patch_source_group_params.model_dump(by_alias=True, exclude_none=True),
-        )
-        resp.raise_for_status()
-        return resp.json()
+        return self.api_client.call(OP_UPDATE_SOURCE_GROUP, locals())
 
     # ----------------- update_source_group (async) ----------------- #
     async def update_source_group_async(
@@ -384,20 +276,4 @@ class SourceGroupsApi:
             patch_source_group_params (PatchSourceGroupParams): Parameter patch_source_group_params (required)
 
         """
-        # Get path template from class attribute
-        path = PATH_UPDATE_SOURCE_GROUP
-
-        # Replace path parameters
-        path = path.format(id=str(id))
-
-        params: Dict[str, Any] = {}
-        params = _normalise_query(params)
-
-        resp = await self.api_client.request_async(
-            "PATCH",
-            path,
-            params=params,
-            json=patch_source_group_params.model_dump(by_alias=True, exclude_none=True),
-        )
-        resp.raise_for_status()
-        return resp.json()
+        return await self.api_client.call_async(OP_UPDATE_SOURCE_GROUP, locals())
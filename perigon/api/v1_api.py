@@ -1,6 +1,5 @@
 from datetime import datetime
-from enum import Enum
-from typing import Any, Dict, Iterable, List, Mapping, Optional, Union
+from typing import Any, Callable, Iterable, Iterator, List, Mapping, Optional, Union
 
 from pydantic import (
     Field,
@@ -13,6 +12,7 @@ from pydantic import (
 from typing_extensions import Annotated
 
 from perigon.api_client import ApiClient
+from perigon.batch import BatchResult, Call, gather_sync, map_sync
 from perigon.models.all_endpoint_sort_by import AllEndpointSortBy
 from perigon.models.article_search_params import ArticleSearchParams
 from perigon.models.articles_vector_search_result import ArticlesVectorSearchResult
@@ -36,6 +36,8 @@ from perigon.models.update_watchlist_params import UpdateWatchlistParams
 from perigon.models.wikipedia_search_params import WikipediaSearchParams
 from perigon.models.wikipedia_search_result import WikipediaSearchResult
 from perigon.models.wikipedia_vector_search_result import WikipediaVectorSearchResult
+from perigon.operation import Operation
+from perigon.query import QuerySpec, encode_list, encode_scalar
 
 # Define API paths
 PATH_CREATE_SOURCE_GROUP = "/v1/api/sourceGroups"
@@ -66,45 +68,566 @@ PATH_VECTOR_SEARCH_ARTICLES = "/v1/vector/news/all"
 PATH_VECTOR_SEARCH_WIKIPEDIA = "/v1/vector/wikipedia/all"
 
 
-def _normalise_query(params: Mapping[str, Any]) -> Dict[str, Any]:
-    """
-    • Convert Enum → Enum.value
-    • Convert list/tuple/set → CSV string (after Enum handling)
-    • Skip None values
-    """
-    out: Dict[str, Any] = {}
-    for key, value in params.items():
-        if value is None:  # ignore "unset"
-            continue
-
-        # Unwrap single Enum
-        if isinstance(value, Enum):  # Enum → str
-            value = value.value
-
-        # Handle datetime objects properly
-        from datetime import datetime
-
-        if isinstance(value, datetime):
-            value = value.isoformat().split("+")[0]
-
-        # Handle collection (after possible Enum unwrap)
-        elif isinstance(value, (list, tuple, set)):
-            # unwrap Enum members inside the collection
-            items: Iterable[str] = (
-                (
-                    item.isoformat().replace(" ", "+")
-                    if isinstance(item, datetime)
-                    else str(item.value if isinstance(item, Enum) else item)
-                )
-                for item in value
-            )
-            value = ",".join(items)  # CSV join
-        else:
-            value = str(value)
-
-        out[key] = value
-
-    return out
+# Define operations
+OP_CREATE_SOURCE_GROUP = Operation(
+    "POST",
+    PATH_CREATE_SOURCE_GROUP,
+    body="create_source_group_params",
+)
+OP_CREATE_WATCHLIST = Operation(
+    "POST",
+    PATH_CREATE_WATCHLIST,
+    body="create_watchlist_params",
+)
+OP_DELETE_SOURCE_GROUP = Operation(
+    "DELETE",
+    PATH_DELETE_SOURCE_GROUP,
+    path_params=(("id", "id"),),
+)
+OP_DELETE_WATCHLIST = Operation(
+    "DELETE",
+    PATH_DELETE_WATCHLIST,
+    path_params=(("id", "id"),),
+)
+OP_GET_JOURNALIST_BY_ID = Operation(
+    "GET",
+    PATH_GET_JOURNALIST_BY_ID,
+    path_params=(("id", "id"),),
+    response=Journalist,
+)
+OP_GET_SOURCE_GROUP = Operation(
+    "GET",
+    PATH_GET_SOURCE_GROUP,
+    path_params=(("id", "id"),),
+)
+OP_GET_STORY_COUNTS = Operation(
+    "GET",
+    PATH_GET_STORY_COUNTS,
+    query=QuerySpec(
+        ("q", "q", encode_scalar),
+        ("name", "name", encode_scalar),
+        ("cluster_id", "clusterId", encode_list),
+        ("exclude_cluster_id", "excludeClusterId", encode_list),
+        ("sort_by", "sortBy", encode_scalar),
+        ("page", "page", encode_scalar),
+        ("size", "size", encode_scalar),
+        ("var_from", "from", encode_scalar),
+        ("to", "to", encode_scalar),
+        ("initialized_from", "initializedFrom", encode_scalar),
+        ("initialized_to", "initializedTo", encode_scalar),
+        ("updated_from", "updatedFrom", encode_scalar),
+        ("updated_to", "updatedTo", encode_scalar),
+        ("topic", "topic", encode_list),
+        ("category", "category", encode_list),
+        ("taxonomy", "taxonomy", encode_list),
+        ("source", "source", encode_list),
+        ("source_group", "sourceGroup", encode_list),
+        ("min_unique_sources", "minUniqueSources", encode_scalar),
+        ("min_source_diversity", "minSourceDiversity", encode_scalar),
+        ("person_wikidata_id", "personWikidataId", encode_list),
+        ("person_name", "personName", encode_scalar),
+        ("company_id", "companyId", encode_list),
+        ("company_name", "companyName", encode_scalar),
+        ("company_domain", "companyDomain", encode_list),
+        ("company_symbol", "companySymbol", encode_list),
+        ("country", "country", encode_list),
+        ("state", "state", encode_list),
+        ("city", "city", encode_list),
+        ("area", "area", encode_list),
+        ("min_cluster_size", "minClusterSize", encode_scalar),
+        ("max_cluster_size", "maxClusterSize", encode_scalar),
+        ("name_exists", "nameExists", encode_scalar),
+        ("positive_sentiment_from", "positiveSentimentFrom", encode_scalar),
+        ("positive_sentiment_to", "positiveSentimentTo", encode_scalar),
+        ("neutral_sentiment_from", "neutralSentimentFrom", encode_scalar),
+        ("neutral_sentiment_to", "neutralSentimentTo", encode_scalar),
+        ("negative_sentiment_from", "negativeSentimentFrom", encode_scalar),
+        ("negative_sentiment_to", "negativeSentimentTo", encode_scalar),
+        ("show_story_page_info", "showStoryPageInfo", encode_scalar),
+        ("show_num_results", "showNumResults", encode_scalar),
+        ("show_duplicates", "showDuplicates", encode_scalar),
+        ("show_highlighting", "showHighlighting", encode_scalar),
+        ("highlight_fragment_size", "highlightFragmentSize", encode_scalar),
+        ("highlight_num_fragments", "highlightNumFragments", encode_scalar),
+        ("highlight_pre_tag", "highlightPreTag", encode_scalar),
+        ("highlight_post_tag", "highlightPostTag", encode_scalar),
+        ("highlight_q", "highlightQ", encode_scalar),
+        ("expand_articles", "expandArticles", encode_scalar),
+        ("split_by", "splitBy", encode_scalar),
+    ),
+    response=StatResult,
+)
+OP_GET_STORY_HISTORY = Operation(
+    "GET",
+    PATH_GET_STORY_HISTORY,
+    query=QuerySpec(
+        ("cluster_id", "clusterId", encode_list),
+        ("var_from", "from", encode_scalar),
+        ("to", "to", encode_scalar),
+        ("sort_by", "sortBy", encode_scalar),
+        ("page", "page", encode_scalar),
+        ("size", "size", encode_scalar),
+        ("changelog_exists", "changelogExists", encode_scalar),
+    ),
+    response=StoryHistoryResult,
+)
+OP_GET_WATCHLIST = Operation(
+    "GET",
+    PATH_GET_WATCHLIST,
+    path_params=(("id", "id"),),
+)
+OP_LIST_SOURCE_GROUPS = Operation(
+    "GET",
+    PATH_LIST_SOURCE_GROUPS,
+    query=QuerySpec(
+        ("name", "name", encode_scalar),
+        ("domain", "domain", encode_scalar),
+        ("page", "page", encode_scalar),
+        ("size", "size", encode_scalar),
+        ("sort_by", "sortBy", encode_scalar),
+        ("sort_order", "sortOrder", encode_scalar),
+    ),
+)
+OP_LIST_WATCHLISTS = Operation(
+    "GET",
+    PATH_LIST_WATCHLISTS,
+    query=QuerySpec(
+        ("name", "name", encode_scalar),
+        ("page", "page", encode_scalar),
+        ("size", "size", encode_scalar),
+        ("sort_by", "sortBy", encode_scalar),
+        ("sort_order", "sortOrder", encode_scalar),
+    ),
+)
+OP_RESOLVE_SOURCE_GROUPS = Operation(
+    "GET",
+    PATH_RESOLVE_SOURCE_GROUPS,
+    query=QuerySpec(
+        ("name", "name", encode_list),
+    ),
+)
+OP_RESOLVE_WATCHLISTS = Operation(
+    "GET",
+    PATH_RESOLVE_WATCHLISTS,
+    query=QuerySpec(
+        ("name", "name", encode_list),
+    ),
+)
+OP_SEARCH_ARTICLES = Operation(
+    "GET",
+    PATH_SEARCH_ARTICLES,
+    query=QuerySpec(
+        ("q", "q", encode_scalar),
+        ("title", "title", encode_scalar),
+        ("desc", "desc", encode_scalar),
+        ("content", "content", encode_scalar),
+        ("summary", "summary", encode_scalar),
+        ("url", "url", encode_scalar),
+        ("article_id", "articleId", encode_list),
+        ("cluster_id", "clusterId", encode_list),
+        ("sort_by", "sortBy", encode_scalar),
+        ("page", "page", encode_scalar),
+        ("size", "size", encode_scalar),
+        ("var_from", "from", encode_scalar),
+        ("to", "to", encode_scalar),
+        ("add_date_from", "addDateFrom", encode_scalar),
+        ("add_date_to", "addDateTo", encode_scalar),
+        ("refresh_date_from", "refreshDateFrom", encode_scalar),
+        ("refresh_date_to", "refreshDateTo", encode_scalar),
+        ("medium", "medium", encode_list),
+        ("source", "source", encode_list),
+        ("source_group", "sourceGroup", encode_list),
+        ("exclude_source_group", "excludeSourceGroup", encode_list),
+        ("exclude_source", "excludeSource", encode_list),
+        ("watchlist", "watchlist", encode_list),
+        ("exclude_watchlist", "excludeWatchlist", encode_list),
+        ("paywall", "paywall", encode_scalar),
+        ("byline", "byline", encode_list),
+        ("author", "author", encode_list),
+        ("exclude_author", "excludeAuthor", encode_list),
+        ("journalist_id", "journalistId", encode_list),
+        ("exclude_journalist_id", "excludeJournalistId", encode_list),
+        ("language", "language", encode_list),
+        ("exclude_language", "excludeLanguage", encode_list),
+        ("search_translation", "searchTranslation", encode_scalar),
+        ("label", "label", encode_list),
+        ("exclude_label", "excludeLabel", encode_list),
+        ("category", "category", encode_list),
+        ("exclude_category", "excludeCategory", encode_list),
+        ("topic", "topic", encode_list),
+        ("exclude_topic", "excludeTopic", encode_list),
+        ("link_to", "linkTo", encode_scalar),
+        ("show_reprints", "showReprints", encode_scalar),
+        ("reprint_group_id", "reprintGroupId", encode_scalar),
+        ("city", "city", encode_list),
+        ("exclude_city", "excludeCity", encode_list),
+        ("area", "area", encode_list),
+        ("state", "state", encode_list),
+        ("exclude_state", "excludeState", encode_list),
+        ("county", "county", encode_list),
+        ("exclude_county", "excludeCounty", encode_list),
+        ("locations_country", "locationsCountry", encode_list),
+        ("country", "country", encode_list),
+        ("exclude_locations_country", "excludeLocationsCountry", encode_list),
+        ("location", "location", encode_list),
+        ("lat", "lat", encode_scalar),
+        ("lon", "lon", encode_scalar),
+        ("max_distance", "maxDistance", encode_scalar),
+        ("source_city", "sourceCity", encode_list),
+        ("exclude_source_city", "excludeSourceCity", encode_list),
+        ("source_county", "sourceCounty", encode_list),
+        ("exclude_source_county", "excludeSourceCounty", encode_list),
+        ("source_country", "sourceCountry", encode_list),
+        ("exclude_source_country", "excludeSourceCountry", encode_list),
+        ("source_state", "sourceState", encode_list),
+        ("exclude_source_state", "excludeSourceState", encode_list),
+        ("source_lat", "sourceLat", encode_scalar),
+        ("source_lon", "sourceLon", encode_scalar),
+        ("source_max_distance", "sourceMaxDistance", encode_scalar),
+        ("person_wikidata_id", "personWikidataId", encode_list),
+        ("exclude_person_wikidata_id", "excludePersonWikidataId", encode_list),
+        ("person_name", "personName", encode_list),
+        ("exclude_person_name", "excludePersonName", encode_list),
+        ("company_id", "companyId", encode_list),
+        ("exclude_company_id", "excludeCompanyId", encode_list),
+        ("company_name", "companyName", encode_scalar),
+        ("company_domain", "companyDomain", encode_list),
+        ("exclude_company_domain", "excludeCompanyDomain", encode_list),
+        ("company_symbol", "companySymbol", encode_list),
+        ("exclude_company_symbol", "excludeCompanySymbol", encode_list),
+        ("show_num_results", "showNumResults", encode_scalar),
+        ("positive_sentiment_from", "positiveSentimentFrom", encode_scalar),
+        ("positive_sentiment_to", "positiveSentimentTo", encode_scalar),
+        ("neutral_sentiment_from", "neutralSentimentFrom", encode_scalar),
+        ("neutral_sentiment_to", "neutralSentimentTo", encode_scalar),
+        ("negative_sentiment_from", "negativeSentimentFrom", encode_scalar),
+        ("negative_sentiment_to", "negativeSentimentTo", encode_scalar),
+        ("taxonomy", "taxonomy", encode_list),
+        ("prefix_taxonomy", "prefixTaxonomy", encode_scalar),
+        ("show_highlighting", "showHighlighting", encode_scalar),
+        ("highlight_fragment_size", "highlightFragmentSize", encode_scalar),
+        ("highlight_num_fragments", "highlightNumFragments", encode_scalar),
+        ("highlight_pre_tag", "highlightPreTag", encode_scalar),
+        ("highlight_post_tag", "highlightPostTag", encode_scalar),
+        ("highlight_q", "highlightQ", encode_scalar),
+    ),
+    response=QuerySearchResult,
+)
+OP_SEARCH_COMPANIES = Operation(
+    "GET",
+    PATH_SEARCH_COMPANIES,
+    query=QuerySpec(
+        ("id", "id", encode_list),
+        ("symbol", "symbol", encode_list),
+        ("domain", "domain", encode_list),
+        ("country", "country", encode_list),
+        ("exchange", "exchange", encode_list),
+        ("num_employees_from", "numEmployeesFrom", encode_scalar),
+        ("num_employees_to", "numEmployeesTo", encode_scalar),
+        ("ipo_from", "ipoFrom", encode_scalar),
+        ("ipo_to", "ipoTo", encode_scalar),
+        ("q", "q", encode_scalar),
+        ("name", "name", encode_scalar),
+        ("industry", "industry", encode_scalar),
+        ("sector", "sector", encode_scalar),
+        ("size", "size", encode_scalar),
+        ("page", "page", encode_scalar),
+    ),
+    response=CompanySearchResult,
+)
+OP_SEARCH_JOURNALISTS = Operation(
+    "GET",
+    PATH_SEARCH_JOURNALISTS,
+    query=QuerySpec(
+        ("id", "id", encode_list),
+        ("q", "q", encode_scalar),
+        ("name", "name", encode_scalar),
+        ("twitter", "twitter", encode_scalar),
+        ("size", "size", encode_scalar),
+        ("page", "page", encode_scalar),
+        ("source", "source", encode_list),
+        ("topic", "topic", encode_list),
+        ("category", "category", encode_list),
+        ("label", "label", encode_list),
+        ("min_monthly_posts", "minMonthlyPosts", encode_scalar),
+        ("max_monthly_posts", "maxMonthlyPosts", encode_scalar),
+        ("country", "country", encode_list),
+        ("updated_at_from", "updatedAtFrom", encode_scalar),
+        ("updated_at_to", "updatedAtTo", encode_scalar),
+        ("show_num_results", "showNumResults", encode_scalar),
+    ),
+    response=JournalistSearchResult,
+)
+OP_SEARCH_PEOPLE = Operation(
+    "GET",
+    PATH_SEARCH_PEOPLE,
+    query=QuerySpec(
+        ("name", "name", encode_scalar),
+        ("wikidata_id", "wikidataId", encode_list),
+        ("occupation_id", "occupationId", encode_list),
+        ("occupation_label", "occupationLabel", encode_scalar),
+        ("page", "page", encode_scalar),
+        ("size", "size", encode_scalar),
+    ),
+    response=PeopleSearchResult,
+)
+OP_SEARCH_SOURCES = Operation(
+    "GET",
+    PATH_SEARCH_SOURCES,
+    query=QuerySpec(
+        ("domain", "domain", encode_list),
+        ("name", "name", encode_scalar),
+        ("source_group", "sourceGroup", encode_scalar),
+        ("sort_by", "sortBy", encode_scalar),
+        ("page", "page", encode_scalar),
+        ("size", "size", encode_scalar),
+        ("min_monthly_visits", "minMonthlyVisits", encode_scalar),
+        ("max_monthly_visits", "maxMonthlyVisits", encode_scalar),
+        ("min_monthly_posts", "minMonthlyPosts", encode_scalar),
+        ("max_monthly_posts", "maxMonthlyPosts", encode_scalar),
+        ("country", "country", encode_list),
+        ("source_country", "sourceCountry", encode_list),
+        ("source_state", "sourceState", encode_list),
+        ("source_county", "sourceCounty", encode_list),
+        ("source_city", "sourceCity", encode_list),
+        ("source_lat", "sourceLat", encode_scalar),
+        ("source_lon", "sourceLon", encode_scalar),
+        ("source_max_distance", "sourceMaxDistance", encode_scalar),
+        ("category", "category", encode_list),
+        ("topic", "topic", encode_list),
+        ("label", "label", encode_list),
+        ("paywall", "paywall", encode_scalar),
+        ("show_subdomains", "showSubdomains", encode_scalar),
+        ("show_num_results", "showNumResults", encode_scalar),
+    ),
+    response=SourceSearchResult,
+)
+OP_SEARCH_STORIES = Operation(
+    "GET",
+    PATH_SEARCH_STORIES,
+    query=QuerySpec(
+        ("q", "q", encode_scalar),
+        ("name", "name", encode_scalar),
+        ("cluster_id", "clusterId", encode_list),
+        ("exclude_cluster_id", "excludeClusterId", encode_list),
+        ("sort_by", "sortBy", encode_scalar),
+        ("page", "page", encode_scalar),
+        ("size", "size", encode_scalar),
+        ("var_from", "from", encode_scalar),
+        ("to", "to", encode_scalar),
+        ("initialized_from", "initializedFrom", encode_scalar),
+        ("initialized_to", "initializedTo", encode_scalar),
+        ("updated_from", "updatedFrom", encode_scalar),
+        ("updated_to", "updatedTo", encode_scalar),
+        ("topic", "topic", encode_list),
+        ("category", "category", encode_list),
+        ("taxonomy", "taxonomy", encode_list),
+        ("source", "source", encode_list),
+        ("source_group", "sourceGroup", encode_list),
+        ("min_unique_sources", "minUniqueSources", encode_scalar),
+        ("min_source_diversity", "minSourceDiversity", encode_scalar),
+        ("person_wikidata_id", "personWikidataId", encode_list),
+        ("person_name", "personName", encode_scalar),
+        ("company_id", "companyId", encode_list),
+        ("company_name", "companyName", encode_scalar),
+        ("company_domain", "companyDomain", encode_list),
+        ("company_symbol", "companySymbol", encode_list),
+        ("country", "country", encode_list),
+        ("state", "state", encode_list),
+        ("city", "city", encode_list),
+        ("area", "area", encode_list),
+        ("min_cluster_size", "minClusterSize", encode_scalar),
+        ("max_cluster_size", "maxClusterSize", encode_scalar),
+        ("name_exists", "nameExists", encode_scalar),
+        ("positive_sentiment_from", "positiveSentimentFrom", encode_scalar),
+        ("positive_sentiment_to", "positiveSentimentTo", encode_scalar),
+        ("neutral_sentiment_from", "neutralSentimentFrom", encode_scalar),
+        ("neutral_sentiment_to", "neutralSentimentTo", encode_scalar),
+        ("negative_sentiment_from", "negativeSentimentFrom", encode_scalar),
+        ("negative_sentiment_to", "negativeSentimentTo", encode_scalar),
+        ("show_story_page_info", "showStoryPageInfo", encode_scalar),
+        ("show_num_results", "showNumResults", encode_scalar),
+        ("show_duplicates", "showDuplicates", encode_scalar),
+        ("show_highlighting", "showHighlighting", encode_scalar),
+        ("highlight_fragment_size", "highlightFragmentSize", encode_scalar),
+        ("highlight_num_fragments", "highlightNumFragments", encode_scalar),
+        ("highlight_pre_tag", "highlightPreTag", encode_scalar),
+        ("highlight_post_tag", "highlightPostTag", encode_scalar),
+        ("highlight_q", "highlightQ", encode_scalar),
+        ("expand_articles", "expandArticles", encode_scalar),
+    ),
+    response=StorySearchResult,
+)
+OP_SEARCH_SUMMARIZER = Operation(
+    "POST",
+    PATH_SEARCH_SUMMARIZER,
+    query=QuerySpec(
+        ("q", "q", encode_scalar),
+        ("title", "title", encode_scalar),
+        ("desc", "desc", encode_scalar),
+        ("content", "content", encode_scalar),
+        ("summary", "summary", encode_scalar),
+        ("url", "url", encode_scalar),
+        ("article_id", "articleId", encode_list),
+        ("cluster_id", "clusterId", encode_list),
+        ("sort_by", "sortBy", encode_scalar),
+        ("page", "page", encode_scalar),
+        ("size", "size", encode_scalar),
+        ("var_from", "from", encode_scalar),
+        ("to", "to", encode_scalar),
+        ("add_date_from", "addDateFrom", encode_scalar),
+        ("add_date_to", "addDateTo", encode_scalar),
+        ("refresh_date_from", "refreshDateFrom", encode_scalar),
+        ("refresh_date_to", "refreshDateTo", encode_scalar),
+        ("medium", "medium", encode_list),
+        ("source", "source", encode_list),
+        ("source_group", "sourceGroup", encode_list),
+        ("exclude_source_group", "excludeSourceGroup", encode_list),
+        ("exclude_source", "excludeSource", encode_list),
+        ("watchlist", "watchlist", encode_list),
+        ("exclude_watchlist", "excludeWatchlist", encode_list),
+        ("paywall", "paywall", encode_scalar),
+        ("byline", "byline", encode_list),
+        ("author", "author", encode_list),
+        ("exclude_author", "excludeAuthor", encode_list),
+        ("journalist_id", "journalistId", encode_list),
+        ("exclude_journalist_id", "excludeJournalistId", encode_list),
+        ("language", "language", encode_list),
+        ("exclude_language", "excludeLanguage", encode_list),
+        ("search_translation", "searchTranslation", encode_scalar),
+        ("label", "label", encode_list),
+        ("exclude_label", "excludeLabel", encode_list),
+        ("category", "category", encode_list),
+        ("exclude_category", "excludeCategory", encode_list),
+        ("topic", "topic", encode_list),
+        ("exclude_topic", "excludeTopic", encode_list),
+        ("link_to", "linkTo", encode_scalar),
+        ("show_reprints", "showReprints", encode_scalar),
+        ("reprint_group_id", "reprintGroupId", encode_scalar),
+        ("city", "city", encode_list),
+        ("exclude_city", "excludeCity", encode_list),
+        ("area", "area", encode_list),
+        ("state", "state", encode_list),
+        ("exclude_state", "excludeState", encode_list),
+        ("county", "county", encode_list),
+        ("exclude_county", "excludeCounty", encode_list),
+        ("locations_country", "locationsCountry", encode_list),
+        ("country", "country", encode_list),
+        ("exclude_locations_country", "excludeLocationsCountry", encode_list),
+        ("location", "location", encode_list),
+        ("lat", "lat", encode_scalar),
+        ("lon", "lon", encode_scalar),
+        ("max_distance", "maxDistance", encode_scalar),
+        ("source_city", "sourceCity", encode_list),
+        ("exclude_source_city", "excludeSourceCity", encode_list),
+        ("source_county", "sourceCounty", encode_list),
+        ("exclude_source_county", "excludeSourceCounty", encode_list),
+        ("source_country", "sourceCountry", encode_list),
+        ("exclude_source_country", "excludeSourceCountry", encode_list),
+        ("source_state", "sourceState", encode_list),
+        ("exclude_source_state", "excludeSourceState", encode_list),
+        ("source_lat", "sourceLat", encode_scalar),
+        ("source_lon", "sourceLon", encode_scalar),
+        ("source_max_distance", "sourceMaxDistance", encode_scalar),
+        ("person_wikidata_id", "personWikidataId", encode_list),
+        ("exclude_person_wikidata_id", "excludePersonWikidataId", encode_list),
+        ("person_name", "personName", encode_list),
+        ("exclude_person_name", "excludePersonName", encode_list),
+        ("company_id", "companyId", encode_list),
+        ("exclude_company_id", "excludeCompanyId", encode_list),
+        ("company_name", "companyName", encode_scalar),
+        ("company_domain", "companyDomain", encode_list),
+        ("exclude_company_domain", "excludeCompanyDomain", encode_list),
+        ("company_symbol", "companySymbol", encode_list),
+        ("exclude_company_symbol", "excludeCompanySymbol", encode_list),
+        ("show_num_results", "showNumResults", encode_scalar),
+        ("positive_sentiment_from", "positiveSentimentFrom", encode_scalar),
+        ("positive_sentiment_to", "positiveSentimentTo", encode_scalar),
+        ("neutral_sentiment_from", "neutralSentimentFrom", encode_scalar),
+        ("neutral_sentiment_to", "neutralSentimentTo", encode_scalar),
+        ("negative_sentiment_from", "negativeSentimentFrom", encode_scalar),
+        ("negative_sentiment_to", "negativeSentimentTo", encode_scalar),
+        ("taxonomy", "taxonomy", encode_list),
+        ("prefix_taxonomy", "prefixTaxonomy", encode_scalar),
+        ("show_highlighting", "showHighlighting", encode_scalar),
+        ("highlight_fragment_size", "highlightFragmentSize", encode_scalar),
+        ("highlight_num_fragments", "highlightNumFragments", encode_scalar),
+        ("highlight_pre_tag", "highlightPreTag", encode_scalar),
+        ("highlight_post_tag", "highlightPostTag", encode_scalar),
+        ("highlight_q", "highlightQ", encode_scalar),
+    ),
+    body="summary_body",
+    response=SummarySearchResult,
+)
+OP_SEARCH_TOPICS = Operation(
+    "GET",
+    PATH_SEARCH_TOPICS,
+    query=QuerySpec(
+        ("name", "name", encode_scalar),
+        ("category", "category", encode_scalar),
+        ("subcategory", "subcategory", encode_scalar),
+        ("page", "page", encode_scalar),
+        ("size", "size", encode_scalar),
+    ),
+    response=TopicSearchResult,
+)
+OP_SEARCH_WIKIPEDIA = Operation(
+    "GET",
+    PATH_SEARCH_WIKIPEDIA,
+    query=QuerySpec(
+        ("q", "q", encode_scalar),
+        ("title", "title", encode_scalar),
+        ("summary", "summary", encode_scalar),
+        ("text", "text", encode_scalar),
+        ("reference", "reference", encode_scalar),
+        ("id", "id", encode_list),
+        ("wiki_page_id", "wikiPageId", encode_list),
+        ("wiki_revision_id", "wikiRevisionId", encode_list),
+        ("wiki_code", "wikiCode", encode_list),
+        ("wiki_namespace", "wikiNamespace", encode_list),
+        ("wikidata_id", "wikidataId", encode_list),
+        ("wikidata_instance_of_id", "wikidataInstanceOfId", encode_list),
+        ("wikidata_instance_of_label", "wikidataInstanceOfLabel", encode_list),
+        ("category", "category", encode_list),
+        ("section_id", "sectionId", encode_list),
+        ("wiki_revision_from", "wikiRevisionFrom", encode_scalar),
+        ("wiki_revision_to", "wikiRevisionTo", encode_scalar),
+        ("scraped_at_from", "scrapedAtFrom", encode_scalar),
+        ("scraped_at_to", "scrapedAtTo", encode_scalar),
+        ("pageviews_from", "pageviewsFrom", encode_scalar),
+        ("pageviews_to", "pageviewsTo", encode_scalar),
+        ("with_pageviews", "withPageviews", encode_scalar),
+        ("show_num_results", "showNumResults", encode_scalar),
+        ("page", "page", encode_scalar),
+        ("size", "size", encode_scalar),
+        ("sort_by", "sortBy", encode_scalar),
+    ),
+    response=WikipediaSearchResult,
+)
+OP_UPDATE_SOURCE_GROUP = Operation(
+    "PATCH",
+    PATH_UPDATE_SOURCE_GROUP,
+    path_params=(("id", "id"),),
+    body="patch_source_group_params",
+)
+OP_UPDATE_WATCHLIST = Operation(
+    "PATCH",
+    PATH_UPDATE_WATCHLIST,
+    path_params=(("id", "id"),),
+    body="update_watchlist_params",
+)
+OP_VECTOR_SEARCH_ARTICLES = Operation(
+    "POST",
+    PATH_VECTOR_SEARCH_ARTICLES,
+    body="article_search_params",
+    response=ArticlesVectorSearchResult,
+)
+OP_VECTOR_SEARCH_WIKIPEDIA = Operation(
+    "POST",
+    PATH_VECTOR_SEARCH_WIKIPEDIA,
+    body="wikipedia_search_params",
+    response=WikipediaVectorSearchResult,
+)
 
 
 class V1Api:
@@ -113,6 +636,50 @@ class V1Api:
     def __init__(self, api_client: Optional[ApiClient] = None):
         self.api_client = api_client or ApiClient()
 
+    def gather(
+        self,
+        calls: Iterable[Call],
+        max_concurrency: int = 8,
+        return_exceptions: bool = False,
+    ) -> List[Any]:
+        """
+        Run several ``(method, kwargs)`` calls concurrently from sync code.
+
+        The ``_async`` variants run on the client's background event loop, so
+        no event loop is needed in the caller. Results come back in order.
+
+        Example:
+            articles, topics = api.gather([
+                (api.search_articles, {"q": "AI"}),
+                (api.search_topics, {"name": "Markets"}),
+            ])
+        """
+        return gather_sync(
+            self.api_client,
+            calls,
+            max_concurrency=max_concurrency,
+            return_exceptions=return_exceptions,
+        )
+
+    def map(
+        self,
+        method: Callable[..., Any],
+        kwargs_list: Iterable[Mapping[str, Any]],
+        workers: Optional[int] = None,
+    ) -> Iterator[BatchResult[Any]]:
+        """
+        Call a sync method once per kwargs mapping on a thread pool.
+
+        Workers share the client's connection pool and default to its
+        keep-alive size. Results are yielded as they complete; each carries
+        the ``index`` of its kwargs mapping.
+
+        Example:
+            for result in api.map(api.search_articles, [{"q": q} for q in queries]):
+                print(result.index, result.unwrap().num_results)
+        """
+        return map_sync(self.api_client, method, kwargs_list, workers=workers)
+
     # ----------------- create_source_group (sync) ----------------- #
     def create_source_group(self, create_source_group_params: CreateSourceGroupParams):
         """
@@ -122,23 +689,7 @@ class V1Api:
             create_source_group_params (CreateSourceGroupParams): Parameter create_source_group_params (required)
 
         """
-        # Get path template from class attribute
-        path = PATH_CREATE_SOURCE_GROUP
-
-        # --- build query dict on the fly ---
-        params: Dict[str, Any] = {}
-        params = _normalise_query(params)
-
-        resp = self.api_client.request(
-            "POST",
-            path,
-            params=params,
-            json=create_source_group_params.model_dump(
-                by_alias=True, exclude_none=True
-            ),
-        )
-        resp.raise_for_status()
-        return resp.json()
+        return self.api_client.call(OP_CREATE_SOURCE_GROUP, locals())
 
     # ----------------- create_source_group (async) ----------------- #
     async def create_source_group_async(
@@ -151,22 +702,7 @@ class V1Api:
             create_source_group_params (CreateSourceGroupParams): Parameter create_source_group_params (required)
 
         """
-        # Get path template from class attribute
-        path = PATH_CREATE_SOURCE_GROUP
-
-        params: Dict[str, Any] = {}
-        params = _normalise_query(params)
-
-        resp = await self.api_client.request_async(
-            "POST",
-            path,
-            params=params,
-            json=create_source_group_params.model_dump(
-                by_alias=True, exclude_none=True
-            ),
-        )
-        resp.raise_for_status()
-        return resp.json()
+        return await self.api_client.call_async(OP_CREATE_SOURCE_GROUP, locals())
 
     # ----------------- create_watchlist (sync) ----------------- #
     def create_watchlist(self, create_watchlist_params: CreateWatchlistParams):
@@ -177,21 +713,7 @@ class V1Api:
             create_watchlist_params (CreateWatchlistParams): Parameter create_watchlist_params (required)
 
         """
-        # Get path template from class attribute
-        path = PATH_CREATE_WATCHLIST
-
-        # --- build query dict on the fly ---
-        params: Dict[str, Any] = {}
-        params = _normalise_query(params)
-
-        resp = self.api_client.request(
-            "POST",
-            path,
-            params=params,
-            json=create_watchlist_params.model_dump(by_alias=True, exclude_none=True),
-        )
-        resp.raise_for_status()
-        return resp.json()
+        return self.api_client.call(OP_CREATE_WATCHLIST, locals())
 
     # ----------------- create_watchlist (async) ----------------- #
     async def create_watchlist_async(
@@ -204,20 +726,7 @@ class V1Api:
             create_watchlist_params (CreateWatchlistParams): Parameter create_watchlist_params (required)
 
         """
-        # Get path template from class attribute
-        path = PATH_CREATE_WATCHLIST
-
-        params: Dict[str, Any] = {}
-        params = _normalise_query(params)
-
-        resp = await self.api_client.request_async(
-            "POST",
-            path,
-            params=params,
-            json=create_watchlist_params.model_dump(by_alias=True, exclude_none=True),
-        )
-        resp.raise_for_status()
-        return resp.json()
+        return await self.api_client.call_async(OP_CREATE_WATCHLIST, locals())
 
     # ----------------- delete_source_group (sync) ----------------- #
     def delete_source_group(self, id: int):
@@ -228,19 +737,7 @@ class V1Api:
             id (int): Parameter id (required)
 
         """
-        # Get path template from class attribute
-        path = PATH_DELETE_SOURCE_GROUP
-
-        # Replace path parameters
-        path = path.format(id=str(id))
-
-        # --- build query dict on the fly ---
-        params: Dict[str, Any] = {}
-        params = _normalise_query(params)
-
-        resp = self.api_client.request("DELETE", path, params=params)
-        resp.raise_for_status()
-        return resp.json()
+        return self.api_client.call(OP_DELETE_SOURCE_GROUP, locals())
 
     # ----------------- delete_source_group (async) ----------------- #
     async def delete_source_group_async(self, id: int):
@@ -251,18 +748,7 @@ class V1Api:
             id (int): Parameter id (required)
 
         """
-        # Get path template from class attribute
-        path = PATH_DELETE_SOURCE_GROUP
-
-        # Replace path parameters
-        path = path.format(id=str(id))
-
-        params: Dict[str, Any] = {}
-        params = _normalise_query(params)
-
-        resp = await self.api_client.request_async("DELETE", path, params=params)
-        resp.raise_for_status()
-        return resp.json()
+        return await self.api_client.call_async(OP_DELETE_SOURCE_GROUP, locals())
 
     # ----------------- delete_watchlist (sync) ----------------- #
     def delete_watchlist(self, id: int):
@@ -273,19 +759,7 @@ class V1Api:
             id (int): Parameter id (required)
 
         """
-        # Get path template from class attribute
-        path = PATH_DELETE_WATCHLIST
-
-        # Replace path parameters
-        path = path.format(id=str(id))
-
-        # --- build query dict on the fly ---
-        params: Dict[str, Any] = {}
-        params = _normalise_query(params)
-
-        resp = self.api_client.request("DELETE", path, params=params)
-        resp.raise_for_status()
-        return resp.json()
+        return self.api_client.call(OP_DELETE_WATCHLIST, locals())
 
     # ----------------- delete_watchlist (async) ----------------- #
     async def delete_watchlist_async(self, id: int):
@@ -296,18 +770,7 @@ class V1Api:
             id (int): Parameter id (required)
 
         """
-        # Get path template from class attribute
-        path = PATH_DELETE_WATCHLIST
-
-        # Replace path parameters
-        path = path.format(id=str(id))
-
-        params: Dict[str, Any] = {}
-        params = _normalise_query(params)
-
-        resp = await self.api_client.request_async("DELETE", path, params=params)
-        resp.raise_for_status()
-        return resp.json()
+        return await self.api_client.call_async(OP_DELETE_WATCHLIST, locals())
 
     # ----------------- get_journalist_by_id (sync) ----------------- #
     def get_journalist_by_id(self, id: str) -> Journalist:
@@ -320,19 +783,7 @@ class V1Api:
         Returns:
             Journalist: The response
         """
-        # Get path template from class attribute
-        path = PATH_GET_JOURNALIST_BY_ID
-
-        # Replace path parameters
-        path = path.format(id=str(id))
-
-        # --- build query dict on the fly ---
-        params: Dict[str, Any] = {}
-        params = _normalise_query(params)
-
-        resp = self.api_client.request("GET", path, params=params)
-        resp.raise_for_status()
-        return Journalist.model_validate(resp.json())
+        return self.api_client.call(OP_GET_JOURNALIST_BY_ID, locals())
 
     # ----------------- get_journalist_by_id (async) ----------------- #
     async def get_journalist_by_id_async(self, id: str) -> Journalist:
@@ -345,18 +796,7 @@ class V1Api:
         Returns:
             Journalist: The response
         """
-        # Get path template from class attribute
-        path = PATH_GET_JOURNALIST_BY_ID
-
-        # Replace path parameters
-        path = path.format(id=str(id))
-
-        params: Dict[str, Any] = {}
-        params = _normalise_query(params)
-
-        resp = await self.api_client.request_async("GET", path, params=params)
-        resp.raise_for_status()
-        return Journalist.model_validate(resp.json())
+        return await self.api_client.call_async(OP_GET_JOURNALIST_BY_ID, locals())
 
     # ----------------- get_source_group (sync) ----------------- #
     def get_source_group(self, id: int):
@@ -367,19 +807,7 @@ class V1Api:
             id (int): Parameter id (required)
 
         """
-        # Get path template from class attribute
-        path = PATH_GET_SOURCE_GROUP
-
-        # Replace path parameters
-        path = path.format(id=str(id))
-
-        # --- build query dict on the fly ---
-        params: Dict[str, Any] = {}
-        params = _normalise_query(params)
-
-        resp = self.api_client.request("GET", path, params=params)
-        resp.raise_for_status()
-        return resp.json()
+        return self.api_client.call(OP_GET_SOURCE_GROUP, locals())
 
     # ----------------- get_source_group (async) ----------------- #
     async def get_source_group_async(self, id: int):
@@ -390,18 +818,7 @@ class V1Api:
             id (int): Parameter id (required)
 
         """
-        # Get path template from class attribute
-        path = PATH_GET_SOURCE_GROUP
-
-        # Replace path parameters
-        path = path.format(id=str(id))
-
-        params: Dict[str, Any] = {}
-        params = _normalise_query(params)
-
-        resp = await self.api_client.request_async("GET", path, params=params)
-        resp.raise_for_status()
-        return resp.json()
+        return await self.api_client.call_async(OP_GET_SOURCE_GROUP, locals())
 
     # ----------------- get_story_counts (sync) ----------------- #
     def get_story_counts(
@@ -516,116 +933,7 @@ class V1Api:
         Returns:
             StatResult: The response
         """
-        # Get path template from class attribute
-        path = PATH_GET_STORY_COUNTS
-
-        # --- build query dict on the fly ---
-        params: Dict[str, Any] = {}
-        if q is not None:
-            params["q"] = q
-        if name is not None:
-            params["name"] = name
-        if cluster_id is not None:
-            params["clusterId"] = cluster_id
-        if exclude_cluster_id is not None:
-            params["excludeClusterId"] = exclude_cluster_id
-        if sort_by is not None:
-            params["sortBy"] = sort_by
-        if page is not None:
-            params["page"] = page
-        if size is not None:
-            params["size"] = size
-        if var_from is not None:
-            params["from"] = var_from
-        if to is not None:
-            params["to"] = to
-        if initialized_from is not None:
-            params["initializedFrom"] = initialized_from
-        if initialized_to is not None:
-            params["initializedTo"] = initialized_to
-        if updated_from is not None:
-            params["updatedFrom"] = updated_from
-        if updated_to is not None:
-            params["updatedTo"] = updated_to
-        if topic is not None:
-            params["topic"] = topic
-        if category is not None:
-            params["category"] = category
-        if taxonomy is not None:
-            params["taxonomy"] = taxonomy
-        if source is not None:
-            params["source"] = source
-        if source_group is not None:
-            params["sourceGroup"] = source_group
-        if min_unique_sources is not None:
-            params["minUniqueSources"] = min_unique_sources
-        if min_source_diversity is not None:
-            params["minSourceDiversity"] = min_source_diversity
-        if person_wikidata_id is not None:
-            params["personWikidataId"] = person_wikidata_id
-        if person_name is not None:
-            params["personName"] = person_name
-        if company_id is not None:
-            params["companyId"] = company_id
-        if company_name is not None:
-            params["companyName"] = company_name
-        if company_domain is not None:
-            params["companyDomain"] = company_domain
-        if company_symbol is not None:
-            params["companySymbol"] = company_symbol
-        if country is not None:
-            params["country"] = country
-        if state is not None:
-            params["state"] = state
-        if city is not None:
-            params["city"] = city
-        if area is not None:
-            params["area"] = area
-        if min_cluster_size is not None:
-            params["minClusterSize"] = min_cluster_size
-        if max_cluster_size is not None:
-            params["maxClusterSize"] = max_cluster_size
-        if name_exists is not None:
-            params["nameExists"] = name_exists
-        if positive_sentiment_from is not None:
-            params["positiveSentimentFrom"] = positive_sentiment_from
-        if positive_sentiment_to is not None:
-            params["positiveSentimentTo"] = positive_sentiment_to
-        if neutral_sentiment_from is not None:
-            params["neutralSentimentFrom"] = neutral_sentiment_from
-        if neutral_sentiment_to is not None:
-            params["neutralSentimentTo"] = neutral_sentiment_to
-        if negative_sentiment_from is not None:
-            params["negativeSentimentFrom"] = negative_sentiment_from
-        if negative_sentiment_to is not None:
-            params["negativeSentimentTo"] = negative_sentiment_to
-        if show_story_page_info is not None:
-            params["showStoryPageInfo"] = show_story_page_info
-        if show_num_results is not None:
-            params["showNumResults"] = show_num_results
-        if show_duplicates is not None:
-            params["showDuplicates"] = show_duplicates
-        if show_highlighting is not None:
-            params["showHighlighting"] = show_highlighting
-        if highlight_fragment_size is not None:
-            params["highlightFragmentSize"] = highlight_fragment_size
-        if highlight_num_fragments is not None:
-            params["highlightNumFragments"] = highlight_num_fragments
-        if highlight_pre_tag is not None:
-            params["highlightPreTag"] = highlight_pre_tag
-        if highlight_post_tag is not None:
-            params["highlightPostTag"] = highlight_post_tag
-        if highlight_q is not None:
-            params["highlightQ"] = highlight_q
-        if expand_articles is not None:
-            params["expandArticles"] = expand_articles
-        if split_by is not None:
-            params["splitBy"] = split_by
-        params = _normalise_query(params)
-
-        resp = self.api_client.request("GET", path, params=params)
-        resp.raise_for_status()
-        return StatResult.model_validate(resp.json())
+        return self.api_client.call(OP_GET_STORY_COUNTS, locals())
 
     # ----------------- get_story_counts (async) ----------------- #
     async def get_story_counts_async(
@@ -740,115 +1048,7 @@ class V1Api:
         Returns:
             StatResult: The response
         """
-        # Get path template from class attribute
-        path = PATH_GET_STORY_COUNTS
-
-        params: Dict[str, Any] = {}
-        if q is not None:
-            params["q"] = q
-        if name is not None:
-            params["name"] = name
-        if cluster_id is not None:
-            params["clusterId"] = cluster_id
-        if exclude_cluster_id is not None:
-            params["excludeClusterId"] = exclude_cluster_id
-        if sort_by is not None:
-            params["sortBy"] = sort_by
-        if page is not None:
-            params["page"] = page
-        if size is not None:
-            params["size"] = size
-        if var_from is not None:
-            params["from"] = var_from
-        if to is not None:
-            params["to"] = to
-        if initialized_from is not None:
-            params["initializedFrom"] = initialized_from
-        if initialized_to is not None:
-            params["initializedTo"] = initialized_to
-        if updated_from is not None:
-            params["updatedFrom"] = updated_from
-        if updated_to is not None:
-            params["updatedTo"] = updated_to
-        if topic is not None:
-            params["topic"] = topic
-        if category is not None:
-            params["category"] = category
-        if taxonomy is not None:
-            params["taxonomy"] = taxonomy
-        if source is not None:
-            params["source"] = source
-        if source_group is not None:
-            params["sourceGroup"] = source_group
-        if min_unique_sources is not None:
-            params["minUniqueSources"] = min_unique_sources
-        if min_source_diversity is not None:
-            params["minSourceDiversity"] = min_source_diversity
-        if person_wikidata_id is not None:
-            params["personWikidataId"] = person_wikidata_id
-        if person_name is not None:
-            params["personName"] = person_name
-        if company_id is not None:
-            params["companyId"] = company_id
-        if company_name is not None:
-            params["companyName"] = company_name
-        if company_domain is not None:
-            params["companyDomain"] = company_domain
-        if company_symbol is not None:
-            params["companySymbol"] = company_symbol
-        if country is not None:
-            params["country"] = country
-        if state is not None:
-            params["state"] = state
-        if city is not None:
-            params["city"] = city
-        if area is not None:
-            params["area"] = area
-        if min_cluster_size is not None:
-            params["minClusterSize"] = min_cluster_size
-        if max_cluster_size is not None:
-            params["maxClusterSize"] = max_cluster_size
-        if name_exists is not None:
-            params["nameExists"] = name_exists
-        if positive_sentiment_from is not None:
-            params["positiveSentimentFrom"] = positive_sentiment_from
-        if positive_sentiment_to is not None:
-            params["positiveSentimentTo"] = positive_sentiment_to
-        if neutral_sentiment_from is not None:
-            params["neutralSentimentFrom"] = neutral_sentiment_from
-        if neutral_sentiment_to is not None:
-            params["neutralSentimentTo"] = neutral_sentiment_to
-        if negative_sentiment_from is not None:
-            params["negativeSentimentFrom"] = negative_sentiment_from
-        if negative_sentiment_to is not None:
-            params["negativeSentimentTo"] = negative_sentiment_to
-        if show_story_page_info is not None:
-            params["showStoryPageInfo"] = show_story_page_info
-        if show_num_results is not None:
-            params["showNumResults"] = show_num_results
-        if show_duplicates is not None:
-            params["showDuplicates"] = show_duplicates
-        if show_highlighting is not None:
-            params["showHighlighting"] = show_highlighting
-        if highlight_fragment_size is not None:
-            params["highlightFragmentSize"] = highlight_fragment_size
-        if highlight_num_fragments is not None:
-            params["highlightNumFragments"] = highlight_num_fragments
-        if highlight_pre_tag is not None:
-            params["highlightPreTag"] = highlight_pre_tag
-        if highlight_post_tag is not None:
-            params["highlightPostTag"] = highlight_post_tag
-        if highlight_q is not None:
-            params["highlightQ"] = highlight_q
-        if expand_articles is not None:
-            params["expandArticles"] = expand_articles
-        if split_by is not None:
-            params["splitBy"] = split_by
-        params = _normalise_query(params)
-
-        resp = await self.api_client.request_async("GET", path, params=params)
-        resp.raise_for_status()
-        return StatResult.model_validate(resp.json())
+        return await self.api_client.call_async(OP_GET_STORY_COUNTS, locals())
 
     # ----------------- get_story_history (sync) ----------------- #
     def get_story_history(
@@ -876,30 +1076,7 @@ class V1Api:
         Returns:
             StoryHistoryResult: The response
         """
-        # Get path template from class attribute
-        path = PATH_GET_STORY_HISTORY
-
-        # --- build query dict on the fly ---
-        params: Dict[str, Any] = {}
-        if cluster_id is not None:
-            params["clusterId"] = cluster_id
-        if var_from is not None:
-            params["from"] = var_from
-        if to is not None:
-            params["to"] = to
-        if sort_by is not None:
-            params["sortBy"] = sort_by
-        if page is not None:
-            params["page"] = page
-        if size is not None:
-            params["size"] = size
-        if changelog_exists is not None:
-            params["changelogExists"] = changelog_exists
-        params = _normalise_query(params)
-
-        resp = self.api_client.request("GET", path, params=params)
-        resp.raise_for_status()
-        return StoryHistoryResult.model_validate(resp.json())
+        return self.api_client.call(OP_GET_STORY_HISTORY, locals())
 
     # ----------------- get_story_history (async) ----------------- #
     async def get_story_history_async(
@@ -928,29 +1105,7 @@ class V1Api:
         Returns:
             StoryHistoryResult: The response
         """
-        # Get path template from class attribute
-        path = PATH_GET_STORY_HISTORY
-
-        params: Dict[str, Any] = {}
-        if cluster_id is not None:
-            params["clusterId"] = cluster_id
-        if var_from is not None:
-            params["from"] = var_from
-        if to is not None:
-            params["to"] = to
-        if sort_by is not None:
-            params["sortBy"] = sort_by
-        if page is not None:
-            params["page"] = page
-        if size is not None:
-            params["size"] = size
-        if changelog_exists is not None:
-            params["changelogExists"] = changelog_exists
-        params = _normalise_query(params)
-
-        resp = await self.api_client.request_async("GET", path, params=params)
-        resp.raise_for_status()
-        return StoryHistoryResult.model_validate(resp.json())
+        return await self.api_client.call_async(OP_GET_STORY_HISTORY, locals())
 
     # ----------------- get_watchlist (sync) ----------------- #
     def get_watchlist(self, id: int):
@@ -961,19 +1116,7 @@ class V1Api:
             id (int): Parameter id (required)
 
         """
-        # Get path template from class attribute
-        path = PATH_GET_WATCHLIST
-
-        # Replace path parameters
-        path = path.format(id=str(id))
-
-        # --- build query dict on the fly ---
-        params: Dict[str, Any] = {}
-        params = _normalise_query(params)
-
-        resp = self.api_client.request("GET", path, params=params)
-        resp.raise_for_status()
-        return resp.json()
+        return self.api_client.call(OP_GET_WATCHLIST, locals())
 
     # ----------------- get_watchlist (async) ----------------- #
     async def get_watchlist_async(self, id: int):
@@ -984,18 +1127,7 @@ class V1Api:
             id (int): Parameter id (required)
 
         """
-        # Get path template from class attribute
-        path = PATH_GET_WATCHLIST
-
-        # Replace path parameters
-        path = path.format(id=str(id))
-
-        params: Dict[str, Any] = {}
-        params = _normalise_query(params)
-
-        resp = await self.api_client.request_async("GET", path, params=params)
-        resp.raise_for_status()
-        return resp.json()
+        return await self.api_client.call_async(OP_GET_WATCHLIST, locals())
 
     # ----------------- list_source_groups (sync) ----------------- #
     def list_source_groups(
@@ -1019,28 +1151,7 @@ class V1Api:
             size (Optional[str]): The number of items per page.   _Must be at least 1_.   _Default value 10_.
 
         """
-        # Get path template from class attribute
-        path = PATH_LIST_SOURCE_GROUPS
-
-        # --- build query dict on the fly ---
-        params: Dict[str, Any] = {}
-        if name is not None:
-            params["name"] = name
-        if domain is not None:
-            params["domain"] = domain
-        if page is not None:
-            params["page"] = page
-        if size is not None:
-            params["size"] = size
-        if sort_by is not None:
-            params["sortBy"] = sort_by
-        if sort_order is not None:
-            params["sortOrder"] = sort_order
-        params = _normalise_query(params)
-
-        resp = self.api_client.request("GET", path, params=params)
-        resp.raise_for_status()
-        return resp.json()
+        return self.api_client.call(OP_LIST_SOURCE_GROUPS, locals())
 
     # ----------------- list_source_groups (async) ----------------- #
     async def list_source_groups_async(
@@ -1064,27 +1175,7 @@ class V1Api:
             size (Optional[str]): The number of items per page.   _Must be at least 1_.   _Default value 10_.
 
         """
-        # Get path template from class attribute
-        path = PATH_LIST_SOURCE_GROUPS
-
-        params: Dict[str, Any] = {}
-        if name is not None:
-            params["name"] = name
-        if domain is not None:
-            params["domain"] = domain
-        if page is not None:
-            params["page"] = page
-        if size is not None:
-            params["size"] = size
-        if sort_by is not None:
-            params["sortBy"] = sort_by
-        if sort_order is not None:
-            params["sortOrder"] = sort_order
-        params = _normalise_query(params)
-
-        resp = await self.api_client.request_async("GET", path, params=params)
-        resp.raise_for_status()
-        return resp.json()
+        return await self.api_client.call_async(OP_LIST_SOURCE_GROUPS, locals())
 
     # ----------------- list_watchlists (sync) ----------------- #
     def list_watchlists(
@@ -1106,26 +1197,7 @@ class V1Api:
             size (Optional[str]): The number of items per page.   _Must be at least 1_.   _Default value 10_.
 
         """
-        # Get path template from class attribute
-        path = PATH_LIST_WATCHLISTS
-
-        # --- build query dict on the fly ---
-        params: Dict[str, Any] = {}
-        if name is not None:
-            params["name"] = name
-        if page is not None:
-            params["page"] = page
-        if size is not None:
-            params["size"] = size
-        if sort_by is not None:
-            params["sortBy"] = sort_by
-        if sort_order is not None:
-            params["sortOrder"] = sort_order
-        params = _normalise_query(params)
-
-        resp = self.api_client.request("GET", path, params=params)
-        resp.raise_for_status()
-        return resp.json()
+        return self.api_client.call(OP_LIST_WATCHLISTS, locals())
 
     # ----------------- list_watchlists (async) ----------------- #
     async def list_watchlists_async(
@@ -1147,25 +1219,7 @@ class V1Api:
             size (Optional[str]): The number of items per page.   _Must be at least 1_.   _Default value 10_.
 
         """
-        # Get path template from class attribute
-        path = PATH_LIST_WATCHLISTS
-
-        params: Dict[str, Any] = {}
-        if name is not None:
-            params["name"] = name
-        if page is not None:
-            params["page"] = page
-        if size is not None:
-            params["size"] = size
-        if sort_by is not None:
-            params["sortBy"] = sort_by
-        if sort_order is not None:
-            params["sortOrder"] = sort_order
-        params = _normalise_query(params)
-
-        resp = await self.api_client.request_async("GET", path, params=params)
-        resp.raise_for_status()
-        return resp.json()
+        return await self.api_client.call_async(OP_LIST_WATCHLISTS, locals())
 
     # ----------------- resolve_source_groups (sync) ----------------- #
     def resolve_source_groups(self, name: Optional[List[str]] = None):
@@ -1176,18 +1230,7 @@ class V1Api:
             name (Optional[List[str]]): Source group names to resolve (max 100)
 
         """
-        # Get path template from class attribute
-        path = PATH_RESOLVE_SOURCE_GROUPS
-
-        # --- build query dict on the fly ---
-        params: Dict[str, Any] = {}
-        if name is not None:
-            params["name"] = name
-        params = _normalise_query(params)
-
-        resp = self.api_client.request("GET", path, params=params)
-        resp.raise_for_status()
-        return resp.json()
+        return self.api_client.call(OP_RESOLVE_SOURCE_GROUPS, locals())
 
     # ----------------- resolve_source_groups (async) ----------------- #
     async def resolve_source_groups_async(self, name: Optional[List[str]] = None):
@@ -1198,17 +1241,7 @@ class V1Api:
             name (Optional[List[str]]): Source group names to resolve (max 100)
 
         """
-        # Get path template from class attribute
-        path = PATH_RESOLVE_SOURCE_GROUPS
-
-        params: Dict[str, Any] = {}
-        if name is not None:
-            params["name"] = name
-        params = _normalise_query(params)
-
-        resp = await self.api_client.request_async("GET", path, params=params)
-        resp.raise_for_status()
-        return resp.json()
+        return await self.api_client.call_async(OP_RESOLVE_SOURCE_GROUPS, locals())
 
     # ----------------- resolve_watchlists (sync) ----------------- #
     def resolve_watchlists(self, name: Optional[List[str]] = None):
@@ -1219,18 +1252,7 @@ class V1Api:
             name (Optional[List[str]]): Watchlist names to resolve (max 100)
 
         """
-        # Get path template from class attribute
-        path = PATH_RESOLVE_WATCHLISTS
-
-        # --- build query dict on the fly ---
-        params: Dict[str, Any] = {}
-        if name is not None:
-            params["name"] = name
-        params = _normalise_query(params)
-
-        resp = self.api_client.request("GET", path, params=params)
-        resp.raise_for_status()
-        return resp.json()
+        return self.api_client.call(OP_RESOLVE_WATCHLISTS, locals())
 
     # ----------------- resolve_watchlists (async) ----------------- #
     async def resolve_watchlists_async(self, name: Optional[List[str]] = None):
@@ -1241,17 +1263,7 @@ class V1Api:
             name (Optional[List[str]]): Watchlist names to resolve (max 100)
 
         """
-        # Get path template from class attribute
-        path = PATH_RESOLVE_WATCHLISTS
-
-        params: Dict[str, Any] = {}
-        if name is not None:
-            params["name"] = name
-        params = _normalise_query(params)
-
-        resp = await self.api_client.request_async("GET", path, params=params)
-        resp.raise_for_status()
-        return resp.json()
+        return await self.api_client.call_async(OP_RESOLVE_WATCHLISTS, locals())
 
     # ----------------- search_articles (sync) ----------------- #
     def search_articles(
@@ -1451,202 +1463,7 @@ class V1Api:
         Returns:
             QuerySearchResult: The response
         """
-        # Get path template from class attribute
-        path = PATH_SEARCH_ARTICLES
-
-        # --- build query dict on the fly ---
-        params: Dict[str, Any] = {}
-        if q is not None:
-            params["q"] = q
-        if title is not None:
-            params["title"] = title
-        if desc is not None:
-            params["desc"] = desc
-        if content is not None:
-            params["content"] = content
-        if summary is not None:
-            params["summary"] = summary
-        if url is not None:
-            params["url"] = url
-        if article_id is not None:
-            params["articleId"] = article_id
-        if cluster_id is not None:
-            params["clusterId"] = cluster_id
-        if sort_by is not None:
-            params["sortBy"] = sort_by
-        if page is not None:
-            params["page"] = page
-        if size is not None:
-            params["size"] = size
-        if var_from is not None:
-            params["from"] = var_from
-        if to is not None:
-            params["to"] = to
-        if add_date_from is not None:
-            params["addDateFrom"] = add_date_from
-        if add_date_to is not None:
-            params["addDateTo"] = add_date_to
-        if refresh_date_from is not None:
-            params["refreshDateFrom"] = refresh_date_from
-        if refresh_date_to is not None:
-            params["refreshDateTo"] = refresh_date_to
-        if medium is not None:
-            params["medium"] = medium
-        if source is not None:
-            params["source"] = source
-        if source_group is not None:
-            params["sourceGroup"] = source_group
-        if exclude_source_group is not None:
-            params["excludeSourceGroup"] = exclude_source_group
-        if exclude_source is not None:
-            params["excludeSource"] = exclude_source
-        if watchlist is not None:
-            params["watchlist"] = watchlist
-        if exclude_watchlist is not None:
-            params["excludeWatchlist"] = exclude_watchlist
-        if paywall is not None:
-            params["paywall"] = paywall
-        if byline is not None:
-            params["byline"] = byline
-        if author is not None:
-            params["author"] = author
-        if exclude_author is not None:
-            params["excludeAuthor"] = exclude_author
-        if journalist_id is not None:
-            params["journalistId"] = journalist_id
-        if exclude_journalist_id is not None:
-            params["excludeJournalistId"] = exclude_journalist_id
-        if language is not None:
-            params["language"] = language
-        if exclude_language is not None:
-            params["excludeLanguage"] = exclude_language
-        if search_translation is not None:
-            params["searchTranslation"] = search_translation
-        if label is not None:
-            params["label"] = label
-        if exclude_label is not None:
-            params["excludeLabel"] = exclude_label
-        if category is not None:
-            params["category"] = category
-        if exclude_category is not None:
-            params["excludeCategory"] = exclude_category
-        if topic is not None:
-            params["topic"] = topic
-        if exclude_topic is not None:
-            params["excludeTopic"] = exclude_topic
-        if link_to is not None:
-            params["linkTo"] = link_to
-        if show_reprints is not None:
-            params["showReprints"] = show_reprints
-        if reprint_group_id is not None:
-            params["reprintGroupId"] = reprint_group_id
-        if city is not None:
-            params["city"] = city
-        if exclude_city is not None:
-            params["excludeCity"] = exclude_city
-        if area is not None:
-            params["area"] = area
-        if state is not None:
-            params["state"] = state
-        if exclude_state is not None:
-            params["excludeState"] = exclude_state
-        if county is not None:
-            params["county"] = county
-        if exclude_county is not None:
-            params["excludeCounty"] = exclude_county
-        if locations_country is not None:
-            params["locationsCountry"] = locations_country
-        if country is not None:
-            params["country"] = country
-        if exclude_locations_country is not None:
-            params["excludeLocationsCountry"] = exclude_locations_country
-        if location is not None:
-            params["location"] = location
-        if lat is not None:
-            params["lat"] = lat
-        if lon is not None:
-            params["lon"] = lon
-        if max_distance is not None:
-            params["maxDistance"] = max_distance
-        if source_city is not None:
-            params["sourceCity"] = source_city
-        if exclude_source_city is not None:
-            params["excludeSourceCity"] = exclude_source_city
-        if source_county is not None:
-            params["sourceCounty"] = source_county
-        if exclude_source_county is not None:
-            params["excludeSourceCounty"] = exclude_source_county
-        if source_country is not None:
-            params["sourceCountry"] = source_country
-        if exclude_source_country is not None:
-            params["excludeSourceCountry"] = exclude_source_country
-        if source_state is not None:
-            params["sourceState"] = source_state
-        if exclude_source_state is not None:
-            params["excludeSourceState"] = exclude_source_state
-        if source_lat is not None:
-            params["sourceLat"] = source_lat
-        if source_lon is not None:
-            params["sourceLon"] = source_lon
-        if source_max_distance is not None:
-            params["sourceMaxDistance"] = source_max_distance
-        if person_wikidata_id is not None:
-            params["personWikidataId"] = person_wikidata_id
-        if exclude_person_wikidata_id is not None:
-            params["excludePersonWikidataId"] = exclude_person_wikidata_id
-        if person_name is not None:
-            params["personName"] = person_name
-        if exclude_person_name is not None:
-            params["excludePersonName"] = exclude_person_name
-        if company_id is not None:
-            params["companyId"] = company_id
-        if exclude_company_id is not None:
-            params["excludeCompanyId"] = exclude_company_id
-        if company_name is not None:
-            params["companyName"] = company_name
-        if company_domain is not None:
-            params["companyDomain"] = company_domain
-        if exclude_company_domain is not None:
-            params["excludeCompanyDomain"] = exclude_company_domain
-        if company_symbol is not None:
-            params["companySymbol"] = company_symbol
-        if exclude_company_symbol is not None:
-            params["excludeCompanySymbol"] = exclude_company_symbol
-        if show_num_results is not None:
-            params["showNumResults"] = show_num_results
-        if positive_sentiment_from is not None:
-            params["positiveSentimentFrom"] = positive_sentiment_from
-        if positive_sentiment_to is not None:
-            params["positiveSentimentTo"] = positive_sentiment_to
-        if neutral_sentiment_from is not None:
-            params["neutralSentimentFrom"] = neutral_sentiment_from
-        if neutral_sentiment_to is not None:
-            params["neutralSentimentTo"] = neutral_sentiment_to
-        if negative_sentiment_from is not None:
-            params["negativeSentimentFrom"] = negative_sentiment_from
-        if negative_sentiment_to is not None:
-            params["negativeSentimentTo"] = negative_sentiment_to
-        if taxonomy is not None:
-            params["taxonomy"] = taxonomy
-        if prefix_taxonomy is not None:
-            params["prefixTaxonomy"] = prefix_taxonomy
-        if show_highlighting is not None:
-            params["showHighlighting"] = show_highlighting
-        if highlight_fragment_size is not None:
-            params["highlightFragmentSize"] = highlight_fragment_size
-        if highlight_num_fragments is not None:
-            params["highlightNumFragments"] = highlight_num_fragments
-        if highlight_pre_tag is not None:
-            params["highlightPreTag"] = highlight_pre_tag
-        if highlight_post_tag is not None:
-            params["highlightPostTag"] = highlight_post_tag
-        if highlight_q is not None:
-            params["highlightQ"] = highlight_q
-        params = _normalise_query(params)
-
-        resp = self.api_client.request("GET", path, params=params)
-        resp.raise_for_status()
-        return QuerySearchResult.model_validate(resp.json())
+        return self.api_client.call(OP_SEARCH_ARTICLES, locals())
 
     # ----------------- search_articles (async) ----------------- #
     async def search_articles_async(
@@ -1846,201 +1663,7 @@ class V1Api:
         Returns:
             QuerySearchResult: The response
         """
-        # Get path template from class attribute
-        path = PATH_SEARCH_ARTICLES
-
-        params: Dict[str, Any] = {}
-        if q is not None:
-            params["q"] = q
-        if title is not None:
-            params["title"] = title
-        if desc is not None:
-            params["desc"] = desc
-        if content is not None:
-            params["content"] = content
-        if summary is not None:
-            params["summary"] = summary
-        if url is not None:
-            params["url"] = url
-        if article_id is not None:
-            params["articleId"] = article_id
-        if cluster_id is not None:
-            params["clusterId"] = cluster_id
-        if sort_by is not None:
-            params["sortBy"] = sort_by
-        if page is not None:
-            params["page"] = page
-        if size is not None:
-            params["size"] = size
-        if var_from is not None:
-            params["from"] = var_from
-        if to is not None:
-            params["to"] = to
-        if add_date_from is not None:
-            params["addDateFrom"] = add_date_from
-        if add_date_to is not None:
-            params["addDateTo"] = add_date_to
-        if refresh_date_from is not None:
-            params["refreshDateFrom"] = refresh_date_from
-        if refresh_date_to is not None:
-            params["refreshDateTo"] = refresh_date_to
-        if medium is not None:
-            params["medium"] = medium
-        if source is not None:
-            params["source"] = source
-        if source_group is not None:
-            params["sourceGroup"] = source_group
-        if exclude_source_group is not None:
-            params["excludeSourceGroup"] = exclude_source_group
-        if exclude_source is not None:
-            params["excludeSource"] = exclude_source
-        if watchlist is not None:
-            params["watchlist"] = watchlist
-        if exclude_watchlist is not None:
-            params["excludeWatchlist"] = exclude_watchlist
-        if paywall is not None:
-            params["paywall"] = paywall
-        if byline is not None:
-            params["byline"] = byline
-        if author is not None:
-            params["author"] = author
-        if exclude_author is not None:
-            params["excludeAuthor"] = exclude_author
-        if journalist_id is not None:
-            params["journalistId"] = journalist_id
-        if exclude_journalist_id is not None:
-            params["excludeJournalistId"] = exclude_journalist_id
-        if language is not None:
-            params["language"] = language
-        if exclude_language is not None:
-            params["excludeLanguage"] = exclude_language
-        if search_translation is not None:
-            params["searchTranslation"] = search_translation
-        if label is not None:
-            params["label"] = label
-        if exclude_label is not None:
-            params["excludeLabel"] = exclude_label
-        if category is not None:
-            params["category"] = category
-        if exclude_category is not None:
-            params["excludeCategory"] = exclude_category
-        if topic is not None:
-            params["topic"] = topic
-        if exclude_topic is not None:
-            params["excludeTopic"] = exclude_topic
-        if link_to is not None:
-            params["linkTo"] = link_to
-        if show_reprints is not None:
-            params["showReprints"] = show_reprints
-        if reprint_group_id is not None:
-            params["reprintGroupId"] = reprint_group_id
-        if city is not None:
-            params["city"] = city
-        if exclude_city is not None:
-            params["excludeCity"] = exclude_city
-        if area is not None:
-            params["area"] = area
-        if state is not None:
-            params["state"] = state
-        if exclude_state is not None:
-            params["excludeState"] = exclude_state
-        if county is not None:
-            params["county"] = county
-        if exclude_county is not None:
-            params["excludeCounty"] = exclude_county
-        if locations_country is not None:
-            params["locationsCountry"] = locations_country
-        if country is not None:
-            params["country"] = country
-        if exclude_locations_country is not None:
-            params["excludeLocationsCountry"] = exclude_locations_country
-        if location is not None:
-            params["location"] = location
-        if lat is not None:
-            params["lat"] = lat
-        if lon is not None:
-            params["lon"] = lon
-        if max_distance is not None:
-            params["maxDistance"] = max_distance
-        if source_city is not None:
-            params["sourceCity"] = source_city
-        if exclude_source_city is not None:
-            params["excludeSourceCity"] = exclude_source_city
-        if source_county is not None:
-            params["sourceCounty"] = source_county
-        if exclude_source_county is not None:
-            params["excludeSourceCounty"] = exclude_source_county
-        if source_country is not None:
-            params["sourceCountry"] = source_country
-        if exclude_source_country is not None:
-            params["excludeSourceCountry"] = exclude_source_country
-        if source_state is not None:
-            params["sourceState"] = source_state
-        if exclude_source_state is not None:
-            params["excludeSourceState"] = exclude_source_state
-        if source_lat is not None:
-            params["sourceLat"] = source_lat
-        if source_lon is not None:
-            params["sourceLon"] = source_lon
-        if source_max_distance is not None:
-            params["sourceMaxDistance"] = source_max_distance
-        if person_wikidata_id is not None:
-            params["personWikidataId"] = person_wikidata_id
-        if exclude_person_wikidata_id is not None:
-            params["excludePersonWikidataId"] = exclude_person_wikidata_id
-        if person_name is not None:
-            params["personName"] = person_name
-        if exclude_person_name is not None:
-            params["excludePersonName"] = exclude_person_name
-        if company_id is not None:
-            params["companyId"] = company_id
-        if exclude_company_id is not None:
-            params["excludeCompanyId"] = exclude_company_id
-        if company_name is not None:
-            params["companyName"] = company_name
-        if company_domain is not None:
-            params["companyDomain"] = company_domain
-        if exclude_company_domain is not None:
-            params["excludeCompanyDomain"] = exclude_company_domain
-        if company_symbol is not None:
-            params["companySymbol"] = company_symbol
-        if exclude_company_symbol is not None:
-            params["excludeCompanySymbol"] = exclude_company_symbol
-        if show_num_results is not None:
-            params["showNumResults"] = show_num_results
-        if positive_sentiment_from is not None:
-            params["positiveSentimentFrom"] = positive_sentiment_from
-        if positive_sentiment_to is not None:
-            params["positiveSentimentTo"] = positive_sentiment_to
-        if neutral_sentiment_from is not None:
-            params["neutralSentimentFrom"] = neutral_sentiment_from
-        if neutral_sentiment_to is not None:
-            params["neutralSentimentTo"] = neutral_sentiment_to
-        if negative_sentiment_from is not None:
-            params["negativeSentimentFrom"] = negative_sentiment_from
-        if negative_sentiment_to is not None:
-            params["negativeSentimentTo"] = negative_sentiment_to
-        if taxonomy is not None:
-            params["taxonomy"] = taxonomy
-        if prefix_taxonomy is not None:
-            params["prefixTaxonomy"] = prefix_taxonomy
-        if show_highlighting is not None:
-            params["showHighlighting"] = show_highlighting
-        if highlight_fragment_size is not None:
-            params["highlightFragmentSize"] = highlight_fragment_size
-        if highlight_num_fragments is not None:
-            params["highlightNumFragments"] = highlight_num_fragments
-        if highlight_pre_tag is not None:
-            params["highlightPreTag"] = highlight_pre_tag
-        if highlight_post_tag is not None:
-            params["highlightPostTag"] = highlight_post_tag
-        if highlight_q is not None:
-            params["highlightQ"] = highlight_q
-        params = _normalise_query(params)
-
-        resp = await self.api_client.request_async("GET", path, params=params)
-        resp.raise_for_status()
-        return QuerySearchResult.model_validate(resp.json())
+        return await self.api_client.call_async(OP_SEARCH_ARTICLES, locals())
 
     # ----------------- search_companies (sync) ----------------- #
     def search_companies(
@@ -2084,46 +1707,7 @@ class V1Api:
         Returns:
             CompanySearchResult: The response
         """
-        # Get path template from class attribute
-        path = PATH_SEARCH_COMPANIES
-
-        # --- build query dict on the fly ---
-        params: Dict[str, Any] = {}
-        if id is not None:
-            params["id"] = id
-        if symbol is not None:
-            params["symbol"] = symbol
-        if domain is not None:
-            params["domain"] = domain
-        if country is not None:
-            params["country"] = country
-        if exchange is not None:
-            params["exchange"] = exchange
-        if num_employees_from is not None:
-            params["numEmployeesFrom"] = num_employees_from
-        if num_employees_to is not None:
-            params["numEmployeesTo"] = num_employees_to
-        if ipo_from is not None:
-            params["ipoFrom"] = ipo_from
-        if ipo_to is not None:
-            params["ipoTo"] = ipo_to
-        if q is not None:
-            params["q"] = q
-        if name is not None:
-            params["name"] = name
-        if industry is not None:
-            params["industry"] = industry
-        if sector is not None:
-            params["sector"] = sector
-        if size is not None:
-            params["size"] = size
-        if page is not None:
-            params["page"] = page
-        params = _normalise_query(params)
-
-        resp = self.api_client.request("GET", path, params=params)
-        resp.raise_for_status()
-        return CompanySearchResult.model_validate(resp.json())
+        return self.api_client.call(OP_SEARCH_COMPANIES, locals())
 
     # ----------------- search_companies (async) ----------------- #
     async def search_companies_async(
@@ -2167,45 +1751,7 @@ class V1Api:
         Returns:
             CompanySearchResult: The response
         """
-        # Get path template from class attribute
-        path = PATH_SEARCH_COMPANIES
-
-        params: Dict[str, Any] = {}
-        if id is not None:
-            params["id"] = id
-        if symbol is not None:
-            params["symbol"] = symbol
-        if domain is not None:
-            params["domain"] = domain
-        if country is not None:
-            params["country"] = country
-        if exchange is not None:
-            params["exchange"] = exchange
-        if num_employees_from is not None:
-            params["numEmployeesFrom"] = num_employees_from
-        if num_employees_to is not None:
-            params["numEmployeesTo"] = num_employees_to
-        if ipo_from is not None:
-            params["ipoFrom"] = ipo_from
-        if ipo_to is not None:
-            params["ipoTo"] = ipo_to
-        if q is not None:
-            params["q"] = q
-        if name is not None:
-            params["name"] = name
-        if industry is not None:
-            params["industry"] = industry
-        if sector is not None:
-            params["sector"] = sector
-        if size is not None:
-            params["size"] = size
-        if page is not None:
-            params["page"] = page
-        params = _normalise_query(params)
-
-        resp = await self.api_client.request_async("GET", path, params=params)
-        resp.raise_for_status()
-        return CompanySearchResult.model_validate(resp.json())
+        return await self.api_client.call_async(OP_SEARCH_COMPANIES, locals())
 
     # ----------------- search_journalists (sync) ----------------- #
     def search_journalists(
@@ -2251,48 +1797,7 @@ class V1Api:
         Returns:
             JournalistSearchResult: The response
         """
-        # Get path template from class attribute
-        path = PATH_SEARCH_JOURNALISTS
-
-        # --- build query dict on the fly ---
-        params: Dict[str, Any] = {}
-        if id is not None:
-            params["id"] = id
-        if q is not None:
-            params["q"] = q
-        if name is not None:
-            params["name"] = name
-        if twitter is not None:
-            params["twitter"] = twitter
-        if size is not None:
-            params["size"] = size
-        if page is not None:
-            params["page"] = page
-        if source is not None:
-            params["source"] = source
-        if topic is not None:
-            params["topic"] = topic
-        if category is not None:
-            params["category"] = category
-        if label is not None:
-            params["label"] = label
-        if min_monthly_posts is not None:
-            params["minMonthlyPosts"] = min_monthly_posts
-        if max_monthly_posts is not None:
-            params["maxMonthlyPosts"] = max_monthly_posts
-        if country is not None:
-            params["country"] = country
-        if updated_at_from is not None:
-            params["updatedAtFrom"] = updated_at_from
-        if updated_at_to is not None:
-            params["updatedAtTo"] = updated_at_to
-        if show_num_results is not None:
-            params["showNumResults"] = show_num_results
-        params = _normalise_query(params)
-
-        resp = self.api_client.request("GET", path, params=params)
-        resp.raise_for_status()
-        return JournalistSearchResult.model_validate(resp.json())
+        return self.api_client.call(OP_SEARCH_JOURNALISTS, locals())
 
     # ----------------- search_journalists (async) ----------------- #
     async def search_journalists_async(
@@ -2338,47 +1843,7 @@ class V1Api:
         Returns:
             JournalistSearchResult: The response
         """
-        # Get path template from class attribute
-        path = PATH_SEARCH_JOURNALISTS
-
-        params: Dict[str, Any] = {}
-        if id is not None:
-            params["id"] = id
-        if q is not None:
-            params["q"] = q
-        if name is not None:
-            params["name"] = name
-        if twitter is not None:
-            params["twitter"] = twitter
-        if size is not None:
-            params["size"] = size
-        if page is not None:
-            params["page"] = page
-        if source is not None:
-            params["source"] = source
-        if topic is not None:
-            params["topic"] = topic
-        if category is not None:
-            params["category"] = category
-        if label is not None:
-            params["label"] = label
-        if min_monthly_posts is not None:
-            params["minMonthlyPosts"] = min_monthly_posts
-        if max_monthly_posts is not None:
-            params["maxMonthlyPosts"] = max_monthly_posts
-        if country is not None:
-            params["country"] = country
-        if updated_at_from is not None:
-            params["updatedAtFrom"] = updated_at_from
-        if updated_at_to is not None:
-            params["updatedAtTo"] = updated_at_to
-        if show_num_results is not None:
-            params["showNumResults"] = show_num_results
-        params = _normalise_query(params)
-
-        resp = await self.api_client.request_async("GET", path, params=params)
-        resp.raise_for_status()
-        return JournalistSearchResult.model_validate(resp.json())
+        return await self.api_client.call_async(OP_SEARCH_JOURNALISTS, locals())
 
     # ----------------- search_people (sync) ----------------- #
     def search_people(
@@ -2404,28 +1869,7 @@ class V1Api:
         Returns:
             PeopleSearchResult: The response
         """
-        # Get path template from class attribute
-        path = PATH_SEARCH_PEOPLE
-
-        # --- build query dict on the fly ---
-        params: Dict[str, Any] = {}
-        if name is not None:
-            params["name"] = name
-        if wikidata_id is not None:
-            params["wikidataId"] = wikidata_id
-        if occupation_id is not None:
-            params["occupationId"] = occupation_id
-        if occupation_label is not None:
-            params["occupationLabel"] = occupation_label
-        if page is not None:
-            params["page"] = page
-        if size is not None:
-            params["size"] = size
-        params = _normalise_query(params)
-
-        resp = self.api_client.request("GET", path, params=params)
-        resp.raise_for_status()
-        return PeopleSearchResult.model_validate(resp.json())
+        return self.api_client.call(OP_SEARCH_PEOPLE, locals())
 
     # ----------------- search_people (async) ----------------- #
     async def search_people_async(
@@ -2451,27 +1895,7 @@ class V1Api:
         Returns:
             PeopleSearchResult: The response
         """
-        # Get path template from class attribute
-        path = PATH_SEARCH_PEOPLE
-
-        params: Dict[str, Any] = {}
-        if name is not None:
-            params["name"] = name
-        if wikidata_id is not None:
-            params["wikidataId"] = wikidata_id
-        if occupation_id is not None:
-            params["occupationId"] = occupation_id
-        if occupation_label is not None:
-            params["occupationLabel"] = occupation_label
-        if page is not None:
-            params["page"] = page
-        if size is not None:
-            params["size"] = size
-        params = _normalise_query(params)
-
-        resp = await self.api_client.request_async("GET", path, params=params)
-        resp.raise_for_status()
-        return PeopleSearchResult.model_validate(resp.json())
+        return await self.api_client.call_async(OP_SEARCH_PEOPLE, locals())
 
     # ----------------- search_sources (sync) ----------------- #
     def search_sources(
@@ -2533,64 +1957,7 @@ class V1Api:
         Returns:
             SourceSearchResult: The response
         """
-        # Get path template from class attribute
-        path = PATH_SEARCH_SOURCES
-
-        # --- build query dict on the fly ---
-        params: Dict[str, Any] = {}
-        if domain is not None:
-            params["domain"] = domain
-        if name is not None:
-            params["name"] = name
-        if source_group is not None:
-            params["sourceGroup"] = source_group
-        if sort_by is not None:
-            params["sortBy"] = sort_by
-        if page is not None:
-            params["page"] = page
-        if size is not None:
-            params["size"] = size
-        if min_monthly_visits is not None:
-            params["minMonthlyVisits"] = min_monthly_visits
-        if max_monthly_visits is not None:
-            params["maxMonthlyVisits"] = max_monthly_visits
-        if min_monthly_posts is not None:
-            params["minMonthlyPosts"] = min_monthly_posts
-        if max_monthly_posts is not None:
-            params["maxMonthlyPosts"] = max_monthly_posts
-        if country is not None:
-            params["country"] = country
-        if source_country is not None:
-            params["sourceCountry"] = source_country
-        if source_state is not None:
-            params["sourceState"] = source_state
-        if source_county is not None:
-            params["sourceCounty"] = source_county
-        if source_city is not None:
-            params["sourceCity"] = source_city
-        if source_lat is not None:
-            params["sourceLat"] = source_lat
-        if source_lon is not None:
-            params["sourceLon"] = source_lon
-        if source_max_distance is not None:
-            params["sourceMaxDistance"] = source_max_distance
-        if category is not None:
-            params["category"] = category
-        if topic is not None:
-            params["topic"] = topic
-        if label is not None:
-            params["label"] = label
-        if paywall is not None:
-            params["paywall"] = paywall
-        if show_subdomains is not None:
-            params["showSubdomains"] = show_subdomains
-        if show_num_results is not None:
-            params["showNumResults"] = show_num_results
-        params = _normalise_query(params)
-
-        resp = self.api_client.request("GET", path, params=params)
-        resp.raise_for_status()
-        return SourceSearchResult.model_validate(resp.json())
+        return self.api_client.call(OP_SEARCH_SOURCES, locals())
 
     # ----------------- search_sources (async) ----------------- #
     async def search_sources_async(
@@ -2652,63 +2019,7 @@ class V1Api:
         Returns:
             SourceSearchResult: The response
         """
-        # Get path template from class attribute
-        path = PATH_SEARCH_SOURCES
-
-        params: Dict[str, Any] = {}
-        if domain is not None:
-            params["domain"] = domain
-        if name is not None:
-            params["name"] = name
-        if source_group is not None:
-            params["sourceGroup"] = source_group
-        if sort_by is not None:
-            params["sortBy"] = sort_by
-        if page is not None:
-            params["page"] = page
-        if size is not None:
-            params["size"] = size
-        if min_monthly_visits is not None:
-            params["minMonthlyVisits"] = min_monthly_visits
-        if max_monthly_visits is not None:
-            params["maxMonthlyVisits"] = max_monthly_visits
-        if min_monthly_posts is not None:
-            params["minMonthlyPosts"] = min_monthly_posts
-        if max_monthly_posts is not None:
-            params["maxMonthlyPosts"] = max_monthly_posts
-        if country is not None:
-            params["country"] = country
-        if source_country is not None:
-            params["sourceCountry"] = source_country
-        if source_state is not None:
-            params["sourceState"] = source_state
-        if source_county is not None:
-            params["sourceCounty"] = source_county
-        if source_city is not None:
-            params["sourceCity"] = source_city
-        if source_lat is not None:
-            params["sourceLat"] = source_lat
-        if source_lon is not None:
-            params["sourceLon"] = source_lon
-        if source_max_distance is not None:
-            params["sourceMaxDistance"] = source_max_distance
-        if category is not None:
-            params["category"] = category
-        if topic is not None:
-            params["topic"] = topic
-        if label is not None:
-            params["label"] = label
-        if paywall is not None:
-            params["paywall"] = paywall
-        if show_subdomains is not None:
-            params["showSubdomains"] = show_subdomains
-        if show_num_results is not None:
-            params["showNumResults"] = show_num_results
-        params = _normalise_query(params)
-
-        resp = await self.api_client.request_async("GET", path, params=params)
-        resp.raise_for_status()
-        return SourceSearchResult.model_validate(resp.json())
+        return await self.api_client.call_async(OP_SEARCH_SOURCES, locals())
 
     # ----------------- search_stories (sync) ----------------- #
     def search_stories(
@@ -2820,114 +2131,7 @@ class V1Api:
         Returns:
             StorySearchResult: The response
         """
-        # Get path template from class attribute
-        path = PATH_SEARCH_STORIES
-
-        # --- build query dict on the fly ---
-        params: Dict[str, Any] = {}
-        if q is not None:
-            params["q"] = q
-        if name is not None:
-            params["name"] = name
-        if cluster_id is not None:
-            params["clusterId"] = cluster_id
-        if exclude_cluster_id is not None:
-            params["excludeClusterId"] = exclude_cluster_id
-        if sort_by is not None:
-            params["sortBy"] = sort_by
-        if page is not None:
-            params["page"] = page
-        if size is not None:
-            params["size"] = size
-        if var_from is not None:
-            params["from"] = var_from
-        if to is not None:
-            params["to"] = to
-        if initialized_from is not None:
-            params["initializedFrom"] = initialized_from
-        if initialized_to is not None:
-            params["initializedTo"] = initialized_to
-        if updated_from is not None:
-            params["updatedFrom"] = updated_from
-        if updated_to is not None:
-            params["updatedTo"] = updated_to
-        if topic is not None:
-            params["topic"] = topic
-        if category is not None:
-            params["category"] = category
-        if taxonomy is not None:
-            params["taxonomy"] = taxonomy
-        if source is not None:
-            params["source"] = source
-        if source_group is not None:
-            params["sourceGroup"] = source_group
-        if min_unique_sources is not None:
-            params["minUniqueSources"] = min_unique_sources
-        if min_source_diversity is not None:
-            params["minSourceDiversity"] = min_source_diversity
-        if person_wikidata_id is not None:
-            params["personWikidataId"] = person_wikidata_id
-        if person_name is not None:
-            params["personName"] = person_name
-        if company_id is not None:
-            params["companyId"] = company_id
-        if company_name is not None:
-            params["companyName"] = company_name
-        if company_domain is not None:
-            params["companyDomain"] = company_domain
-        if company_symbol is not None:
-            params["companySymbol"] = company_symbol
-        if country is not None:
-            params["country"] = country
-        if state is not None:
-            params["state"] = state
-        if city is not None:
-            params["city"] = city
-        if area is not None:
-            params["area"] = area
-        if min_cluster_size is not None:
-            params["minClusterSize"] = min_cluster_size
-        if max_cluster_size is not None:
-            params["maxClusterSize"] = max_cluster_size
-        if name_exists is not None:
-            params["nameExists"] = name_exists
-        if positive_sentiment_from is not None:
-            params["positiveSentimentFrom"] = positive_sentiment_from
-        if positive_sentiment_to is not None:
-            params["positiveSentimentTo"] = positive_sentiment_to
-        if neutral_sentiment_from is not None:
-            params["neutralSentimentFrom"] = neutral_sentiment_from
-        if neutral_sentiment_to is not None:
-            params["neutralSentimentTo"] = neutral_sentiment_to
-        if negative_sentiment_from is not None:
-            params["negativeSentimentFrom"] = negative_sentiment_from
-        if negative_sentiment_to is not None:
-            params["negativeSentimentTo"] = negative_sentiment_to
-        if show_story_page_info is not None:
-            params["showStoryPageInfo"] = show_story_page_info
-        if show_num_results is not None:
-            params["showNumResults"] = show_num_results
-        if show_duplicates is not None:
-            params["showDuplicates"] = show_duplicates
-        if show_highlighting is not None:
-            params["showHighlighting"] = show_highlighting
-        if highlight_fragment_size is not None:
-            params["highlightFragmentSize"] = highlight_fragment_size
-        if highlight_num_fragments is not None:
-            params["highlightNumFragments"] = highlight_num_fragments
-        if highlight_pre_tag is not None:
-            params["highlightPreTag"] = highlight_pre_tag
-        if highlight_post_tag is not None:
-            params["highlightPostTag"] = highlight_post_tag
-        if highlight_q is not None:
-            params["highlightQ"] = highlight_q
-        if expand_articles is not None:
-            params["expandArticles"] = expand_articles
-        params = _normalise_query(params)
-
-        resp = self.api_client.request("GET", path, params=params)
-        resp.raise_for_status()
-        return StorySearchResult.model_validate(resp.json())
+        return self.api_client.call(OP_SEARCH_STORIES, locals())
 
     # ----------------- search_stories (async) ----------------- #
     async def search_stories_async(
@@ -3039,113 +2243,7 @@ class V1Api:
         Returns:
             StorySearchResult: The response
         """
-        # Get path template from class attribute
-        path = PATH_SEARCH_STORIES
-
-        params: Dict[str, Any] = {}
-        if q is not None:
-            params["q"] = q
-        if name is not None:
-            params["name"] = name
-        if cluster_id is not None:
-            params["clusterId"] = cluster_id
-        if exclude_cluster_id is not None:
-            params["excludeClusterId"] = exclude_cluster_id
-        if sort_by is not None:
-            params["sortBy"] = sort_by
-        if page is not None:
-            params["page"] = page
-        if size is not None:
-            params["size"] = size
-        if var_from is not None:
-            params["from"] = var_from
-        if to is not None:
-            params["to"] = to
-        if initialized_from is not None:
-            params["initializedFrom"] = initialized_from
-        if initialized_to is not None:
-            params["initializedTo"] = initialized_to
-        if updated_from is not None:
-            params["updatedFrom"] = updated_from
-        if updated_to is not None:
-            params["updatedTo"] = updated_to
-        if topic is not None:
-            params["topic"] = topic
-        if category is not None:
-            params["category"] = category
-        if taxonomy is not None:
-            params["taxonomy"] = taxonomy
-        if source is not None:
-            params["source"] = source
-        if source_group is not None:
-            params["sourceGroup"] = source_group
-        if min_unique_sources is not None:
-            params["minUniqueSources"] = min_unique_sources
-        if min_source_diversity is not None:
-            params["minSourceDiversity"] = min_source_diversity
-        if person_wikidata_id is not None:
-            params["personWikidataId"] = person_wikidata_id
-        if person_name is not None:
-            params["personName"] = person_name
-        if company_id is not None:
-            params["companyId"] = company_id
-        if company_name is not None:
-            params["companyName"] = company_name
-        if company_domain is not None:
-            params["companyDomain"] = company_domain
-        if company_symbol is not None:
-            params["companySymbol"] = company_symbol
-        if country is not None:
-            params["country"] = country
-        if state is not None:
-            params["state"] = state
-        if city is not None:
-            params["city"] = city
-        if area is not None:
-            params["area"] = area
-        if min_cluster_size is not None:
-            params["minClusterSize"] = min_cluster_size
-        if max_cluster_size is not None:
-            params["maxClusterSize"] = max_cluster_size
-        if name_exists is not None:
-            params["nameExists"] = name_exists
-        if positive_sentiment_from is not None:
-            params["positiveSentimentFrom"] = positive_sentiment_from
-        if positive_sentiment_to is not None:
-            params["positiveSentimentTo"] = positive_sentiment_to
-        if neutral_sentiment_from is not None:
-            params["neutralSentimentFrom"] = neutral_sentiment_from
-        if neutral_sentiment_to is not None:
-            params["neutralSentimentTo"] = neutral_sentiment_to
-        if negative_sentiment_from is not None:
-            params["negativeSentimentFrom"] = negative_sentiment_from
-        if negative_sentiment_to is not None:
-            params["negativeSentimentTo"] = negative_sentiment_to
-        if show_story_page_info is not None:
-            params["showStoryPageInfo"] = show_story_page_info
-        if show_num_results is not None:
-            params["showNumResults"] = show_num_results
-        if show_duplicates is not None:
-            params["showDuplicates"] = show_duplicates
-        if show_highlighting is not None:
-            params["showHighlighting"] = show_highlighting
-        if highlight_fragment_size is not None:
-            params["highlightFragmentSize"] = highlight_fragment_size
-        if highlight_num_fragments is not None:
-            params["highlightNumFragments"] = highlight_num_fragments
-        if highlight_pre_tag is not None:
-            params["highlightPreTag"] = highlight_pre_tag
-        if highlight_post_tag is not None:
-            params["highlightPostTag"] = highlight_post_tag
-        if highlight_q is not None:
-            params["highlightQ"] = highlight_q
-        if expand_articles is not None:
-            params["expandArticles"] = expand_articles
-        params = _normalise_query(params)
-
-        resp = await self.api_client.request_async("GET", path, params=params)
-        resp.raise_for_status()
-        return StorySearchResult.model_validate(resp.json())
+        return await self.api_client.call_async(OP_SEARCH_STORIES, locals())
 
     # ----------------- search_summarizer (sync) ----------------- #
     def search_summarizer(
@@ -3347,207 +2445,7 @@ class V1Api:
         Returns:
             SummarySearchResult: The response
         """
-        # Get path template from class attribute
-        path = PATH_SEARCH_SUMMARIZER
-
-        # --- build query dict on the fly ---
-        params: Dict[str, Any] = {}
-        if q is not None:
-            params["q"] = q
-        if title is not None:
-            params["title"] = title
-        if desc is not None:
-            params["desc"] = desc
-        if content is not None:
-            params["content"] = content
-        if summary is not None:
-            params["summary"] = summary
-        if url is not None:
-            params["url"] = url
-        if article_id is not None:
-            params["articleId"] = article_id
-        if cluster_id is not None:
-            params["clusterId"] = cluster_id
-        if sort_by is not None:
-            params["sortBy"] = sort_by
-        if page is not None:
-            params["page"] = page
-        if size is not None:
-            params["size"] = size
-        if var_from is not None:
-            params["from"] = var_from
-        if to is not None:
-            params["to"] = to
-        if add_date_from is not None:
-            params["addDateFrom"] = add_date_from
-        if add_date_to is not None:
-            params["addDateTo"] = add_date_to
-        if refresh_date_from is not None:
-            params["refreshDateFrom"] = refresh_date_from
-        if refresh_date_to is not None:
-            params["refreshDateTo"] = refresh_date_to
-        if medium is not None:
-            params["medium"] = medium
-        if source is not None:
-            params["source"] = source
-        if source_group is not None:
-            params["sourceGroup"] = source_group
-        if exclude_source_group is not None:
-            params["excludeSourceGroup"] = exclude_source_group
-        if exclude_source is not None:
-            params["excludeSource"] = exclude_source
-        if watchlist is not None:
-            params["watchlist"] = watchlist
-        if exclude_watchlist is not None:
-            params["excludeWatchlist"] = exclude_watchlist
-        if paywall is not None:
-            params["paywall"] = paywall
-        if byline is not None:
-            params["byline"] = byline
-        if author is not None:
-            params["author"] = author
-        if exclude_author is not None:
-            params["excludeAuthor"] = exclude_author
-        if journalist_id is not None:
-            params["journalistId"] = journalist_id
-        if exclude_journalist_id is not None:
-            params["excludeJournalistId"] = exclude_journalist_id
-        if language is not None:
-            params["language"] = language
-        if exclude_language is not None:
-            params["excludeLanguage"] = exclude_language
-        if search_translation is not None:
-            params["searchTranslation"] = search_translation
-        if label is not None:
-            params["label"] = label
-        if exclude_label is not None:
-            params["excludeLabel"] = exclude_label
-        if category is not None:
-            params["category"] = category
-        if exclude_category is not None:
-            params["excludeCategory"] = exclude_category
-        if topic is not None:
-            params["topic"] = topic
-        if exclude_topic is not None:
-            params["excludeTopic"] = exclude_topic
-        if link_to is not None:
-            params["linkTo"] = link_to
-        if show_reprints is not None:
-            params["showReprints"] = show_reprints
-        if reprint_group_id is not None:
-            params["reprintGroupId"] = reprint_group_id
-        if city is not None:
-            params["city"] = city
-        if exclude_city is not None:
-            params["excludeCity"] = exclude_city
-        if area is not None:
-            params["area"] = area
-        if state is not None:
-            params["state"] = state
-        if exclude_state is not None:
-            params["excludeState"] = exclude_state
-        if county is not None:
-            params["county"] = county
-        if exclude_county is not None:
-            params["excludeCounty"] = exclude_county
-        if locations_country is not None:
-            params["locationsCountry"] = locations_country
-        if country is not None:
-            params["country"] = country
-        if exclude_locations_country is not None:
-            params["excludeLocationsCountry"] = exclude_locations_country
-        if location is not None:
-            params["location"] = location
-        if lat is not None:
-            params["lat"] = lat
-        if lon is not None:
-            params["lon"] = lon
-        if max_distance is not None:
-            params["maxDistance"] = max_distance
-        if source_city is not None:
-            params["sourceCity"] = source_city
-        if exclude_source_city is not None:
-            params["excludeSourceCity"] = exclude_source_city
-        if source_county is not None:
-            params["sourceCounty"] = source_county
-        if exclude_source_county is not None:
-            params["excludeSourceCounty"] = exclude_source_county
-        if source_country is not None:
-            params["sourceCountry"] = source_country
-        if exclude_source_country is not None:
-            params["excludeSourceCountry"] = exclude_source_country
-        if source_state is not None:
-            params["sourceState"] = source_state
-        if exclude_source_state is not None:
-            params["excludeSourceState"] = exclude_source_state
-        if source_lat is not None:
-            params["sourceLat"] = source_lat
-        if source_lon is not None:
-            params["sourceLon"] = source_lon
-        if source_max_distance is not None:
-            params["sourceMaxDistance"] = source_max_distance
-        if person_wikidata_id is not None:
-            params["personWikidataId"] = person_wikidata_id
-        if exclude_person_wikidata_id is not None:
-            params["excludePersonWikidataId"] = exclude_person_wikidata_id
-        if person_name is not None:
-            params["personName"] = person_name
-        if exclude_person_name is not None:
-            params["excludePersonName"] = exclude_person_name
-        if company_id is not None:
-            params["companyId"] = company_id
-        if exclude_company_id is not None:
-            params["excludeCompanyId"] = exclude_company_id
-        if company_name is not None:
-            params["companyName"] = company_name
-        if company_domain is not None:
-            params["companyDomain"] = company_domain
-        if exclude_company_domain is not None:
-            params["excludeCompanyDomain"] = exclude_company_domain
-        if company_symbol is not None:
-            params["companySymbol"] = company_symbol
-        if exclude_company_symbol is not None:
-            params["excludeCompanySymbol"] = exclude_company_symbol
-        if show_num_results is not None:
-            params["showNumResults"] = show_num_results
-        if positive_sentiment_from is not None:
-            params["positiveSentimentFrom"] = positive_sentiment_from
-        if positive_sentiment_to is not None:
-            params["positiveSentimentTo"] = positive_sentiment_to
-        if neutral_sentiment_from is not None:
-            params["neutralSentimentFrom"] = neutral_sentiment_from
-        if neutral_sentiment_to is not None:
-            params["neutralSentimentTo"] = neutral_sentiment_to
-        if negative_sentiment_from is not None:
-            params["negativeSentimentFrom"] = negative_sentiment_from
-        if negative_sentiment_to is not None:
-            params["negativeSentimentTo"] = negative_sentiment_to
-        if taxonomy is not None:
-            params["taxonomy"] = taxonomy
-        if prefix_taxonomy is not None:
-            params["prefixTaxonomy"] = prefix_taxonomy
-        if show_highlighting is not None:
-            params["showHighlighting"] = show_highlighting
-        if highlight_fragment_size is not None:
-            params["highlightFragmentSize"] = highlight_fragment_size
-        if highlight_num_fragments is not None:
-            params["highlightNumFragments"] = highlight_num_fragments
-        if highlight_pre_tag is not None:
-            params["highlightPreTag"] = highlight_pre_tag
-        if highlight_post_tag is not None:
-            params["highlightPostTag"] = highlight_post_tag
-        if highlight_q is not None:
-            params["highlightQ"] = highlight_q
-        params = _normalise_query(params)
-
-        resp = self.api_client.request(
-            "POST",
-            path,
-            params=params,
-            json=summary_body.model_dump(by_alias=True, exclude_none=True),
-        )
-        resp.raise_for_status()
-        return SummarySearchResult.model_validate(resp.json())
+        return self.api_client.call(OP_SEARCH_SUMMARIZER, locals())
 
     # ----------------- search_summarizer (async) ----------------- #
     async def search_summarizer_async(
@@ -3749,206 +2647,7 @@ class V1Api:
         Returns:
             SummarySearchResult: The response
         """
-        # Get path template from class attribute
-        path = PATH_SEARCH_SUMMARIZER
-
-        params: Dict[str, Any] = {}
-        if q is not None:
-            params["q"] = q
-        if title is not None:
-            params["title"] = title
-        if desc is not None:
-            params["desc"] = desc
-        if content is not None:
-            params["content"] = content
-        if summary is not None:
-            params["summary"] = summary
-        if url is not None:
-            params["url"] = url
-        if article_id is not None:
-            params["articleId"] = article_id
-        if cluster_id is not None:
-            params["clusterId"] = cluster_id
-        if sort_by is not None:
-            params["sortBy"] = sort_by
-        if page is not None:
-            params["page"] = page
-        if size is not None:
-            params["size"] = size
-        if var_from is not None:
-            params["from"] = var_from
-        if to is not None:
-            params["to"] = to
-        if add_date_from is not None:
-            params["addDateFrom"] = add_date_from
-        if add_date_to is not None:
-            params["addDateTo"] = add_date_to
-        if refresh_date_from is not None:
-            params["refreshDateFrom"] = refresh_date_from
-        if refresh_date_to is not None:
-            params["refreshDateTo"] = refresh_date_to
-        if medium is not None:
-            params["medium"] = medium
-        if source is not None:
-            params["source"] = source
-        if source_group is not None:
-            params["sourceGroup"] = source_group
-        if exclude_source_group is not None:
-            params["excludeSourceGroup"] = exclude_source_group
-        if exclude_source is not None:
-            params["excludeSource"] = exclude_source
-        if watchlist is not None:
-            params["watchlist"] = watchlist
-        if exclude_watchlist is not None:
-            params["excludeWatchlist"] = exclude_watchlist
-        if paywall is not None:
-            params["paywall"] = paywall
-        if byline is not None:
-            params["byline"] = byline
-        if author is not None:
-            params["author"] = author
-        if exclude_author is not None:
-            params["excludeAuthor"] = exclude_author
-        if journalist_id is not None:
-            params["journalistId"] = journalist_id
-        if exclude_journalist_id is not None:
-            params["excludeJournalistId"] = exclude_journalist_id
-        if language is not None:
-            params["language"] = language
-        if exclude_language is not None:
-            params["excludeLanguage"] = exclude_language
-        if search_translation is not None:
-            params["searchTranslation"] = search_translation
-        if label is not None:
-            params["label"] = label
-        if exclude_label is not None:
-            params["excludeLabel"] = exclude_label
-        if category is not None:
-            params["category"] = category
-        if exclude_category is not None:
-            params["excludeCategory"] = exclude_category
-        if topic is not None:
-            params["topic"] = topic
-        if exclude_topic is not None:
-            params["excludeTopic"] = exclude_topic
-        if link_to is not None:
-            params["linkTo"] = link_to
-        if show_reprints is not None:
-            params["showReprints"] = show_reprints
-        if reprint_group_id is not None:
-            params["reprintGroupId"] = reprint_group_id
-        if city is not None:
-            params["city"] = city
-        if exclude_city is not None:
-            params["excludeCity"] = exclude_city
-        if area is not None:
-            params["area"] = area
-        if state is not None:
-            params["state"] = state
-        if exclude_state is not None:
-            params["excludeState"] = exclude_state
-        if county is not None:
-            params["county"] = county
-        if exclude_county is not None:
-            params["excludeCounty"] = exclude_county
-        if locations_country is not None:
-            params["locationsCountry"] = locations_country
-        if country is not None:
-            params["country"] = country
-        if exclude_locations_country is not None:
-            params["excludeLocationsCountry"] = exclude_locations_country
-        if location is not None:
-            params["location"] = location
-        if lat is not None:
-            params["lat"] = lat
-        if lon is not None:
-            params["lon"] = lon
-        if max_distance is not None:
-            params["maxDistance"] = max_distance
-        if source_city is not None:
-            params["sourceCity"] = source_city
-        if exclude_source_city is not None:
-            params["excludeSourceCity"] = exclude_source_city
-        if source_county is not None:
-            params["sourceCounty"] = source_county
-        if exclude_source_county is not None:
-            params["excludeSourceCounty"] = exclude_source_county
-        if source_country is not None:
-            params["sourceCountry"] = source_country
-        if exclude_source_country is not None:
-            params["excludeSourceCountry"] = exclude_source_country
-        if source_state is not None:
-            params["sourceState"] = source_state
-        if exclude_source_state is not None:
-            params["excludeSourceState"] = exclude_source_state
-        if source_lat is not None:
-            params["sourceLat"] = source_lat
-        if source_lon is not None:
-            params["sourceLon"] = source_lon
-        if source_max_distance is not None:
-            params["sourceMaxDistance"] = source_max_distance
-        if person_wikidata_id is not None:
-            params["personWikidataId"] = person_wikidata_id
-        if exclude_person_wikidata_id is not None:
-            params["excludePersonWikidataId"] = exclude_person_wikidata_id
-        if person_name is not None:
-            params["personName"] = person_name
-        if exclude_person_name is not None:
-            params["excludePersonName"] = exclude_person_name
-        if company_id is not None:
-            params["companyId"] = company_id
-        if exclude_company_id is not None:
-            params["excludeCompanyId"] = exclude_company_id
-        if company_name is not None:
-            params["companyName"] = company_name
-        if company_domain is not None:
-            params["companyDomain"] = company_domain
-        if exclude_company_domain is not None:
-            params["excludeCompanyDomain"] = exclude_company_domain
-        if company_symbol is not None:
-            params["companySymbol"] = company_symbol
-        if exclude_company_symbol is not None:
-            params["excludeCompanySymbol"] = exclude_company_symbol
-        if show_num_results is not None:
-            params["showNumResults"] = show_num_results
-        if positive_sentiment_from is not None:
-            params["positiveSentimentFrom"] = positive_sentiment_from
-        if positive_sentiment_to is not None:
-            params["positiveSentimentTo"] = positive_sentiment_to
-        if neutral_sentiment_from is not None:
-            params["neutralSentimentFrom"] = neutral_sentiment_from
-        if neutral_sentiment_to is not None:
-            params["neutralSentimentTo"] = neutral_sentiment_to
-        if negative_sentiment_from is not None:
-            params["negativeSentimentFrom"] = negative_sentiment_from
-        if negative_sentiment_to is not None:
-            params["negativeSentimentTo"] = negative_sentiment_to
-        if taxonomy is not None:
-            params["taxonomy"] = taxonomy
-        if prefix_taxonomy is not None:
-            params["prefixTaxonomy"] = prefix_taxonomy
-        if show_highlighting is not None:
-            params["showHighlighting"] = show_highlighting
-        if highlight_fragment_size is not None:
-            params["highlightFragmentSize"] = highlight_fragment_size
-        if highlight_num_fragments is not None:
-            params["highlightNumFragments"] = highlight_num_fragments
-        if highlight_pre_tag is not None:
-            params["highlightPreTag"] = highlight_pre_tag
-        if highlight_post_tag is not None:
-            params["highlightPostTag"] = highlight_post_tag
-        if highlight_q is not None:
-            params["highlightQ"] = highlight_q
-        params = _normalise_query(params)
-
-        resp = await self.api_client.request_async(
-            "POST",
-            path,
-            params=params,
-            json=summary_body.model_dump(by_alias=True, exclude_none=True),
-        )
-        resp.raise_for_status()
-        return SummarySearchResult.model_validate(resp.json())
+        return await self.api_client.call_async(OP_SEARCH_SUMMARIZER, locals())
 
     # ----------------- search_topics (sync) ----------------- #
     def search_topics(
@@ -3972,26 +2671,7 @@ class V1Api:
         Returns:
             TopicSearchResult: The response
         """
-        # Get path template from class attribute
-        path = PATH_SEARCH_TOPICS
-
-        # --- build query dict on the fly ---
-        params: Dict[str, Any] = {}
-        if name is not None:
-            params["name"] = name
-        if category is not None:
-            params["category"] = category
-        if subcategory is not None:
-            params["subcategory"] = subcategory
-        if page is not None:
-            params["page"] = page
-        if size is not None:
-            params["size"] = size
-        params = _normalise_query(params)
-
-        resp = self.api_client.request("GET", path, params=params)
-        resp.raise_for_status()
-        return TopicSearchResult.model_validate(resp.json())
+        return self.api_client.call(OP_SEARCH_TOPICS, locals())
 
     # ----------------- search_topics (async) ----------------- #
     async def search_topics_async(
@@ -4015,25 +2695,7 @@ class V1Api:
         Returns:
             TopicSearchResult: The response
         """
-        # Get path template from class attribute
-        path = PATH_SEARCH_TOPICS
-
-        params: Dict[str, Any] = {}
-        if name is not None:
-            params["name"] = name
-        if category is not None:
-            params["category"] = category
-        if subcategory is not None:
-            params["subcategory"] = subcategory
-        if page is not None:
-            params["page"] = page
-        if size is not None:
-            params["size"] = size
-        params = _normalise_query(params)
-
-        resp = await self.api_client.request_async("GET", path, params=params)
-        resp.raise_for_status()
-        return TopicSearchResult.model_validate(resp.json())
+        return await self.api_client.call_async(OP_SEARCH_TOPICS, locals())
 
     # ----------------- search_wikipedia (sync) ----------------- #
     def search_wikipedia(
@@ -4100,68 +2762,7 @@ class V1Api:
         Returns:
             WikipediaSearchResult: The response
         """
-        # Get path template from class attribute
-        path = PATH_SEARCH_WIKIPEDIA
-
-        # --- build query dict on the fly ---
-        params: Dict[str, Any] = {}
-        if q is not None:
-            params["q"] = q
-        if title is not None:
-            params["title"] = title
-        if summary is not None:
-            params["summary"] = summary
-        if text is not None:
-            params["text"] = text
-        if reference is not None:
-            params["reference"] = reference
-        if id is not None:
-            params["id"] = id
-        if wiki_page_id is not None:
-            params["wikiPageId"] = wiki_page_id
-        if wiki_revision_id is not None:
-            params["wikiRevisionId"] = wiki_revision_id
-        if wiki_code is not None:
-            params["wikiCode"] = wiki_code
-        if wiki_namespace is not None:
-            params["wikiNamespace"] = wiki_namespace
-        if wikidata_id is not None:
-            params["wikidataId"] = wikidata_id
-        if wikidata_instance_of_id is not None:
-            params["wikidataInstanceOfId"] = wikidata_instance_of_id
-        if wikidata_instance_of_label is not None:
-            params["wikidataInstanceOfLabel"] = wikidata_instance_of_label
-        if category is not None:
-            params["category"] = category
-        if section_id is not None:
-            params["sectionId"] = section_id
-        if wiki_revision_from is not None:
-            params["wikiRevisionFrom"] = wiki_revision_from
-        if wiki_revision_to is not None:
-            params["wikiRevisionTo"] = wiki_revision_to
-        if scraped_at_from is not None:
-            params["scrapedAtFrom"] = scraped_at_from
-        if scraped_at_to is not None:
-            params["scrapedAtTo"] = scraped_at_to
-        if pageviews_from is not None:
-            params["pageviewsFrom"] = pageviews_from
-        if pageviews_to is not None:
-            params["pageviewsTo"] = pageviews_to
-        if with_pageviews is not None:
-            params["withPageviews"] = with_pageviews
-        if show_num_results is not None:
-            params["showNumResults"] = show_num_results
-        if page is not None:
-            params["page"] = page
-        if size is not None:
-            params["size"] = size
-        if sort_by is not None:
-            params["sortBy"] = sort_by
-        params = _normalise_query(params)
-
-        resp = self.api_client.request("GET", path, params=params)
-        resp.raise_for_status()
-        return WikipediaSearchResult.model_validate(resp.json())
+        return self.api_client.call(OP_SEARCH_WIKIPEDIA, locals())
 
     # ----------------- search_wikipedia (async) ----------------- #
     async def search_wikipedia_async(
@@ -4228,67 +2829,7 @@ class V1Api:
         Returns:
             WikipediaSearchResult: The response
         """
-        # Get path template from class attribute
-        path = PATH_SEARCH_WIKIPEDIA
-
-        params: Dict[str, Any] = {}
-        if q is not None:
-            params["q"] = q
-        if title is not None:
-            params["title"] = title
-        if summary is not None:
-            params["summary"] = summary
-        if text is not None:
-            params["text"] = text
-        if reference is not None:
-            params["reference"] = reference
-        if id is not None:
-            params["id"] = id
-        if wiki_page_id is not None:
-            params["wikiPageId"] = wiki_page_id
-        if wiki_revision_id is not None:
-            params["wikiRevisionId"] = wiki_revision_id
-        if wiki_code is not None:
-            params["wikiCode"] = wiki_code
-        if wiki_namespace is not None:
-            params["wikiNamespace"] = wiki_namespace
-        if wikidata_id is not None:
-            params["wikidataId"] = wikidata_id
-        if wikidata_instance_of_id is not None:
-            params["wikidataInstanceOfId"] = wikidata_instance_of_id
-        if wikidata_instance_of_label is not None:
-            params["wikidataInstanceOfLabel"] = wikidata_instance_of_label
-        if category is not None:
-            params["category"] = category
-        if section_id is not None:
-            params["sectionId"] = section_id
-        if wiki_revision_from is not None:
-            params["wikiRevisionFrom"] = wiki_revision_from
-        if wiki_revision_to is not None:
-            params["wikiRevisionTo"] = wiki_revision_to
-        if scraped_at_from is not None:
-            params["scrapedAtFrom"] = scraped_at_from
-        if scraped_at_to is not None:
-            params["scrapedAtTo"] = scraped_at_to
-        if pageviews_from is not None:
-            params["pageviewsFrom"] = pageviews_from
-        if pageviews_to is not None:
-            params["pageviewsTo"] = pageviews_to
-        if with_pageviews is not None:
-            params["withPageviews"] = with_pageviews
-        if show_num_results is not None:
-            params["showNumResults"] = show_num_results
-        if page is not None:
-            params["page"] = page
-        if size is not None:
-            params["size"] = size
-        if sort_by is not None:
-            params["sortBy"] = sort_by
-        params = _normalise_query(params)
-
-        resp = await self.api_client.request_async("GET", path, params=params)
-        resp.raise_for_status()
-        return WikipediaSearchResult.model_validate(resp.json())
+        return await self.api_client.call_async(OP_SEARCH_WIKIPEDIA, locals())
 
     # ----------------- update_source_group (sync) ----------------- #
     def update_source_group(
@@ -4302,24 +2843,7 @@ class V1Api:
             patch_source_group_params (PatchSourceGroupParams): Parameter patch_source_group_params (required)
 
         """
-        # Get path template from class attribute
-        path = PATH_UPDATE_SOURCE_GROUP
-
-        # Replace path parameters
-        path = path.format(id=str(id))
-
-        # --- build query dict on the fly ---
-        params: Dict[str, Any] = {}
-        params = _normalise_query(params)
-
-        resp = self.api_client.request(
-            "PATCH",
-            path,
-            params=params,
-            json=patch_source_group_params.model_dump(by_alias=True, exclude_none=True),
-        )
-        resp.raise_for_status()
-        return resp.json()
+        return self.api_client.call(OP_UPDATE_SOURCE_GROUP, locals())
 
     # ----------------- update_source_group (async) ----------------- #
     async def update_source_group_async(
@@ -4333,23 +2857,7 @@ class V1Api:
             patch_source_group_params (PatchSourceGroupParams): Parameter patch_source_group_params (required)
 
         """
-        # Get path template from class attribute
-        path = PATH_UPDATE_SOURCE_GROUP
-
-        # Replace path parameters
-        path = path.format(id=str(id))
-
-        params: Dict[str, Any] = {}
-        params = _normalise_query(params)
-
-        resp = await self.api_client.request_async(
-            "PATCH",
-            path,
-            params=params,
-            json=patch_source_group_params.model_dump(by_alias=True, exclude_none=True),
-        )
-        resp.raise_for_status()
-        return resp.json()
+        return await self.api_client.call_async(OP_UPDATE_SOURCE_GROUP, locals())
 
     # ----------------- update_watchlist (sync) ----------------- #
     def update_watchlist(self, id: int, update_watchlist_params: UpdateWatchlistParams):
@@ -4361,24 +2869,7 @@ class V1Api:
             update_watchlist_params (UpdateWatchlistParams): Parameter update_watchlist_params (required)
 
         """
-        # Get path template from class attribute
-        path = PATH_UPDATE_WATCHLIST
-
-        # Replace path parameters
-        path = path.format(id=str(id))
-
-        # --- build query dict on the fly ---
-        params: Dict[str, Any] = {}
-        params = _normalise_query(params)
-
-        resp = self.api_client.request(
-            "PATCH",
-            path,
-            params=params,
-            json=update_watchlist_params.model_dump(by_alias=True, exclude_none=True),
-        )
-        resp.raise_for_status()
-        return resp.json()
+        return self.api_client.call(OP_UPDATE_WATCHLIST, locals())
 
     # ----------------- update_watchlist (async) ----------------- #
     async def update_watchlist_async(
@@ -4392,23 +2883,7 @@ class V1Api:
             update_watchlist_params (UpdateWatchlistParams): Parameter update_watchlist_params (required)
 
         """
-        # Get path template from class attribute
-        path = PATH_UPDATE_WATCHLIST
-
-        # Replace path parameters
-        path = path.format(id=str(id))
-
-        params: Dict[str, Any] = {}
-        params = _normalise_query(params)
-
-        resp = await self.api_client.request_async(
-            "PATCH",
-            path,
-            params=params,
-            json=update_watchlist_params.model_dump(by_alias=True, exclude_none=True),
-        )
-        resp.raise_for_status()
-        return resp.json()
+        return await self.api_client.call_async(OP_UPDATE_WATCHLIST, locals())
 
     # ----------------- vector_search_articles (sync) ----------------- #
     def vector_search_articles(
@@ -4423,21 +2898,7 @@ class V1Api:
         Returns:
             ArticlesVectorSearchResult: The response
         """
-        # Get path template from class attribute
-        path = PATH_VECTOR_SEARCH_ARTICLES
-
-        # --- build query dict on the fly ---
-        params: Dict[str, Any] = {}
-        params = _normalise_query(params)
-
-        resp = self.api_client.request(
-            "POST",
-            path,
-            params=params,
-            json=article_search_params.model_dump(by_alias=True, exclude_none=True),
-        )
-        resp.raise_for_status()
-        return ArticlesVectorSearchResult.model_validate(resp.json())
+        return self.api_client.call(OP_VECTOR_SEARCH_ARTICLES, locals())
 
     # ----------------- vector_search_articles (async) ----------------- #
     async def vector_search_articles_async(
@@ -4452,20 +2913,7 @@ class V1Api:
         Returns:
             ArticlesVectorSearchResult: The response
         """
-        # Get path template from class attribute
-        path = PATH_VECTOR_SEARCH_ARTICLES
-
-        params: Dict[str, Any] = {}
-        params = _normalise_query(params)
-
-        resp = await self.api_client.request_async(
-            "POST",
-            path,
-            params=params,
-            json=article_search_params.model_dump(by_alias=True, exclude_none=True),
-        )
-        resp.raise_for_status()
-        return ArticlesVectorSearchResult.model_validate(resp.json())
+        return await self.api_client.call_async(OP_VECTOR_SEARCH_ARTICLES, locals())
 
     # ----------------- vector_search_wikipedia (sync) ----------------- #
     def vector_search_wikipedia(
@@ -4480,21 +2928,7 @@ class V1Api:
         Returns:
             WikipediaVectorSearchResult: The response
         """
-        # Get path template from class attribute
-        path = PATH_VECTOR_SEARCH_WIKIPEDIA
-
-        # --- build query dict on the fly ---
-        params: Dict[str, Any] = {}
-        params = _normalise_query(params)
-
-        resp = self.api_client.request(
-            "POST",
-            path,
-            params=params,
-            json=wikipedia_search_params.model_dump(by_alias=True, exclude_none=True),
-        )
-        resp.raise_for_status()
-        return WikipediaVectorSearchResult.model_validate(resp.json())
+        return self.api_client.call(OP_VECTOR_SEARCH_WIKIPEDIA, locals())
 
     # ----------------- vector_search_wikipedia (async) ----------------- #
     async def vector_search_wikipedia_async(
@@ -4509,17 +2943,4 @@ class V1Api:
         Returns:
             WikipediaVectorSearchResult: The response
         """
-        # Get path template from class attribute
-        path = PATH_VECTOR_SEARCH_WIKIPEDIA
-
-        params: Dict[str, Any] = {}
-        params = _normalise_query(params)
-
-        resp = await self.api_client.request_async(
-            "POST",
-            path,
-            params=params,
-            json=wikipedia_search_params.model_dump(by_alias=True, exclude_none=True),
-        )
-        resp.raise_for_status()
-        return WikipediaVectorSearchResult.model_validate(resp.json())
+        return await self.api_client.call_async(OP_VECTOR_SEARCH_WIKIPEDIA, locals())
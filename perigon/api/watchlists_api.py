@@ -1,12 +1,14 @@
-from enum import Enum
-from typing import Any, Dict, Iterable, List, Mapping, Optional
+from typing import Any, Callable, Iterable, Iterator, List, Mapping, Optional
 
 from pydantic import Field, StrictInt, StrictStr
 from typing_extensions import Annotated
 
 from perigon.api_client import ApiClient
+from perigon.batch import BatchResult, Call, gather_sync, map_sync
 from perigon.models.create_watchlist_params import CreateWatchlistParams
 from perigon.models.update_watchlist_params import UpdateWatchlistParams
+from perigon.operation import Operation
+from perigon.query import QuerySpec, encode_list, encode_scalar
 
 # Define API paths
 PATH_CREATE_WATCHLIST = "/v1/api/watchlists"
@@ -17,52 +19,97 @@ PATH_RESOLVE_WATCHLISTS = "/v1/api/watchlists/resolve"
 PATH_UPDATE_WATCHLIST = "/v1/api/watchlists/{id}"
 
 
-def _normalise_query(params: Mapping[str, Any]) -> Dict[str, Any]:
-    """
-    • Convert Enum → Enum.value
-    • Convert list/tuple/set → CSV string (after Enum handling)
-    • Skip None values
-    """
-    out: Dict[str, Any] = {}
-    for key, value in params.items():
-        if value is None:  # ignore "unset"
-            continue
+# Define operations
+OP_CREATE_WATCHLIST = Operation(
+    "POST",
+    PATH_CREATE_WATCHLIST,
+    body="create_watchlist_params",
+)
+OP_DELETE_WATCHLIST = Operation(
+    "DELETE",
+    PATH_DELETE_WATCHLIST,
+    path_params=(("id", "id"),),
+)
+OP_GET_WATCHLIST = Operation(
+    "GET",
+    PATH_GET_WATCHLIST,
+    path_params=(("id", "id"),),
+)
+OP_LIST_WATCHLISTS = Operation(
+    "GET",
+    PATH_LIST_WATCHLISTS,
+    query=QuerySpec(
+        ("name", "name", encode_scalar),
+        ("page", "page", encode_scalar),
+        ("size", "size", encode_scalar),
+        ("sort_by", "sortBy", encode_scalar),
+        ("sort_order", "sortOrder", encode_scalar),
+    ),
+)
+OP_RESOLVE_WATCHLISTS = Operation(
+    "GET",
+    PATH_RESOLVE_WATCHLISTS,
+    query=QuerySpec(
+        ("name", "name", encode_list),
+    ),
+)
+OP_UPDATE_WATCHLIST = Operation(
+    "PATCH",
+    PATH_UPDATE_WATCHLIST,
+    path_params=(("id", "id"),),
+    body="update_watchlist_params",
+)
 
-        # Unwrap single Enum
-        if isinstance(value, Enum):  # Enum → str
-            value = value.value
 
-        # Handle datetime objects properly
-        from datetime import datetime
+class WatchlistsApi:
+    """"""
 
-        if isinstance(value, datetime):
-            value = value.isoformat().split("+")[0]
+    def __init__(self, api_client: Optional[ApiClient] = None):
+        self.api_client = api_client or ApiClient()
 
-        # Handle collection (after possible Enum unwrap)
-        elif isinstance(value, (list, tuple, set)):
-            # unwrap Enum members inside the collection
-            items: Iterable[str] = (
-                (
-                    item.isoformat().replace(" ", "+")
-                    if isinstance(item, datetime)
-                    else str(item.value if isinstance(item, Enum) else item)
-                )
-                for item in value
-            )
-            value = ",".join(items)  # CSV join
-        else:
-            value = str(value)
+    def gather(
+        self,
+        calls: Iterable[Call],
+        max_concurrency: int = 8,
+        return_exceptions: bool = False,
+    ) -> List[Any]:
+        """
+        Run several ``(method, kwargs)`` calls concurrently from sync code.
 
-        out[key] = value
+        The ``_async`` variants run on the client's background event loop, so
+        no event loop is needed in the caller. Results come back in order.
 
-    return out
+        Example:
+            articles, topics = api.gather([
+                (api.search_articles, {"q": "AI"}),
+                (api.search_topics, {"name": "Markets"}),
+            ])
+        """
+        return gather_sync(
+            self.api_client,
+            calls,
+            max_concurrency=max_concurrency,
+            return_exceptions=return_exceptions,
+        )
 
+    def map(
+        self,
+        method: Callable[..., Any],
+        kwargs_list: Iterable[Mapping[str, Any]],
+        workers: Optional[int] = None,
+    ) -> Iterator[BatchResult[Any]]:
+        """
+        Call a sync method once per kwargs mapping on a thread pool.
 
-class WatchlistsApi:
-    """"""
+        Workers share the client's connection pool and default to its
+        keep-alive size. Results are yielded as they complete; each carries
+        the ``index`` of its kwargs mapping.
 
-    def __init__(self, api_client: Optional[ApiClient] = None):
-        self.api_client = api_client or ApiClient()
+        Example:
+            for result in api.map(api.search_articles, [{"q": q} for q in queries]):
+                print(result.index, result.unwrap().num_results)
+        """
+        return map_sync(self.api_client, method, kwargs_list, workers=workers)
 
     # ----------------- create_watchlist (sync) ----------------- #
     def create_watchlist(self, create_watchlist_params: CreateWatchlistParams):
@@ -73,21 +120,7 @@ class WatchlistsApi:
             create_watchlist_params (CreateWatchlistParams): Parameter create_watchlist_params (required)
 
         """
-        # Get path template from class attribute
-        path = PATH_CREATE_WATCHLIST
-
-        # --- build query dict on the fly ---
-        params: Dict[str, Any] = {}
-        params = _normalise_query(params)
-
-        resp = self.api_client.request(
-            "POST",
-            path,
-            params=params,
-            json=create_watchlist_params.model_dump(by_alias=True, exclude_none=True),
-        )
-        resp.raise_for_status()
-        return resp.json()
+        return self.api_client.call(OP_CREATE_WATCHLIST, locals())
 
     # ----------------- create_watchlist (async) ----------------- #
     async def create_watchlist_async(
@@ -100,20 +133,7 @@ class WatchlistsApi:
             create_watchlist_params (CreateWatchlistParams): Parameter create_watchlist_params (required)
 
         """
-        # Get path template from class attribute
-        path = PATH_CREATE_WATCHLIST
-
-        params: Dict[str, Any] = {}
-        params = _normalise_query(params)
-
-        resp = await self.api_client.request_async(
-            "POST",
-            path,
-            params=params,
-            json=create_watchlist_params.model_dump(by_alias=True, exclude_none=True),
-        )
-        resp.raise_for_status()
-        return resp.json()
+        return await self.api_client.call_async(OP_CREATE_WATCHLIST, locals())
 
     # ----------------- delete_watchlist (sync) ----------------- #
     def delete_watchlist(self, id: int):
@@ -124,19 +144,7 @@ class WatchlistsApi:
             id (int): Parameter id (required)
 
         """
-        # Get path template from class attribute
-        path = PATH_DELETE_WATCHLIST
-
-        # Replace path parameters
-        path = path.format(id=str(id))
-
-        # --- build query dict on the fly ---
-        params: Dict[str, Any] = {}
-        params = _normalise_query(params)
-
-        resp = self.api_client.request("DELETE", path, params=params)
-        resp.raise_for_status()
-        return resp.json()
+        return self.api_client.call(OP_DELETE_WATCHLIST, locals())
 
     # ----------------- delete_watchlist (async) ----------------- #
     async def delete_watchlist_async(self, id: int):
@@ -147,18 +155,7 @@ class WatchlistsApi:
             id (int): Parameter id (required)
 
         """
-        # Get path template from class attribute
-        path = PATH_DELETE_WATCHLIST
-
-        # Replace path parameters
-        path = path.format(id=str(id))
-
-        params: Dict[str, Any] = {}
-        params = _normalise_query(params)
-
-        resp = await self.api_client.request_async("DELETE", path, params=params)
-        resp.raise_for_status()
-        return resp.json()
+        return await self.api_client.call_async(OP_DELETE_WATCHLIST, locals())
 
     # ----------------- get_watchlist (sync) ----------------- #
     def get_watchlist(self, id: int):
@@ -169,19 +166,7 @@ class WatchlistsApi:
             id (int): Parameter id (required)
 
         """
-        # Get path template from class attribute
-        path = PATH_GET_WATCHLIST
-
-        # Replace path parameters
-        path = path.format(id=str(id))
-
-        # --- build query dict on the fly ---
-        params: Dict[str, Any] = {}
-        params = _normalise_query(params)
-
-        resp = self.api_client.request("GET", path, params=params)
-        resp.raise_for_status()
-        return resp.json()
+        return self.api_client.call(OP_GET_WATCHLIST, locals())
 
     # ----------------- get_watchlist (async) ----------------- #
     async def get_watchlist_async(self, id: int):
@@ -192,18 +177,7 @@ class WatchlistsApi:
             id (int): Parameter id (required)
 
         """
-        # Get path template from class attribute
-        path = PATH_GET_WATCHLIST
-
-        # Replace path parameters
-        path = path.format(id=str(id))
-
-        params: Dict[str, Any] = {}
-        params = _normalise_query(params)
-
-        resp = await self.api_client.request_async("GET", path, params=params)
-        resp.raise_for_status()
-        return resp.json()
+        return await self.api_client.call_async(OP_GET_WATCHLIST, locals())
 
     # ----------------- list_watchlists (sync) ----------------- #
     def list_watchlists(
@@ -225,26 +199,7 @@ class WatchlistsApi:
             size (Optional[str]): The number of items per page.   _Must be at least 1_.   _Default value 10_.
 
         """
-        # Get path template from class attribute
-        path = PATH_LIST_WATCHLISTS
-
-        # --- build query dict on the fly ---
-        params: Dict[str, Any] = {}
-        if name is not None:
-            params["name"] = name
-        if page is not None:
-            params["page"] = page
-        if size is not None:
-            params["size"] = size
-        if sort_by is not None:
-            params["sortBy"] = sort_by
-        if sort_order is not None:
-            params["sortOrder"] = sort_order
-        params = _normalise_query(params)
-
-        resp = self.api_client.request("GET", path, params=params)
-        resp.raise_for_status()
-        return resp.json()
+        return self.api_client.call(OP_LIST_WATCHLISTS, locals())
 
     # ----------------- list_watchlists (async) ----------------- #
     async def list_watchlists_async(
@@ -266,25 +221,7 @@ class WatchlistsApi:
             size (Optional[str]): The number of items per page.   _Must be at least 1_.   _Default value 10_.
 
         """
-        # Get path template from class attribute
-        path = PATH_LIST_WATCHLISTS
-
-        params: Dict[str, Any] = {}
-        if name is not None:
-            params["name"] = name
-        if page is not None:
-            params["page"] = page
-        if size is not None:
-            params["size"] = size
-        if sort_by is not None:
-            params["sortBy"] = sort_by
-        if sort_order is not None:
-            params["sortOrder"] = sort_order
-        params = _normalise_query(params)
-
-        resp = await self.api_client.request_async("GET", path, params=params)
-        resp.raise_for_status()
-        return resp.json()
+        return await self.api_client.call_async(OP_LIST_WATCHLISTS, locals())
 
     # ----------------- resolve_watchlists (sync) ----------------- #
     def resolve_watchlists(self, name: Optional[List[str]] = None):
@@ -295,18 +232,7 @@ class WatchlistsApi:
             name (Optional[List[str]]): Watchlist names to resolve (max 100)
 
         """
-        # Get path template from class attribute
-        path = PATH_RESOLVE_WATCHLISTS
-
-        # --- build query dict on the fly ---
-        params: Dict[str, Any] = {}
-        if name is not None:
-            params["name"] = name
-        params = _normalise_query(params)
-
-        resp = self.api_client.request("GET", path, params=params)
-        resp.raise_for_status()
-        return resp.json()
+        return self.api_client.call(OP_RESOLVE_WATCHLISTS, locals())
 
     # ----------------- resolve_watchlists (async) ----------------- #
     async def resolve_watchlists_async(self, name: Optional[List[str]] = None):
@@ -317,17 +243,7 @@ class WatchlistsApi:
             name (Optional[List[str]]): Watchlist names to resolve (max 100)
 
         """
-        # Get path template from class attribute
-        path = PATH_RESOLVE_WATCHLISTS
-
-        params: Dict[str, Any] = {}
-        if name is not None:
-            params["name"] = name
-        params = _normalise_query(params)
-
-        resp = await self.api_client.request_async("GET", path, params=params)
-        resp.raise_for_status()
-        return resp.json()
+        return await self.api_client.call_async(OP_RESOLVE_WATCHLISTS, locals())
 
     # ----------------- update_watchlist (sync) ----------------- #
     def update_watchlist(self, id: int, update_watchlist_params: UpdateWatchlistParams):
@@ -339,24 +255,7 @@ class WatchlistsApi:
             update_watchlist_params (UpdateWatchlistParams): Parameter update_watchlist_params (required)
 
         """
-        # Get path template from class attribute
-        path = PATH_UPDATE_WATCHLIST
-
-        # Replace path parameters
-        path = path.format(id=str(id))
-
-        # --- build query dict on the fly ---
-        params: Dict[str, Any] = {}
-        params = _normalise_query(params)
-
-        resp = self.api_client.request(
-            "PATCH",
-            path,
-            params=params,
-            json=update_watchlist_params.model_dump(by_alias=True, exclude_none=True),
-        )
-        resp.raise_for_status()
-        return resp.json()
+        return self.api_client.call(OP_UPDATE_WATCHLIST, locals())
 
     # ----------------- update_watchlist (async) ----------------- #
     async def update_watchlist_async(
@@ -370,20 +269,4 @@ class WatchlistsApi:
             update_watchlist_params (UpdateWatchlistParams): Parameter update_watchlist_params (required)
 
         """
-        # Get path template from class attribute
-        path = PATH_UPDATE_WATCHLIST
-
-        # Replace path parameters
-        path = path.format(id=str(id))
-
-        params: Dict[str, Any] = {}
-        params = _normalise_query(params)
-
-        resp = await self.api_client.request_async(
-            "PATCH",
-            path,
-            params=params,
-            json=update_watchlist_params.model_dump(by_alias=True, exclude_none=True),
-        )
-        resp.raise_for_status()
-        return resp.json()
+        return await self.api_client.call_async(OP_UPDATE_WATCHLIST, locals())
@@ -1,9 +1,49 @@
 # Package : perigon
 from __future__ import annotations
 
-from typing import Any, Dict, Optional
+import asyncio
+import threading
+from time import perf_counter
+from typing import (
+    Any,
+    Coroutine,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Type,
+    TypeVar,
+    Union,
+    cast,
+)
 
 import httpx
+from pydantic import TypeAdapter
+
+from perigon.compression import TransferStats, accept_encoding
+from perigon.instrumentation import CallReport, Observer
+from perigon.operation import Operation
+from perigon.profiling import Profiler
+from perigon.vectors import (
+    VECTOR_RESULTS,
+    attach_vectors,
+    check_format,
+    split_vectors,
+)
+
+T = TypeVar("T")
+
+
+_ADAPTERS: Dict[Any, TypeAdapter[Any]] = {}
+
+
+def _adapter(tp: Type[T]) -> TypeAdapter[T]:
+    # One validator per result type, built on first use.
+    adapter = _ADAPTERS.get(tp)
+    if adapter is None:
+        adapter = _ADAPTERS[tp] = TypeAdapter(tp)
+    return adapter
 
 
 class ApiClient:
@@ -17,14 +57,54 @@ class ApiClient:
         api_key: Optional[str] = None,
         base_url: str = "https://api.perigon.io",
         timeout: Optional[float] = None,
+        limits: Optional[httpx.Limits] = None,
+        observers: Optional[Iterable[Observer]] = None,
+        profile: Union[bool, Profiler] = False,
+        compression: Union[bool, Sequence[str]] = True,
+        transport: Optional[httpx.BaseTransport] = None,
+        async_transport: Optional[httpx.AsyncBaseTransport] = None,
+        vectors: Optional[str] = None,
     ):
         self.api_key = api_key
         self.base_url = base_url or "https://api.perigon.io"
         self.timeout = timeout
+        # Shared by the sync and async sessions; also sizes V1Api.map() pools
+        self.limits = limits or httpx.Limits(
+            max_connections=100, max_keepalive_connections=20
+        )
+
+        # Receive a CallReport per API call; see perigon.instrumentation
+        self.observers: List[Observer] = list(observers or ())
+        # profile=True: per-endpoint time breakdown, see perigon.profiling
+        self.profiler: Optional[Profiler] = None
+        if profile:
+            self.profiler = profile if isinstance(profile, Profiler) else Profiler()
+            self.observers.append(self.profiler)
+
+        # Accept-Encoding offered on every request; see perigon.compression
+        self.accept_encoding = accept_encoding(compression)
+        # Wire vs decoded response bytes across all calls
+        self.transfer = TransferStats()
+
+        # "numpy" / "array": decode embeddings without per-element validation
+        self.vectors = check_format(vectors)
+
+        # Custom transports (e.g. perigon.cassette); one object implementing
+        # both interfaces serves the sync and async sessions alike
+        self.transport = transport
+        if async_transport is None and isinstance(transport, httpx.AsyncBaseTransport):
+            async_transport = transport
+        self.async_transport = async_transport
 
         # Persistent sessions for connection‑pool reuse (HTTP/1.1 or HTTP/2)
-        self._sync = httpx.Client(base_url=self.base_url, timeout=self.timeout)
-        self._async = httpx.AsyncClient(base_url=self.base_url, timeout=self.timeout)
+        self._sync = httpx.Client(transport=transport, **self._session_options())
+        self._async = self._make_async_client()
+
+        # Background event loop used by run_sync(); started on first use
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_thread: Optional[threading.Thread] = None
+        self._loop_async: Optional[httpx.AsyncClient] = None
+        self._loop_lock = threading.Lock()
 
     # ------------------------------------------------------------------ #
     # Internal helpers
@@ -37,6 +117,26 @@ class ApiClient:
 
         return hdrs
 
+    def _session_options(self) -> Dict[str, Any]:
+        return {
+            "base_url": self.base_url,
+            "timeout": self.timeout,
+            "limits": self.limits,
+            "headers": {"Accept-Encoding": self.accept_encoding},
+        }
+
+    def _make_async_client(self) -> httpx.AsyncClient:
+        return httpx.AsyncClient(
+            transport=self.async_transport, **self._session_options()
+        )
+
+    def _async_client(self) -> httpx.AsyncClient:
+        # httpx connection pools are bound to the loop that opened them, so
+        # coroutines on the background loop get a session of their own.
+        if self._loop is not None and asyncio.get_running_loop() is self._loop:
+            return self._loop_async  # type: ignore[return-value]
+        return self._async
+
     def _prepare_url(self, path: str) -> str:
         url = f"{self.base_url}{path}"
         return url
@@ -68,13 +168,183 @@ class ApiClient:
         if headers:
             all_headers.update(headers)
         url = self._prepare_url(path)
-        return await self._async.request(method, url, headers=all_headers, **kwargs)
+        return await self._async_client().request(
+            method, url, headers=all_headers, **kwargs
+        )
+
+    def deserialize(self, resp: httpx.Response, model: Type[T]) -> T:
+        """
+        Decode ``resp`` into ``model``. The JSON is parsed and validated in
+        one pass unless the raw dict is needed to split off vectors.
+        """
+        if self.vectors is not None and model in VECTOR_RESULTS:
+            return self._validate(model, resp.json())
+        return _adapter(model).validate_json(resp.content)
+
+    def _validate(self, model: Type[T], data: Any) -> T:
+        if self.vectors is not None and model in VECTOR_RESULTS:
+            raw = split_vectors(data)
+            parsed = _adapter(model).validate_python(data)
+            return cast(T, attach_vectors(parsed, raw, self.vectors))
+        return _adapter(model).validate_python(data)
+
+    # ------------------------------------------------------------------ #
+    # Operation core shared by the generated sync / async methods
+    # ------------------------------------------------------------------ #
+    def call(
+        self,
+        op: Operation[T],
+        values: Dict[str, Any],
+        cache_hit: Optional[bool] = None,
+    ) -> T:
+        """
+        Execute ``op`` with the calling method's arguments. Caching layers
+        pass ``cache_hit=False`` so observers see the call as a cache miss.
+        """
+        if not self.observers:
+            path, kwargs = op.prepare(values)
+            return self._handle(op, self.request(op.method, path, **kwargs))
+
+        started = perf_counter()
+        path, kwargs = op.prepare(values)
+        report = self._begin(op, path, kwargs, started)
+        report.cache_hit = cache_hit
+        kwargs["extensions"] = {"trace": report.trace}
+        try:
+            resp = self.request(op.method, path, **kwargs)
+            return self._handle(op, resp, report)
+        except BaseException as exc:
+            report.error = exc
+            raise
+        finally:
+            self._end(report)
+
+    async def call_async(
+        self,
+        op: Operation[T],
+        values: Dict[str, Any],
+        cache_hit: Optional[bool] = None,
+    ) -> T:
+        """Async counterpart of :meth:`call`."""
+        if not self.observers:
+            path, kwargs = op.prepare(values)
+            resp = await self.request_async(op.method, path, **kwargs)
+            return self._handle(op, resp)
+
+        started = perf_counter()
+        path, kwargs = op.prepare(values)
+        report = self._begin(op, path, kwargs, started)
+        report.cache_hit = cache_hit
+        kwargs["extensions"] = {"trace": report.trace_async}
+        try:
+            resp = await self.request_async(op.method, path, **kwargs)
+            return self._handle(op, resp, report)
+        except BaseException as exc:
+            report.error = exc
+            raise
+        finally:
+            self._end(report)
+
+    def record_cached(
+        self, op: Operation[Any], values: Dict[str, Any], started: float
+    ) -> None:
+        """
+        Report a call of ``op`` that a caching layer answered without a
+        request: observers get a ``CallReport`` with ``cache_hit=True``.
+        """
+        if not self.observers:
+            return
+        path, kwargs = op.prepare(values)
+        report = self._begin(op, path, kwargs, started)
+        report.cache_hit = True
+        self._end(report)
+
+    def _handle(
+        self,
+        op: Operation[T],
+        resp: httpx.Response,
+        report: Optional[CallReport] = None,
+    ) -> T:
+        self.transfer.add(resp)
+        if report is None:
+            resp.raise_for_status()
+            if op.response is None:
+                return cast(T, resp.json())
+            return self.deserialize(resp, op.response)
+
+        report.record_response(resp)
+        resp.raise_for_status()
+        started = perf_counter()
+        data = resp.json()
+        decoded = perf_counter()
+        report.decode = decoded - started
+        if op.response is None:
+            return cast(T, data)
+        result = self._validate(op.response, data)
+        report.validate = perf_counter() - decoded
+        return result
+
+    def _begin(
+        self, op: Operation[Any], path: str, kwargs: Dict[str, Any], started: float
+    ) -> CallReport:
+        report = CallReport(op.method, op.path, path, kwargs["params"])
+        report.encode = report.started - started
+        report.started = started
+        for observer in self.observers:
+            observer.on_start(report)
+        report.sent = perf_counter()
+        return report
+
+    def _end(self, report: CallReport) -> None:
+        report.finish()
+        for observer in self.observers:
+            observer.on_end(report)
+
+    # ------------------------------------------------------------------ #
+    # Background event loop for sync callers
+    # ------------------------------------------------------------------ #
+    def run_sync(self, coro: Coroutine[Any, Any, T]) -> T:
+        """
+        Run ``coro`` on the client's background event loop and block until it
+        finishes. Lets synchronous code fan out ``_async`` calls without an
+        event loop of its own; the loop thread is started on first use and
+        stopped by :meth:`close`.
+        """
+        loop = self._ensure_loop()
+        if threading.current_thread() is self._loop_thread:
+            coro.close()
+            raise RuntimeError("run_sync() cannot be called from the client's loop")
+        return asyncio.run_coroutine_threadsafe(coro, loop).result()
+
+    def _ensure_loop(self) -> asyncio.AbstractEventLoop:
+        with self._loop_lock:
+            if self._loop is None:
+                loop = asyncio.new_event_loop()
+                thread = threading.Thread(
+                    target=loop.run_forever, name="perigon-loop", daemon=True
+                )
+                thread.start()
+                self._loop_async = self._make_async_client()
+                self._loop, self._loop_thread = loop, thread
+            return self._loop
+
+    def _stop_loop(self) -> None:
+        with self._loop_lock:
+            loop, thread, client = self._loop, self._loop_thread, self._loop_async
+            self._loop = self._loop_thread = self._loop_async = None
+        if loop is None or thread is None or client is None:
+            return
+        asyncio.run_coroutine_threadsafe(client.aclose(), loop).result()
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join()
+        loop.close()
 
     # ------------------------------------------------------------------ #
     # Clean‑up helpers
     # ------------------------------------------------------------------ #
     def close(self) -> None:
         self._sync.close()
+        self._stop_loop()
 
     async def aclose(self) -> None:
         await self._async.aclose()
@@ -0,0 +1,242 @@
+# Package : perigon
+"""
+Concurrent execution of heterogeneous API calls.
+
+A :class:`Batch` collects calls to any generated API method (``V1Api``,
+``WatchlistsApi``, …) and runs them on the async client with bounded
+fan-out, so a page that needs twenty calls waits for the slowest one rather
+than for their sum::
+
+    batch = Batch(max_concurrency=8)
+    articles = batch.add(api.search_articles, q="AI", size=10)
+    counts = batch.add(api.get_story_counts, split_by="DAY", q="AI")
+    await batch.run()
+
+    articles.unwrap().num_results       # typed as QuerySearchResult
+    counts.error                        # per-call exception, if any
+"""
+
+from __future__ import annotations
+
+import asyncio
+import inspect
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Generic,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Tuple,
+    TypeVar,
+    cast,
+    overload,
+)
+
+from perigon.exceptions import ApiTypeError
+
+if TYPE_CHECKING:
+    from perigon.api_client import ApiClient
+
+T = TypeVar("T")
+
+# ``(api method, keyword arguments)`` as accepted by :func:`gather_sync`
+Call = Tuple[Callable[..., Any], Mapping[str, Any]]
+
+
+class BatchResult(Generic[T]):
+    """Outcome of one call in a :class:`Batch`; filled in by :meth:`Batch.run`."""
+
+    __slots__ = ("index", "name", "value", "error", "done")
+
+    def __init__(self, index: int, name: str):
+        self.index = index
+        self.name = name
+        self.value: Optional[T] = None
+        self.error: Optional[BaseException] = None
+        self.done = False
+
+    @property
+    def ok(self) -> bool:
+        return self.done and self.error is None
+
+    def unwrap(self) -> T:
+        """Return the value, re-raising the call's exception if it failed."""
+        if not self.done:
+            raise RuntimeError(f"{self.name} has not run yet")
+        if self.error is not None:
+            raise self.error
+        return self.value  # type: ignore[return-value]
+
+    def __repr__(self) -> str:
+        state = "pending" if not self.done else "ok" if self.ok else "error"
+        return f"BatchResult({self.index}, {self.name}, {state})"
+
+
+def resolve_async(method: Callable[..., Any]) -> Callable[..., Awaitable[Any]]:
+    """
+    Return the coroutine variant of a generated API method.
+
+    Accepts either the sync method (``api.search_articles``) or the async one
+    (``api.search_articles_async``).
+    """
+    if inspect.iscoroutinefunction(method):
+        return method
+    owner = getattr(method, "__self__", None)
+    name = getattr(method, "__name__", repr(method))
+    async_method = getattr(owner, f"{name}_async", None)
+    if async_method is None or not inspect.iscoroutinefunction(async_method):
+        raise ApiTypeError(f"{name} has no async variant on {type(owner).__name__}")
+    return cast(Callable[..., Awaitable[Any]], async_method)
+
+
+class Batch:
+    """Collects API calls and runs them concurrently, preserving order."""
+
+    def __init__(self, max_concurrency: int = 8):
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        self.max_concurrency = max_concurrency
+        self._calls: List[Callable[[], Awaitable[Any]]] = []
+        self._results: List[BatchResult[Any]] = []
+
+    def __len__(self) -> int:
+        return len(self._calls)
+
+    @overload
+    def add(
+        self, method: Callable[..., Awaitable[T]], **kwargs: Any
+    ) -> BatchResult[T]: ...
+
+    @overload
+    def add(self, method: Callable[..., T], **kwargs: Any) -> BatchResult[T]: ...
+
+    def add(self, method: Callable[..., Any], **kwargs: Any) -> BatchResult[Any]:
+        """Queue ``method(**kwargs)``; returns its (pending) result slot."""
+        async_method = resolve_async(method)
+        result: BatchResult[Any] = BatchResult(
+            len(self._results), async_method.__name__.removesuffix("_async")
+        )
+        self._calls.append(lambda: async_method(**kwargs))
+        self._results.append(result)
+        return result
+
+    async def run(self) -> List[BatchResult[Any]]:
+        """
+        Execute every queued call with at most ``max_concurrency`` in flight.
+
+        Exceptions are captured per call on :attr:`BatchResult.error`; the
+        returned list is in the order the calls were added.
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def _one(
+            call: Callable[[], Awaitable[Any]], slot: BatchResult[Any]
+        ) -> None:
+            async with semaphore:
+                try:
+                    slot.value = await call()
+                except Exception as exc:
+                    slot.error = exc
+                finally:
+                    slot.done = True
+
+        pending = [
+            _one(call, slot)
+            for call, slot in zip(self._calls, self._results)
+            if not slot.done
+        ]
+        await asyncio.gather(*pending)
+        return list(self._results)
+
+
+def gather_sync(
+    api_client: "ApiClient",
+    calls: Iterable[Call],
+    *,
+    max_concurrency: int = 8,
+    return_exceptions: bool = False,
+) -> List[Any]:
+    """
+    Run ``(method, kwargs)`` calls concurrently from synchronous code.
+
+    The calls execute as a :class:`Batch` on ``api_client``'s background event
+    loop (:meth:`ApiClient.run_sync`). Results are returned in order. With
+    ``return_exceptions=False`` the first failed call (in order) is re-raised
+    once every call has finished; otherwise exceptions take the place of their
+    results, as with :func:`asyncio.gather`.
+    """
+    batch = Batch(max_concurrency)
+    for method, kwargs in calls:
+        batch.add(method, **kwargs)
+    results = api_client.run_sync(batch.run())
+    if return_exceptions:
+        return [r.value if r.error is None else r.error for r in results]
+    return [r.unwrap() for r in results]
+
+
+def pool_size(api_client: "ApiClient", jobs: int, workers: Optional[int] = None) -> int:
+    """
+    Number of threads for :func:`map_sync`.
+
+    Defaults to the client's keep-alive pool size, so every worker can hold on
+    to a warm connection instead of churning new ones, and never exceeds
+    ``max_connections`` (extra threads would only queue on the pool) or the
+    number of jobs.
+    """
+    limits = api_client.limits
+    size = workers or limits.max_keepalive_connections or limits.max_connections or 32
+    if limits.max_connections is not None:
+        size = min(size, limits.max_connections)
+    return max(1, min(size, jobs))
+
+
+def map_sync(
+    api_client: "ApiClient",
+    method: Callable[..., T],
+    kwargs_list: Iterable[Mapping[str, Any]],
+    workers: Optional[int] = None,
+) -> Iterator[BatchResult[T]]:
+    """
+    Run a sync API method once per kwargs mapping on a thread pool.
+
+    All threads share ``api_client``'s ``httpx.Client`` connection pool.
+    Results are yielded as they complete; use :attr:`BatchResult.index` to
+    line them up with the input. Closing the iterator early cancels calls
+    that have not started yet.
+    """
+    # Checked here rather than in the generator so the error comes from the call
+    if inspect.iscoroutinefunction(method):
+        raise ApiTypeError(f"{method.__name__} is async; pass the sync method")
+    jobs = list(kwargs_list)
+    return _map_sync(method, jobs, pool_size(api_client, len(jobs), workers))
+
+
+def _map_sync(
+    method: Callable[..., T], jobs: List[Mapping[str, Any]], threads: int
+) -> Iterator[BatchResult[T]]:
+    if not jobs:
+        return
+    name = getattr(method, "__name__", repr(method))
+    executor = ThreadPoolExecutor(threads, thread_name_prefix="perigon-map")
+    try:
+        futures: Dict["Future[T]", BatchResult[T]] = {
+            executor.submit(method, **kwargs): BatchResult(index, name)
+            for index, kwargs in enumerate(jobs)
+        }
+        for future in as_completed(futures):
+            slot = futures[future]
+            try:
+                slot.value = future.result()
+            except Exception as exc:
+                slot.error = exc
+            slot.done = True
+            yield slot
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
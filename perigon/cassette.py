@@ -0,0 +1,285 @@
+# Package : perigon
+"""
+Record / replay transports for deterministic, offline runs.
+
+:class:`RecordingTransport` sits in front of the real network transport and
+captures every request / response pair; :class:`ReplayTransport` serves them
+back without a network, either at full speed or at the recorded latencies.
+Both plug into :class:`ApiClient` for sync and async calls::
+
+    client = ApiClient(api_key=..., transport=RecordingTransport("job.cassette"))
+    run_job(V1Api(client))
+    client.close()                                  # writes job.cassette
+
+    replay = ReplayTransport("job.cassette", latency="recorded")
+    run_job(V1Api(ApiClient(transport=replay)))     # no network, no quota
+
+Interactions are keyed by method, path, query string with its parameters
+sorted, and a hash of the request body, so keyword order and the API key do
+not matter. Repeated requests for the same key replay their recordings in
+order, cycling once exhausted. The cassette is gzip-compressed JSON Lines
+holding decoded bodies; ``Content-Encoding`` is therefore not replayed.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import base64
+import gzip
+import hashlib
+import itertools
+import json
+import os
+import threading
+import time
+import weakref
+from time import perf_counter
+from typing import (
+    Any,
+    AsyncIterator,
+    Dict,
+    Iterator,
+    List,
+    MutableMapping,
+    Optional,
+    Tuple,
+    Union,
+)
+from urllib.parse import parse_qsl, urlencode
+
+import httpx
+
+from perigon.exceptions import ApiKeyError, ApiValueError
+
+PathLike = Union[str, "os.PathLike[str]"]
+
+# Describe the payload rather than how it travelled
+_DROP_HEADERS = {"content-encoding", "content-length", "transfer-encoding"}
+
+
+def request_key(request: httpx.Request) -> str:
+    """Normalised lookup key for ``request``."""
+    query = urlencode(sorted(parse_qsl(request.url.query.decode(), True)))
+    key = f"{request.method} {request.url.path}?{query}"
+    body = request.content
+    if body:
+        key += " #" + hashlib.sha1(body).hexdigest()
+    return key
+
+
+class Interaction:
+    """One recorded response and how long it took to arrive."""
+
+    __slots__ = ("key", "status", "headers", "body", "latency")
+
+    def __init__(
+        self,
+        key: str,
+        status: int,
+        headers: List[Tuple[str, str]],
+        body: bytes,
+        latency: float,
+    ):
+        self.key = key
+        self.status = status
+        self.headers = headers
+        self.body = body
+        self.latency = latency
+
+    def to_json(self) -> Dict[str, Any]:
+        record: Dict[str, Any] = {
+            "key": self.key,
+            "status": self.status,
+            "headers": self.headers,
+            "latency": round(self.latency, 6),
+        }
+        try:
+            record["text"] = self.body.decode()
+        except UnicodeDecodeError:
+            record["base64"] = base64.b64encode(self.body).decode()
+        return record
+
+    @classmethod
+    def from_json(cls, record: Dict[str, Any]) -> "Interaction":
+        if "text" in record:
+            body = record["text"].encode()
+        else:
+            body = base64.b64decode(record["base64"])
+        headers = [(name, value) for name, value in record["headers"]]
+        return cls(record["key"], record["status"], headers, body, record["latency"])
+
+    def to_response(self) -> httpx.Response:
+        return httpx.Response(
+            self.status, headers=self.headers, stream=_Body(self.body)
+        )
+
+
+class _Body(httpx.SyncByteStream, httpx.AsyncByteStream):
+    # Streamed rather than pre-read, so httpx counts the bytes as downloaded
+    def __init__(self, body: bytes):
+        self.body = body
+
+    def __iter__(self) -> Iterator[bytes]:
+        yield self.body
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        yield self.body
+
+
+def load(path: PathLike) -> List[Interaction]:
+    """Read every interaction in a cassette file."""
+    with gzip.open(path, "rt", encoding="utf-8") as fh:
+        return [Interaction.from_json(json.loads(line)) for line in fh if line]
+
+
+def save(path: PathLike, interactions: List[Interaction]) -> None:
+    """Write ``interactions`` to a cassette file, replacing it."""
+    tmp = f"{os.fspath(path)}.tmp"
+    with gzip.open(tmp, "wt", encoding="utf-8") as fh:
+        for interaction in interactions:
+            fh.write(json.dumps(interaction.to_json(), separators=(",", ":")))
+            fh.write("\n")
+    os.replace(tmp, path)
+
+
+class RecordingTransport(httpx.BaseTransport, httpx.AsyncBaseTransport):
+    """
+    Forwards requests to a real transport and records the exchanges.
+
+    The cassette is written when the transport is closed (closing the
+    :class:`ApiClient` does that) or on :meth:`save`. ``transport`` also
+    serves async requests when it implements ``httpx.AsyncBaseTransport``
+    (as ``httpx.MockTransport`` does), unless ``async_transport`` is given.
+    Without either, async requests get an ``httpx.AsyncHTTPTransport`` per
+    event loop, since connection pools cannot be shared between loops.
+    """
+
+    def __init__(
+        self,
+        path: PathLike,
+        transport: Optional[httpx.BaseTransport] = None,
+        async_transport: Optional[httpx.AsyncBaseTransport] = None,
+        **transport_options: Any,
+    ):
+        self.path = path
+        self.interactions: List[Interaction] = []
+        self._options = transport_options
+        self._sync = transport or httpx.HTTPTransport(**transport_options)
+        if async_transport is None and isinstance(transport, httpx.AsyncBaseTransport):
+            async_transport = transport
+        self._given_async = async_transport
+        self._async: MutableMapping[
+            asyncio.AbstractEventLoop, httpx.AsyncBaseTransport
+        ] = weakref.WeakKeyDictionary()
+        self._lock = threading.Lock()
+
+    def _record(
+        self, request: httpx.Request, resp: httpx.Response, started: float
+    ) -> httpx.Response:
+        headers = [
+            (name, value)
+            for name, value in resp.headers.items()
+            if name.lower() not in _DROP_HEADERS
+        ]
+        interaction = Interaction(
+            request_key(request),
+            resp.status_code,
+            headers,
+            resp.content,
+            perf_counter() - started,
+        )
+        with self._lock:
+            self.interactions.append(interaction)
+        return interaction.to_response()
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        started = perf_counter()
+        resp = self._sync.handle_request(request)
+        try:
+            resp.read()
+        finally:
+            resp.close()
+        return self._record(request, resp, started)
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        transport = self._given_async
+        if transport is None:
+            loop = asyncio.get_running_loop()
+            transport = self._async.get(loop)
+            if transport is None:
+                transport = httpx.AsyncHTTPTransport(**self._options)
+                self._async[loop] = transport
+        started = perf_counter()
+        resp = await transport.handle_async_request(request)
+        try:
+            await resp.aread()
+        finally:
+            await resp.aclose()
+        return self._record(request, resp, started)
+
+    def save(self) -> None:
+        with self._lock:
+            interactions = list(self.interactions)
+        save(self.path, interactions)
+
+    def close(self) -> None:
+        self.save()
+        self._sync.close()
+
+    async def aclose(self) -> None:
+        self.save()
+        transport = self._given_async
+        if transport is None:
+            transport = self._async.pop(asyncio.get_running_loop(), None)
+        if transport is not None:
+            await transport.aclose()
+
+
+class ReplayTransport(httpx.BaseTransport, httpx.AsyncBaseTransport):
+    """
+    Serves responses from a cassette without touching the network.
+
+    ``latency="none"`` answers immediately; ``"recorded"`` waits as long as
+    the original response took, multiplied by ``speed`` (``0.5`` replays at
+    half the recorded latency). A request with no recording raises
+    :class:`ApiKeyError`.
+    """
+
+    def __init__(
+        self,
+        cassette: Union[PathLike, List[Interaction]],
+        latency: str = "none",
+        speed: float = 1.0,
+    ):
+        if latency not in ("none", "recorded"):
+            raise ApiValueError("latency must be 'none' or 'recorded'")
+        if isinstance(cassette, list):
+            interactions = cassette
+        else:
+            interactions = load(cassette)
+        grouped: Dict[str, List[Interaction]] = {}
+        for interaction in interactions:
+            grouped.setdefault(interaction.key, []).append(interaction)
+        self._cycles = {key: itertools.cycle(group) for key, group in grouped.items()}
+        self._delay = speed if latency == "recorded" else 0.0
+        self._lock = threading.Lock()
+
+    def _next(self, request: httpx.Request) -> Interaction:
+        key = request_key(request)
+        with self._lock:
+            cycle = self._cycles.get(key)
+            if cycle is None:
+                raise ApiKeyError(f"no recorded response for {key}")
+            return next(cycle)
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        interaction = self._next(request)
+        if self._delay:
+            time.sleep(interaction.latency * self._delay)
+        return interaction.to_response()
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        interaction = self._next(request)
+        if self._delay:
+            await asyncio.sleep(interaction.latency * self._delay)
+        return interaction.to_response()
@@ -0,0 +1,137 @@
+# Package : perigon
+"""
+Response compression negotiation and transfer accounting.
+
+httpx transparently decodes ``gzip`` and ``deflate`` and, when the optional
+decoders are installed, ``br`` (``brotli`` / ``brotlicffi``) and ``zstd``
+(``zstandard``, httpx >= 0.27.1). :func:`accept_encoding` builds the
+``Accept-Encoding`` header :class:`ApiClient` sends from the codecs the
+installed httpx can actually decode, and
+:class:`TransferStats` counts wire vs. decoded bytes so the savings can be
+measured::
+
+    client = ApiClient(api_key=..., compression=["zstd", "gzip"])
+    ...
+    client.transfer.snapshot()
+    # {'responses': 12, 'wire_bytes': 41210, 'decoded_bytes': 388412, ...}
+"""
+
+from __future__ import annotations
+
+import threading
+from importlib import import_module
+from typing import Dict, Iterable, List, Tuple, Union
+
+import httpx
+
+from perigon.exceptions import ApiValueError
+
+# Every codec the client can negotiate, in order of preference
+CODECS = ("zstd", "br", "gzip", "deflate")
+
+# Codec -> what to install for it; gzip and deflate are always available
+_OPTIONAL = {"zstd": "zstandard and httpx >= 0.27.1", "br": "brotli"}
+
+# First httpx release that decodes zstd
+_HTTPX_ZSTD = (0, 27, 1)
+
+
+def _installed(*modules: str) -> bool:
+    for name in modules:
+        try:
+            import_module(name)
+        except ImportError:
+            continue
+        return True
+    return False
+
+
+def _httpx_version() -> Tuple[int, ...]:
+    return tuple(int(part) for part in httpx.__version__.split(".")[:3])
+
+
+def available_codecs() -> Tuple[str, ...]:
+    """Codecs the installed httpx can decode, most preferred first."""
+    # The same modules httpx looks for; anything unexpected while checking
+    # (e.g. a pre-release version string) leaves just gzip and deflate
+    optional: List[str] = []
+    try:
+        if _installed("zstandard") and _httpx_version() >= _HTTPX_ZSTD:
+            optional.append("zstd")
+        if _installed("brotli", "brotlicffi"):
+            optional.append("br")
+    except Exception:
+        optional = []
+    return (*optional, "gzip", "deflate")
+
+
+def accept_encoding(compression: Union[bool, Iterable[str]] = True) -> str:
+    """
+    ``Accept-Encoding`` value for ``ApiClient(compression=...)``.
+
+    ``True`` offers every available codec, ``False`` asks for uncompressed
+    responses, and an iterable restricts the offer to the named codecs.
+    """
+    if compression is True:
+        return ", ".join(available_codecs())
+    if compression is False:
+        return "identity"
+
+    requested = list(compression)
+    unknown = [codec for codec in requested if codec not in CODECS]
+    if unknown:
+        raise ApiValueError(f"unknown codecs {unknown}; choose from {list(CODECS)}")
+    available = available_codecs()
+    missing = [codec for codec in requested if codec not in available]
+    if missing:
+        needs = "; ".join(f"{codec} needs {_OPTIONAL[codec]}" for codec in missing)
+        raise ApiValueError(f"codecs {missing} are not available: {needs}")
+    return ", ".join(codec for codec in CODECS if codec in requested) or "identity"
+
+
+class TransferStats:
+    """Thread-safe running totals of response bytes on the wire vs. decoded."""
+
+    __slots__ = ("_lock", "responses", "wire_bytes", "decoded_bytes", "encodings")
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        with self._lock:
+            self.responses = 0
+            self.wire_bytes = 0
+            self.decoded_bytes = 0
+            # Content-Encoding -> number of responses that used it
+            self.encodings: Dict[str, int] = {}
+
+    def add(self, resp: httpx.Response) -> None:
+        encoding = resp.headers.get("content-encoding", "identity")
+        wire, decoded = resp.num_bytes_downloaded, len(resp.content)
+        with self._lock:
+            self.responses += 1
+            self.wire_bytes += wire
+            self.decoded_bytes += decoded
+            self.encodings[encoding] = self.encodings.get(encoding, 0) + 1
+
+    @property
+    def ratio(self) -> float:
+        """Decoded bytes per wire byte (``1.0`` when nothing was compressed)."""
+        return self.decoded_bytes / self.wire_bytes if self.wire_bytes else 1.0
+
+    def snapshot(self) -> Dict[str, object]:
+        with self._lock:
+            return {
+                "responses": self.responses,
+                "wire_bytes": self.wire_bytes,
+                "decoded_bytes": self.decoded_bytes,
+                "saved_bytes": self.decoded_bytes - self.wire_bytes,
+                "encodings": dict(self.encodings),
+            }
+
+    def __repr__(self) -> str:
+        return (
+            f"TransferStats(responses={self.responses}, wire={self.wire_bytes}, "
+            f"decoded={self.decoded_bytes})"
+        )
@@ -0,0 +1,215 @@
+# Package : perigon
+"""
+Fast parsing of the API's ISO 8601 timestamps.
+
+Timestamp fields such as ``Article.pub_date`` or ``NewsCluster.updated_at``
+are plain strings. :func:`parse_datetime` turns one into an aware
+``datetime`` with ``datetime.fromisoformat`` – far cheaper than
+``dateutil.parser.parse`` – and :func:`epochs` converts many at once into
+an ``int64`` array of epoch seconds for sorting and bucketing::
+
+    Dates(article).pub_date                  # datetime(2024, 5, 1, 9, 0, tzinfo=utc)
+    epochs(articles, "pub_date")             # array([1714554000, ...])
+    sort_by_date(articles, reverse=True)     # newest first
+
+Timestamps without an offset are taken as UTC. :func:`epochs` and
+:func:`sort_by_date` require numpy (``pip install "perigon[numpy]"``).
+"""
+
+from __future__ import annotations
+
+import re
+import sys
+from datetime import datetime, timedelta, timezone, tzinfo
+from functools import lru_cache
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from perigon._helpers import require_numpy
+from perigon.exceptions import ApiValueError
+
+# Epoch value of a missing timestamp in :func:`epochs`
+MISSING = -(2**63)
+
+# Timestamp fields of the models that carry them
+DATE_FIELDS = {
+    "Article": ("pub_date", "add_date", "refresh_date"),
+    "NewsCluster": ("created_at", "updated_at", "initialized_at"),
+}
+
+# Fixed-width bucket lengths in seconds
+INTERVALS = {"minute": 60, "hour": 3600, "day": 86400, "week": 7 * 86400}
+
+# Epoch 0 was a Thursday; weeks start on Monday 1970-01-05
+WEEK_ORIGIN = 4 * 86400
+
+# "YYYY-MM-DDTHH:MM:SS", the fixed-width head of every API timestamp
+_HEAD = 19
+
+_TAIL = re.compile(r"(?:\.(\d+))?(Z|z|[+-]\d\d(?::?\d\d)?)?")
+
+# fromisoformat only takes "Z" and any number of fraction digits from 3.11
+_NATIVE = sys.version_info >= (3, 11)
+
+
+@lru_cache(maxsize=256)
+def _tail(tail: str) -> Optional[Tuple[int, tzinfo, int]]:
+    """
+    ``(microsecond, tzinfo, offset seconds)`` of the part after the seconds.
+    The few distinct tails (".000Z", "+00:00", ...) repeat on every
+    timestamp, so they are parsed once.
+    """
+    match = _TAIL.fullmatch(tail)
+    if match is None:
+        return None
+    fraction, zone = match.groups()
+    microsecond = int(fraction[:6].ljust(6, "0")) if fraction else 0
+    offset = 0
+    if zone and zone not in "Zz":
+        digits = zone[1:].replace(":", "")
+        offset = int(digits[:2]) * 3600 + int(digits[2:4] or 0) * 60
+        offset = -offset if zone[0] == "-" else offset
+    zone_info = timezone(timedelta(seconds=offset)) if offset else timezone.utc
+    return microsecond, zone_info, offset
+
+
+def _seconds(value: str) -> str:
+    # Minute precision ("...T10:00Z") gets ":00", so the head is full width
+    if len(value) >= 16 and value[13] == ":" and value[16:17] != ":":
+        return f"{value[:16]}:00{value[16:]}"
+    return value
+
+
+def _split(value: str) -> Optional[Tuple[str, Tuple[int, tzinfo, int]]]:
+    if len(value) < _HEAD or value[10] not in "T ":
+        return None
+    tail = _tail(value[_HEAD:])
+    return None if tail is None else (value[:_HEAD], tail)
+
+
+def parse_datetime(value: Optional[str]) -> Optional[datetime]:
+    """Aware ``datetime`` of an ISO 8601 timestamp; ``None`` stays ``None``."""
+    if value is None:
+        return None
+    try:
+        if _NATIVE:
+            parsed = datetime.fromisoformat(value)
+        else:
+            split = _split(value)
+            if split is None:
+                parsed = datetime.fromisoformat(value)
+            else:
+                head, (microsecond, zone, _) = split
+                parsed = datetime.fromisoformat(head).replace(
+                    microsecond=microsecond, tzinfo=zone
+                )
+    except ValueError:
+        raise ApiValueError(f"not an ISO 8601 timestamp: {value!r}") from None
+    return parsed if parsed.tzinfo is not None else parsed.replace(tzinfo=timezone.utc)
+
+
+def parse_epoch(value: Optional[str]) -> Optional[int]:
+    """Whole epoch seconds of an ISO 8601 timestamp; ``None`` stays ``None``."""
+    parsed = parse_datetime(value)
+    return None if parsed is None else int(parsed.timestamp())
+
+
+class Dates:
+    """
+    Typed view of a model's timestamp fields: ``Dates(cluster).updated_at``
+    is ``cluster.updated_at`` parsed by :func:`parse_datetime`. Each field
+    is parsed once and re-parsed only if the model's value changes.
+    """
+
+    __slots__ = ("_model", "_parsed")
+
+    def __init__(self, model: Any):
+        self._model = model
+        # field -> (raw string, parsed value)
+        self._parsed: Dict[str, Tuple[Any, Optional[datetime]]] = {}
+
+    def __getattr__(self, name: str) -> Optional[datetime]:
+        if name.startswith("_"):
+            raise AttributeError(name)
+        raw = getattr(self._model, name)
+        cached = self._parsed.get(name)
+        if cached is not None and cached[0] == raw:
+            return cached[1]
+        parsed = parse_datetime(raw)
+        self._parsed[name] = (raw, parsed)
+        return parsed
+
+    def __repr__(self) -> str:
+        fields = DATE_FIELDS.get(type(self._model).__name__, ())
+        shown = ", ".join(f"{f}={getattr(self, f)!r}" for f in fields)
+        return f"Dates({shown})"
+
+
+def as_utc(moment: datetime) -> datetime:
+    """``moment`` in UTC; a naive ``moment`` is taken as UTC."""
+    if moment.tzinfo is None:
+        return moment.replace(tzinfo=timezone.utc)
+    return moment.astimezone(timezone.utc)
+
+
+def utc_timestamp(moment: datetime) -> float:
+    """Epoch seconds of ``moment``; a naive ``moment`` is taken as UTC."""
+    return as_utc(moment).timestamp()
+
+
+def epochs(values: Iterable[Any], field: Optional[str] = None) -> Any:
+    """
+    ``int64`` array of epoch seconds, :data:`MISSING` where a value is
+    ``None`` or empty. ``values`` are timestamp strings, or models whose
+    ``field`` holds one.
+
+    The fixed-width heads are converted by NumPy in one call and shifted by
+    their cached offsets; anything else goes through :func:`parse_epoch`.
+    """
+    np = require_numpy("perigon.dates.epochs")
+    if field is not None:
+        values = [getattr(value, field) for value in values]
+    values = [_seconds(value) if value else value for value in values]
+    heads = [value[:_HEAD] if value else "NaT" for value in values]
+    tails = {tail: _tail(tail) for tail in {v[_HEAD:] for v in values if v}}
+    # Other partial heads ("...T10Z") are left to parse_epoch, as NumPy
+    # would warn about their zone; bare dates it converts cleanly
+    slow = [
+        n
+        for n, v in enumerate(values)
+        if v and (tails[v[_HEAD:]] is None or len(v) != 10 and len(v) < _HEAD)
+    ]
+    for n in slow:
+        heads[n] = "NaT"
+    try:
+        out = np.array(heads, dtype="datetime64[s]").astype(np.int64)
+    except ValueError:
+        # A malformed head; go one by one so the bad value is reported
+        out = np.full(len(values), MISSING, dtype=np.int64)
+        slow = [n for n, value in enumerate(values) if value]
+    else:
+        shift = {tail: parsed[2] for tail, parsed in tails.items() if parsed}
+        if any(shift.values()):
+            out -= np.array(
+                [shift.get(value[_HEAD:], 0) if value else 0 for value in values],
+                dtype=np.int64,
+            )
+    for n in slow:
+        out[n] = parse_epoch(values[n])
+    return out
+
+
+def sort_by_date(
+    items: Iterable[Any], field: str = "pub_date", reverse: bool = False
+) -> List[Any]:
+    """
+    ``items`` ordered by the timestamp in ``field``, oldest first (newest
+    with ``reverse``); items without one go last. The sort is stable.
+    """
+    np = require_numpy("perigon.dates.sort_by_date")
+    items = list(items)
+    keys = epochs(items, field)
+    missing = keys == MISSING
+    if reverse:
+        keys = -np.where(missing, 0, keys)
+    keys[missing] = np.iinfo(np.int64).max
+    return [items[n] for n in np.argsort(keys, kind="stable")]
@@ -0,0 +1,251 @@
+# Package : perigon
+"""
+Streaming de-duplication of articles.
+
+Wire stories are republished by hundreds of outlets. :class:`Deduplicator`
+drops repeats from an article stream in bounded memory, cheapest test first:
+
+1. ``article_id`` already seen;
+2. ``reprint_group_id`` already seen – the API's own reprint grouping;
+3. near-duplicate ``title`` + ``description``, by SimHash (64-bit, word
+   bigrams) within ``max_distance`` differing bits;
+4. near-duplicate embedding (cosine ≥ ``min_cosine``), for
+   ``ScoredDataArticle`` items that carry ``vectors`` when numpy is installed.
+
+::
+
+    dedupe = Deduplicator()
+    for article in dedupe.filter(paginate(api.search_articles, q="AI")):
+        ...
+    dedupe.stats        # DedupeStats(seen=1000, kept=412, article_id=0, ...)
+
+Every index remembers only the most recent ``capacity`` articles, so memory
+stays flat on endless feeds; a repeat older than that window is kept.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import re
+from collections import OrderedDict, deque
+from functools import lru_cache
+from typing import Any, Deque, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from perigon._helpers import as_article, require_numpy
+from perigon.vectors import pick_vector
+
+REASONS = ("article_id", "reprint_group", "simhash", "embedding")
+
+_WORD = re.compile(r"\w+")
+
+
+@lru_cache(maxsize=1 << 16)
+def _token_hash(token: str) -> int:
+    return int.from_bytes(
+        hashlib.blake2b(token.encode(), digest_size=8).digest(), "little"
+    )
+
+
+def simhash(text: str) -> int:
+    """64-bit SimHash of ``text`` over lower-cased word bigrams."""
+    words = _WORD.findall(text.lower())
+    shingles = [f"{a} {b}" for a, b in zip(words, words[1:])] or words
+    hashes = [_token_hash(shingle) for shingle in set(shingles)]
+    half = len(hashes) / 2
+    out = 0
+    for bit in range(64):
+        mask = 1 << bit
+        if sum(1 for h in hashes if h & mask) > half:
+            out |= mask
+    return out
+
+
+class DedupeStats:
+    """Per-run counters of a :class:`Deduplicator`."""
+
+    __slots__ = ("seen", "kept", "dropped")
+
+    def __init__(self) -> None:
+        self.seen = 0
+        self.kept = 0
+        self.dropped: Dict[str, int] = dict.fromkeys(REASONS, 0)
+
+    def as_dict(self) -> Dict[str, int]:
+        return {"seen": self.seen, "kept": self.kept, **self.dropped}
+
+    def __repr__(self) -> str:
+        fields = ", ".join(f"{k}={v}" for k, v in self.as_dict().items())
+        return f"DedupeStats({fields})"
+
+
+class _RecentKeys:
+    # Set that forgets its oldest keys beyond ``capacity``
+    def __init__(self, capacity: int):
+        self.capacity = capacity
+        self._keys: "OrderedDict[str, None]" = OrderedDict()
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._keys
+
+    def add(self, key: str) -> None:
+        self._keys[key] = None
+        self._keys.move_to_end(key)
+        if len(self._keys) > self.capacity:
+            self._keys.popitem(last=False)
+
+
+class _SimHashIndex:
+    """
+    Recent SimHashes, found within ``max_distance`` bits by banding: split
+    into ``max_distance + 1`` bands, any hash that close matches exactly in
+    at least one of them (pigeonhole), so only those buckets are compared.
+    """
+
+    def __init__(self, max_distance: int, capacity: int):
+        self.max_distance = max_distance
+        self.capacity = capacity
+        bands = max_distance + 1
+        width = 64 // bands
+        # (shift, mask) per band; the last band takes the leftover bits
+        self._bands: List[Tuple[int, int]] = []
+        for n in range(bands):
+            bits = width if n < bands - 1 else 64 - n * width
+            self._bands.append((n * width, (1 << bits) - 1))
+        self._buckets: List[Dict[int, List[int]]] = [{} for _ in self._bands]
+        self._recent: Deque[int] = deque()
+
+    def _keys(self, value: int) -> Iterator[Tuple[Dict[int, List[int]], int]]:
+        for buckets, (shift, mask) in zip(self._buckets, self._bands):
+            yield buckets, (value >> shift) & mask
+
+    def near(self, value: int) -> bool:
+        for buckets, key in self._keys(value):
+            for other in buckets.get(key, ()):
+                if bin(value ^ other).count("1") <= self.max_distance:
+                    return True
+        return False
+
+    def add(self, value: int) -> None:
+        for buckets, key in self._keys(value):
+            buckets.setdefault(key, []).append(value)
+        self._recent.append(value)
+        if len(self._recent) > self.capacity:
+            old = self._recent.popleft()
+            for buckets, key in self._keys(old):
+                bucket = buckets[key]
+                bucket.remove(old)
+                if not bucket:
+                    del buckets[key]
+
+
+class _EmbeddingWindow:
+    # Ring buffer of the latest normalised embeddings
+    def __init__(self, min_cosine: float, capacity: int):
+        self.np = require_numpy("embedding deduplication")
+        self.min_cosine = min_cosine
+        self.capacity = capacity
+        self._matrix: Any = None
+        self._count = 0
+
+    def _unit(self, vector: Any) -> Any:
+        v = self.np.asarray(vector, dtype=self.np.float32)
+        norm = self.np.linalg.norm(v)
+        return v / norm if norm else v
+
+    def near(self, vector: Any) -> bool:
+        if self._matrix is None or self._count == 0:
+            return False
+        unit = self._unit(vector)
+        if unit.shape[0] != self._matrix.shape[1]:
+            return False
+        rows = self._matrix[: min(self._count, self.capacity)]
+        return bool((rows @ unit).max() >= self.min_cosine)
+
+    def add(self, vector: Any) -> None:
+        unit = self._unit(vector)
+        if self._matrix is None:
+            self._matrix = self.np.zeros(
+                (self.capacity, unit.shape[0]), dtype=self.np.float32
+            )
+        if unit.shape[0] != self._matrix.shape[1]:
+            return
+        self._matrix[self._count % self.capacity] = unit
+        self._count += 1
+
+
+class Deduplicator:
+    """
+    Drops repeated articles from a stream; see the module docstring.
+
+    Accepts ``Article`` items or wrappers with the article on ``.data``
+    (``ScoredDataArticle``), which are yielded unchanged.
+    """
+
+    def __init__(
+        self,
+        max_distance: int = 3,
+        min_cosine: float = 0.97,
+        capacity: int = 100_000,
+        embeddings: bool = True,
+        embedding_capacity: int = 10_000,
+    ):
+        self.stats = DedupeStats()
+        self._ids = _RecentKeys(capacity)
+        self._groups = _RecentKeys(capacity)
+        self._simhashes = _SimHashIndex(max_distance, capacity)
+        self._embeddings: Optional[_EmbeddingWindow] = None
+        if embeddings:
+            try:
+                self._embeddings = _EmbeddingWindow(min_cosine, embedding_capacity)
+            except ImportError:
+                pass
+
+    def check(self, item: Any) -> Optional[str]:
+        """
+        Record ``item`` and return why it is a duplicate (one of
+        :data:`REASONS`), or ``None`` if it is new.
+        """
+        article = as_article(item)
+        self.stats.seen += 1
+        reason = self._reason(item, article)
+        if reason is None:
+            self.stats.kept += 1
+        else:
+            self.stats.dropped[reason] += 1
+        return reason
+
+    def _reason(self, item: Any, article: Any) -> Optional[str]:
+        if article is None:
+            return None
+        article_id = article.article_id
+        if article_id is not None:
+            if article_id in self._ids:
+                return "article_id"
+            self._ids.add(article_id)
+
+        group = article.reprint_group_id
+        if group is not None:
+            if group in self._groups:
+                return "reprint_group"
+            self._groups.add(group)
+
+        text = f"{article.title or ''} {article.description or ''}"
+        # Text without words would hash to 0 and match every other such item
+        if _WORD.search(text):
+            fingerprint = simhash(text)
+            if self._simhashes.near(fingerprint):
+                return "simhash"
+            self._simhashes.add(fingerprint)
+
+        vector = pick_vector(getattr(item, "vectors", None))
+        if self._embeddings is not None and vector is not None:
+            if self._embeddings.near(vector):
+                return "embedding"
+            self._embeddings.add(vector)
+        return None
+
+    def filter(self, items: Iterable[Any]) -> Iterator[Any]:
+        """Yield the items of ``items`` that are not duplicates."""
+        for item in items:
+            if self.check(item) is None:
+                yield item
@@ -0,0 +1,225 @@
+# Package : perigon
+"""
+Metrics and tracing exporters for SDK calls.
+
+Both exporters are :class:`~perigon.instrumentation.Observer` objects, so they
+plug into ``ApiClient(observers=[...])`` and publish what each
+:class:`~perigon.instrumentation.CallReport` measured. Their backends are
+optional dependencies::
+
+    pip install "perigon[prometheus]"       # PrometheusObserver
+    pip install "perigon[opentelemetry]"    # OpenTelemetryObserver
+
+Every metric is labelled with the endpoint's path template (the ``PATH_*``
+constant) and the HTTP method; responses also carry the status code, or
+``"error"`` when no response arrived. Calls a cache answered without a
+request only count as cache hits: they add no response, duration or phase
+samples.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Dict, Optional
+
+from perigon.instrumentation import CallReport, Observer
+
+# Network and decode phases of a CallReport exported as a latency breakdown
+PHASES = (
+    "encode",
+    "connect",
+    "tls",
+    "ttfb",
+    "download",
+    "network",
+    "decode",
+    "validate",
+)
+
+
+def _status(report: CallReport) -> str:
+    return "error" if report.status is None else str(report.status)
+
+
+class PrometheusObserver(Observer):
+    """
+    Publishes SDK calls as Prometheus metrics.
+
+    Metrics (with the default ``namespace="perigon"``):
+
+    * ``perigon_request_duration_seconds`` – histogram of total call time
+    * ``perigon_request_phase_seconds`` – histogram per ``phase``
+    * ``perigon_responses_total`` – counter per ``status``
+    * ``perigon_rate_limited_total`` – counter of HTTP 429 responses
+    * ``perigon_requests_in_flight`` – gauge of calls awaiting a response
+    * ``perigon_cache_lookups_total`` – counter per ``result`` (hit / miss)
+
+    Pass ``registry`` to keep the metrics off the global default registry,
+    e.g. a fresh ``CollectorRegistry()`` in tests.
+    """
+
+    def __init__(self, registry: Any = None, namespace: str = "perigon"):
+        try:
+            import prometheus_client as prom
+        except ImportError as exc:  # pragma: no cover - depends on extras
+            raise ImportError(
+                "PrometheusObserver requires prometheus-client; "
+                'install it with `pip install "perigon[prometheus]"`'
+            ) from exc
+
+        if registry is None:
+            registry = prom.REGISTRY
+        labels = ("endpoint", "method")
+        common: Dict[str, Any] = {"namespace": namespace, "registry": registry}
+        self.duration = prom.Histogram(
+            "request_duration_seconds", "Total SDK call time.", labels, **common
+        )
+        self.phase = prom.Histogram(
+            "request_phase_seconds",
+            "SDK call time by phase.",
+            labels + ("phase",),
+            **common,
+        )
+        self.responses = prom.Counter(
+            "responses", "SDK calls by response status.", labels + ("status",), **common
+        )
+        self.rate_limited = prom.Counter(
+            "rate_limited", "SDK calls answered with HTTP 429.", labels, **common
+        )
+        self.in_flight = prom.Gauge(
+            "requests_in_flight", "SDK calls awaiting a response.", labels, **common
+        )
+        self.cache = prom.Counter(
+            "cache_lookups",
+            "SDK cache lookups by result.",
+            labels + ("result",),
+            **common,
+        )
+
+    def on_start(self, report: CallReport) -> None:
+        self.in_flight.labels(report.endpoint, report.method).inc()
+
+    def on_end(self, report: CallReport) -> None:
+        endpoint, method = report.endpoint, report.method
+        self.in_flight.labels(endpoint, method).dec()
+        if report.cache_hit is not None:
+            result = "hit" if report.cache_hit else "miss"
+            self.cache.labels(endpoint, method, result).inc()
+        if report.cache_hit:
+            return
+        self.duration.labels(endpoint, method).observe(report.total or 0.0)
+        for name in PHASES:
+            value = getattr(report, name)
+            if value is not None:
+                self.phase.labels(endpoint, method, name).observe(value)
+        self.responses.labels(endpoint, method, _status(report)).inc()
+        if report.status == 429:
+            self.rate_limited.labels(endpoint, method).inc()
+
+
+class OpenTelemetryObserver(Observer):
+    """
+    Publishes SDK calls as OpenTelemetry metrics and client spans.
+
+    Each call gets a ``CLIENT`` span named ``"<METHOD> <path template>"``
+    carrying the status code, byte counts and decode / validation times. The
+    span is the current one until the call ends, so transport-level
+    instrumentation and log correlation see it as their parent.
+    Metric instruments mirror :class:`PrometheusObserver`:
+    ``perigon.client.request.duration``, ``perigon.client.request.phase``,
+    ``perigon.client.responses``, ``perigon.client.rate_limited``,
+    ``perigon.client.requests.in_flight`` and ``perigon.client.cache.lookups``.
+
+    Providers default to the globally configured ones.
+    """
+
+    def __init__(self, meter_provider: Any = None, tracer_provider: Any = None):
+        try:
+            from opentelemetry import context, metrics, trace
+        except ImportError as exc:  # pragma: no cover - depends on extras
+            raise ImportError(
+                "OpenTelemetryObserver requires opentelemetry-api; "
+                'install it with `pip install "perigon[opentelemetry]"`'
+            ) from exc
+
+        self._context = context
+        self._trace = trace
+        meter = metrics.get_meter("perigon", meter_provider=meter_provider)
+        self.tracer = trace.get_tracer("perigon", tracer_provider=tracer_provider)
+        self.duration = meter.create_histogram(
+            "perigon.client.request.duration",
+            unit="s",
+            description="Total SDK call time.",
+        )
+        self.phase = meter.create_histogram(
+            "perigon.client.request.phase",
+            unit="s",
+            description="SDK call time by phase.",
+        )
+        self.responses = meter.create_counter(
+            "perigon.client.responses", description="SDK calls by response status."
+        )
+        self.rate_limited = meter.create_counter(
+            "perigon.client.rate_limited",
+            description="SDK calls answered with HTTP 429.",
+        )
+        self.in_flight = meter.create_up_down_counter(
+            "perigon.client.requests.in_flight",
+            description="SDK calls awaiting a response.",
+        )
+        self.cache = meter.create_counter(
+            "perigon.client.cache.lookups", description="SDK cache lookups by result."
+        )
+
+    @staticmethod
+    def _attributes(report: CallReport) -> Dict[str, Any]:
+        return {"endpoint": report.endpoint, "method": report.method}
+
+    def on_start(self, report: CallReport) -> None:
+        self.in_flight.add(1, self._attributes(report))
+        span = self.tracer.start_span(
+            f"{report.method} {report.endpoint}",
+            kind=self._trace.SpanKind.CLIENT,
+            attributes={
+                "http.request.method": report.method,
+                "url.template": report.endpoint,
+                "url.path": report.path,
+            },
+        )
+        token = self._context.attach(self._trace.set_span_in_context(span))
+        report.state[self] = (span, token)
+
+    def on_end(self, report: CallReport) -> None:
+        attributes = self._attributes(report)
+        self.in_flight.add(-1, attributes)
+        if report.cache_hit is not None:
+            result = "hit" if report.cache_hit else "miss"
+            self.cache.add(1, {**attributes, "result": result})
+        value: Optional[float]
+        if not report.cache_hit:
+            self.duration.record(report.total or 0.0, attributes)
+            for name in PHASES:
+                value = getattr(report, name)
+                if value is not None:
+                    self.phase.record(value, {**attributes, "phase": name})
+            self.responses.add(1, {**attributes, "status": _status(report)})
+            if report.status == 429:
+                self.rate_limited.add(1, attributes)
+
+        started = report.state.pop(self, None)
+        if started is None:
+            return
+        span, token = started
+        self._context.detach(token)
+        if report.cache_hit is not None:
+            span.set_attribute("perigon.cache_hit", report.cache_hit)
+        if report.status is not None:
+            span.set_attribute("http.response.status_code", report.status)
+        span.set_attribute("perigon.response_bytes", report.response_bytes)
+        for name in ("decode", "validate"):
+            value = getattr(report, name)
+            if value is not None:
+                span.set_attribute(f"perigon.{name}_seconds", value)
+        if report.error is not None:
+            span.record_exception(report.error)
+            span.set_status(self._trace.StatusCode.ERROR, type(report.error).__name__)
+        span.end()
@@ -0,0 +1,179 @@
+# Package : perigon
+"""
+Attach ``NewsCluster`` stories to articles with a few batched calls.
+
+Articles carry ``cluster_id`` but usually not the ``cluster`` itself, and
+fetching one story per article is an N+1 pattern. :class:`ClusterHydrator`
+collects the distinct ids of a batch of articles, fetches the unknown ones
+with ``search_stories(cluster_id=[...])`` in batches of up to
+``batch_size`` ids – several batches concurrently – and sets
+``article.cluster``::
+
+    hydrator = ClusterHydrator(api)
+    for article in hydrator.hydrate_iter(paginate(api.search_articles, q="AI")):
+        article.cluster.name
+
+Stories are cached by id. A cached story is refetched once it is older
+than ``max_age``; a fetched copy never replaces one with a later
+``updatedAt``. Ids the API does not return are remembered as missing for
+``max_age`` as well (keeping any copy fetched before).
+"""
+
+from __future__ import annotations
+
+import time
+from collections import OrderedDict
+from itertools import islice
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from perigon.batch import Batch
+from perigon.dates import parse_epoch
+from perigon.models.article import Article
+from perigon.models.news_cluster import NewsCluster
+
+# cluster id -> story, or None if the API did not return it
+Stories = Dict[str, Optional[NewsCluster]]
+
+
+def _updated(story: NewsCluster) -> int:
+    return parse_epoch(story.updated_at) or 0
+
+
+class ClusterHydrator:
+    """
+    Batched, cached ``NewsCluster`` lookups; see the module docstring.
+
+    ``api`` is a ``V1Api``; ``search_kwargs`` are passed to every
+    ``search_stories`` call (e.g. ``show_duplicates=True``).
+    """
+
+    def __init__(
+        self,
+        api: Any,
+        batch_size: int = 100,
+        max_concurrency: int = 8,
+        max_age: float = 900.0,
+        cache_size: int = 100_000,
+        **search_kwargs: Any,
+    ):
+        self.api = api
+        self.batch_size = batch_size
+        self.max_concurrency = max_concurrency
+        self.max_age = max_age
+        self.cache_size = cache_size
+        self.search_kwargs = search_kwargs
+        self.calls = self.hits = self.misses = 0
+        # id -> (fetched at, story or None if the API did not return it)
+        self._cache: "OrderedDict[str, Tuple[float, Optional[NewsCluster]]]" = (
+            OrderedDict()
+        )
+
+    # -- cache --------------------------------------------------------- #
+    def get(self, cluster_id: str) -> Optional[NewsCluster]:
+        """The cached story for ``cluster_id``, however old, if any."""
+        entry = self._cache.get(cluster_id)
+        return None if entry is None else entry[1]
+
+    def _fresh(self, cluster_id: str, now: float) -> bool:
+        entry = self._cache.get(cluster_id)
+        return entry is not None and now - entry[0] < self.max_age
+
+    def _put(
+        self, cluster_id: str, story: Optional[NewsCluster], now: float
+    ) -> Optional[NewsCluster]:
+        old = self.get(cluster_id)
+        # Keep the copy we have if the API lost the story or served an older one
+        if old is not None and (story is None or _updated(old) > _updated(story)):
+            story = old
+        self._cache[cluster_id] = (now, story)
+        self._cache.move_to_end(cluster_id)
+        while len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+        return story
+
+    def _missing(self, articles: Iterable[Article], stories: Stories) -> List[str]:
+        # Fresh cached stories go into ``stories``; the other ids are returned
+        now = time.monotonic()
+        missing: Dict[str, None] = {}
+        for article in articles:
+            cluster_id = article.cluster_id
+            if cluster_id is None or cluster_id in missing:
+                continue
+            if self._fresh(cluster_id, now):
+                self.hits += 1
+                stories[cluster_id] = self.get(cluster_id)
+            else:
+                self.misses += 1
+                missing[cluster_id] = None
+        return list(missing)
+
+    def _batches(self, ids: List[str]) -> List[List[str]]:
+        return [
+            ids[n : n + self.batch_size] for n in range(0, len(ids), self.batch_size)
+        ]
+
+    def _calls(self, ids: List[str]) -> List[Dict[str, Any]]:
+        batches = self._batches(ids)
+        self.calls += len(batches)
+        return [
+            dict(self.search_kwargs, cluster_id=batch, size=len(batch), page=0)
+            for batch in batches
+        ]
+
+    def _store(self, ids: List[str], results: Iterable[Any]) -> Stories:
+        now = time.monotonic()
+        found: Dict[str, NewsCluster] = {}
+        for result in results:
+            for story in result.results:
+                if story.id is not None:
+                    found[story.id] = story
+        return {
+            cluster_id: self._put(cluster_id, found.get(cluster_id), now)
+            for cluster_id in ids
+        }
+
+    @staticmethod
+    def _attach(articles: List[Article], stories: Stories) -> List[Article]:
+        # From this call's stories: with more ids than ``cache_size`` the
+        # cache may already have evicted some of them
+        for article in articles:
+            story = stories.get(article.cluster_id) if article.cluster_id else None
+            if story is not None:
+                article.cluster = story
+        return articles
+
+    # -- hydration ----------------------------------------------------- #
+    def hydrate(self, articles: Iterable[Article]) -> List[Article]:
+        """Set ``cluster`` on each article whose story can be found; returns them."""
+        articles = list(articles)
+        stories: Stories = {}
+        ids = self._missing(articles, stories)
+        if ids:
+            calls = [(self.api.search_stories, kwargs) for kwargs in self._calls(ids)]
+            results = self.api.gather(calls, max_concurrency=self.max_concurrency)
+            stories.update(self._store(ids, results))
+        return self._attach(articles, stories)
+
+    async def hydrate_async(self, articles: Iterable[Article]) -> List[Article]:
+        """Async counterpart of :meth:`hydrate`."""
+        articles = list(articles)
+        stories: Stories = {}
+        ids = self._missing(articles, stories)
+        if ids:
+            batch = Batch(self.max_concurrency)
+            for kwargs in self._calls(ids):
+                batch.add(self.api.search_stories_async, **kwargs)
+            results = [slot.unwrap() for slot in await batch.run()]
+            stories.update(self._store(ids, results))
+        return self._attach(articles, stories)
+
+    def hydrate_iter(
+        self, articles: Iterable[Article], chunk: int = 1000
+    ) -> Iterator[Article]:
+        """Hydrate a stream ``chunk`` articles at a time, yielding them in order."""
+        iterator = iter(articles)
+        while True:
+            block = list(islice(iterator, chunk))
+            if not block:
+                return
+            yield from self.hydrate(block)
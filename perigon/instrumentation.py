@@ -0,0 +1,185 @@
+# Package : perigon
+"""
+Per-call instrumentation for :class:`ApiClient`.
+
+Register one or more :class:`Observer` objects and every generated API call
+produces a :class:`CallReport` breaking its latency down into network,
+server, JSON decode and model validation time::
+
+    class SlowCallLogger(Observer):
+        def on_end(self, report):
+            if report.total > 1.0:
+                print(report.endpoint, report.ttfb, report.validate)
+
+    client = ApiClient(api_key=..., observers=[SlowCallLogger()])
+
+Network phases come from the ``trace`` extension of httpx's transport
+(httpcore), so they are only filled in when the request reaches a real
+connection pool. With no observers registered the client skips all of this.
+"""
+
+from __future__ import annotations
+
+from time import perf_counter
+from typing import Any, Dict, Mapping, Optional
+
+import httpx
+
+
+class CallReport:
+    """
+    Timings and sizes for one API call; times are seconds (``perf_counter``).
+
+    ``endpoint`` is the operation's path template – the value of the
+    ``PATH_*`` constant – so reports group per endpoint regardless of path
+    parameters. Phase properties return ``None`` when the phase did not
+    happen, e.g. ``connect`` on a reused keep-alive connection.
+    """
+
+    __slots__ = (
+        "method",
+        "endpoint",
+        "path",
+        "query_params",
+        "query_bytes",
+        "encode",
+        "network",
+        "status",
+        "response_bytes",
+        "content_bytes",
+        "decode",
+        "validate",
+        "retries",
+        "cache_hit",
+        "error",
+        "started",
+        "sent",
+        "finished",
+        "marks",
+        "state",
+    )
+
+    def __init__(
+        self, method: str, endpoint: str, path: str, params: Mapping[str, Any]
+    ):
+        self.method = method
+        self.endpoint = endpoint
+        self.path = path
+        self.query_params = len(params)
+        self.query_bytes = 0
+        # Time spent encoding the query, and waiting on the HTTP round trip
+        self.encode: Optional[float] = None
+        self.network: Optional[float] = None
+        self.status: Optional[int] = None
+        # Bytes as received on the wire vs after content decoding
+        self.response_bytes = 0
+        self.content_bytes = 0
+        self.decode: Optional[float] = None
+        self.validate: Optional[float] = None
+        # The client does not retry yet; kept so a retry layer can report it
+        self.retries = 0
+        # Set by caching layers: True / False for a hit / miss, None if uncached
+        self.cache_hit: Optional[bool] = None
+        self.error: Optional[BaseException] = None
+        self.started = perf_counter()
+        self.sent = self.started
+        self.finished: Optional[float] = None
+        # httpcore trace events keyed without their "http11." / "http2." prefix
+        self.marks: Dict[str, float] = {}
+        # Scratch space for observers that carry state from on_start to on_end
+        self.state: Dict[Any, Any] = {}
+
+    # -- httpcore trace hooks ----------------------------------------- #
+    def trace(self, event: str, info: Mapping[str, Any]) -> None:
+        self.marks[event.split(".", 1)[1]] = perf_counter()
+
+    async def trace_async(self, event: str, info: Mapping[str, Any]) -> None:
+        self.marks[event.split(".", 1)[1]] = perf_counter()
+
+    def record_response(self, resp: httpx.Response) -> None:
+        self.network = perf_counter() - self.sent
+        self.status = resp.status_code
+        self.query_bytes = len(resp.request.url.query)
+        self.response_bytes = resp.num_bytes_downloaded
+        self.content_bytes = len(resp.content)
+
+    def finish(self) -> None:
+        self.finished = perf_counter()
+
+    # -- derived phases ------------------------------------------------ #
+    def _span(self, start: str, end: str) -> Optional[float]:
+        try:
+            return self.marks[end] - self.marks[start]
+        except KeyError:
+            return None
+
+    @property
+    def connect(self) -> Optional[float]:
+        """TCP connect, including DNS resolution (httpcore does not split them)."""
+        return self._span("connect_tcp.started", "connect_tcp.complete")
+
+    @property
+    def tls(self) -> Optional[float]:
+        return self._span("start_tls.started", "start_tls.complete")
+
+    @property
+    def ttfb(self) -> Optional[float]:
+        """From sending the request headers to receiving the response headers."""
+        return self._span(
+            "send_request_headers.started", "receive_response_headers.complete"
+        )
+
+    @property
+    def download(self) -> Optional[float]:
+        return self._span(
+            "receive_response_body.started", "receive_response_body.complete"
+        )
+
+    @property
+    def total(self) -> Optional[float]:
+        if self.finished is None:
+            return None
+        return self.finished - self.started
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Flat, JSON-friendly view of the report."""
+        return {
+            "method": self.method,
+            "endpoint": self.endpoint,
+            "path": self.path,
+            "status": self.status,
+            "query_params": self.query_params,
+            "query_bytes": self.query_bytes,
+            "response_bytes": self.response_bytes,
+            "content_bytes": self.content_bytes,
+            "connect": self.connect,
+            "tls": self.tls,
+            "ttfb": self.ttfb,
+            "download": self.download,
+            "encode": self.encode,
+            "network": self.network,
+            "decode": self.decode,
+            "validate": self.validate,
+            "total": self.total,
+            "retries": self.retries,
+            "cache_hit": self.cache_hit,
+            "error": type(self.error).__name__ if self.error else None,
+        }
+
+    def __repr__(self) -> str:
+        return f"CallReport({self.method} {self.endpoint}, status={self.status})"
+
+
+class Observer:
+    """
+    Receives a :class:`CallReport` around every API call.
+
+    Both hooks run inline on the calling thread (or event loop), so keep them
+    cheap – hand heavy work off to a queue. Subclass and override either hook.
+    """
+
+    def on_start(self, report: CallReport) -> None:
+        """Called before the request is sent; only identity fields are set."""
+
+    def on_end(self, report: CallReport) -> None:
+        """Called once the call has returned or raised (``report.error``)."""
@@ -0,0 +1,551 @@
+# Package : perigon
+"""
+Offline keyword search over articles you already fetched.
+
+:class:`KeywordIndex` is an in-memory inverted index (term → article →
+positions) over ``title``, ``description``, ``content`` and ``summary``.
+It evaluates the subset of the ``q`` syntax that ``search_articles``
+documents: ``AND`` / ``OR`` / ``NOT``, parentheses, ``"exact phrases"`` and
+``*`` / ``?`` wildcards; terms side by side are ANDed.
+
+:class:`LocalSearch` wraps a ``V1Api`` and answers ``search_articles``
+from the index when the request's ``var_from`` / ``to`` window is one the
+index was told it fully covers, and from the API otherwise::
+
+    index = KeywordIndex()
+    index.extend(store.between(start, end))      # e.g. an ArticleStore
+    index.cover(start, end)
+
+    api = LocalSearch(V1Api(client), index)
+    api.search_articles(q='"rate cut" AND (fed OR ecb) NOT crypto*',
+                        var_from=start, to=end)  # no API call
+"""
+
+from __future__ import annotations
+
+import inspect
+import math
+import re
+from bisect import bisect_left
+from datetime import datetime, timezone
+from fnmatch import translate
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    FrozenSet,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Union,
+    cast,
+)
+
+from perigon._helpers import articles as unwrap
+from perigon.api.v1_api import V1Api
+from perigon.dates import DATE_FIELDS, parse_epoch, utc_timestamp
+from perigon.exceptions import ApiValueError
+from perigon.models.article import Article
+from perigon.models.query_search_result import QuerySearchResult
+
+# Article attribute indexed for each search parameter
+FIELDS = {
+    "title": "title",
+    "desc": "description",
+    "content": "content",
+    "summary": "summary",
+}
+
+# Fields ``q`` searches
+Q_FIELDS = ("title", "desc", "content")
+
+# ``search_articles`` arguments :class:`LocalSearch` can answer itself
+LOCAL_PARAMS = frozenset(
+    {
+        *FIELDS,
+        "q",
+        "article_id",
+        "cluster_id",
+        "source",
+        "language",
+        "medium",
+        "reprint_group_id",
+        "var_from",
+        "to",
+        "sort_by",
+        "page",
+        "size",
+        "show_num_results",
+    }
+)
+
+# ``sort_by`` -> (Article timestamp field, newest first); anything else is relevance
+DATE_SORTS = {
+    "date": ("pub_date", True),
+    "pubDate": ("pub_date", True),
+    "reverseDate": ("pub_date", False),
+    "addDate": ("add_date", True),
+    "reverseAddDate": ("add_date", False),
+    "refreshDate": ("refresh_date", True),
+}
+
+SORTS = frozenset({"relevance", *DATE_SORTS})
+
+# Positional arguments of ``search_articles`` bind to these names
+_SEARCH = inspect.signature(V1Api.search_articles)
+
+_WORD = re.compile(r"\w+")
+_QUERY_TOKEN = re.compile(r'"[^"]*"?|\(|\)|[^\s()"]+')
+_OPERATORS = {"AND", "OR", "NOT"}
+
+# Parsed query: ("term", word) | ("phrase", words) | ("wild", pattern)
+#               | ("and", a, b) | ("or", a, b) | ("not", a)
+Node = Tuple[Any, ...]
+
+
+def tokenize(text: str) -> List[str]:
+    """Lower-cased word tokens, as indexed."""
+    return _WORD.findall(text.lower())
+
+
+def _leaf(token: str) -> Node:
+    if "*" in token or "?" in token:
+        return ("wild", token.lower())
+    words = tokenize(token)
+    if not words:
+        raise ApiValueError(f"nothing to search for in {token!r}")
+    return ("term", words[0]) if len(words) == 1 else ("phrase", tuple(words))
+
+
+def parse_query(query: str) -> Node:
+    """
+    Parse a ``q`` expression. ``NOT`` binds tightest, then ``AND`` (also
+    implied between adjacent terms), then ``OR``.
+    """
+    tokens = _QUERY_TOKEN.findall(query)
+    position = 0
+
+    def peek() -> Optional[str]:
+        return tokens[position] if position < len(tokens) else None
+
+    def take() -> str:
+        nonlocal position
+        token = peek()
+        if token is None:
+            raise ApiValueError(f"unexpected end of query: {query!r}")
+        position += 1
+        return token
+
+    def parse_or() -> Node:
+        node = parse_and()
+        while peek() == "OR":
+            take()
+            node = ("or", node, parse_and())
+        return node
+
+    def parse_and() -> Node:
+        node = parse_not()
+        while peek() not in (None, "OR", ")"):
+            if peek() == "AND":
+                take()
+            node = ("and", node, parse_not())
+        return node
+
+    def parse_not() -> Node:
+        if peek() == "NOT":
+            take()
+            return ("not", parse_not())
+        return parse_atom()
+
+    def parse_atom() -> Node:
+        token = take()
+        if token == "(":
+            node = parse_or()
+            if take() != ")":
+                raise ApiValueError(f"unbalanced parentheses in {query!r}")
+            return node
+        if token in _OPERATORS or token == ")":
+            raise ApiValueError(f"unexpected {token!r} in {query!r}")
+        if token.startswith('"'):
+            words = tokenize(token.strip('"'))
+            if not words:
+                raise ApiValueError(f"empty phrase in {query!r}")
+            return ("phrase", tuple(words))
+        return _leaf(token)
+
+    node = parse_or()
+    if peek() is not None:
+        raise ApiValueError(f"unexpected {peek()!r} in {query!r}")
+    return node
+
+
+class KeywordIndex:
+    """
+    Positional inverted index over articles; see the module docstring.
+
+    Re-adding an ``article_id`` replaces the earlier copy.
+    """
+
+    def __init__(self) -> None:
+        self.articles: List[Optional[Article]] = []
+        self._ids: Dict[str, int] = {}
+        self._live: Set[int] = set()
+        # date field -> doc -> epoch seconds
+        self._epochs: Dict[str, List[Optional[int]]] = {
+            field: [] for field in DATE_FIELDS["Article"]
+        }
+        # field -> term -> doc -> positions
+        self._postings: Dict[str, Dict[str, Dict[int, List[int]]]] = {
+            field: {} for field in FIELDS
+        }
+        self._vocab: Dict[str, List[str]] = {}
+        self._covered: List[Tuple[float, float]] = []
+
+    def __len__(self) -> int:
+        return len(self._live)
+
+    # -- building ------------------------------------------------------ #
+    def add(self, article: Article) -> None:
+        if article.article_id is not None:
+            old = self._ids.get(article.article_id)
+            if old is not None:
+                self._remove(old)
+        doc = len(self.articles)
+        self.articles.append(article)
+        self._live.add(doc)
+        for field, epochs in self._epochs.items():
+            epochs.append(parse_epoch(getattr(article, field)))
+        if article.article_id is not None:
+            self._ids[article.article_id] = doc
+        for field, attr in FIELDS.items():
+            text = getattr(article, attr)
+            if not text:
+                continue
+            positions: Dict[str, List[int]] = {}
+            for position, word in enumerate(tokenize(text)):
+                positions.setdefault(word, []).append(position)
+            postings = self._postings[field]
+            for word, found in positions.items():
+                postings.setdefault(word, {})[doc] = found
+        self._vocab.clear()
+
+    def extend(self, articles: Iterable[Any]) -> int:
+        """Index articles (or ``.data`` of wrappers); returns how many."""
+        count = 0
+        for article in unwrap(articles):
+            self.add(article)
+            count += 1
+        return count
+
+    def _remove(self, doc: int) -> None:
+        article = self.articles[doc]
+        assert article is not None
+        for field, attr in FIELDS.items():
+            postings = self._postings[field]
+            for word in set(tokenize(getattr(article, attr) or "")):
+                docs = postings.get(word)
+                if docs is not None:
+                    docs.pop(doc, None)
+                    if not docs:
+                        del postings[word]
+        self.articles[doc] = None
+        self._live.discard(doc)
+        self._vocab.clear()
+
+    # -- coverage ------------------------------------------------------ #
+    def cover(self, start: Optional[datetime], end: Optional[datetime]) -> None:
+        """
+        Declare that every article of interest published in ``[start, end)``
+        is indexed (``None`` for an open end).
+        """
+        low = -math.inf if start is None else utc_timestamp(start)
+        high = math.inf if end is None else utc_timestamp(end)
+        merged: List[Tuple[float, float]] = []
+        for a, b in sorted(self._covered + [(low, high)]):
+            if merged and a <= merged[-1][1]:
+                merged[-1] = (merged[-1][0], max(merged[-1][1], b))
+            else:
+                merged.append((a, b))
+        self._covered = merged
+
+    def covers(self, start: Optional[datetime], end: Optional[datetime]) -> bool:
+        low = -math.inf if start is None else utc_timestamp(start)
+        high = (
+            datetime.now(timezone.utc).timestamp()
+            if end is None
+            else utc_timestamp(end)
+        )
+        return any(a <= low and high <= b for a, b in self._covered)
+
+    # -- matching ------------------------------------------------------ #
+    def _terms(self, field: str, pattern: str) -> List[str]:
+        vocab = self._vocab.get(field)
+        if vocab is None:
+            vocab = self._vocab[field] = sorted(self._postings[field])
+        prefix = re.split(r"[*?]", pattern, 1)[0]
+        rest = pattern[len(prefix) :]
+        start = bisect_left(vocab, prefix)
+        candidates = []
+        for term in vocab[start:]:
+            if not term.startswith(prefix):
+                break
+            candidates.append(term)
+        if rest == "*":
+            return candidates
+        match = re.compile(translate(pattern)).match
+        return [term for term in candidates if match(term)]
+
+    def _docs(self, node: Node, fields: Sequence[str]) -> Set[int]:
+        kind = node[0]
+        if kind == "and":
+            return self._docs(node[1], fields) & self._docs(node[2], fields)
+        if kind == "or":
+            return self._docs(node[1], fields) | self._docs(node[2], fields)
+        if kind == "not":
+            return set(self._live) - self._docs(node[1], fields)
+        out: Set[int] = set()
+        for field in fields:
+            postings = self._postings[field]
+            if kind == "term":
+                out.update(postings.get(node[1], ()))
+            elif kind == "wild":
+                for term in self._terms(field, node[1]):
+                    out.update(postings[term])
+            else:
+                out.update(self._phrase(postings, node[1]))
+        return out
+
+    @staticmethod
+    def _phrase(
+        postings: Dict[str, Dict[int, List[int]]], words: Sequence[str]
+    ) -> List[int]:
+        lists = []
+        for word in words:
+            docs = postings.get(word)
+            if not docs:
+                return []
+            lists.append(docs)
+        hits = []
+        for doc in set(lists[0]).intersection(*lists[1:]):
+            # Phrase starts: positions of word n, shifted back by n
+            starts = set(lists[0][doc])
+            for n, docs in enumerate(lists[1:], 1):
+                starts.intersection_update([p - n for p in docs[doc]])
+                if not starts:
+                    break
+            else:
+                hits.append(doc)
+        return hits
+
+    def _score(self, doc: int, terms: FrozenSet[str], fields: Sequence[str]) -> float:
+        total = len(self._live) or 1
+        score = 0.0
+        for field in fields:
+            postings = self._postings[field]
+            for term in terms:
+                docs = postings.get(term)
+                if docs and doc in docs:
+                    score += math.log1p(len(docs[doc])) * math.log(total / len(docs))
+        return score
+
+    def match(
+        self,
+        query: Optional[str] = None,
+        fields: Sequence[str] = Q_FIELDS,
+        **field_queries: Optional[str],
+    ) -> Set[int]:
+        """
+        Documents matching ``query`` in any of ``fields`` and each of the
+        ``field_queries`` (``title=...``, ``desc=...``, ...) in its field.
+        """
+        docs: Optional[Set[int]] = None
+        clauses: List[Tuple[Node, Sequence[str]]] = []
+        if query:
+            clauses.append((parse_query(query), fields))
+        for field, value in field_queries.items():
+            if value:
+                clauses.append((parse_query(value), (field,)))
+        for node, on in clauses:
+            found = self._docs(node, on)
+            docs = found if docs is None else docs & found
+        return set(self._live) if docs is None else docs
+
+    def search(
+        self,
+        query: Optional[str] = None,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        where: Optional[Callable[[Article], bool]] = None,
+        sort_by: Optional[str] = None,
+        fields: Sequence[str] = Q_FIELDS,
+        **field_queries: Optional[str],
+    ) -> List[Article]:
+        """
+        Articles :meth:`match`-ing the queries and published in ``[start,
+        end)``, by relevance (default) or by a timestamp as :data:`DATE_SORTS`
+        lists for each ``sort_by``; ``where`` filters further.
+        """
+        if sort_by is not None and sort_by not in SORTS:
+            raise ApiValueError(f"sort_by must be one of {sorted(SORTS)}")
+        docs = self.match(query, fields, **field_queries)
+        low = None if start is None else utc_timestamp(start)
+        high = None if end is None else utc_timestamp(end)
+        kept = []
+        published = self._epochs["pub_date"]
+        for doc in docs:
+            epoch = published[doc]
+            if low is not None and (epoch is None or epoch < low):
+                continue
+            if high is not None and (epoch is None or epoch >= high):
+                continue
+            article = self.articles[doc]
+            if article is not None and (where is None or where(article)):
+                kept.append(doc)
+
+        if sort_by in DATE_SORTS:
+            field, newest = DATE_SORTS[sort_by]
+            sign = -1 if newest else 1
+            stamps = self._epochs[field]
+
+            def by_date(doc: int) -> Tuple[bool, int, int]:
+                epoch = stamps[doc]
+                return epoch is None, sign * (epoch or 0), doc
+
+            kept.sort(key=by_date)
+        else:
+            clauses = self._positive_terms(query, fields, field_queries)
+            scores = {
+                d: sum(self._score(d, terms, on) for terms, on in clauses) for d in kept
+            }
+            kept.sort(key=lambda d: (-scores[d], d))
+        return [a for a in (self.articles[d] for d in kept) if a is not None]
+
+    def _positive_terms(
+        self,
+        query: Optional[str],
+        fields: Sequence[str],
+        field_queries: Dict[str, Optional[str]],
+    ) -> List[Tuple[FrozenSet[str], Sequence[str]]]:
+        # Terms each clause looks for, with the fields it looks in
+        def walk(node: Node, on: Sequence[str]) -> Iterable[str]:
+            kind = node[0]
+            if kind in ("and", "or"):
+                yield from walk(node[1], on)
+                yield from walk(node[2], on)
+            elif kind == "term":
+                yield node[1]
+            elif kind == "phrase":
+                yield from node[1]
+            elif kind == "wild":
+                for field in on:
+                    yield from self._terms(field, node[1])
+
+        clauses: List[Tuple[Optional[str], Sequence[str]]] = [(query, fields)]
+        clauses += [(text, (field,)) for field, text in field_queries.items()]
+        return [
+            (frozenset(walk(parse_query(text), on)), on) for text, on in clauses if text
+        ]
+
+
+def _value(value: Any) -> Any:
+    return getattr(value, "value", value)
+
+
+def _filter(kwargs: Dict[str, Any]) -> Optional[Callable[[Article], bool]]:
+    checks: List[Callable[[Article], bool]] = []
+
+    def one_of(
+        values: Union[str, Iterable[str]], get: Callable[[Article], Any]
+    ) -> None:
+        wanted = {values} if isinstance(values, str) else set(values)
+        checks.append(lambda a: get(a) in wanted)
+
+    if kwargs.get("article_id"):
+        one_of(kwargs["article_id"], lambda a: a.article_id)
+    if kwargs.get("cluster_id"):
+        one_of(kwargs["cluster_id"], lambda a: a.cluster_id)
+    if kwargs.get("source"):
+        one_of(kwargs["source"], lambda a: a.source and a.source.domain)
+    if kwargs.get("language"):
+        one_of(kwargs["language"], lambda a: a.language)
+    if kwargs.get("medium"):
+        one_of(kwargs["medium"], lambda a: a.medium)
+    if kwargs.get("reprint_group_id"):
+        one_of(kwargs["reprint_group_id"], lambda a: a.reprint_group_id)
+    if not checks:
+        return None
+    return lambda article: all(check(article) for check in checks)
+
+
+def _arguments(args: Sequence[Any], kwargs: Dict[str, Any]) -> Dict[str, Any]:
+    # As V1Api.search_articles would bind them; raises TypeError the same way
+    bound = _SEARCH.bind(None, *args, **kwargs)
+    del bound.arguments["self"]
+    return dict(bound.arguments)
+
+
+class LocalSearch:
+    """
+    ``V1Api`` stand-in whose ``search_articles`` runs against a
+    :class:`KeywordIndex` when it can; see the module docstring.
+
+    A request is answered locally when every argument is in
+    :data:`LOCAL_PARAMS` and ``[var_from, to)`` (``to`` defaulting to now)
+    lies within a window passed to :meth:`KeywordIndex.cover`. Anything else
+    – and every other method – goes to ``api``.
+    """
+
+    def __init__(self, api: Any, index: KeywordIndex):
+        self.api = api
+        self.index = index
+        self.local_calls = 0
+        self.remote_calls = 0
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.api, name)
+
+    def can_answer(self, kwargs: Dict[str, Any]) -> bool:
+        given = {k for k, v in kwargs.items() if v is not None}
+        if not given <= LOCAL_PARAMS:
+            return False
+        if _value(kwargs.get("sort_by")) not in (None, *SORTS):
+            return False
+        return self.index.covers(kwargs.get("var_from"), kwargs.get("to"))
+
+    def _local(self, kwargs: Dict[str, Any]) -> QuerySearchResult:
+        self.local_calls += 1
+        field_queries: Dict[str, Any] = {field: kwargs.get(field) for field in FIELDS}
+        matches = self.index.search(
+            kwargs.get("q"),
+            start=kwargs.get("var_from"),
+            end=kwargs.get("to"),
+            where=_filter(kwargs),
+            sort_by=_value(kwargs.get("sort_by")),
+            **field_queries,
+        )
+        size = kwargs.get("size") or 10
+        first = (kwargs.get("page") or 0) * size
+        return QuerySearchResult(
+            status=200, numResults=len(matches), articles=matches[first : first + size]
+        )
+
+    def search_articles(self, *args: Any, **kwargs: Any) -> QuerySearchResult:
+        """Takes the arguments of ``V1Api.search_articles``."""
+        kwargs = _arguments(args, kwargs)
+        if self.can_answer(kwargs):
+            return self._local(kwargs)
+        self.remote_calls += 1
+        return cast(QuerySearchResult, self.api.search_articles(**kwargs))
+
+    async def search_articles_async(
+        self, *args: Any, **kwargs: Any
+    ) -> QuerySearchResult:
+        """Takes the arguments of ``V1Api.search_articles_async``."""
+        kwargs = _arguments(args, kwargs)
+        if self.can_answer(kwargs):
+            return self._local(kwargs)
+        self.remote_calls += 1
+        return cast(QuerySearchResult, await self.api.search_articles_async(**kwargs))
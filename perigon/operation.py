@@ -0,0 +1,95 @@
+# Package : perigon
+"""
+Request specs for generated API operations.
+
+Every operation is described once, at import time, by an :class:`Operation`;
+the sync and async methods on the generated API classes both hand their
+arguments to :meth:`ApiClient.call` / :meth:`ApiClient.call_async`, which
+share the request-building and decoding logic below.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Dict, Generic, Mapping, Optional, Tuple, Type, TypeVar, overload
+
+from perigon.query import QuerySpec
+
+_NO_QUERY = QuerySpec()
+
+T = TypeVar("T")
+
+
+class Operation(Generic[T]):
+    """
+    Static description of one API operation; ``T`` is the ``response`` model,
+    or ``Any`` for operations that return the decoded JSON as is.
+    """
+
+    __slots__ = ("method", "path", "path_params", "query", "body", "response")
+
+    @overload
+    def __init__(
+        self: "Operation[Any]",
+        method: str,
+        path: str,
+        *,
+        path_params: Tuple[Tuple[str, str], ...] = ...,
+        query: QuerySpec = ...,
+        body: Optional[str] = ...,
+        response: None = ...,
+    ) -> None: ...
+
+    @overload
+    def __init__(
+        self,
+        method: str,
+        path: str,
+        *,
+        path_params: Tuple[Tuple[str, str], ...] = ...,
+        query: QuerySpec = ...,
+        body: Optional[str] = ...,
+        response: Type[T],
+    ) -> None: ...
+
+    def __init__(
+        self,
+        method: str,
+        path: str,
+        *,
+        path_params: Tuple[Tuple[str, str], ...] = (),
+        query: QuerySpec = _NO_QUERY,
+        body: Optional[str] = None,
+        response: Optional[Type[T]] = None,
+    ):
+        self.method = method
+        self.path = path
+        self.path_params = path_params
+        self.query = query
+        self.body = body
+        self.response = response
+
+    def __repr__(self) -> str:
+        return f"Operation({self.method} {self.path})"
+
+    def prepare(self, values: Mapping[str, Any]) -> Tuple[str, Dict[str, Any]]:
+        """
+        Turn a method's arguments into ``(path, request kwargs)``.
+
+        ``values`` maps python parameter names to their values – the generated
+        methods pass their ``locals()``.
+        """
+        path = self.path
+        if self.path_params:
+            path = path.format(
+                **{
+                    placeholder: str(values[name])
+                    for placeholder, name in self.path_params
+                }
+            )
+
+        kwargs: Dict[str, Any] = {"params": self.query.encode(values)}
+        if self.body is not None:
+            kwargs["json"] = values[self.body].model_dump(
+                by_alias=True, exclude_none=True
+            )
+        return path, kwargs
@@ -0,0 +1,257 @@
+# Package : perigon
+"""
+Iterate over every item of a paginated search.
+
+The search endpoints take ``page`` / ``size`` and return one page at a time.
+:func:`paginate` walks the pages of any such method and yields the items of
+the list field named by ``items``::
+
+    for article in paginate(api.search_articles, q="AI", size=100):
+        ...
+
+    async for story in paginate_async(api.search_stories_async, "results", q="AI"):
+        ...
+
+Iteration stops at the first short page, after ``max_pages`` pages, or
+once ``limit`` items have been yielded.
+
+With ``tune`` a :class:`PageSizeTuner` picks ``size`` page by page instead:
+as large as the endpoint allows while a page still arrives within
+``target_time`` and stays under ``max_page_bytes``::
+
+    tuner = PageSizeTuner(target_time=1.0)
+    for article in paginate(api.search_articles, q="AI", tune=tuner):
+        ...
+    tuner.summary()     # sizes chosen, items per second, ...
+"""
+
+from __future__ import annotations
+
+import time
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Union,
+)
+
+# Page size the API uses when ``size`` is not given
+DEFAULT_SIZE = 10
+
+# Largest ``size`` the search endpoints accept
+DEFAULT_MAX_SIZE = 100
+
+
+def _items(result: Any, items: str) -> List[Any]:
+    return getattr(result, items, None) or []
+
+
+def _aligned(offset: int, desired: int, current: int, min_size: int) -> int:
+    # Pages are ``offset // size``, so the next size must divide the offset
+    # already consumed. Growing never goes below the current size and
+    # shrinking never below ``min_size``; failing that the size stays.
+    if offset == 0:
+        return desired
+    floor = current if desired >= current else max(1, min_size)
+    for size in range(desired, floor - 1, -1):
+        if offset % size == 0:
+            return size
+    return current
+
+
+class PageStat(NamedTuple):
+    """One fetched page as seen by a :class:`PageSizeTuner`."""
+
+    size: int
+    items: int
+    seconds: float
+    bytes: Optional[int]
+
+
+class PageSizeTuner:
+    """
+    Chooses each page's ``size`` from the pages fetched before it.
+
+    Per-item time and bytes are tracked as moving averages (weight
+    ``smoothing`` for the newest page). The next size is the largest that
+    should take at most ``target_time`` and ``max_page_bytes``, at most
+    double the last one, within ``[min_size, max_size]`` – ``max_size``
+    defaults to :data:`DEFAULT_MAX_SIZE` – and aligned so no item is skipped or
+    repeated. Bytes come from the client's transfer counters and are
+    approximate when other calls run at the same time.
+    """
+
+    def __init__(
+        self,
+        target_time: float = 1.0,
+        max_page_bytes: Optional[int] = 8 << 20,
+        min_size: int = DEFAULT_SIZE,
+        max_size: Optional[int] = None,
+        smoothing: float = 0.5,
+    ):
+        self.target_time = target_time
+        self.max_page_bytes = max_page_bytes
+        self.min_size = min_size
+        self.max_size = max_size
+        self.smoothing = smoothing
+        self.pages: List[PageStat] = []
+        self.seconds_per_item: Optional[float] = None
+        self.bytes_per_item: Optional[float] = None
+
+    def _average(self, old: Optional[float], new: float) -> float:
+        return new if old is None else old + self.smoothing * (new - old)
+
+    def observe(
+        self, size: int, items: int, seconds: float, nbytes: Optional[int] = None
+    ) -> None:
+        """Record a fetched page."""
+        self.pages.append(PageStat(size, items, seconds, nbytes))
+        if items:
+            self.seconds_per_item = self._average(
+                self.seconds_per_item, seconds / items
+            )
+            if nbytes:
+                self.bytes_per_item = self._average(self.bytes_per_item, nbytes / items)
+
+    def next_size(self, offset: int, current: int, cap: int) -> int:
+        """``size`` for the page starting at item ``offset``."""
+        cap = min(cap, self.max_size or cap)
+        desired = min(cap, current * 2)
+        if self.seconds_per_item:
+            desired = min(desired, int(self.target_time / self.seconds_per_item))
+        if self.bytes_per_item and self.max_page_bytes:
+            desired = min(desired, int(self.max_page_bytes / self.bytes_per_item))
+        desired = max(1, min(cap, max(self.min_size, desired)))
+        return _aligned(offset, desired, current, self.min_size)
+
+    @property
+    def sizes(self) -> List[int]:
+        """The ``size`` of every page fetched, in order."""
+        return [page.size for page in self.pages]
+
+    def summary(self) -> Dict[str, Any]:
+        seconds = sum(page.seconds for page in self.pages)
+        items = sum(page.items for page in self.pages)
+        return {
+            "pages": len(self.pages),
+            "items": items,
+            "seconds": seconds,
+            "items_per_second": items / seconds if seconds else None,
+            "sizes": self.sizes,
+            "seconds_per_item": self.seconds_per_item,
+            "bytes_per_item": self.bytes_per_item,
+        }
+
+
+Tune = Union[bool, PageSizeTuner, None]
+
+
+class _Pager:
+    """Page, size and bookkeeping shared by the sync and async iterators."""
+
+    def __init__(
+        self, method: Callable[..., Any], page: int, tune: Tune, kwargs: Dict[str, Any]
+    ):
+        given = kwargs.pop("size", None)
+        self.size = given or DEFAULT_SIZE
+        self.offset = page * self.size
+        self.tuner = PageSizeTuner() if tune is True else tune or None
+        # Leave ``size`` to the API's default unless it was given or is tuned
+        self.send_size = bool(given) or self.tuner is not None
+        self.cap = DEFAULT_MAX_SIZE
+        client = getattr(getattr(method, "__self__", None), "api_client", None)
+        self.transfer = getattr(client, "transfer", None)
+        self.started = 0.0
+        self.bytes = 0
+
+    def request(self) -> Dict[str, Any]:
+        if self.tuner is not None:
+            if self.tuner.pages:
+                self.size = self.tuner.next_size(self.offset, self.size, self.cap)
+            self.started = time.perf_counter()
+            if self.transfer is not None:
+                self.bytes = self.transfer.decoded_bytes
+        if not self.send_size:
+            return {"page": self.offset // self.size}
+        return {"page": self.offset // self.size, "size": self.size}
+
+    def received(self, batch: List[Any]) -> bool:
+        """Record a page; ``False`` once it was the last one."""
+        if self.tuner is not None:
+            nbytes = None
+            if self.transfer is not None:
+                nbytes = self.transfer.decoded_bytes - self.bytes
+            self.tuner.observe(
+                self.size, len(batch), time.perf_counter() - self.started, nbytes
+            )
+        self.offset += self.size
+        return len(batch) >= self.size
+
+
+def paginate(
+    method: Callable[..., Any],
+    items: str = "articles",
+    *,
+    page: int = 0,
+    max_pages: Optional[int] = None,
+    limit: Optional[int] = None,
+    tune: Tune = None,
+    **kwargs: Any,
+) -> Iterator[Any]:
+    """
+    Yield the ``items`` of successive pages of ``method(**kwargs)``.
+
+    ``tune=True`` (or a :class:`PageSizeTuner` to inspect afterwards) adapts
+    ``size`` page by page, starting from ``size`` if given.
+    """
+    pager = _Pager(method, page, tune, kwargs)
+    pages = yielded = 0
+    while (max_pages is None or pages < max_pages) and (
+        limit is None or yielded < limit
+    ):
+        request = pager.request()
+        batch = _items(method(**request, **kwargs), items)
+        more = pager.received(batch)
+        if limit is not None:
+            batch = batch[: limit - yielded]
+        for item in batch:
+            yield item
+        yielded += len(batch)
+        pages += 1
+        if not more:
+            return
+
+
+async def paginate_async(
+    method: Callable[..., Awaitable[Any]],
+    items: str = "articles",
+    *,
+    page: int = 0,
+    max_pages: Optional[int] = None,
+    limit: Optional[int] = None,
+    tune: Tune = None,
+    **kwargs: Any,
+) -> AsyncIterator[Any]:
+    """Async counterpart of :func:`paginate` for the ``_async`` methods."""
+    pager = _Pager(method, page, tune, kwargs)
+    pages = yielded = 0
+    while (max_pages is None or pages < max_pages) and (
+        limit is None or yielded < limit
+    ):
+        request = pager.request()
+        batch = _items(await method(**request, **kwargs), items)
+        more = pager.received(batch)
+        if limit is not None:
+            batch = batch[: limit - yielded]
+        for item in batch:
+            yield item
+        yielded += len(batch)
+        pages += 1
+        if not more:
+            return
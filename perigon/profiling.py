@@ -0,0 +1,169 @@
+# Package : perigon
+"""
+Per-endpoint profiling for :class:`ApiClient`.
+
+``ApiClient(profile=True)`` installs a :class:`Profiler` that splits the wall
+time of every call into query encoding, network wait, JSON parsing, model
+validation and remaining SDK overhead, aggregated per endpoint, and tracks
+how much of the profiled window was spent in the caller's own code::
+
+    client = ApiClient(api_key=..., profile=True)
+    run_job(V1Api(client))
+    print(client.profiler.report())
+    open("perigon.folded", "w").write(client.profiler.folded())  # flamegraph.pl
+
+``Profiler(functions=True)`` additionally runs :mod:`cProfile` while SDK calls
+are in flight, for a function-level view of the SDK's own frames
+(:meth:`Profiler.stats`). cProfile only sees the thread that started it, so
+use it with sequential sync calls or a single event loop.
+"""
+
+from __future__ import annotations
+
+import cProfile
+import io
+import pstats
+import threading
+from time import perf_counter
+from typing import Dict, List, Optional
+
+from perigon.instrumentation import CallReport, Observer
+
+# Order of the columns in report() and the frames in folded()
+STAGES = ("encode", "network", "decode", "validate", "sdk")
+
+
+class EndpointProfile:
+    """Accumulated stage times (seconds) for one endpoint."""
+
+    __slots__ = ("endpoint", "calls", "errors", "total", "stages")
+
+    def __init__(self, endpoint: str):
+        self.endpoint = endpoint
+        self.calls = 0
+        self.errors = 0
+        self.total = 0.0
+        self.stages: Dict[str, float] = dict.fromkeys(STAGES, 0.0)
+
+    def add(self, report: CallReport) -> None:
+        total = report.total or 0.0
+        self.calls += 1
+        self.errors += report.error is not None
+        self.total += total
+        accounted = 0.0
+        for stage in STAGES[:-1]:
+            value = getattr(report, stage) or 0.0
+            self.stages[stage] += value
+            accounted += value
+        self.stages["sdk"] += max(total - accounted, 0.0)
+
+
+class Profiler(Observer):
+    """Aggregates :class:`CallReport` timings per endpoint."""
+
+    def __init__(self, functions: bool = False):
+        self.endpoints: Dict[str, EndpointProfile] = {}
+        self._lock = threading.Lock()
+        self._started: Optional[float] = None
+        # Wall time with at least one SDK call in flight
+        self._busy = 0.0
+        self._busy_since = 0.0
+        self._in_flight = 0
+        self._cprofile = cProfile.Profile() if functions else None
+
+    # -- Observer hooks ------------------------------------------------ #
+    def on_start(self, report: CallReport) -> None:
+        with self._lock:
+            if self._started is None:
+                self._started = report.started
+            if self._in_flight == 0:
+                self._busy_since = report.started
+                if self._cprofile is not None:
+                    self._cprofile.enable()
+            self._in_flight += 1
+
+    def on_end(self, report: CallReport) -> None:
+        with self._lock:
+            self._in_flight -= 1
+            if self._in_flight == 0:
+                if self._cprofile is not None:
+                    self._cprofile.disable()
+                self._busy += (report.finished or perf_counter()) - self._busy_since
+            profile = self.endpoints.get(report.endpoint)
+            if profile is None:
+                profile = self.endpoints[report.endpoint] = EndpointProfile(
+                    report.endpoint
+                )
+            profile.add(report)
+
+    # -- results ------------------------------------------------------- #
+    def user_time(self) -> float:
+        """Wall time since the first call during which no SDK call was running."""
+        with self._lock:
+            if self._started is None:
+                return 0.0
+            now = perf_counter()
+            busy = self._busy
+            if self._in_flight:
+                busy += now - self._busy_since
+            return max(now - self._started - busy, 0.0)
+
+    def summary(self) -> Dict[str, Dict[str, float]]:
+        """``{endpoint: {"calls", "errors", "total", <stage>...}}`` in seconds."""
+        with self._lock:
+            return {
+                name: {
+                    "calls": p.calls,
+                    "errors": p.errors,
+                    "total": p.total,
+                    **p.stages,
+                }
+                for name, p in self.endpoints.items()
+            }
+
+    def folded(self) -> str:
+        """
+        Collapsed stacks (``endpoint;stage microseconds``) for flamegraph.pl,
+        speedscope and similar tools, with the caller's own time as ``user``.
+        """
+        lines = [
+            f"{endpoint};{stage} {round(value * 1e6)}"
+            for endpoint, stats in self.summary().items()
+            for stage, value in stats.items()
+            if stage in STAGES and value > 0
+        ]
+        user = self.user_time()
+        if user > 0:
+            lines.append(f"user {round(user * 1e6)}")
+        return "\n".join(lines)
+
+    def report(self) -> str:
+        """Text table of per-endpoint stage times (ms) and their share."""
+        summary = sorted(self.summary().items(), key=lambda kv: -kv[1]["total"])
+        header = f"{'endpoint':<40} {'calls':>6} {'total ms':>10}" + "".join(
+            f" {stage:>15}" for stage in STAGES
+        )
+        lines: List[str] = [header]
+        for endpoint, stats in summary:
+            total = stats["total"] or 1.0
+            cells = "".join(
+                f" {stats[s] * 1e3:>8.1f} ({stats[s] / total:>3.0%})" for s in STAGES
+            )
+            lines.append(
+                f"{endpoint:<40} {stats['calls']:>6.0f} {stats['total'] * 1e3:>10.1f}"
+                + cells
+            )
+        lines.append(f"user code outside SDK calls: {self.user_time() * 1e3:.1f} ms")
+        return "\n".join(lines)
+
+    def stats(self, limit: int = 30) -> str:
+        """cProfile output restricted to SDK call windows (``functions=True``)."""
+        if self._cprofile is None:
+            raise RuntimeError(
+                "function profiling is off; use Profiler(functions=True)"
+            )
+        out = io.StringIO()
+        pstats.Stats(self._cprofile, stream=out).sort_stats("cumulative").print_stats(
+            limit
+        )
+        return out.getvalue()
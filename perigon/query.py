@@ -0,0 +1,111 @@
+# Package : perigon
+"""
+Query-string encoding shared by the generated API modules.
+
+Each operation declares a :class:`QuerySpec` – a table of
+``(python name, wire alias, encoder)`` rows – once at import time.
+Encoding a call is then a single loop over that table; value conversion is
+dispatched on ``type(value)`` through a per-type cache, so the ``isinstance``
+chain runs once per type rather than once per value.
+"""
+
+from __future__ import annotations
+
+from datetime import datetime
+from enum import Enum
+from typing import Any, Callable, Dict, Mapping, Tuple
+
+Encoder = Callable[[Any], str]
+
+_COLLECTIONS = (list, tuple, set)
+
+
+# ---------------------------------------------------------------------- #
+# Per-type encoders
+# ---------------------------------------------------------------------- #
+def _scalar_datetime(value: datetime) -> str:
+    return value.isoformat().split("+")[0]
+
+
+def _item_datetime(value: datetime) -> str:
+    return value.isoformat().replace(" ", "+")
+
+
+def _item_enum(value: Enum) -> str:
+    return str(value.value)
+
+
+def _resolve_scalar(tp: type) -> Encoder:
+    if issubclass(tp, Enum):
+        return lambda value: encode_scalar(value.value)
+    if issubclass(tp, datetime):
+        return _scalar_datetime
+    if issubclass(tp, _COLLECTIONS):
+        return _encode_csv
+    if tp is str:
+        return lambda value: value
+    return str
+
+
+def _resolve_item(tp: type) -> Encoder:
+    if issubclass(tp, datetime):
+        return _item_datetime
+    if issubclass(tp, Enum):
+        return _item_enum
+    if tp is str:
+        return lambda value: value
+    return str
+
+
+_SCALAR_ENCODERS: Dict[type, Encoder] = {}
+_ITEM_ENCODERS: Dict[type, Encoder] = {}
+
+
+def _encode_csv(values: Any) -> str:
+    cache = _ITEM_ENCODERS
+    out = []
+    for item in values:
+        encode = cache.get(type(item))
+        if encode is None:
+            encode = cache[type(item)] = _resolve_item(type(item))
+        out.append(encode(item))
+    return ",".join(out)
+
+
+def encode_scalar(value: Any) -> str:
+    """Encode a single query value (Enum → value, datetime → ISO, else str)."""
+    encode = _SCALAR_ENCODERS.get(type(value))
+    if encode is None:
+        encode = _SCALAR_ENCODERS[type(value)] = _resolve_scalar(type(value))
+    return encode(value)
+
+
+def encode_list(value: Any) -> str:
+    """Encode an array query value as CSV, tolerating a single scalar."""
+    if type(value) is list:
+        return _encode_csv(value)
+    return encode_scalar(value)
+
+
+# ---------------------------------------------------------------------- #
+# Operation specs
+# ---------------------------------------------------------------------- #
+class QuerySpec:
+    """Pre-compiled query parameter table for one API operation."""
+
+    __slots__ = ("params",)
+
+    def __init__(self, *params: Tuple[str, str, Encoder]):
+        self.params = params
+
+    def encode(self, values: Mapping[str, Any]) -> Dict[str, str]:
+        """
+        Build the query dict from ``values`` (usually the method's
+        ``locals()``), skipping parameters that are ``None``.
+        """
+        out: Dict[str, str] = {}
+        for name, alias, encode in self.params:
+            value = values[name]
+            if value is not None:
+                out[alias] = encode(value)
+        return out
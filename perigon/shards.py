@@ -0,0 +1,400 @@
+# Package : perigon
+"""
+Sharded backfills across API keys and worker processes.
+
+:func:`plan_shards` splits a query space – time windows × ``source_group`` ×
+``language`` – into shards. A :class:`ShardQueue` keeps them in a local
+SQLite file, and :class:`Coordinator` starts worker processes, one per API
+key, that lease shards from it until none are left::
+
+    with ShardQueue("backfill.db") as queue:
+        queue.add(plan_shards(datetime(2024, 1, 1), datetime(2024, 7, 1),
+                              source_groups=["top100"], languages=["en", "de"]))
+    Coordinator("backfill.db", api_keys=[key1, key2, key3], sink=save, q="AI").run()
+
+Each worker process has its own ``ApiClient``. A worker calls
+``sink(shard, articles)`` for every shard it leases; the return value is
+recorded as the shard's item count. A lease is renewed while the articles
+are consumed. A shard whose call fails goes back to the queue, and so does
+one whose worker died once its lease expires; workers wait for leased
+shards before exiting, so the survivors pick it up. A shard that fails
+``max_attempts`` times is marked failed; :meth:`ShardQueue.retry_failed`
+queues those again. Running the coordinator again resumes a backfill.
+
+A shard may run twice if its lease expires mid-way, so sinks should be
+idempotent (an :class:`~perigon.store.ArticleStore` per worker is).
+``sink`` must be picklable, e.g. a module-level function.
+"""
+
+from __future__ import annotations
+
+import json
+import multiprocessing
+import os
+import socket
+import sqlite3
+import time
+from datetime import datetime, timedelta
+from itertools import product
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+from perigon.api.v1_api import V1Api
+from perigon.api_client import ApiClient
+from perigon.exceptions import ApiValueError
+from perigon.pagination import paginate
+
+STATES = ("pending", "leased", "done", "failed")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS shards (
+    id INTEGER PRIMARY KEY,
+    params TEXT NOT NULL UNIQUE,
+    state TEXT NOT NULL DEFAULT 'pending',
+    owner TEXT,
+    lease_until REAL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    items INTEGER,
+    error TEXT
+)
+"""
+
+Shard = Dict[str, Any]
+Sink = Callable[[Shard, Iterator[Any]], int]
+
+
+def plan_shards(
+    start: datetime,
+    end: datetime,
+    window: timedelta = timedelta(days=1),
+    source_groups: Sequence[Optional[str]] = (None,),
+    languages: Sequence[Optional[str]] = (None,),
+) -> List[Shard]:
+    """
+    One shard per ``window`` of ``[start, end)`` (the last one clipped) per
+    source group per language; ``None`` leaves that filter out.
+    """
+    if window <= timedelta(0):
+        raise ApiValueError("window must be positive")
+    windows = []
+    while start < end:
+        windows.append((start, min(start + window, end)))
+        start += window
+    shards = []
+    for (var_from, to), group, language in product(windows, source_groups, languages):
+        shard: Shard = {"var_from": var_from, "to": to}
+        if group is not None:
+            shard["source_group"] = group
+        if language is not None:
+            shard["language"] = language
+        shards.append(shard)
+    return shards
+
+
+def _default(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return {"$datetime": value.isoformat()}
+    raise TypeError(f"cannot store {type(value).__name__} in a shard")
+
+
+def _hook(obj: Dict[str, Any]) -> Any:
+    if obj.keys() == {"$datetime"}:
+        return datetime.fromisoformat(obj["$datetime"])
+    return obj
+
+
+class ShardQueue:
+    """
+    Shards and their state in a SQLite file shared by the worker processes.
+    Leases last ``lease_time`` seconds unless renewed.
+    """
+
+    def __init__(self, path: str, lease_time: float = 600.0, max_attempts: int = 3):
+        self.path = path
+        self.lease_time = lease_time
+        self.max_attempts = max_attempts
+        self._db = sqlite3.connect(path, timeout=60, isolation_level=None)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute(_SCHEMA)
+
+    def _update(self, sql: str, *args: Any) -> bool:
+        return self._db.execute(sql, args).rowcount == 1
+
+    def add(self, shards: Iterable[Shard]) -> int:
+        """Queue ``shards``, skipping ones already queued; returns how many were new."""
+        rows = [
+            (json.dumps(shard, sort_keys=True, default=_default),) for shard in shards
+        ]
+        before = self._db.total_changes
+        self._db.execute("BEGIN IMMEDIATE")
+        try:
+            self._db.executemany(
+                "INSERT OR IGNORE INTO shards (params) VALUES (?)", rows
+            )
+        except BaseException:
+            self._db.execute("ROLLBACK")
+            raise
+        self._db.execute("COMMIT")
+        return self._db.total_changes - before
+
+    def lease(self, owner: str) -> Optional[Tuple[int, Shard]]:
+        """``(shard id, shard)`` of the next shard to run, now leased to ``owner``."""
+        now = time.time()
+        self._db.execute("BEGIN IMMEDIATE")
+        try:
+            # Expired leases count as attempts: their worker died mid-way
+            self._db.execute(
+                "UPDATE shards SET state = 'failed', error = 'lease expired' "
+                "WHERE state = 'leased' AND lease_until < ? AND attempts >= ?",
+                (now, self.max_attempts),
+            )
+            row = self._db.execute(
+                "SELECT id, params FROM shards WHERE state = 'pending' "
+                "OR (state = 'leased' AND lease_until < ?) ORDER BY id LIMIT 1",
+                (now,),
+            ).fetchone()
+            if row is not None:
+                self._db.execute(
+                    "UPDATE shards SET state = 'leased', owner = ?, "
+                    "lease_until = ?, attempts = attempts + 1 WHERE id = ?",
+                    (owner, now + self.lease_time, row[0]),
+                )
+        except BaseException:
+            self._db.execute("ROLLBACK")
+            raise
+        self._db.execute("COMMIT")
+        if row is None:
+            return None
+        return row[0], json.loads(row[1], object_hook=_hook)
+
+    def next_expiry(self) -> Optional[float]:
+        """When the first current lease runs out, or ``None`` if none are held."""
+        row = self._db.execute(
+            "SELECT MIN(lease_until) FROM shards WHERE state = 'leased'"
+        ).fetchone()
+        return None if row[0] is None else float(row[0])
+
+    def renew(self, shard_id: int, owner: str) -> bool:
+        """Extend ``owner``'s lease; ``False`` if it has lost the shard."""
+        return self._update(
+            "UPDATE shards SET lease_until = ? "
+            "WHERE id = ? AND owner = ? AND state = 'leased'",
+            time.time() + self.lease_time,
+            shard_id,
+            owner,
+        )
+
+    def complete(self, shard_id: int, owner: str, items: int) -> bool:
+        return self._update(
+            "UPDATE shards SET state = 'done', items = ?, error = NULL "
+            "WHERE id = ? AND owner = ? AND state = 'leased'",
+            items,
+            shard_id,
+            owner,
+        )
+
+    def fail(self, shard_id: int, owner: str, error: str) -> bool:
+        """Requeue the shard, or mark it failed after ``max_attempts``."""
+        return self._update(
+            "UPDATE shards SET error = ?, lease_until = NULL, state = "
+            "CASE WHEN attempts >= ? THEN 'failed' ELSE 'pending' END "
+            "WHERE id = ? AND owner = ? AND state = 'leased'",
+            error,
+            self.max_attempts,
+            shard_id,
+            owner,
+        )
+
+    def retry_failed(self) -> int:
+        """Queue every failed shard again with fresh attempts; returns how many."""
+        return self._db.execute(
+            "UPDATE shards SET state = 'pending', attempts = 0 WHERE state = 'failed'"
+        ).rowcount
+
+    def counts(self) -> Dict[str, int]:
+        """Number of shards per state."""
+        counts = dict.fromkeys(STATES, 0)
+        for state, count in self._db.execute(
+            "SELECT state, COUNT(*) FROM shards GROUP BY state"
+        ):
+            counts[state] = count
+        return counts
+
+    def errors(self) -> Dict[int, str]:
+        """Last error of each failed shard, by id."""
+        rows = self._db.execute("SELECT id, error FROM shards WHERE state = 'failed'")
+        return dict(rows.fetchall())
+
+    def close(self) -> None:
+        self._db.close()
+
+    def __enter__(self) -> "ShardQueue":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+
+class _LeaseLost(Exception):
+    pass
+
+
+def _renewing(
+    items: Iterator[Any], queue: ShardQueue, shard_id: int, owner: str
+) -> Iterator[Any]:
+    renewed = time.monotonic()
+    for item in items:
+        if time.monotonic() - renewed > queue.lease_time / 2:
+            if not queue.renew(shard_id, owner):
+                raise _LeaseLost
+            renewed = time.monotonic()
+        yield item
+
+
+def _count(shard: Shard, items: Iterator[Any]) -> int:
+    return sum(1 for _ in items)
+
+
+def work(
+    queue: ShardQueue,
+    api: Any,
+    sink: Optional[Sink] = None,
+    method: str = "search_articles",
+    items: str = "articles",
+    owner: Optional[str] = None,
+    poll_interval: float = 1.0,
+    **params: Any,
+) -> int:
+    """
+    Lease and run shards from ``queue`` until none are left: paginate
+    ``api.<method>`` with ``params`` and the shard's filters, and hand the
+    ``items`` to ``sink`` (by default they are only counted). Returns how
+    many shards this worker completed.
+
+    While other workers hold leases, it checks every ``poll_interval``
+    seconds for a lease that has expired, so a dead worker's shard still
+    runs.
+    """
+    owner = owner or f"{socket.gethostname()}:{os.getpid()}"
+    fetch = getattr(api, method)
+    sink = sink or _count
+    completed = 0
+    while True:
+        leased = queue.lease(owner)
+        if leased is None:
+            expiry = queue.next_expiry()
+            if expiry is None:
+                return completed
+            time.sleep(max(0.0, min(poll_interval, expiry - time.time())))
+            continue
+        shard_id, shard = leased
+        try:
+            stream = paginate(fetch, items, **dict(params, **shard))
+            count = sink(shard, _renewing(stream, queue, shard_id, owner))
+        except _LeaseLost:
+            continue
+        except Exception as exc:
+            queue.fail(shard_id, owner, f"{type(exc).__name__}: {exc}")
+            continue
+        if queue.complete(shard_id, owner, count or 0):
+            completed += 1
+
+
+def _process(
+    path: str,
+    api_key: str,
+    queue_options: Dict[str, Any],
+    client_options: Dict[str, Any],
+    work_options: Dict[str, Any],
+) -> None:
+    client = ApiClient(api_key=api_key, **client_options)
+    try:
+        with ShardQueue(path, **queue_options) as queue:
+            work(queue, V1Api(client), **work_options)
+    finally:
+        client.close()
+
+
+class Coordinator:
+    """
+    Runs the shards queued in ``path`` on ``workers_per_key`` processes per
+    key in ``api_keys``; see the module docstring. ``client_options`` go to
+    each worker's ``ApiClient``, ``params`` to every call.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        api_keys: Sequence[str],
+        sink: Optional[Sink] = None,
+        method: str = "search_articles",
+        items: str = "articles",
+        workers_per_key: int = 1,
+        lease_time: float = 600.0,
+        max_attempts: int = 3,
+        client_options: Optional[Dict[str, Any]] = None,
+        context: Optional[str] = None,
+        **params: Any,
+    ):
+        if not api_keys:
+            raise ApiValueError("at least one API key is required")
+        self.path = path
+        self.api_keys = list(api_keys)
+        self.workers_per_key = workers_per_key
+        self.queue_options: Dict[str, Any] = {
+            "lease_time": lease_time,
+            "max_attempts": max_attempts,
+        }
+        self.client_options = dict(client_options or {})
+        self.work_options = dict(params, sink=sink, method=method, items=items)
+        # multiprocessing start method; None uses the platform default
+        self.context = context
+
+    def run(self) -> Dict[str, int]:
+        """
+        Run workers until the queue is drained; returns the shard counts.
+        Raises :class:`ChildProcessError` if a worker exited abnormally,
+        after the others have finished its shards.
+        """
+        # Any: the stubs type a context chosen by name as BaseContext, which
+        # has no Process
+        context: Any = multiprocessing.get_context(self.context)
+        processes = [
+            context.Process(
+                target=_process,
+                args=(
+                    self.path,
+                    api_key,
+                    self.queue_options,
+                    self.client_options,
+                    self.work_options,
+                ),
+                name=f"perigon-shard-{number}",
+            )
+            for number, api_key in enumerate(self.api_keys * self.workers_per_key)
+        ]
+        for process in processes:
+            process.start()
+        for process in processes:
+            process.join()
+        with ShardQueue(self.path, **self.queue_options) as queue:
+            counts = queue.counts()
+        crashed = [
+            f"{process.name} (exit code {process.exitcode})"
+            for process in processes
+            if process.exitcode != 0
+        ]
+        if crashed:
+            raise ChildProcessError(
+                f"shard workers died: {', '.join(crashed)}; shards: {counts}"
+            )
+        return counts
@@ -0,0 +1,224 @@
+# Package : perigon
+"""
+Typed, array-backed decoding of ``StatResult``.
+
+``StatResult.results`` is a list of loosely typed bucket dicts.
+:func:`decode_stats` turns it into a :class:`TimeSeries` – parallel
+``int64`` arrays of bucket start (epoch seconds, UTC) and count – with the
+usual time-series operations done in NumPy::
+
+    series = decode_stats(api.get_story_counts(split_by="HOUR", q="AI"))
+    series.sum()                   # total stories
+    series.resample("day")         # daily totals
+    series.fill("hour").rolling(24, "mean")
+
+Requires numpy (``pip install "perigon[numpy]"``).
+"""
+
+from __future__ import annotations
+
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple, Union
+
+from perigon._helpers import numpy_error
+
+try:
+    import numpy as np
+except ImportError as exc:  # pragma: no cover - depends on extras
+    raise numpy_error("perigon.stats") from exc
+
+from perigon.dates import INTERVALS, MISSING, WEEK_ORIGIN, epochs
+from perigon.exceptions import ApiValueError
+
+# Candidate keys of a ``StatResult.results`` bucket, in order of preference
+TIME_KEYS = ("date", "from", "key", "timestamp", "time", "bucket")
+COUNT_KEYS = ("count", "numResults", "value", "total")
+
+Interval = Union[str, int]
+
+
+def _step(interval: Interval) -> int:
+    step = INTERVALS.get(interval.lower()) if isinstance(interval, str) else interval
+    if not step or step <= 0:
+        raise ApiValueError(
+            f"interval must be one of {(*INTERVALS, 'month')} or positive seconds"
+        )
+    return step
+
+
+def _monthly(interval: Interval) -> bool:
+    return isinstance(interval, str) and interval.lower() == "month"
+
+
+def floor_epochs(times: Any, interval: Interval) -> Any:
+    """Start of the ``interval`` bucket holding each epoch (weeks from Monday)."""
+    times = np.asarray(times, dtype=np.int64)
+    if _monthly(interval):
+        months = times.astype("datetime64[s]").astype("datetime64[M]")
+        return months.astype("datetime64[s]").astype(np.int64)
+    step = _step(interval)
+    origin = (
+        WEEK_ORIGIN if isinstance(interval, str) and interval.lower() == "week" else 0
+    )
+    return (times - origin) // step * step + origin
+
+
+def _grid(first: int, last: int, interval: Interval) -> Any:
+    # Every bucket start from ``first`` to ``last``, both already floored
+    if _monthly(interval):
+        months = np.arange(
+            np.datetime64(first, "s").astype("datetime64[M]"),
+            np.datetime64(last, "s").astype("datetime64[M]") + 1,
+        )
+        return months.astype("datetime64[s]").astype(np.int64)
+    return np.arange(first, last + 1, _step(interval), dtype=np.int64)
+
+
+class TimeSeries:
+    """
+    Counts per time bucket as two parallel arrays, sorted by time:
+    ``epochs`` (``int64`` bucket starts) and ``counts`` (``int64``, or
+    ``float64`` after a rolling mean).
+    """
+
+    __slots__ = ("epochs", "counts")
+
+    def __init__(self, epochs: Any = (), counts: Any = ()):
+        self.epochs = np.asarray(epochs, dtype=np.int64)
+        self.counts = np.asarray(counts)
+        if self.counts.dtype.kind not in "iuf":
+            self.counts = self.counts.astype(np.int64)
+        if self.epochs.shape != self.counts.shape:
+            raise ApiValueError(
+                f"{self.epochs.size} timestamps but {self.counts.size} counts"
+            )
+
+    def __len__(self) -> int:
+        return int(self.epochs.size)
+
+    def __iter__(self) -> Iterator[Tuple[datetime, Any]]:
+        for when, count in zip(self.datetimes(), self.counts.tolist()):
+            yield when, count
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, TimeSeries):
+            return NotImplemented
+        return np.array_equal(self.epochs, other.epochs) and np.array_equal(
+            self.counts, other.counts
+        )
+
+    def __repr__(self) -> str:
+        return f"TimeSeries({len(self)} buckets, total={self.sum()})"
+
+    def datetimes(self) -> List[datetime]:
+        """Bucket starts as aware UTC datetimes."""
+        return [
+            datetime.fromtimestamp(t, tz=timezone.utc) for t in self.epochs.tolist()
+        ]
+
+    def sum(self) -> Any:
+        return self.counts.sum().item() if len(self) else 0
+
+    @classmethod
+    def merge(cls, parts: Sequence["TimeSeries"]) -> "TimeSeries":
+        """One series from several, summing the counts of repeated buckets."""
+        if not parts:
+            return cls()
+        times = np.concatenate([p.epochs for p in parts])
+        counts = np.concatenate([p.counts for p in parts])
+        keys, inverse = np.unique(times, return_inverse=True)
+        totals = np.bincount(inverse, weights=counts, minlength=len(keys))
+        return cls(keys, totals.astype(counts.dtype))
+
+    def between(
+        self, start: Optional[int] = None, end: Optional[int] = None
+    ) -> "TimeSeries":
+        """Buckets with ``start <= epoch < end`` (either bound optional)."""
+        keep = np.ones(len(self), dtype=bool)
+        if start is not None:
+            keep &= self.epochs >= start
+        if end is not None:
+            keep &= self.epochs < end
+        return TimeSeries(self.epochs[keep], self.counts[keep])
+
+    def resample(self, interval: Interval) -> "TimeSeries":
+        """Totals per coarser ``interval`` (a name, ``"month"`` or seconds)."""
+        if not len(self):
+            return TimeSeries()
+        starts = floor_epochs(self.epochs, interval)
+        # ``epochs`` is sorted, so equal starts are adjacent
+        edges = np.flatnonzero(np.diff(starts)) + 1
+        first = np.concatenate(([0], edges))
+        return TimeSeries(starts[first], np.add.reduceat(self.counts, first))
+
+    def fill(self, interval: Interval) -> "TimeSeries":
+        """
+        Totals per ``interval`` bucket, as :meth:`resample` gives, plus a
+        zero-count bucket for every missing step in between.
+        """
+        if not len(self):
+            return TimeSeries()
+        starts = floor_epochs(self.epochs, interval)
+        grid = _grid(int(starts[0]), int(starts[-1]), interval)
+        counts = np.zeros(grid.size, dtype=self.counts.dtype)
+        # Several buckets can share a start when ``interval`` is coarser
+        np.add.at(counts, np.searchsorted(grid, starts), self.counts)
+        return TimeSeries(grid, counts)
+
+    def rolling(self, window: int, how: str = "sum") -> "TimeSeries":
+        """
+        Sum or mean of each ``window`` consecutive buckets, labelled by the
+        last one. Buckets are taken as they are; :meth:`fill` gaps first.
+        """
+        if window < 1:
+            raise ApiValueError("window must be at least 1")
+        if how not in ("sum", "mean"):
+            raise ApiValueError(f"how must be 'sum' or 'mean', not {how!r}")
+        if len(self) < window:
+            return TimeSeries()
+        totals = np.cumsum(self.counts)
+        totals[window:] = totals[window:] - totals[:-window]
+        totals = totals[window - 1 :]
+        if how == "mean":
+            totals = totals / window
+        return TimeSeries(self.epochs[window - 1 :], totals)
+
+
+def _pick(bucket: Dict[str, Any], keys: Sequence[str]) -> Optional[str]:
+    return next((key for key in keys if key in bucket), None)
+
+
+def decode_stats(
+    result: Any, time_key: Optional[str] = None, count_key: Optional[str] = None
+) -> TimeSeries:
+    """
+    :class:`TimeSeries` of a ``StatResult`` (or its ``results`` list).
+
+    The keys default to the first of :data:`TIME_KEYS` / :data:`COUNT_KEYS`
+    present in the buckets; timestamps may be ISO strings or epoch seconds
+    or milliseconds. Buckets without a timestamp are dropped.
+    """
+    results = getattr(result, "results", result) or []
+    if not results:
+        return TimeSeries()
+    time_key = time_key or _pick(results[0], TIME_KEYS)
+    count_key = count_key or _pick(results[0], COUNT_KEYS)
+    if time_key is None or count_key is None:
+        raise ApiValueError(f"cannot find time and count keys in {results[0]!r}")
+    # Drop buckets without a timestamp first, so they cannot turn an
+    # all-numeric column into a mixed one
+    results = [bucket for bucket in results if bucket.get(time_key) not in (None, "")]
+    if not results:
+        return TimeSeries()
+    stamps = [bucket[time_key] for bucket in results]
+    if all(isinstance(s, (int, float)) for s in stamps):
+        times = np.array(stamps, dtype=np.int64)
+        if np.abs(times).max() > 10**11:
+            times //= 1000
+    else:
+        times = epochs(stamps)
+    counts = np.array([bucket.get(count_key) or 0 for bucket in results], np.int64)
+    keep = times != MISSING
+    times, counts = times[keep], counts[keep]
+    order = np.argsort(times, kind="stable")
+    return TimeSeries(times[order], counts[order])
@@ -0,0 +1,301 @@
+# Package : perigon
+"""
+Append-only local article store with secondary indexes.
+
+:class:`ArticleStore` keeps articles in a directory of two files:
+
+* ``articles.dat`` – the records, each an article's compact JSON (aliases,
+  no null fields), appended and read back through a read-only ``mmap``;
+* ``keys.log`` – one JSON line per record with its offset, length and
+  indexed keys, replayed on open so nothing else has to be read.
+
+Lookups by ``article_id``, ``cluster_id``, source domain and
+``reprint_group_id`` and ``pub_date`` range scans touch the in-memory
+indexes and only the records they return::
+
+    with ArticleStore("articles/") as store:
+        store.sync(api.search_articles, q="AI")     # fetch what is new
+        store.get(article_id)
+        store.by_cluster(cluster_id)
+        store.between(datetime(2024, 5, 1), datetime(2024, 5, 2))
+        store.compact(since=datetime.now() - timedelta(days=30))
+
+Adding an article whose ``article_id`` is already stored supersedes the
+old record; :meth:`ArticleStore.compact` reclaims the space.
+"""
+
+from __future__ import annotations
+
+import json
+import mmap
+import os
+from bisect import bisect_left, insort
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+from perigon._helpers import articles as unwrap
+from perigon.dates import parse_epoch, utc_timestamp
+from perigon.models.article import Article
+from perigon.pagination import paginate
+
+_DATA = "articles.dat"
+_KEYS = "keys.log"
+
+# Fields of a ``keys.log`` line, in order
+KEY_FIELDS = (
+    "offset",
+    "length",
+    "pub_date",
+    "add_date",
+    "article_id",
+    "cluster_id",
+    "source",
+    "reprint_group_id",
+    "refresh_date",
+)
+
+# Secondary indexes: name -> position in a ``keys.log`` line
+INDEXES = {"cluster_id": 5, "source": 6, "reprint_group_id": 7}
+
+Moment = Union[datetime, int, None]
+
+
+def _epoch(moment: Moment) -> Optional[int]:
+    if moment is None or isinstance(moment, int):
+        return moment
+    return int(utc_timestamp(moment))
+
+
+def _key_line(article: Article, offset: int, length: int) -> List[Any]:
+    return [
+        offset,
+        length,
+        parse_epoch(article.pub_date),
+        parse_epoch(article.add_date),
+        article.article_id,
+        article.cluster_id,
+        article.source.domain if article.source is not None else None,
+        article.reprint_group_id,
+        article.refresh_date,
+    ]
+
+
+class ArticleStore:
+    """Articles on disk with in-memory indexes; see the module docstring."""
+
+    def __init__(self, directory: str):
+        os.makedirs(directory, exist_ok=True)
+        self.directory = directory
+        self._open()
+
+    def _open(self) -> None:
+        data_path = os.path.join(self.directory, _DATA)
+        keys_path = os.path.join(self.directory, _KEYS)
+        self._map: Optional[mmap.mmap] = None
+        # One entry per record, live or superseded
+        self._records: List[List[Any]] = []
+        self._ids: Dict[str, int] = {}
+        self._indexes: Dict[str, Dict[str, List[int]]] = {name: {} for name in INDEXES}
+        # (pub_date epoch, record) sorted, for range scans
+        self._dates: List[Tuple[int, int]] = []
+        self.watermark: Optional[int] = None
+        self._replay(data_path, keys_path)
+        self._data = open(data_path, "a+b")
+        self._keys = open(keys_path, "a+", encoding="utf-8")
+
+    def _replay(self, data_path: str, keys_path: str) -> None:
+        # Index the key lines up to the first torn or dangling one (from an
+        # interrupted write), then cut both files back to the last good
+        # record so later appends line up with their offsets again
+        size = os.path.getsize(data_path) if os.path.exists(data_path) else 0
+        valid = end = 0
+        if os.path.exists(keys_path):
+            with open(keys_path, "rb") as file:
+                for line in file:
+                    try:
+                        keys = json.loads(line)
+                    except ValueError:
+                        break
+                    if not line.endswith(b"\n") or keys[0] + keys[1] > size:
+                        break
+                    valid += len(line)
+                    end = max(end, keys[0] + keys[1])
+                    self._index(keys)
+            os.truncate(keys_path, valid)
+        if size > end:
+            os.truncate(data_path, end)
+
+    def _index(self, keys: List[Any]) -> int:
+        record = len(self._records)
+        self._records.append(keys)
+        article_id = keys[4]
+        if article_id is not None:
+            self._ids[article_id] = record
+        for name, position in INDEXES.items():
+            if keys[position] is not None:
+                self._indexes[name].setdefault(keys[position], []).append(record)
+        if keys[2] is not None:
+            if self._dates and keys[2] >= self._dates[-1][0]:
+                self._dates.append((keys[2], record))
+            else:
+                insort(self._dates, (keys[2], record))
+        if keys[3] is not None and (self.watermark is None or keys[3] > self.watermark):
+            self.watermark = keys[3]
+        return record
+
+    def _live(self, record: int) -> bool:
+        article_id = self._records[record][4]
+        return article_id is None or self._ids.get(article_id) == record
+
+    # -- writing ------------------------------------------------------- #
+    def add(self, article: Article) -> bool:
+        """
+        Append ``article``; returns ``False`` if the same version (by
+        ``refresh_date``) is already stored.
+        """
+        current = self._ids.get(article.article_id) if article.article_id else None
+        if current is not None and self._records[current][8] == article.refresh_date:
+            return False
+        payload = article.model_dump_json(by_alias=True, exclude_none=True).encode()
+        self._data.seek(0, os.SEEK_END)
+        offset = self._data.tell()
+        self._data.write(payload)
+        keys = _key_line(article, offset, len(payload))
+        self._keys.write(json.dumps(keys, separators=(",", ":")) + "\n")
+        self._index(keys)
+        return True
+
+    def extend(self, articles: Iterable[Any]) -> int:
+        """Add each article (or ``.data`` of a wrapper); returns how many were new."""
+        added = 0
+        for article in unwrap(articles):
+            if self.add(article):
+                added += 1
+        self.flush()
+        return added
+
+    def flush(self) -> None:
+        self._data.flush()
+        self._keys.flush()
+
+    def sync(
+        self,
+        method: Callable[..., Any],
+        since: Moment = None,
+        overlap: timedelta = timedelta(minutes=10),
+        **kwargs: Any,
+    ) -> int:
+        """
+        Fetch articles added since ``since`` – by default the newest
+        ``add_date`` stored, less ``overlap`` for late-indexed ones – with
+        :func:`~perigon.pagination.paginate` over ``method`` (e.g.
+        ``api.search_articles``) and store them. Returns how many were new.
+        """
+        start = _epoch(since)
+        if start is None and self.watermark is not None:
+            start = self.watermark - int(overlap.total_seconds())
+        if start is not None:
+            kwargs["add_date_from"] = datetime.fromtimestamp(start, tz=timezone.utc)
+        return self.extend(paginate(method, **kwargs))
+
+    # -- reading ------------------------------------------------------- #
+    def _read(self, record: int) -> Article:
+        offset, length = self._records[record][:2]
+        if self._map is None or offset + length > len(self._map):
+            self.flush()
+            if self._map is not None:
+                self._map.close()
+            self._map = mmap.mmap(self._data.fileno(), 0, access=mmap.ACCESS_READ)
+        return Article.model_validate_json(self._map[offset : offset + length])
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def __contains__(self, article_id: object) -> bool:
+        return article_id in self._ids
+
+    def get(self, article_id: str) -> Optional[Article]:
+        record = self._ids.get(article_id)
+        return None if record is None else self._read(record)
+
+    def _lookup(self, index: str, key: str) -> List[Article]:
+        records = self._indexes[index].get(key, ())
+        return [self._read(r) for r in records if self._live(r)]
+
+    def by_cluster(self, cluster_id: str) -> List[Article]:
+        return self._lookup("cluster_id", cluster_id)
+
+    def by_source(self, domain: str) -> List[Article]:
+        return self._lookup("source", domain)
+
+    def by_reprint_group(self, reprint_group_id: str) -> List[Article]:
+        return self._lookup("reprint_group_id", reprint_group_id)
+
+    def between(self, start: Moment = None, end: Moment = None) -> Iterator[Article]:
+        """Articles with ``start <= pub_date < end``, oldest first."""
+        low, high = _epoch(start), _epoch(end)
+        first = 0 if low is None else bisect_left(self._dates, (low, -1))
+        last = (
+            len(self._dates) if high is None else bisect_left(self._dates, (high, -1))
+        )
+        for _, record in self._dates[first:last]:
+            if self._live(record):
+                yield self._read(record)
+
+    def __iter__(self) -> Iterator[Article]:
+        """Every live article, in insertion order."""
+        for record in range(len(self._records)):
+            if self._live(record):
+                yield self._read(record)
+
+    # -- maintenance --------------------------------------------------- #
+    def compact(self, since: Moment = None) -> int:
+        """
+        Rewrite the files without superseded records and, with ``since``,
+        without articles published before it. Returns the records dropped.
+        """
+        cutoff = _epoch(since)
+
+        def wanted(record: int) -> bool:
+            published = self._records[record][2]
+            if cutoff is not None and published is not None and published < cutoff:
+                return False
+            return self._live(record)
+
+        keep = [r for r in range(len(self._records)) if wanted(r)]
+        tmp_data = os.path.join(self.directory, _DATA + ".tmp")
+        tmp_keys = os.path.join(self.directory, _KEYS + ".tmp")
+        self.flush()
+        with open(tmp_data, "wb") as data, open(
+            tmp_keys, "w", encoding="utf-8"
+        ) as keys:
+            for record in keep:
+                line = list(self._records[record])
+                payload = self._raw(record)
+                line[0], line[1] = data.tell(), len(payload)
+                data.write(payload)
+                keys.write(json.dumps(line, separators=(",", ":")) + "\n")
+        dropped = len(self._records) - len(keep)
+        self.close()
+        os.replace(tmp_data, os.path.join(self.directory, _DATA))
+        os.replace(tmp_keys, os.path.join(self.directory, _KEYS))
+        self._open()
+        return dropped
+
+    def _raw(self, record: int) -> bytes:
+        offset, length = self._records[record][:2]
+        self._data.seek(offset)
+        return self._data.read(length)
+
+    def close(self) -> None:
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+        self._data.close()
+        self._keys.close()
+
+    def __enter__(self) -> "ArticleStore":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
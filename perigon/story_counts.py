@@ -0,0 +1,194 @@
+# Package : perigon
+"""
+Long story-count series from concurrent, cached ``get_story_counts`` calls.
+
+:class:`StoryCounts` splits a ``var_from`` / ``to`` range into chunks on a
+fixed grid of ``split_by`` buckets, fetches the chunks concurrently and
+merges their buckets into one :class:`~perigon.stats.TimeSeries`. Chunks
+that ended more than ``settle`` ago are cached, so redrawing a year-long
+chart costs a few lookups plus one call for the current chunk::
+
+    counts = StoryCounts(V1Api(client), split_by="DAY")
+    series = counts.fetch(datetime(2024, 1, 1), datetime.now(), q="AI")
+    series.resample("week")
+
+Buckets are keyed by their UTC start in epoch seconds; weeks start on
+Monday. Requires numpy (``pip install "perigon[numpy]"``).
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Hashable, List, Optional, Tuple
+
+from perigon.batch import Batch
+from perigon.dates import INTERVALS, WEEK_ORIGIN, as_utc
+from perigon.exceptions import ApiValueError
+from perigon.stats import TimeSeries, decode_stats
+
+# Buckets per fetched chunk
+CHUNK_BUCKETS = {"HOUR": 24 * 7, "DAY": 90, "WEEK": 52, "MONTH": 24}
+
+_STEP = {name.upper(): INTERVALS[name] for name in ("hour", "day", "week")}
+
+
+def bucket_ordinal(moment: datetime, split_by: str) -> int:
+    """Index of the ``split_by`` bucket containing ``moment``."""
+    moment = as_utc(moment)
+    if split_by == "MONTH":
+        return moment.year * 12 + moment.month - 1
+    seconds = int(moment.timestamp())
+    if split_by == "WEEK":
+        seconds -= WEEK_ORIGIN
+    return seconds // _STEP[split_by]
+
+
+def bucket_start(ordinal: int, split_by: str) -> datetime:
+    """UTC start of the bucket with index ``ordinal``."""
+    if split_by == "MONTH":
+        return datetime(ordinal // 12, ordinal % 12 + 1, 1, tzinfo=timezone.utc)
+    seconds = ordinal * _STEP[split_by] + (WEEK_ORIGIN if split_by == "WEEK" else 0)
+    return datetime.fromtimestamp(seconds, tz=timezone.utc)
+
+
+class StoryCounts:
+    """
+    Fetches and caches ``get_story_counts`` buckets; see the module docstring.
+
+    ``api`` is a ``V1Api``. Filters passed to :meth:`fetch` are forwarded to
+    every chunk and are part of the cache key. ``settle`` is how long after
+    its end a chunk may still change and is refetched rather than cached.
+    """
+
+    def __init__(
+        self,
+        api: Any,
+        split_by: str = "DAY",
+        chunk_buckets: Optional[int] = None,
+        max_concurrency: int = 8,
+        settle: timedelta = timedelta(days=1),
+        cache_size: int = 1024,
+        time_key: Optional[str] = None,
+        count_key: Optional[str] = None,
+    ):
+        split_by = split_by.upper()
+        if split_by not in CHUNK_BUCKETS:
+            raise ApiValueError(
+                f"split_by must be one of {tuple(CHUNK_BUCKETS)}, not {split_by!r}"
+            )
+        self.api = api
+        self.split_by = split_by
+        self.chunk_buckets = chunk_buckets or CHUNK_BUCKETS[split_by]
+        self.max_concurrency = max_concurrency
+        self.settle = settle
+        self.cache_size = cache_size
+        self.time_key = time_key
+        self.count_key = count_key
+        self.hits = self.misses = 0
+        self._cache: "OrderedDict[Hashable, TimeSeries]" = OrderedDict()
+
+    # -- planning ------------------------------------------------------ #
+    def chunks(
+        self, var_from: datetime, to: datetime
+    ) -> List[Tuple[int, datetime, datetime]]:
+        """``(chunk index, start, end)`` of the grid chunks covering the range."""
+        if as_utc(to) <= as_utc(var_from):
+            return []
+        per = self.chunk_buckets
+        first = bucket_ordinal(var_from, self.split_by) // per
+        last = (
+            bucket_ordinal(as_utc(to) - timedelta(microseconds=1), self.split_by) // per
+        )
+        return [
+            (
+                chunk,
+                bucket_start(chunk * per, self.split_by),
+                bucket_start((chunk + 1) * per, self.split_by),
+            )
+            for chunk in range(first, last + 1)
+        ]
+
+    def _plan(
+        self, var_from: datetime, to: datetime, filters: Dict[str, Any]
+    ) -> Tuple[List[TimeSeries], List[Tuple[Optional[Hashable], datetime, datetime]]]:
+        settled = datetime.now(timezone.utc) - self.settle
+        scope = tuple(sorted((k, repr(v)) for k, v in filters.items()))
+        cached: List[TimeSeries] = []
+        missing: List[Tuple[Optional[Hashable], datetime, datetime]] = []
+        for chunk, start, end in self.chunks(var_from, to):
+            key = (self.split_by, self.chunk_buckets, chunk, scope)
+            hit = self._cache.get(key)
+            if hit is not None:
+                self._cache.move_to_end(key)
+                self.hits += 1
+                cached.append(hit)
+                continue
+            self.misses += 1
+            if end <= settled:
+                missing.append((key, start, end))
+            else:
+                # Still filling up: fetch up to ``to`` and keep it out of the cache
+                missing.append((None, start, min(end, max(as_utc(to), start))))
+        return cached, missing
+
+    def _store(
+        self, key: Optional[Hashable], start: datetime, end: datetime, result: Any
+    ) -> TimeSeries:
+        series = decode_stats(result, self.time_key, self.count_key).between(
+            int(start.timestamp()), int(end.timestamp())
+        )
+        if key is not None:
+            self._cache[key] = series
+            if len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        return series
+
+    def _trim(
+        self, parts: List[TimeSeries], var_from: datetime, to: datetime
+    ) -> TimeSeries:
+        first = bucket_start(bucket_ordinal(var_from, self.split_by), self.split_by)
+        return TimeSeries.merge(parts).between(
+            int(first.timestamp()), int(as_utc(to).timestamp())
+        )
+
+    # -- fetching ------------------------------------------------------ #
+    def fetch(self, var_from: datetime, to: datetime, **filters: Any) -> TimeSeries:
+        """
+        Series of the buckets from the one containing ``var_from`` up to
+        ``to``, fetching uncached chunks concurrently.
+        """
+        cached, missing = self._plan(var_from, to, filters)
+        calls = [
+            (
+                self.api.get_story_counts,
+                dict(filters, split_by=self.split_by, var_from=start, to=end),
+            )
+            for _, start, end in missing
+        ]
+        results = (
+            self.api.gather(calls, max_concurrency=self.max_concurrency)
+            if calls
+            else []
+        )
+        fresh = [self._store(*plan, result) for plan, result in zip(missing, results)]
+        return self._trim(cached + fresh, var_from, to)
+
+    async def fetch_async(
+        self, var_from: datetime, to: datetime, **filters: Any
+    ) -> TimeSeries:
+        """Async counterpart of :meth:`fetch`."""
+        cached, missing = self._plan(var_from, to, filters)
+        batch = Batch(self.max_concurrency)
+        for _, start, end in missing:
+            batch.add(
+                self.api.get_story_counts_async,
+                **dict(filters, split_by=self.split_by, var_from=start, to=end),
+            )
+        results = [slot.unwrap() for slot in await batch.run()]
+        fresh = [self._store(*plan, result) for plan, result in zip(missing, results)]
+        return self._trim(cached + fresh, var_from, to)
+
+    def clear(self) -> None:
+        """Forget every cached chunk."""
+        self._cache.clear()
@@ -0,0 +1,293 @@
+# Package : perigon
+"""
+Content-addressed cache for ``search_summarizer``.
+
+Summaries are the slowest and most expensive call, and identical
+prompt + filter + model requests recur. :class:`SummaryCache` wraps a
+``V1Api``, keys each ``search_summarizer`` call by a SHA-256 of its encoded
+query parameters and ``SummaryBody`` (as sent on the wire) and serves
+repeats from a backend; concurrent identical calls share one request::
+
+    api = SummaryCache(V1Api(client), backend=DiskBackend("summaries/"))
+    api.search_summarizer(SummaryBody(prompt="..."), q="AI", var_from=...)
+    api.search_articles(q="AI")         # every other method is passed through
+
+Entries expire after ``ttl`` seconds, since the same filters match new
+articles over time. ``sampled`` sets what happens to requests with a
+temperature above zero (``SummaryBody`` defaults to 0.7):
+
+* ``"reuse"`` – cached like any other request;
+* ``"coalesce"`` – only shared with identical calls already in flight;
+* ``"never"`` – always a request of their own.
+
+Cached results are shared between callers; treat them as read-only. Hits
+are reported to the client's observers with ``CallReport.cache_hit``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
+from time import perf_counter
+from typing import Any, Dict, Optional, Tuple, Union
+
+from perigon.api.v1_api import OP_SEARCH_SUMMARIZER
+from perigon.api_client import ApiClient
+from perigon.exceptions import ApiTypeError, ApiValueError
+from perigon.models.summary_body import SummaryBody
+from perigon.models.summary_search_result import SummarySearchResult
+
+SAMPLED = ("reuse", "coalesce", "never")
+
+_PARAMS = frozenset(name for name, _, _ in OP_SEARCH_SUMMARIZER.query.params)
+_DEFAULT_TEMPERATURE = SummaryBody.model_fields["temperature"].default
+
+Entry = Tuple[float, SummarySearchResult]
+
+
+def _values(summary_body: SummaryBody, kwargs: Dict[str, Any]) -> Dict[str, Any]:
+    unknown = kwargs.keys() - _PARAMS
+    if unknown:
+        raise ApiTypeError(
+            f"search_summarizer() got unexpected keyword arguments {sorted(unknown)}"
+        )
+    values = dict.fromkeys(_PARAMS)
+    values.update(kwargs, summary_body=summary_body)
+    return values
+
+
+def _digest(values: Dict[str, Any]) -> str:
+    _, request = OP_SEARCH_SUMMARIZER.prepare(values)
+    # temperature=0 and temperature=0.0 are the same request
+    body = {
+        name: int(value) if isinstance(value, float) and value.is_integer() else value
+        for name, value in request["json"].items()
+    }
+    canonical = json.dumps(
+        [sorted(request["params"].items()), body],
+        sort_keys=True,
+        separators=(",", ":"),
+        ensure_ascii=False,
+    )
+    return hashlib.sha256(canonical.encode()).hexdigest()
+
+
+def summary_key(summary_body: SummaryBody, **kwargs: Any) -> str:
+    """Hex SHA-256 of a ``search_summarizer`` call's encoded request."""
+    return _digest(_values(summary_body, kwargs))
+
+
+class MemoryBackend:
+    """Least-recently-used entries in memory."""
+
+    def __init__(self, max_entries: int = 1024):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, Entry]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[Entry]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def put(self, key: str, stored: float, result: SummarySearchResult) -> None:
+        with self._lock:
+            self._entries[key] = (stored, result)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+class DiskBackend:
+    """
+    One JSON file per entry under ``directory`` (``ab/abcdef….json``),
+    written atomically, so several processes can share it.
+    """
+
+    def __init__(self, directory: str):
+        os.makedirs(directory, exist_ok=True)
+        self.directory = directory
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, key[:2], key + ".json")
+
+    def get(self, key: str) -> Optional[Entry]:
+        try:
+            with open(self._path(key), encoding="utf-8") as file:
+                entry = json.load(file)
+        except (OSError, ValueError):
+            return None
+        return entry["stored"], SummarySearchResult.model_validate(entry["result"])
+
+    def put(self, key: str, stored: float, result: SummarySearchResult) -> None:
+        path = self._path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        payload = result.model_dump(mode="json", by_alias=True, exclude_none=True)
+        tmp = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp, "w", encoding="utf-8") as file:
+            json.dump({"stored": stored, "result": payload}, file)
+        os.replace(tmp, path)
+
+    def delete(self, key: str) -> None:
+        try:
+            os.remove(self._path(key))
+        except FileNotFoundError:
+            pass
+
+    def clear(self) -> None:
+        for shard in os.listdir(self.directory):
+            path = os.path.join(self.directory, shard)
+            if os.path.isdir(path):
+                for name in os.listdir(path):
+                    if name.endswith(".json"):
+                        os.remove(os.path.join(path, name))
+
+
+class SummaryCache:
+    """
+    ``V1Api`` stand-in with a cached ``search_summarizer``; see the module
+    docstring. ``backend`` defaults to a :class:`MemoryBackend`; ``ttl`` of
+    ``None`` keeps entries until the backend evicts them.
+    """
+
+    def __init__(
+        self,
+        api: Any,
+        backend: Any = None,
+        ttl: Optional[float] = 3600.0,
+        sampled: str = "reuse",
+    ):
+        if sampled not in SAMPLED:
+            raise ApiValueError(f"sampled must be one of {SAMPLED}, not {sampled!r}")
+        self.api = api
+        self.backend = MemoryBackend() if backend is None else backend
+        self.ttl = ttl
+        self.sampled = sampled
+        self.hits = self.misses = self.coalesced = 0
+        self._lock = threading.Lock()
+        self._pending: Dict[str, "Future[SummarySearchResult]"] = {}
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.api, name)
+
+    def _policy(self, summary_body: SummaryBody) -> str:
+        temperature = summary_body.temperature
+        if temperature is None:
+            temperature = _DEFAULT_TEMPERATURE
+        return "reuse" if not temperature else self.sampled
+
+    def _lookup(self, key: str) -> Optional[SummarySearchResult]:
+        entry = self.backend.get(key)
+        if entry is None:
+            return None
+        stored, result = entry
+        if self.ttl is not None and time.time() - stored >= self.ttl:
+            self.backend.delete(key)
+            return None
+        return result
+
+    def _claim(
+        self, key: str, policy: str
+    ) -> Tuple[Optional[SummarySearchResult], "Future[SummarySearchResult]", bool]:
+        """``(cached result, future, whether this caller must fetch)``."""
+        with self._lock:
+            if policy == "reuse":
+                result = self._lookup(key)
+                if result is not None:
+                    self.hits += 1
+                    return result, Future(), False
+            future = self._pending.get(key)
+            if future is not None:
+                self.coalesced += 1
+                return None, future, False
+            self.misses += 1
+            future = self._pending[key] = Future()
+            return None, future, True
+
+    def _settle(
+        self,
+        key: str,
+        policy: str,
+        future: "Future[SummarySearchResult]",
+        outcome: Union[SummarySearchResult, BaseException],
+    ) -> None:
+        # Store before dropping the pending entry so no caller misses both
+        if not isinstance(outcome, BaseException) and policy == "reuse":
+            self.backend.put(key, time.time(), outcome)
+        with self._lock:
+            del self._pending[key]
+        if isinstance(outcome, BaseException):
+            future.set_exception(outcome)
+        else:
+            future.set_result(outcome)
+
+    def search_summarizer(
+        self, summary_body: SummaryBody, **kwargs: Any
+    ) -> SummarySearchResult:
+        """``V1Api.search_summarizer``, served from the cache when possible."""
+        started = perf_counter()
+        policy = self._policy(summary_body)
+        values = _values(summary_body, kwargs)
+        client: ApiClient = self.api.api_client
+        if policy == "never":
+            return client.call(OP_SEARCH_SUMMARIZER, values)
+        key = _digest(values)
+        result, future, leader = self._claim(key, policy)
+        if not leader:
+            result = result if result is not None else future.result()
+            client.record_cached(OP_SEARCH_SUMMARIZER, values, started)
+            return result
+        try:
+            result = client.call(OP_SEARCH_SUMMARIZER, values, cache_hit=False)
+        except BaseException as exc:
+            self._settle(key, policy, future, exc)
+            raise
+        self._settle(key, policy, future, result)
+        return result
+
+    async def search_summarizer_async(
+        self, summary_body: SummaryBody, **kwargs: Any
+    ) -> SummarySearchResult:
+        """Async counterpart of :meth:`search_summarizer`."""
+        started = perf_counter()
+        policy = self._policy(summary_body)
+        values = _values(summary_body, kwargs)
+        client: ApiClient = self.api.api_client
+        if policy == "never":
+            return await client.call_async(OP_SEARCH_SUMMARIZER, values)
+        key = _digest(values)
+        result, future, leader = self._claim(key, policy)
+        if not leader:
+            if result is None:
+                result = await asyncio.wrap_future(future)
+            client.record_cached(OP_SEARCH_SUMMARIZER, values, started)
+            return result
+        try:
+            result = await client.call_async(
+                OP_SEARCH_SUMMARIZER, values, cache_hit=False
+            )
+        except BaseException as exc:
+            self._settle(key, policy, future, exc)
+            raise
+        self._settle(key, policy, future, result)
+        return result
+
+    def clear(self) -> None:
+        """Forget every cached summary."""
+        self.backend.clear()
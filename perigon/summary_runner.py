@@ -0,0 +1,224 @@
+# Package : perigon
+"""
+Scheduled, checkpointed batches of ``search_summarizer`` calls.
+
+Summaries take seconds each, so a few hundred of them need their own
+concurrency cap: too many at once trips rate limits, one at a time takes
+too long. :class:`SummaryRunner` queues named jobs, starts them highest
+``priority`` first and, within a priority, earliest ``deadline`` first, and
+streams each result as it finishes::
+
+    runner = SummaryRunner(api, max_concurrency=4, checkpoint="summaries.jsonl")
+    for topic in topics:
+        runner.add(topic, SummaryBody(prompt=...), q=topic, priority=...)
+    async for slot in runner.run():
+        publish(slot.name, slot.unwrap().summary)
+
+A job still waiting at its deadline fails with :class:`asyncio.TimeoutError`
+and a running one is cancelled then. With ``checkpoint``, every finished
+summary is appended to a JSON Lines file; after a crash, jobs added again
+with the same name and request are restored from it instead of rerun. Their
+slots come back from :meth:`SummaryRunner.add` already done, and
+:meth:`SummaryRunner.run` only yields the jobs it actually runs.
+
+``api`` may be a :class:`~perigon.summary_cache.SummaryCache`.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import heapq
+import json
+import math
+import os
+import time
+from datetime import datetime
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
+
+from perigon.batch import BatchResult
+from perigon.dates import utc_timestamp
+from perigon.exceptions import ApiValueError
+from perigon.models.summary_body import SummaryBody
+from perigon.models.summary_search_result import SummarySearchResult
+from perigon.summary_cache import summary_key
+
+Slot = BatchResult[SummarySearchResult]
+
+
+def _missed(slot: Slot) -> asyncio.TimeoutError:
+    return asyncio.TimeoutError(f"{slot.name} missed its deadline")
+
+
+class SummaryRunner:
+    """Prioritised ``search_summarizer`` jobs; see the module docstring."""
+
+    def __init__(
+        self, api: Any, max_concurrency: int = 4, checkpoint: Optional[str] = None
+    ):
+        if max_concurrency < 1:
+            raise ApiValueError("max_concurrency must be at least 1")
+        self.api = api
+        self.max_concurrency = max_concurrency
+        self.checkpoint = checkpoint
+        # name -> (request key, result) of summaries finished in earlier runs
+        self._restored: Dict[str, Tuple[str, SummarySearchResult]] = {}
+        self._names: Dict[str, Slot] = {}
+        # (-priority, deadline, sequence, slot, request key, body, kwargs)
+        self._queue: List[Tuple[Any, ...]] = []
+        self._log = None
+        if checkpoint is not None:
+            self._load(checkpoint)
+            self._log = open(checkpoint, "a", encoding="utf-8")
+
+    def _load(self, path: str) -> None:
+        try:
+            file = open(path, "rb")
+        except FileNotFoundError:
+            return
+        valid = 0
+        with file:
+            for line in file:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    break
+                if not line.endswith(b"\n"):
+                    break
+                valid += len(line)
+                result = SummarySearchResult.model_validate(entry["result"])
+                self._restored[entry["name"]] = (entry["key"], result)
+        # Drop a torn final line from an interrupted write before appending
+        os.truncate(path, valid)
+
+    def __len__(self) -> int:
+        """Jobs waiting to run."""
+        return len(self._queue)
+
+    def add(
+        self,
+        name: str,
+        summary_body: SummaryBody,
+        priority: int = 0,
+        deadline: Optional[datetime] = None,
+        **kwargs: Any,
+    ) -> Slot:
+        """
+        Queue ``search_summarizer(summary_body, **kwargs)`` as job ``name``,
+        which must be unique; returns its result slot.
+        """
+        if name in self._names:
+            raise ApiValueError(f"job {name!r} was already added")
+        key = summary_key(summary_body, **kwargs)
+        slot: Slot = BatchResult(len(self._names), name)
+        self._names[name] = slot
+        restored = self._restored.get(name)
+        if restored is not None and restored[0] == key:
+            slot.value, slot.done = restored[1], True
+            return slot
+        heapq.heappush(
+            self._queue,
+            (
+                -priority,
+                math.inf if deadline is None else utc_timestamp(deadline),
+                slot.index,
+                slot,
+                key,
+                summary_body,
+                kwargs,
+            ),
+        )
+        return slot
+
+    def _record(self, name: str, key: str, result: SummarySearchResult) -> None:
+        if self._log is None:
+            return
+        dumped = result.model_dump(mode="json", by_alias=True, exclude_none=True)
+        entry = {"name": name, "key": key, "result": dumped}
+        self._log.write(json.dumps(entry, separators=(",", ":")) + "\n")
+        self._log.flush()
+
+    async def _run_one(
+        self,
+        slot: Slot,
+        deadline: float,
+        key: str,
+        body: SummaryBody,
+        kwargs: Dict[str, Any],
+    ) -> None:
+        try:
+            remaining = deadline - time.time()
+            if remaining <= 0:
+                raise _missed(slot)
+            call = self.api.search_summarizer_async(body, **kwargs)
+            if remaining == math.inf:
+                result = await call
+            else:
+                result = await asyncio.wait_for(call, remaining)
+            slot.value = result
+            self._record(slot.name, key, result)
+        except Exception as exc:
+            slot.error = exc
+        slot.done = True
+
+    async def run(self) -> AsyncIterator[Slot]:
+        """
+        Run the queued jobs with at most ``max_concurrency`` in flight,
+        yielding each slot as it finishes. Exceptions are captured per job on
+        :attr:`~perigon.batch.BatchResult.error`; failed jobs are not
+        checkpointed. Closing the iterator early cancels the running jobs and
+        leaves them queued.
+        """
+        finished: "asyncio.Queue[Slot]" = asyncio.Queue()
+        total = len(self._queue)
+
+        async def worker() -> None:
+            while self._queue:
+                job = heapq.heappop(self._queue)
+                _, deadline, _, slot, key, body, kwargs = job
+                try:
+                    await self._run_one(slot, deadline, key, body, kwargs)
+                except asyncio.CancelledError:
+                    heapq.heappush(self._queue, job)  # left for the next run
+                    raise
+                finished.put_nowait(slot)
+
+        async def sweeper() -> None:
+            # Fails queued jobs at their deadline rather than when dequeued
+            while self._queue:
+                now = time.time()
+                if any(job[1] <= now for job in self._queue):
+                    expired = [job for job in self._queue if job[1] <= now]
+                    self._queue[:] = [job for job in self._queue if job[1] > now]
+                    heapq.heapify(self._queue)
+                    for job in expired:
+                        slot = job[3]
+                        slot.error, slot.done = _missed(slot), True
+                        finished.put_nowait(slot)
+                soonest = min((job[1] for job in self._queue), default=math.inf)
+                if soonest == math.inf:
+                    return
+                await asyncio.sleep(soonest - now)
+
+        workers = [
+            asyncio.ensure_future(worker())
+            for _ in range(min(self.max_concurrency, total))
+        ]
+        workers.append(asyncio.ensure_future(sweeper()))
+        try:
+            for _ in range(total):
+                yield await finished.get()
+        finally:
+            for task in workers:
+                task.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+
+    def close(self) -> None:
+        if self._log is not None:
+            self._log.close()
+            self._log = None
+
+    def __enter__(self) -> "SummaryRunner":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
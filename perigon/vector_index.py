@@ -0,0 +1,287 @@
+# Package : perigon
+"""
+Local cosine-similarity index over article embeddings.
+
+``vector_search_articles`` can return each article's embeddings
+(``ScoredDataArticle.vectors``). :class:`VectorIndex` keeps them in one
+contiguous, L2-normalised ``float32`` matrix keyed by ``article_id`` so
+"more like this" and re-ranking over articles you already fetched are a
+matrix product away instead of another API call::
+
+    index = VectorIndex()
+    index.add_results(api.vector_search_articles(params).results)
+    index.more_like_this(article_id, k=5)      # [(article_id, cosine), ...]
+    index.save("embeddings/")                  # reopen with VectorIndex.load()
+
+Search is exact (brute force) by default. :meth:`VectorIndex.build_ivf`
+switches to an inverted-file index – k-means cells, probing the ``nprobe``
+closest – which trades a little recall for scanning a fraction of the rows.
+
+Requires numpy (``pip install "perigon[numpy]"``).
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from typing import Any, Dict, Iterable, List, Literal, Optional, Sequence, Tuple
+
+from perigon._helpers import numpy_error
+
+try:
+    import numpy as np
+except ImportError as exc:  # pragma: no cover - depends on extras
+    raise numpy_error("perigon.vector_index") from exc
+
+from perigon.exceptions import ApiKeyError, ApiValueError
+from perigon.vectors import stack_vectors
+
+Match = Tuple[str, float]
+
+_VECTORS = "vectors.npy"
+_META = "index.json"
+_CENTROIDS = "ivf_centroids.npy"
+_CELLS = "ivf_cells.npy"
+
+
+def _normalise(vectors: "np.ndarray") -> "np.ndarray":
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    normalised: "np.ndarray" = vectors / norms
+    return normalised
+
+
+class VectorIndex:
+    """
+    Embeddings keyed by id in a growable ``float32`` matrix.
+
+    ``version`` selects which embedding :meth:`add_results` takes when the
+    API returns several per article.
+    """
+
+    def __init__(self, dim: Optional[int] = None, version: Optional[int] = None):
+        self.dim = dim
+        self.version = version
+        self.ids: List[str] = []
+        self._rows: Dict[str, int] = {}
+        self._matrix = np.empty((0, dim or 0), dtype=np.float32)
+        # IVF state: centroids (nlist x dim), each row's cell, rows grouped by cell
+        self._centroids: Optional["np.ndarray"] = None
+        self._cells: Optional["np.ndarray"] = None
+        self._order: Optional["np.ndarray"] = None
+        self._offsets: Optional["np.ndarray"] = None
+        self.nprobe = 1
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._rows
+
+    @property
+    def vectors(self) -> "np.ndarray":
+        """Normalised embeddings, one row per entry of :attr:`ids`."""
+        return self._matrix[: len(self.ids)]
+
+    # -- building ------------------------------------------------------ #
+    def add(self, ids: Sequence[str], vectors: Any) -> None:
+        """Insert or replace embeddings; ``vectors`` is (len(ids), dim)."""
+        matrix = np.asarray(vectors, dtype=np.float32)
+        if matrix.ndim == 1:
+            matrix = matrix.reshape(1, -1)
+        if matrix.shape[0] != len(ids):
+            raise ApiValueError(f"{len(ids)} ids but {matrix.shape[0]} vectors")
+        if self.dim is None:
+            self.dim = matrix.shape[1]
+            self._matrix = np.empty((0, self.dim), dtype=np.float32)
+        if matrix.shape[1] != self.dim:
+            raise ApiValueError(f"expected {self.dim}-d vectors, got {matrix.shape[1]}")
+        matrix = _normalise(matrix)
+
+        rows = np.empty(len(ids), dtype=np.intp)
+        for n, key in enumerate(ids):
+            row = self._rows.get(key)
+            if row is None:
+                row = self._rows[key] = len(self.ids)
+                self.ids.append(key)
+            rows[n] = row
+        self._reserve(len(self.ids))
+        self._matrix[rows] = matrix
+        if self._centroids is not None:
+            self._assign()
+
+    def add_results(self, results: Iterable[Any]) -> int:
+        """
+        Index ``ScoredDataArticle`` items (e.g. ``vector_search_articles(...)
+        .results``) by ``article_id`` – or wiki results by ``section_id`` –
+        and return how many had an embedding.
+        """
+        ids, vectors = stack_vectors(results, self.version)
+        if ids:
+            self.add(ids, vectors)
+        return len(ids)
+
+    def _reserve(self, rows: int) -> None:
+        capacity = self._matrix.shape[0]
+        if rows <= capacity and self._matrix.flags.writeable:
+            return
+        dim = self._matrix.shape[1]
+        grown = np.empty((max(rows, capacity * 2, 64), dim), dtype=np.float32)
+        grown[:capacity] = self._matrix
+        self._matrix = grown
+
+    def vector(self, key: str) -> "np.ndarray":
+        row = self._rows.get(key)
+        if row is None:
+            raise ApiKeyError(f"{key} is not in the index")
+        vector: "np.ndarray" = self._matrix[row]
+        return vector
+
+    # -- search -------------------------------------------------------- #
+    def search(self, queries: Any, k: int = 10) -> List[List[Match]]:
+        """
+        Top-``k`` ``(id, cosine)`` matches for each query vector, best first.
+
+        ``queries`` is one vector or a (q, dim) batch; the result always has
+        one list per query.
+        """
+        matrix = np.asarray(queries, dtype=np.float32)
+        if matrix.ndim == 1:
+            matrix = matrix.reshape(1, -1)
+        matrix = _normalise(matrix)
+        if not self.ids:
+            return [[] for _ in range(matrix.shape[0])]
+        if self._centroids is None:
+            scores = matrix @ self.vectors.T
+            return [self._top(row, k) for row in scores]
+        return [self._search_ivf(query, k) for query in matrix]
+
+    def _top(
+        self, scores: "np.ndarray", k: int, rows: Optional["np.ndarray"] = None
+    ) -> List[Match]:
+        k = min(k, scores.shape[0])
+        if k <= 0:
+            return []
+        best = np.argpartition(-scores, k - 1)[:k]
+        best = best[np.argsort(-scores[best], kind="stable")]
+        if rows is not None:
+            return [(self.ids[rows[i]], float(scores[i])) for i in best]
+        return [(self.ids[i], float(scores[i])) for i in best]
+
+    def more_like_this(self, key: str, k: int = 10) -> List[Match]:
+        """Nearest neighbours of an indexed article, excluding itself."""
+        matches = self.search(self.vector(key), k + 1)[0]
+        return [match for match in matches if match[0] != key][:k]
+
+    def rerank(self, query: Any, ids: Iterable[str]) -> List[Match]:
+        """Order ``ids`` by cosine similarity to ``query``; unknown ids are dropped."""
+        rows = np.array([self._rows[i] for i in ids if i in self._rows], dtype=np.intp)
+        if rows.size == 0:
+            return []
+        scores = (
+            self._matrix[rows]
+            @ _normalise(np.asarray(query, dtype=np.float32).reshape(1, -1))[0]
+        )
+        return self._top(scores, rows.size, rows)
+
+    # -- IVF ----------------------------------------------------------- #
+    def build_ivf(
+        self,
+        nlist: Optional[int] = None,
+        nprobe: int = 4,
+        iterations: int = 10,
+        seed: int = 0,
+    ) -> None:
+        """
+        Partition the rows into ``nlist`` k-means cells (default ``√n``);
+        searches then score only the ``nprobe`` cells closest to the query.
+        Rows added later are assigned to the existing cells.
+        """
+        count = len(self.ids)
+        if count == 0:
+            raise ApiValueError("cannot build an IVF index over an empty index")
+        nlist = min(nlist or max(1, int(count**0.5)), count)
+        vectors = self.vectors
+        rng = np.random.default_rng(seed)
+        centroids = vectors[rng.choice(count, nlist, replace=False)].copy()
+        for _ in range(iterations):
+            cells = np.argmax(vectors @ centroids.T, axis=1)
+            for cell in range(nlist):
+                members = vectors[cells == cell]
+                if len(members):
+                    centroids[cell] = members.mean(axis=0)
+            centroids = _normalise(centroids)
+        self._centroids = centroids
+        self.nprobe = nprobe
+        self._assign()
+
+    def _assign(self) -> None:
+        assert self._centroids is not None
+        self._cells = np.argmax(self.vectors @ self._centroids.T, axis=1)
+        self._group()
+
+    def _group(self) -> None:
+        assert self._centroids is not None and self._cells is not None
+        self._order = np.argsort(self._cells, kind="stable")
+        self._offsets = np.searchsorted(
+            self._cells[self._order], np.arange(len(self._centroids) + 1)
+        )
+
+    def _search_ivf(self, query: "np.ndarray", k: int) -> List[Match]:
+        assert self._centroids is not None
+        assert self._order is not None and self._offsets is not None
+        probes = np.argsort(-(self._centroids @ query))[: self.nprobe]
+        rows = np.concatenate(
+            [self._order[self._offsets[c] : self._offsets[c + 1]] for c in probes]
+        )
+        return self._top(self._matrix[rows] @ query, k, rows)
+
+    # -- persistence --------------------------------------------------- #
+    def save(self, directory: str) -> None:
+        """Write the index to ``directory`` (created if missing)."""
+        os.makedirs(directory, exist_ok=True)
+        arrays = {_VECTORS: self.vectors}
+        if self._centroids is not None and self._cells is not None:
+            arrays[_CENTROIDS] = self._centroids
+            arrays[_CELLS] = self._cells
+        else:
+            # Cells left by an earlier save would not match these vectors
+            for name in (_CENTROIDS, _CELLS):
+                if os.path.exists(os.path.join(directory, name)):
+                    os.remove(os.path.join(directory, name))
+        for name, array in arrays.items():
+            tmp = os.path.join(directory, f"{name}.tmp")
+            with open(tmp, "wb") as fh:
+                np.save(fh, array)
+            os.replace(tmp, os.path.join(directory, name))
+        meta = {
+            "dim": self.dim,
+            "version": self.version,
+            "nprobe": self.nprobe,
+            "ivf": _CENTROIDS in arrays,
+            "ids": self.ids,
+        }
+        with open(os.path.join(directory, _META), "w", encoding="utf-8") as fh:
+            json.dump(meta, fh)
+
+    @classmethod
+    def load(cls, directory: str, mmap: bool = True) -> "VectorIndex":
+        """
+        Open an index written by :meth:`save`. With ``mmap`` the embedding
+        matrix is memory-mapped read-only and paged in on demand; it is
+        copied into memory the first time the index is modified.
+        """
+        with open(os.path.join(directory, _META), encoding="utf-8") as fh:
+            meta = json.load(fh)
+        index = cls(meta["dim"], meta["version"])
+        index.ids = meta["ids"]
+        index._rows = {key: row for row, key in enumerate(index.ids)}
+        mode: Optional[Literal["r"]] = "r" if mmap else None
+        index._matrix = np.load(os.path.join(directory, _VECTORS), mmap_mode=mode)
+        centroids = os.path.join(directory, _CENTROIDS)
+        if meta.get("ivf", os.path.exists(centroids)):
+            index._centroids = np.load(centroids)
+            index._cells = np.load(os.path.join(directory, _CELLS))
+            index.nprobe = meta["nprobe"]
+            index._group()
+        return index
@@ -0,0 +1,127 @@
+# Package : perigon
+"""
+Fast decoding and stacking of embedding vectors.
+
+``VectorData.data`` is declared as a list of numbers, so by default every
+component of every embedding is validated by pydantic and kept as a boxed
+Python float. ``ApiClient(vectors="numpy")`` (or ``"array"``) instead lifts
+the embeddings out of vector search responses before validation and stores
+each one as a ``float32`` ``numpy.ndarray`` (or ``array.array("f")``)::
+
+    client = ApiClient(api_key=..., vectors="numpy")
+    page = V1Api(client).vector_search_articles(params)
+    ids, matrix = stack_vectors(page.results)      # (len(ids), dim) float32
+
+The rest of the response is validated as usual. Vectors decoded this way
+bypass pydantic, so dump them with ``.tolist()`` rather than
+``model_dump()`` if you need plain JSON.
+"""
+
+from __future__ import annotations
+
+from array import array
+from typing import Any, Dict, FrozenSet, Iterable, List, Optional, Sequence, Tuple
+
+from perigon._helpers import require_numpy
+from perigon.exceptions import ApiValueError
+from perigon.models.articles_vector_search_result import ArticlesVectorSearchResult
+from perigon.models.vector_data import VectorData
+from perigon.models.wikipedia_vector_search_result import WikipediaVectorSearchResult
+
+FORMATS = ("numpy", "array")
+
+# Response models whose ``results`` items carry ``vectors``
+VECTOR_RESULTS: FrozenSet[type] = frozenset(
+    {ArticlesVectorSearchResult, WikipediaVectorSearchResult}
+)
+
+
+def check_format(fmt: Optional[str]) -> Optional[str]:
+    if fmt is not None and fmt not in FORMATS:
+        raise ApiValueError(f"vectors must be one of {FORMATS} or None, not {fmt!r}")
+    if fmt == "numpy":
+        require_numpy('vectors="numpy"')
+    return fmt
+
+
+def to_vector(data: Sequence[float], fmt: str) -> Any:
+    """One embedding as a float32 ndarray (``"numpy"``) or ``array("f")``."""
+    if fmt == "numpy":
+        return require_numpy('vectors="numpy"').asarray(data, dtype="float32")
+    return array("f", data)
+
+
+def split_vectors(data: Dict[str, Any]) -> List[Optional[List[Any]]]:
+    """Remove and return each ``results[i]["vectors"]`` of a raw response."""
+    raw: List[Optional[List[Any]]] = []
+    for result in data.get("results") or ():
+        raw.append(result.pop("vectors", None) if isinstance(result, dict) else None)
+    return raw
+
+
+def attach_vectors(parsed: Any, raw: List[Optional[List[Any]]], fmt: str) -> Any:
+    """Put the vectors removed by :func:`split_vectors` back, converted."""
+    for item, vectors in zip(parsed.results, raw):
+        if vectors is None:
+            continue
+        built = [
+            VectorData.model_construct(
+                data=None if v.get("data") is None else to_vector(v["data"], fmt),
+                version=v.get("version"),
+            )
+            for v in vectors
+            if v is not None
+        ]
+        # Bypass validate_assignment, which would walk the vectors again
+        item.__dict__["vectors"] = built
+        item.__pydantic_fields_set__.add("vectors")
+    return parsed
+
+
+def pick_vector(
+    vectors: Optional[Sequence[Any]], version: Optional[int] = None
+) -> Optional[Any]:
+    """
+    The embedding to use from a result's ``vectors`` list: the one with
+    ``version`` if given, else the first; ``None`` if there is none.
+    """
+    for vector in vectors or ():
+        if vector is None or vector.data is None:
+            continue
+        if version is None or vector.version == version:
+            return vector.data
+    return None
+
+
+def result_id(result: Any) -> Optional[str]:
+    """``article_id`` of a ``ScoredDataArticle``, ``section_id`` of a wiki hit."""
+    data = result.data
+    if data is None:
+        return None
+    return getattr(data, "article_id", None) or getattr(data, "section_id", None)
+
+
+def stack_vectors(
+    results: Iterable[Any], version: Optional[int] = None, dtype: str = "float32"
+) -> Tuple[List[str], Any]:
+    """
+    Stack the embeddings of ``ScoredDataArticle`` / ``ScoredDataWikiData``
+    results into one ``(n, dim)`` matrix, returning ``(ids, matrix)``.
+
+    Results without an id or embedding are skipped. Vectors decoded with
+    ``vectors="numpy"`` / ``"array"`` are copied once, straight from their
+    buffers; plain lists are converted.
+    """
+    np = require_numpy('vectors="numpy"')
+    ids: List[str] = []
+    rows: List[Any] = []
+    for result in results:
+        key = result_id(result)
+        vector = pick_vector(result.vectors, version)
+        if key is None or vector is None:
+            continue
+        ids.append(key)
+        rows.append(np.asarray(vector, dtype=dtype))
+    if not rows:
+        return ids, np.empty((0, 0), dtype=dtype)
+    return ids, np.stack(rows)
@@ -0,0 +1,56 @@
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Iterator
+from urllib.parse import parse_qs, urlparse
+
+import httpx
+import pytest
+
+from perigon.api_client import ApiClient
+
+# Type of the ``mock_client`` fixture: ``mock_client(handler)`` -> ApiClient
+MockClient = Callable[..., ApiClient]
+
+
+@pytest.fixture
+def mock_client() -> MockClient:
+    """Build an ApiClient whose sync and async sessions use ``handler``."""
+
+    def _make(handler: Callable[[httpx.Request], Any]) -> ApiClient:
+        return ApiClient(api_key="test", transport=httpx.MockTransport(handler))
+
+    return _make
+
+
+@pytest.fixture
+def local_server() -> Iterator[str]:
+    """
+    Real HTTP server on loopback; answers every GET with an empty article
+    page whose ``numResults`` echoes the ``size`` query parameter.
+    """
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_GET(self) -> None:
+            query = parse_qs(urlparse(self.path).query)
+            size = int(query.get("size", ["1"])[0])
+            body = json.dumps(
+                {"status": 200, "numResults": size, "articles": []}
+            ).encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args: Any) -> None:
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
@@ -0,0 +1,98 @@
+from datetime import datetime, timezone
+from typing import List, Optional, Tuple
+
+import pytest
+
+pytest.importorskip("numpy")
+
+from perigon.aggregations import Aggregates, to_columns  # noqa: E402
+from perigon.models.article import Article  # noqa: E402
+from perigon.models.company_holder import CompanyHolder  # noqa: E402
+from perigon.models.scored_data_article import ScoredDataArticle  # noqa: E402
+from perigon.models.sentiment_holder import SentimentHolder  # noqa: E402
+from perigon.models.source_holder import SourceHolder  # noqa: E402
+from perigon.models.topic_holder import TopicHolder  # noqa: E402
+
+
+def article(
+    n: int,
+    source: str,
+    topics: List[str],
+    pub_date: Optional[str],
+    sentiment: Optional[Tuple[float, float, float]] = None,
+) -> Article:
+    return Article.model_validate(
+        {
+            "articleId": str(n),
+            "source": SourceHolder(domain=source),
+            "topics": [TopicHolder(name=t) for t in topics],
+            "companies": [CompanyHolder(name="Acme")] if n % 2 else None,
+            "pubDate": pub_date,
+            "sentiment": (
+                None
+                if sentiment is None
+                else SentimentHolder(
+                    positive=sentiment[0], negative=sentiment[1], neutral=sentiment[2]
+                )
+            ),
+        }
+    )
+
+
+ARTICLES = [
+    article(0, "a.com", ["AI", "Chips"], "2024-05-01T09:00:00Z", (0.8, 0.1, 0.1)),
+    article(1, "b.com", ["AI", "AI"], "2024-05-01T23:59:59+00:00", (0.1, 0.7, 0.2)),
+    article(2, "a.com", ["Chips"], "2024-05-03T12:00:00+00:00", (0.6, 0.2, 0.2)),
+    article(3, "a.com", [], None),
+]
+
+
+def test_counts_and_facets() -> None:
+    agg = Aggregates(ARTICLES)
+
+    assert len(agg) == 4
+    assert agg.counts("source") == [("a.com", 3), ("b.com", 1)]
+    # repeated topics on one article count once
+    assert agg.counts("topics") == [("AI", 2), ("Chips", 2)]
+    assert agg.facets(["source", "companies"], top=1) == {
+        "source": [("a.com", 3)],
+        "companies": [("Acme", 2)],
+    }
+
+
+def test_histogram_fills_empty_buckets() -> None:
+    agg = Aggregates(ARTICLES)
+
+    def day(d: int) -> datetime:
+        return datetime(2024, 5, d, tzinfo=timezone.utc)
+
+    assert agg.histogram("day") == [(day(1), 2), (day(2), 0), (day(3), 1)]
+    assert agg.histogram("week") == [(datetime(2024, 4, 29, tzinfo=timezone.utc), 3)]
+
+
+def test_sentiment_overall_grouped_and_buckets() -> None:
+    agg = Aggregates(ARTICLES)
+
+    overall = agg.sentiment()
+    assert overall["count"] == 3
+    assert overall["positive"] == pytest.approx(0.5)
+    by_source = agg.sentiment(by="source")
+    assert by_source["a.com"]["count"] == 2
+    assert by_source["a.com"]["negative"] == pytest.approx(0.15)
+    assert agg.sentiment_buckets() == {"positive": 2, "negative": 1, "neutral": 0}
+
+
+def test_columnar_input_matches_articles() -> None:
+    wrapped = [ScoredDataArticle(data=a) for a in ARTICLES]
+    columns = to_columns(wrapped)
+    assert columns["pub_date"].dtype.kind == "i"
+
+    external = {
+        "source": ["a.com", "b.com", "a.com"],
+        "topics": [["AI"], [], ["AI", "Chips"]],
+        "pub_date": ["2024-05-01T00:00:00Z", "2024-05-01T05:00:00Z", None],
+    }
+    agg = Aggregates(external)
+    assert Aggregates(columns).counts("source") == Aggregates(ARTICLES).counts("source")
+    assert agg.counts("topics") == [("AI", 2), ("Chips", 1)]
+    assert agg.histogram(3600 * 6) == [(datetime(2024, 5, 1, tzinfo=timezone.utc), 2)]
@@ -0,0 +1,81 @@
+import asyncio
+import json
+from typing import List
+
+import httpx
+from conftest import MockClient
+
+from perigon.api.v1_api import V1Api
+from perigon.api_client import ApiClient
+from perigon.models.query_search_result import QuerySearchResult
+from perigon.models.update_watchlist_params import UpdateWatchlistParams
+
+PAGE = {
+    "status": 200,
+    "numResults": 1,
+    "articles": [
+        {
+            "articleId": "a1",
+            "title": "Hello",
+            "source": {"domain": "example.com"},
+            "topics": [{"name": "Markets"}],
+        }
+    ],
+}
+
+
+def test_deserialize_matches_model_validate() -> None:
+    client = ApiClient(api_key="test")
+    resp = httpx.Response(200, json=PAGE)
+
+    result = client.deserialize(resp, QuerySearchResult)
+
+    assert result == QuerySearchResult.model_validate(PAGE)
+    source = result.articles[0].source
+    assert source is not None and source.domain == "example.com"
+    raw = httpx.Response(200, content=json.dumps(PAGE).encode())
+    assert client.deserialize(raw, QuerySearchResult) == result
+
+
+def test_sync_and_async_methods_share_request_building(
+    mock_client: MockClient,
+) -> None:
+    seen: List[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request)
+        return httpx.Response(200, json=PAGE)
+
+    api = V1Api(mock_client(handler))
+    sync_result = api.search_articles(q="ai", source=["a.com", "b.com"], size=5)
+    async_result = asyncio.run(
+        api.search_articles_async(q="ai", source=["a.com", "b.com"], size=5)
+    )
+
+    assert sync_result == async_result
+    assert isinstance(sync_result, QuerySearchResult)
+    assert seen[0].url == seen[1].url
+    assert seen[0].url.path == "/v1/articles/all"
+    assert dict(seen[0].url.params) == {"q": "ai", "source": "a.com,b.com", "size": "5"}
+    assert seen[0].headers["Authorization"] == "Bearer test"
+
+
+def test_path_params_and_body_are_sent(mock_client: MockClient) -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(
+            200, json={"path": request.url.path, "body": json.loads(request.content)}
+        )
+
+    api = V1Api(mock_client(handler))
+    result = api.update_watchlist(
+        id=7, update_watchlist_params=UpdateWatchlistParams(name="Tech")
+    )
+
+    assert result == {"path": "/v1/api/watchlists/7", "body": {"name": "Tech"}}
+
+
+def test_supplemental_endpoints_module_still_imports() -> None:
+    from perigon.api.supplemental_endpoints_api import SupplementalEndpointsApi
+
+    api = SupplementalEndpointsApi(ApiClient(api_key="test"))
+    assert isinstance(api, V1Api) and callable(api.search_journalists)
@@ -0,0 +1,138 @@
+import asyncio
+import threading
+import time
+from typing import Set
+
+import httpx
+import pytest
+from conftest import MockClient
+
+from perigon.api.v1_api import V1Api
+from perigon.api_client import ApiClient
+from perigon.batch import Batch, pool_size
+from perigon.exceptions import ApiTypeError
+from perigon.models.query_search_result import QuerySearchResult
+
+
+def test_batch_runs_concurrently_and_keeps_order(mock_client: MockClient) -> None:
+    in_flight = 0
+    peak = 0
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        if request.url.path == "/v1/topics/all":
+            return httpx.Response(500)
+        return httpx.Response(
+            200,
+            json={
+                "status": 200,
+                "numResults": int(request.url.params["size"]),
+                "articles": [],
+            },
+        )
+
+    api = V1Api(mock_client(handler))
+    batch = Batch(max_concurrency=3)
+    slots = [batch.add(api.search_articles, q="x", size=n) for n in range(6)]
+    topics = batch.add(api.search_topics_async, name="Markets")
+
+    results = asyncio.run(batch.run())
+
+    assert peak == 3
+    assert results[:6] == slots
+    assert [r.unwrap().num_results for r in slots] == list(range(6))
+    assert isinstance(slots[0].value, QuerySearchResult)
+    assert not topics.ok
+    assert isinstance(topics.error, httpx.HTTPStatusError)
+    with pytest.raises(httpx.HTTPStatusError):
+        topics.unwrap()
+
+
+def test_batch_rejects_methods_without_async_variant() -> None:
+    with pytest.raises(ApiTypeError):
+        Batch().add(len, obj=[])
+
+
+def test_gather_runs_async_calls_from_sync_code(mock_client: MockClient) -> None:
+    loops: Set[int] = set()
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        loops.add(id(asyncio.get_running_loop()))
+        if request.url.params.get("q") == "boom":
+            return httpx.Response(500)
+        return httpx.Response(
+            200, json={"status": 200, "numResults": 1, "articles": []}
+        )
+
+    client = mock_client(handler)
+    api = V1Api(client)
+    try:
+        first, second = api.gather(
+            [(api.search_articles, {"q": "a"}), (api.search_articles, {"q": "b"})]
+        )
+        assert first.num_results == second.num_results == 1
+
+        mixed = api.gather(
+            [(api.search_articles, {"q": "boom"}), (api.search_articles, {"q": "c"})],
+            return_exceptions=True,
+        )
+        assert isinstance(mixed[0], httpx.HTTPStatusError)
+        with pytest.raises(httpx.HTTPStatusError):
+            api.gather([(api.search_articles, {"q": "boom"})])
+        assert len(loops) == 1
+    finally:
+        client.close()
+    assert client._loop is None
+
+
+def test_map_streams_sync_results_on_a_bounded_pool(
+    mock_client: MockClient,
+) -> None:
+    lock = threading.Lock()
+    in_flight = 0
+    peak = 0
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal in_flight, peak
+        with lock:
+            in_flight += 1
+            peak = max(peak, in_flight)
+        time.sleep(0.01)
+        with lock:
+            in_flight -= 1
+        size = int(request.url.params["size"])
+        if size == 3:
+            return httpx.Response(500)
+        return httpx.Response(
+            200, json={"status": 200, "numResults": size, "articles": []}
+        )
+
+    api = V1Api(mock_client(handler))
+    results = list(
+        api.map(api.search_articles, [{"size": n} for n in range(8)], workers=4)
+    )
+
+    assert peak <= 4
+    assert sorted(r.index for r in results) == list(range(8))
+    by_index = {r.index: r for r in results}
+    assert by_index[5].unwrap().num_results == 5
+    assert isinstance(by_index[3].error, httpx.HTTPStatusError)
+
+
+def test_map_rejects_async_methods_when_called(mock_client: MockClient) -> None:
+    api = V1Api(mock_client(lambda request: httpx.Response(200)))
+    with pytest.raises(ApiTypeError):
+        api.map(api.search_articles_async, [{"size": 1}])
+
+
+def test_pool_size_follows_connection_limits() -> None:
+    client = ApiClient(
+        limits=httpx.Limits(max_connections=6, max_keepalive_connections=4)
+    )
+    assert pool_size(client, jobs=100) == 4
+    assert pool_size(client, jobs=100, workers=50) == 6
+    assert pool_size(client, jobs=2) == 2
@@ -0,0 +1,81 @@
+import asyncio
+import time
+from pathlib import Path
+from typing import List
+
+import httpx
+import pytest
+
+from perigon.api.v1_api import V1Api
+from perigon.api_client import ApiClient
+from perigon.cassette import RecordingTransport, ReplayTransport, load, request_key
+from perigon.exceptions import ApiKeyError
+
+
+def test_record_then_replay_offline(local_server: str, tmp_path: Path) -> None:
+    path = tmp_path / "search.cassette"
+    client = ApiClient(
+        api_key="secret", base_url=local_server, transport=RecordingTransport(path)
+    )
+    api = V1Api(client)
+    recorded = [api.search_articles(q="AI", size=n).num_results for n in (1, 2)]
+    recorded.append(asyncio.run(api.search_articles_async(q="AI", size=3)).num_results)
+    client.close()
+
+    assert [i.key for i in load(path)] == [
+        "GET /v1/articles/all?q=AI&size=1",
+        "GET /v1/articles/all?q=AI&size=2",
+        "GET /v1/articles/all?q=AI&size=3",
+    ]
+
+    # Unreachable base URL: every response must come from the cassette
+    replay = ApiClient(base_url="http://192.0.2.1", transport=ReplayTransport(path))
+    api = V1Api(replay)
+    assert api.search_articles(size=1, q="AI").num_results == recorded[0]
+    assert api.search_articles(q="AI", size=2).num_results == recorded[1]
+    result = asyncio.run(api.search_articles_async(q="AI", size=3))
+    assert result.num_results == recorded[2]
+    with pytest.raises(ApiKeyError):
+        api.search_articles(q="other")
+
+
+def test_replay_at_recorded_latency(local_server: str, tmp_path: Path) -> None:
+    path = tmp_path / "search.cassette"
+    client = ApiClient(base_url=local_server, transport=RecordingTransport(path))
+    V1Api(client).search_articles(q="AI")
+    client.close()
+    (interaction,) = load(path)
+    interaction.latency = 0.05
+
+    api = V1Api(ApiClient(transport=ReplayTransport([interaction], latency="recorded")))
+    started = time.perf_counter()
+    api.search_articles(q="AI")
+    assert time.perf_counter() - started >= 0.05
+
+
+def test_recording_wraps_a_custom_transport_for_async_calls(tmp_path: Path) -> None:
+    seen: List[str] = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request.url.params["q"])
+        return httpx.Response(
+            200, json={"status": 200, "numResults": 7, "articles": []}
+        )
+
+    path = tmp_path / "mock.cassette"
+    recording = RecordingTransport(path, transport=httpx.MockTransport(handler))
+    client = ApiClient(base_url="http://192.0.2.1", transport=recording)
+    result = asyncio.run(V1Api(client).search_articles_async(q="AI"))
+    client.close()
+
+    assert result.num_results == 7 and seen == ["AI"]
+    assert [i.key for i in load(path)] == ["GET /v1/articles/all?q=AI"]
+
+
+def test_request_key_ignores_parameter_order_and_hashes_body() -> None:
+    a = httpx.Request("GET", "http://x/v1/all?b=2&a=1")
+    b = httpx.Request("GET", "http://y/v1/all?a=1&b=2")
+    assert request_key(a) == request_key(b) == "GET /v1/all?a=1&b=2"
+
+    post = httpx.Request("POST", "http://x/v1/watchlists", json={"name": "n"})
+    assert request_key(post).startswith("POST /v1/watchlists? #")
@@ -0,0 +1,85 @@
+import gzip
+import json
+from typing import Callable, Iterator, List
+
+import httpx
+import pytest
+
+from perigon import compression
+from perigon.api.v1_api import V1Api
+from perigon.api_client import ApiClient
+from perigon.compression import CODECS, accept_encoding, available_codecs
+from perigon.exceptions import ApiValueError
+
+PAGE = {"status": 200, "numResults": 0, "articles": [], "padding": "x" * 4000}
+
+
+class Chunks(httpx.SyncByteStream):
+    # Streamed body, so httpx counts the bytes as they arrive off the "wire"
+    def __init__(self, body: bytes):
+        self.body = body
+
+    def __iter__(self) -> Iterator[bytes]:
+        yield self.body
+
+
+def test_accept_encoding_offers_available_codecs() -> None:
+    assert accept_encoding(True) == ", ".join(available_codecs())
+    assert accept_encoding(False) == "identity"
+    assert accept_encoding(["deflate", "gzip"]) == "gzip, deflate"
+    assert set(available_codecs()) <= set(CODECS)
+    with pytest.raises(ApiValueError):
+        accept_encoding(["lzma"])
+
+
+def test_codecs_follow_the_installed_decoders(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    # zstandard installed next to an httpx without a zstd decoder
+    monkeypatch.setattr(compression, "_installed", lambda *modules: True)
+    monkeypatch.setattr(httpx, "__version__", "0.27.0")
+    assert available_codecs() == ("br", "gzip", "deflate")
+    with pytest.raises(ApiValueError, match="httpx >= 0.27.1"):
+        accept_encoding(["zstd"])
+
+    monkeypatch.setattr(httpx, "__version__", "0.28.1")
+    assert available_codecs() == CODECS
+
+    # a version that cannot be read falls back to the built-in codecs
+    monkeypatch.setattr(httpx, "__version__", "1.0.dev1")
+    assert available_codecs() == ("gzip", "deflate")
+    assert "zstd" not in accept_encoding(True)
+
+    monkeypatch.setattr(compression, "_installed", lambda *modules: False)
+    monkeypatch.setattr(httpx, "__version__", "0.28.1")
+    assert available_codecs() == ("gzip", "deflate")
+
+
+def test_client_negotiates_and_counts_bytes(
+    mock_client: Callable[..., ApiClient],
+) -> None:
+    seen: List[str] = []
+    body = json.dumps(PAGE).encode()
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request.headers["accept-encoding"])
+        return httpx.Response(
+            200,
+            headers={"content-encoding": "gzip"},
+            stream=Chunks(gzip.compress(body)),
+        )
+
+    client = mock_client(handler)
+    V1Api(client).search_articles(q="AI")
+
+    assert seen == [client.accept_encoding]
+    stats = client.transfer.snapshot()
+    assert stats["responses"] == 1
+    assert stats["decoded_bytes"] == len(body)
+    assert stats["wire_bytes"] == len(gzip.compress(body))
+    assert stats["encodings"] == {"gzip": 1}
+    assert client.transfer.ratio > 10
+
+
+def test_compression_can_be_disabled() -> None:
+    assert ApiClient(compression=False).accept_encoding == "identity"
@@ -0,0 +1,104 @@
+from datetime import datetime, timedelta, timezone
+from typing import List, Optional
+
+import pytest
+
+from perigon import dates as dates_module
+from perigon.dates import MISSING, Dates, epochs, parse_datetime, sort_by_date
+from perigon.exceptions import ApiValueError
+from perigon.models.article import Article
+from perigon.models.news_cluster import NewsCluster
+
+UTC = timezone.utc
+
+CASES = [
+    ("2024-05-01T09:00:00Z", datetime(2024, 5, 1, 9, tzinfo=UTC)),
+    ("2024-05-01T09:00:00+00:00", datetime(2024, 5, 1, 9, tzinfo=UTC)),
+    ("2024-05-01 09:00:00", datetime(2024, 5, 1, 9, tzinfo=UTC)),
+    (
+        "2024-05-01T09:00:00.1234567+02:00",
+        datetime(2024, 5, 1, 9, 0, 0, 123456, timezone(timedelta(hours=2))),
+    ),
+    ("2024-05-01T09:00:00-0530", datetime(2024, 5, 1, 14, 30, tzinfo=UTC)),
+    ("2024-05-01", datetime(2024, 5, 1, tzinfo=UTC)),
+]
+
+
+@pytest.mark.parametrize("native", [True, False])
+def test_parse_datetime(monkeypatch: pytest.MonkeyPatch, native: bool) -> None:
+    if native and not dates_module._NATIVE:
+        pytest.skip("fromisoformat is not ISO 8601 complete before 3.11")
+    monkeypatch.setattr(dates_module, "_NATIVE", native)
+    for value, expected in CASES:
+        assert parse_datetime(value) == expected
+    assert parse_datetime(None) is None
+    with pytest.raises(ApiValueError):
+        parse_datetime("yesterday")
+
+
+def test_model_accessors() -> None:
+    article = Article(pubDate="2024-05-01T09:00:00Z", addDate=None)
+    cluster = NewsCluster(updatedAt="2024-05-02T00:00:00+00:00")
+
+    assert Dates(article).pub_date == datetime(2024, 5, 1, 9, tzinfo=UTC)
+    assert Dates(article).add_date is None
+    assert Dates(cluster).updated_at == datetime(2024, 5, 2, tzinfo=UTC)
+    assert "pub_date=datetime.datetime(2024, 5, 1, 9, 0" in repr(Dates(article))
+
+
+def test_model_accessor_parses_each_field_once(monkeypatch: pytest.MonkeyPatch) -> None:
+    article = Article(pubDate="2024-05-01T09:00:00Z")
+    view = Dates(article)
+    calls: List[Optional[str]] = []
+    parse = dates_module.parse_datetime
+
+    def counting(value: Optional[str]) -> Optional[datetime]:
+        calls.append(value)
+        return parse(value)
+
+    monkeypatch.setattr(dates_module, "parse_datetime", counting)
+    assert view.pub_date == view.pub_date == datetime(2024, 5, 1, 9, tzinfo=UTC)
+    assert calls == ["2024-05-01T09:00:00Z"]
+
+    article.pub_date = "2024-05-02T09:00:00Z"  # a changed field is parsed again
+    assert view.pub_date == datetime(2024, 5, 2, 9, tzinfo=UTC)
+    assert len(calls) == 2
+
+
+def test_epochs_and_sorting() -> None:
+    pytest.importorskip("numpy")
+    values = [value for value, _ in CASES] + [None, ""]
+    expected = [int(dt.timestamp()) for _, dt in CASES] + [MISSING, MISSING]
+
+    assert epochs(values).tolist() == expected
+    with pytest.raises(ApiValueError):
+        epochs(["2024-13-01T00:00:00Z"])
+
+    articles = [
+        Article(articleId="b", pubDate="2024-05-02T00:00:00Z"),
+        Article(articleId="none"),
+        Article(articleId="a", pubDate="2024-05-01T23:00:00-02:00"),
+        Article(articleId="c", pubDate="2024-05-01T00:00:00Z"),
+    ]
+
+    def ids(items: List[Article]) -> List[str]:
+        return [a.article_id or "" for a in items]
+
+    assert ids(sort_by_date(articles)) == ["c", "b", "a", "none"]
+    assert ids(sort_by_date(articles, reverse=True)) == ["a", "b", "c", "none"]
+
+
+@pytest.mark.filterwarnings("error")
+def test_epochs_of_partial_timestamps_do_not_warn() -> None:
+    pytest.importorskip("numpy")
+    values = [
+        "2024-05-01T10:00Z",
+        "2024-05-01T10:00",
+        "2024-05-01T10:00+01:00",
+        "2024-05-01 10:00:30.5-02:00",
+        "2024-05-01",
+        "2024-05-01T10Z",
+    ]
+    assert epochs(values).tolist() == [
+        dates_module.parse_epoch(value) for value in values
+    ]
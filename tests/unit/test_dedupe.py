@@ -0,0 +1,103 @@
+from typing import Callable
+
+import httpx
+import pytest
+
+from perigon.api.v1_api import V1Api
+from perigon.api_client import ApiClient
+from perigon.dedupe import Deduplicator, simhash
+from perigon.models.article import Article
+from perigon.models.scored_data_article import ScoredDataArticle
+from perigon.models.vector_data import VectorData
+from perigon.pagination import paginate
+
+TITLE = "Central bank raises interest rates again as inflation persists"
+DESCRIPTION = "The decision surprised markets and pushed bond yields to a new high."
+
+
+def test_simhash_is_close_for_near_duplicates() -> None:
+    a = simhash(f"{TITLE} {DESCRIPTION}")
+    b = simhash(f"{TITLE}. {DESCRIPTION} (Reuters)")
+    c = simhash("Wildfire forces evacuations across the northern valley overnight")
+    assert bin(a ^ b).count("1") < bin(a ^ c).count("1")
+
+
+def test_reasons_and_stats() -> None:
+    articles = [
+        Article(articleId="1", reprintGroupId="g1", title=TITLE),
+        Article(articleId="1", title="repeat fetch"),
+        Article(articleId="2", reprintGroupId="g1", title="syndicated copy"),
+        Article(articleId="3", title=TITLE, description=DESCRIPTION),
+        Article(articleId="4", title=TITLE, description=DESCRIPTION),
+        Article(articleId="5", title="An unrelated local sports report"),
+    ]
+    dedupe = Deduplicator()
+
+    reasons = [dedupe.check(a) for a in articles]
+
+    assert reasons == [None, "article_id", "reprint_group", None, "simhash", None]
+    assert dedupe.stats.as_dict() == {
+        "seen": 6,
+        "kept": 3,
+        "article_id": 1,
+        "reprint_group": 1,
+        "simhash": 1,
+        "embedding": 0,
+    }
+
+
+def test_text_without_words_is_not_fingerprinted() -> None:
+    dedupe = Deduplicator()
+    articles = [
+        Article(articleId="1", title="!!!"),
+        Article(articleId="2", title="???", description="—"),
+        Article(articleId="3"),
+    ]
+    assert [dedupe.check(a) for a in articles] == [None, None, None]
+
+
+def test_embeddings_catch_rewritten_duplicates() -> None:
+    pytest.importorskip("numpy")
+    items = [
+        ScoredDataArticle(
+            data=Article(articleId=str(n), title=title),
+            vectors=[VectorData(data=vector)],
+        )
+        for n, (title, vector) in enumerate(
+            [
+                ("Storm hits the coast", [1.0, 0.0, 0.1]),
+                ("Coastal towns battered by storm", [0.99, 0.01, 0.1]),
+                ("Chip maker beats earnings", [0.0, 1.0, 0.0]),
+            ]
+        )
+    ]
+    kept = list(Deduplicator().filter(items))
+    assert [i.data.article_id for i in kept] == ["0", "2"]
+
+
+def test_memory_is_bounded() -> None:
+    dedupe = Deduplicator(capacity=2)
+    for n in range(3):
+        dedupe.check(Article(articleId=str(n)))
+    # "0" fell out of the window, so it is treated as new again
+    assert dedupe.check(Article(articleId="0")) is None
+
+
+def test_filters_a_paginated_stream(mock_client: Callable[..., ApiClient]) -> None:
+    pages = {
+        "0": [{"articleId": "1", "reprintGroupId": "g"}, {"articleId": "2"}],
+        "1": [{"articleId": "3", "reprintGroupId": "g"}],
+    }
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        articles = pages[request.url.params["page"]]
+        return httpx.Response(
+            200, json={"status": 200, "numResults": 3, "articles": articles}
+        )
+
+    api = V1Api(mock_client(handler))
+    dedupe = Deduplicator()
+    stream = dedupe.filter(paginate(api.search_articles, q="AI", size=2))
+
+    assert [a.article_id for a in stream] == ["1", "2"]
+    assert dedupe.stats.dropped["reprint_group"] == 1
@@ -0,0 +1,138 @@
+from typing import Any, List
+
+import httpx
+import pytest
+from conftest import MockClient
+
+from perigon.api.v1_api import PATH_SEARCH_ARTICLES, PATH_SEARCH_SUMMARIZER, V1Api
+from perigon.models.summary_body import SummaryBody
+from perigon.summary_cache import SummaryCache
+
+PAGE = {"status": 200, "numResults": 0, "articles": []}
+SUMMARY = {"status": 200, "numResults": 0, "summary": "s", "results": []}
+
+
+def _handler(request: httpx.Request) -> httpx.Response:
+    if request.url.path == PATH_SEARCH_SUMMARIZER:
+        return httpx.Response(200, json=SUMMARY)
+    if request.url.params.get("q") == "busy":
+        return httpx.Response(429)
+    return httpx.Response(200, json=PAGE)
+
+
+def _run(api: V1Api) -> None:
+    api.search_articles(q="AI")
+    api.search_articles(q="AI")
+    with pytest.raises(httpx.HTTPStatusError):
+        api.search_articles(q="busy")
+    # A cache miss, then a hit answered without a request
+    cached = SummaryCache(api)
+    cached.search_summarizer(SummaryBody(prompt="p"), q="AI")
+    cached.search_summarizer(SummaryBody(prompt="p"), q="AI")
+
+
+def test_prometheus_observer(mock_client: MockClient) -> None:
+    prom = pytest.importorskip("prometheus_client")
+    from perigon.exporters import PrometheusObserver
+
+    registry = prom.CollectorRegistry()
+    client = mock_client(_handler)
+    client.observers.append(PrometheusObserver(registry=registry))
+    _run(V1Api(client))
+
+    labels = {"endpoint": PATH_SEARCH_ARTICLES, "method": "GET"}
+    sample = registry.get_sample_value
+    assert sample("perigon_request_duration_seconds_count", labels) == 3
+    assert sample("perigon_responses_total", {**labels, "status": "200"}) == 2
+    assert sample("perigon_responses_total", {**labels, "status": "429"}) == 1
+    assert sample("perigon_rate_limited_total", labels) == 1
+    assert sample("perigon_requests_in_flight", labels) == 0
+    phase = {**labels, "phase": "validate"}
+    assert sample("perigon_request_phase_seconds_count", phase) == 2
+
+    summaries = {"endpoint": PATH_SEARCH_SUMMARIZER, "method": "POST"}
+    assert sample("perigon_cache_lookups_total", {**summaries, "result": "hit"}) == 1
+    assert sample("perigon_cache_lookups_total", {**summaries, "result": "miss"}) == 1
+    # The hit is not a response, so neither an "error" nor a duration sample
+    assert sample("perigon_request_duration_seconds_count", summaries) == 1
+    assert sample("perigon_responses_total", {**summaries, "status": "200"}) == 1
+    assert sample("perigon_responses_total", {**summaries, "status": "error"}) is None
+
+
+def test_opentelemetry_observer(mock_client: MockClient) -> None:
+    pytest.importorskip("opentelemetry.sdk")
+    from opentelemetry import trace
+    from opentelemetry.sdk.metrics import MeterProvider
+    from opentelemetry.sdk.metrics.export import InMemoryMetricReader
+    from opentelemetry.sdk.trace import TracerProvider
+    from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+    from opentelemetry.sdk.trace.export.in_memory_span_exporter import (
+        InMemorySpanExporter,
+    )
+    from opentelemetry.trace import SpanKind, StatusCode
+
+    from perigon.exporters import OpenTelemetryObserver
+
+    reader = InMemoryMetricReader()
+    spans = InMemorySpanExporter()
+    tracer_provider = TracerProvider()
+    tracer_provider.add_span_processor(SimpleSpanProcessor(spans))
+    current: List[Any] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        current.append(trace.get_current_span())
+        return _handler(request)
+
+    client = mock_client(handler)
+    client.observers.append(
+        OpenTelemetryObserver(
+            meter_provider=MeterProvider(metric_readers=[reader]),
+            tracer_provider=tracer_provider,
+        )
+    )
+    _run(V1Api(client))
+
+    data = reader.get_metrics_data()
+    assert data is not None
+    metrics: Any = {
+        metric.name: metric.data.data_points
+        for resource in data.resource_metrics
+        for scope in resource.scope_metrics
+        for metric in scope.metrics
+    }
+    durations = {
+        p.attributes["endpoint"]: p.count
+        for p in metrics["perigon.client.request.duration"]
+    }
+    assert durations == {PATH_SEARCH_ARTICLES: 3, PATH_SEARCH_SUMMARIZER: 1}
+    by_status = {
+        (p.attributes["endpoint"], p.attributes["status"]): p.value
+        for p in metrics["perigon.client.responses"]
+    }
+    assert by_status == {
+        (PATH_SEARCH_ARTICLES, "200"): 2,
+        (PATH_SEARCH_ARTICLES, "429"): 1,
+        (PATH_SEARCH_SUMMARIZER, "200"): 1,
+    }
+    lookups = {
+        p.attributes["result"]: p.value for p in metrics["perigon.client.cache.lookups"]
+    }
+    assert lookups == {"hit": 1, "miss": 1}
+    assert [p.value for p in metrics["perigon.client.rate_limited"]] == [1]
+    assert [p.value for p in metrics["perigon.client.requests.in_flight"]] == [0, 0]
+
+    finished = spans.get_finished_spans()
+    assert [s.name for s in finished] == [f"GET {PATH_SEARCH_ARTICLES}"] * 3 + [
+        f"POST {PATH_SEARCH_SUMMARIZER}"
+    ] * 2
+    assert all(s.kind is SpanKind.CLIENT for s in finished)
+    assert finished[0].attributes is not None
+    assert finished[0].attributes["http.response.status_code"] == 200
+    assert finished[2].status.status_code is StatusCode.ERROR
+    assert finished[4].attributes is not None
+    assert finished[4].attributes["perigon.cache_hit"] is True
+    # Each span is current while its request is sent, and only then
+    assert [s.get_span_context() for s in current] == [
+        s.get_span_context() for s in finished[:4]
+    ]
+    assert not trace.get_current_span().get_span_context().is_valid
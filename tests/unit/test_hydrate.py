@@ -0,0 +1,87 @@
+import asyncio
+from typing import Any, Callable, List, Optional
+from urllib.parse import parse_qs
+
+import httpx
+from conftest import MockClient
+
+from perigon.api.v1_api import V1Api
+from perigon.hydrate import ClusterHydrator
+from perigon.models.article import Article
+from perigon.models.news_cluster import NewsCluster
+
+
+def _handler(
+    requests: List[List[str]], updated: str = "2024-05-01T00:00:00Z"
+) -> Callable[[httpx.Request], httpx.Response]:
+    def handler(request: httpx.Request) -> httpx.Response:
+        ids = parse_qs(request.url.query.decode())["clusterId"][0].split(",")
+        requests.append(ids)
+        stories = [
+            {"id": i, "name": f"story {i}", "updatedAt": updated}
+            for i in ids
+            if i != "gone"
+        ]
+        return httpx.Response(
+            200, json={"status": 200, "numResults": len(stories), "results": stories}
+        )
+
+    return handler
+
+
+def _article(article_id: str, cluster_id: Optional[str] = None) -> Article:
+    return Article(articleId=article_id, clusterId=cluster_id)
+
+
+def _name(article: Article) -> Optional[str]:
+    assert article.cluster is not None
+    return article.cluster.name
+
+
+def test_batches_distinct_ids_and_attaches(mock_client: MockClient) -> None:
+    requests: List[List[str]] = []
+    api = V1Api(mock_client(_handler(requests)))
+    hydrator = ClusterHydrator(api, batch_size=3)
+    articles = [_article(str(n), f"c{n % 7}") for n in range(50)]
+    articles.append(_article("x", "gone"))
+    articles.append(_article("y"))
+
+    hydrated = hydrator.hydrate(articles)
+
+    assert sorted(len(ids) for ids in requests) == [2, 3, 3]
+    assert _name(hydrated[9]) == "story c2"
+    assert hydrated[-2].cluster is None and hydrated[-1].cluster is None
+
+    # everything is cached, including the id the API did not return
+    again = list(hydrator.hydrate_iter(articles, chunk=10))
+    assert len(requests) == 3 and hydrator.calls == 3
+    assert _name(again[0]) == "story c0"
+
+
+def test_attaches_more_stories_than_the_cache_holds(mock_client: MockClient) -> None:
+    requests: List[List[str]] = []
+    api = V1Api(mock_client(_handler(requests)))
+    hydrator = ClusterHydrator(api, cache_size=2)
+    articles = [_article(str(n), f"c{n}") for n in range(5)]
+
+    hydrated = hydrator.hydrate(articles)
+
+    assert [_name(article) for article in hydrated] == [f"story c{n}" for n in range(5)]
+    assert hydrator.get("c0") is None and hydrator.get("c4") is not None
+
+
+def test_refetches_stale_entries_keeping_newest(mock_client: MockClient) -> None:
+    requests: List[List[str]] = []
+    api = V1Api(mock_client(_handler(requests, updated="2024-04-01T00:00:00Z")))
+    hydrator = ClusterHydrator(api, max_age=0)
+    newer = NewsCluster.model_validate(
+        {"id": "c1", "name": "newer", "updatedAt": "2024-05-01T00:00:00Z"}
+    )
+    result: Any = type("R", (), {"results": [newer]})()
+    hydrator._store(["c1"], [result])
+
+    article = _article("1", "c1")
+    asyncio.run(hydrator.hydrate_async([article]))
+
+    assert requests == [["c1"]]
+    assert _name(article) == "newer"
@@ -0,0 +1,79 @@
+import asyncio
+from typing import List
+
+import httpx
+import pytest
+from conftest import MockClient
+
+from perigon.api.v1_api import PATH_SEARCH_ARTICLES, V1Api
+from perigon.api_client import ApiClient
+from perigon.instrumentation import CallReport, Observer
+
+PAGE = {"status": 200, "numResults": 1, "articles": [{"articleId": "a1"}]}
+
+
+class Recorder(Observer):
+    def __init__(self) -> None:
+        self.started: List[CallReport] = []
+        self.reports: List[CallReport] = []
+
+    def on_start(self, report: CallReport) -> None:
+        self.started.append(report)
+
+    def on_end(self, report: CallReport) -> None:
+        self.reports.append(report)
+
+
+def test_report_covers_decode_and_validation(mock_client: MockClient) -> None:
+    recorder = Recorder()
+    client = mock_client(lambda request: httpx.Response(200, json=PAGE))
+    client.observers.append(recorder)
+    api = V1Api(client)
+
+    api.search_articles(q="AI", size=5)
+    asyncio.run(api.search_articles_async(q="AI"))
+
+    assert len(recorder.started) == len(recorder.reports) == 2
+    sync, async_ = recorder.reports
+    assert sync.endpoint == PATH_SEARCH_ARTICLES
+    assert sync.status == 200
+    assert sync.query_params == 2
+    assert sync.query_bytes == len(b"q=AI&size=5")
+    assert sync.content_bytes == len(httpx.Response(200, json=PAGE).content)
+    assert sync.decode is not None and sync.validate is not None
+    assert sync.total is not None
+    assert sync.total >= sync.decode + sync.validate
+    assert async_.query_params == 1 and async_.validate is not None
+
+
+def test_report_records_errors(mock_client: MockClient) -> None:
+    recorder = Recorder()
+    client = mock_client(lambda request: httpx.Response(429))
+    client.observers.append(recorder)
+
+    with pytest.raises(httpx.HTTPStatusError):
+        V1Api(client).search_articles(q="AI")
+
+    (report,) = recorder.reports
+    assert report.status == 429
+    assert isinstance(report.error, httpx.HTTPStatusError)
+    assert report.decode is None
+    assert report.as_dict()["error"] == "HTTPStatusError"
+
+
+def test_network_phases_from_transport_trace(local_server: str) -> None:
+    recorder = Recorder()
+    client = ApiClient(api_key="test", base_url=local_server, observers=[recorder])
+    api = V1Api(client)
+    try:
+        api.search_articles(q="AI")
+        api.search_articles(q="AI")
+    finally:
+        client.close()
+
+    first, second = recorder.reports
+    assert first.connect is not None and first.tls is None
+    assert first.ttfb is not None and first.download is not None
+    assert first.response_bytes == first.content_bytes
+    # The second call reuses the keep-alive connection
+    assert second.connect is None and second.ttfb is not None
@@ -0,0 +1,192 @@
+from datetime import datetime, timezone
+from typing import Any, Iterable, List, Optional
+
+import httpx
+import pytest
+from conftest import MockClient
+
+from perigon.api.v1_api import V1Api
+from perigon.exceptions import ApiValueError
+from perigon.keyword_index import KeywordIndex, LocalSearch, parse_query
+from perigon.models.all_endpoint_sort_by import AllEndpointSortBy
+from perigon.models.article import Article
+
+
+def _article(**fields: Any) -> Article:
+    return Article.model_validate(fields)
+
+
+ARTICLES = [
+    _article(
+        articleId="1",
+        title="Fed signals a rate cut in June",
+        content="Markets rallied after the central bank hinted at easing.",
+        pubDate="2024-05-01T10:00:00Z",
+        source={"domain": "a.com"},
+    ),
+    _article(
+        articleId="2",
+        title="ECB holds rates",
+        description="No cut this time, the bank said.",
+        pubDate="2024-05-02T10:00:00Z",
+        source={"domain": "b.com"},
+    ),
+    _article(
+        articleId="3",
+        title="Bitcoin jumps as traders bet on a rate cut",
+        summary="Crypto markets rose.",
+        pubDate="2024-05-03T10:00:00Z",
+        source={"domain": "a.com"},
+    ),
+]
+
+MAY = datetime(2024, 5, 1, tzinfo=timezone.utc)
+JUNE = datetime(2024, 6, 1, tzinfo=timezone.utc)
+
+
+@pytest.fixture
+def index() -> KeywordIndex:
+    index = KeywordIndex()
+    index.extend(ARTICLES)
+    index.cover(MAY, JUNE)
+    return index
+
+
+def _ids(articles: Iterable[Article]) -> List[str]:
+    return sorted(a.article_id or "" for a in articles)
+
+
+@pytest.mark.parametrize(
+    "query,expected",
+    [
+        ('"rate cut"', ["1", "3"]),
+        ("rate cut", ["1", "3"]),
+        ("cut", ["1", "2", "3"]),
+        ("fed OR ecb", ["1", "2"]),
+        ('"rate cut" NOT bitcoin', ["1"]),
+        ("NOT (fed OR ecb)", ["3"]),
+        ("bit* AND trader?", ["3"]),
+        ("rat?s", ["2"]),
+        ("central-bank", ["1"]),
+        ("crypto", []),  # summary is not part of q
+    ],
+)
+def test_query_syntax(index: KeywordIndex, query: str, expected: List[str]) -> None:
+    assert _ids(index.search(query)) == expected
+
+
+def test_field_queries_windows_and_sorting(index: KeywordIndex) -> None:
+    assert _ids(index.search(summary="crypto")) == ["3"]
+    assert _ids(index.search(title="bank")) == []
+    assert _ids(index.search("cut", start=datetime(2024, 5, 2))) == ["2", "3"]
+    newest = index.search("cut", sort_by="date")
+    assert [a.article_id for a in newest] == ["3", "2", "1"]
+
+    index.add(_article(articleId="3", title="Bitcoin slides", pubDate="2024-05-03"))
+    assert _ids(index.search("cut")) == ["1", "2"]
+    assert len(index) == 3
+
+
+# Published 1 < 2 < 3, added 2 < 3 < 1, refreshed 3 < 1 < 2
+DATED = [
+    _article(
+        articleId=str(n),
+        title="rate cut",
+        pubDate=f"2024-05-0{n}T10:00:00Z",
+        addDate=f"2024-05-0{(n + 1) % 3 + 1}T10:00:00Z",
+        refreshDate=f"2024-05-0{n % 3 + 1}T10:00:00Z",
+    )
+    for n in (1, 2, 3)
+]
+
+
+@pytest.mark.parametrize(
+    "sort_by,expected",
+    [
+        (AllEndpointSortBy.RELEVANCE, ["1", "2", "3"]),
+        (AllEndpointSortBy.DATE, ["3", "2", "1"]),
+        (AllEndpointSortBy.PUBDATE, ["3", "2", "1"]),
+        (AllEndpointSortBy.REVERSEDATE, ["1", "2", "3"]),
+        (AllEndpointSortBy.ADDDATE, ["1", "3", "2"]),
+        (AllEndpointSortBy.REVERSEADDDATE, ["2", "3", "1"]),
+        (AllEndpointSortBy.REFRESHDATE, ["2", "1", "3"]),
+    ],
+)
+def test_local_search_sorts_by_each_date(
+    mock_client: MockClient, sort_by: AllEndpointSortBy, expected: List[str]
+) -> None:
+    index = KeywordIndex()
+    index.extend(DATED)
+    index.cover(MAY, JUNE)
+    api = LocalSearch(V1Api(mock_client(lambda request: httpx.Response(500))), index)
+
+    page = api.search_articles(q="cut", var_from=MAY, to=JUNE, sort_by=sort_by)
+    assert [a.article_id for a in page.articles] == expected
+    assert api.remote_calls == 0
+
+
+def test_unknown_sort_is_left_to_the_api(index: KeywordIndex) -> None:
+    api = LocalSearch(None, index)
+    assert not api.can_answer({"q": "cut", "sort_by": "title"})
+    with pytest.raises(ApiValueError):
+        index.search("cut", sort_by="title")
+
+
+def test_local_search_takes_positional_arguments(index: KeywordIndex) -> None:
+    api = LocalSearch(None, index)
+    # q, then title, as in V1Api.search_articles
+    page = api.search_articles(None, "ecb", var_from=MAY, to=JUNE)
+    assert [a.article_id for a in page.articles] == ["2"]
+    with pytest.raises(TypeError):
+        api.search_articles("cut", q="cut")
+    with pytest.raises(TypeError):
+        api.search_articles(q="cut", query="cut")
+
+
+def test_fields_and_per_clause_scores(index: KeywordIndex) -> None:
+    assert _ids(index.search("cut", fields=("title",))) == ["1", "3"]
+    assert _ids(index.search("markets", fields=("content", "summary"))) == ["1", "3"]
+
+    index.add(_article(articleId="4", summary="crypto crypto crypto rally"))
+    index.add(_article(articleId="5", title="Crypto", summary="crypto"))
+    ranked = index.search(summary="crypto")
+    # scored on the summary only, so the title match does not count
+    assert [a.article_id for a in ranked] == ["4", "3", "5"]
+
+
+def test_parse_errors() -> None:
+    assert parse_query("a b OR c") == (
+        "or",
+        ("and", ("term", "a"), ("term", "b")),
+        ("term", "c"),
+    )
+    for bad in ["(a", "a AND", "OR a", '""', "a )"]:
+        with pytest.raises(ApiValueError):
+            parse_query(bad)
+
+
+def test_local_search_falls_back_outside_coverage(
+    index: KeywordIndex, mock_client: MockClient
+) -> None:
+    remote: List[Optional[str]] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        remote.append(request.url.params.get("q"))
+        return httpx.Response(
+            200, json={"status": 200, "numResults": 0, "articles": []}
+        )
+
+    api = LocalSearch(V1Api(mock_client(handler)), index)
+
+    page = api.search_articles(
+        q='"rate cut"', var_from=MAY, to=JUNE, source=["a.com"], size=1, page=1
+    )
+    assert page.num_results == 2 and [a.article_id for a in page.articles] == ["3"]
+    assert remote == []
+
+    api.search_articles(q="cut", var_from=datetime(2024, 4, 1), to=JUNE)
+    api.search_articles(q="cut", var_from=MAY, to=JUNE, label=["Opinion"])
+    assert remote == ["cut", "cut"]
+    assert (api.local_calls, api.remote_calls) == (1, 2)
+    calls = [(api.search_articles, {"q": "fed", "var_from": MAY, "to": JUNE})]
+    assert api.gather(calls)[0].num_results == 1
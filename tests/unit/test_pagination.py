@@ -0,0 +1,122 @@
+import asyncio
+from typing import Any, Callable, List, Optional, Tuple
+from urllib.parse import parse_qs
+
+import httpx
+from conftest import MockClient
+
+from perigon.api.v1_api import V1Api
+from perigon.pagination import PageSizeTuner, paginate, paginate_async
+
+
+def _fake(total: int, calls: List[Tuple[int, int]]) -> Callable[..., Any]:
+    def search_articles(page: int = 0, size: int = 10, **kwargs: Any) -> Any:
+        calls.append((page, size))
+        first = page * size
+        articles = list(range(first, min(first + size, total)))
+        return type("Page", (), {"articles": articles})()
+
+    return search_articles
+
+
+def test_untuned_pages_are_unchanged() -> None:
+    calls: List[Tuple[int, int]] = []
+    items = list(paginate(_fake(25, calls), q="AI"))
+    assert items == list(range(25))
+    assert calls == [(0, 10), (1, 10), (2, 10)]
+
+
+def test_limit_stops_without_fetching_another_page() -> None:
+    calls: List[Tuple[int, int]] = []
+    assert list(paginate(_fake(100, calls), limit=20)) == list(range(20))
+    assert calls == [(0, 10), (1, 10)]
+
+    calls.clear()
+    assert list(paginate(_fake(100, calls), limit=15)) == list(range(15))
+    assert calls == [(0, 10), (1, 10)]
+
+    calls.clear()
+    assert list(paginate(_fake(100, calls), limit=0)) == []
+    assert calls == []
+
+    calls.clear()
+
+    async def collect() -> List[int]:
+        async def search_articles_async(**kwargs: Any) -> Any:
+            return _fake(100, calls)(**kwargs)
+
+        stream = paginate_async(search_articles_async, limit=20)
+        return [item async for item in stream]
+
+    assert asyncio.run(collect()) == list(range(20))
+    assert calls == [(0, 10), (1, 10)]
+
+
+def test_max_pages_and_short_pages_end_iteration() -> None:
+    calls: List[Tuple[int, int]] = []
+    assert list(paginate(_fake(100, calls), max_pages=3)) == list(range(30))
+    assert calls == [(0, 10), (1, 10), (2, 10)]
+
+    calls.clear()
+    assert list(paginate(_fake(100, calls), page=9)) == list(range(90, 100))
+    assert calls == [(9, 10), (10, 10)]  # a full last page needs one more call
+
+    calls.clear()
+    assert list(paginate(_fake(23, calls), size=5, page=2)) == list(range(10, 23))
+    assert calls == [(2, 5), (3, 5), (4, 5)]
+
+
+def test_tuned_sizes_grow_to_the_cap_without_gaps() -> None:
+    calls: List[Tuple[int, int]] = []
+    tuner = PageSizeTuner()
+    items = list(paginate(_fake(1234, calls), tune=tuner))
+
+    assert items == list(range(1234))
+    assert max(tuner.sizes) == 100
+    assert tuner.sizes[:6] == [10, 10, 20, 40, 80, 80]
+    summary = tuner.summary()
+    assert summary["items"] == 1234 and summary["pages"] == len(calls)
+
+
+def test_tuner_respects_time_and_bytes() -> None:
+    tuner = PageSizeTuner(target_time=1.0)
+    tuner.observe(100, 100, 2.0)
+    assert tuner.next_size(200, 100, 100) == 50
+
+    tuner = PageSizeTuner(max_page_bytes=8_000_000, min_size=1)
+    tuner.observe(10, 10, 0.01, nbytes=10_000_000)
+    assert tuner.next_size(10, 10, 100) == 5  # 8 does not divide the offset
+
+    # 14 would divide 70 but is below min_size: keep the current size
+    tuner = PageSizeTuner(target_time=1.0, min_size=15)
+    tuner.observe(70, 70, 3.5)
+    assert tuner.next_size(70, 70, 100) == 70
+
+    assert PageSizeTuner(max_size=30).next_size(0, 20, 100) == 30
+
+
+def test_tuned_async_against_client(mock_client: MockClient) -> None:
+    sizes: List[int] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        query = parse_qs(request.url.query.decode())
+        page, size = int(query["page"][0]), int(query["size"][0])
+        sizes.append(size)
+        count = max(0, min(size, 150 - page * size))
+        articles = [{"articleId": str(page * size + n)} for n in range(count)]
+        return httpx.Response(
+            200, json={"status": 200, "numResults": 150, "articles": articles}
+        )
+
+    api = V1Api(mock_client(handler))
+    tuner = PageSizeTuner()
+
+    async def collect() -> List[Optional[str]]:
+        stream = paginate_async(api.search_articles_async, tune=tuner, q="AI")
+        return [article.article_id async for article in stream]
+
+    ids = asyncio.run(collect())
+
+    assert ids == [str(n) for n in range(150)]
+    assert sizes == tuner.sizes and sizes[-1] > 10
+    assert tuner.bytes_per_item is not None and tuner.bytes_per_item > 0
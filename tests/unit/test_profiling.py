@@ -0,0 +1,54 @@
+import time
+from typing import Callable
+
+import httpx
+
+from perigon.api.v1_api import PATH_SEARCH_ARTICLES, PATH_SEARCH_TOPICS, V1Api
+from perigon.api_client import ApiClient
+from perigon.profiling import STAGES, Profiler
+
+
+def _handler(request: httpx.Request) -> httpx.Response:
+    if request.url.path == PATH_SEARCH_TOPICS:
+        return httpx.Response(200, json={"total": 0, "data": []})
+    return httpx.Response(200, json={"status": 200, "numResults": 0, "articles": []})
+
+
+def test_profile_breaks_calls_down_per_endpoint(
+    mock_client: Callable[..., ApiClient],
+) -> None:
+    client = mock_client(_handler)
+    client.profiler = Profiler()
+    client.observers.append(client.profiler)
+    api = V1Api(client)
+
+    api.search_articles(q="AI")
+    time.sleep(0.02)  # caller's own work between SDK calls
+    api.search_articles(q="AI")
+    api.search_topics(name="Markets")
+
+    summary = client.profiler.summary()
+    articles = summary[PATH_SEARCH_ARTICLES]
+    assert articles["calls"] == 2 and summary[PATH_SEARCH_TOPICS]["calls"] == 1
+    assert all(articles[stage] >= 0 for stage in STAGES)
+    assert articles["network"] > 0 and articles["validate"] > 0
+    assert sum(articles[stage] for stage in STAGES) >= articles["total"] * 0.99
+    assert client.profiler.user_time() >= 0.02
+
+    folded = client.profiler.folded().splitlines()
+    assert f"{PATH_SEARCH_ARTICLES};validate" in {line.split()[0] for line in folded}
+    assert folded[-1].startswith("user ")
+    assert PATH_SEARCH_TOPICS in client.profiler.report()
+
+
+def test_profile_flag_and_function_stats() -> None:
+    assert ApiClient(profile=True).profiler is not None
+    assert ApiClient().profiler is None
+
+    profiler = Profiler(functions=True)
+    client = ApiClient(profile=profiler, transport=httpx.MockTransport(_handler))
+    assert client.profiler is profiler and profiler in client.observers
+
+    V1Api(client).search_articles(q="AI")
+
+    assert "(_handle)" in profiler.stats(limit=100)
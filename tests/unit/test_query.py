@@ -0,0 +1,40 @@
+from datetime import datetime
+
+from perigon.api.v1_api import OP_SEARCH_ARTICLES
+from perigon.models.all_endpoint_sort_by import AllEndpointSortBy
+from perigon.query import QuerySpec, encode_list, encode_scalar
+
+
+def test_encode_skips_none_and_uses_wire_alias() -> None:
+    spec = QuerySpec(
+        ("var_from", "from", encode_scalar),
+        ("sort_by", "sortBy", encode_scalar),
+        ("source", "source", encode_list),
+        ("size", "size", encode_scalar),
+    )
+    params = spec.encode(
+        {
+            "var_from": datetime(2025, 4, 1, 12, 30),
+            "sort_by": AllEndpointSortBy.DATE,
+            "source": ["nytimes.com", "wsj.com"],
+            "size": None,
+        }
+    )
+    assert params == {
+        "from": "2025-04-01T12:30:00",
+        "sortBy": "date",
+        "source": "nytimes.com,wsj.com",
+    }
+
+
+def test_encode_scalar_matches_legacy_conversions() -> None:
+    assert encode_scalar("2025-04-01") == "2025-04-01"
+    assert encode_scalar(True) == "True"
+    assert encode_scalar(0.5) == "0.5"
+    assert encode_list(("a", AllEndpointSortBy.PUBDATE)) == "a,pubDate"
+    assert encode_list("single") == "single"
+
+
+def test_generated_spec_covers_every_query_parameter() -> None:
+    aliases = {alias for _, alias, _ in OP_SEARCH_ARTICLES.query.params}
+    assert {"q", "from", "to", "sortBy", "showReprints"} <= aliases
@@ -0,0 +1,150 @@
+import os
+from datetime import datetime, timedelta
+from functools import partial
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Tuple
+from urllib.parse import parse_qs
+
+import httpx
+import pytest
+from conftest import MockClient
+
+from perigon.api.v1_api import V1Api
+from perigon.exceptions import ApiValueError
+from perigon.shards import Coordinator, Shard, ShardQueue, plan_shards, work
+
+
+def _lease(queue: ShardQueue, owner: str) -> Tuple[int, Shard]:
+    leased = queue.lease(owner)
+    assert leased is not None
+    return leased
+
+
+def test_plan_shards() -> None:
+    shards = plan_shards(
+        datetime(2024, 5, 1),
+        datetime(2024, 5, 3, 12),
+        source_groups=["top10", "top100"],
+        languages=["en", "de"],
+    )
+    assert len(shards) == 3 * 2 * 2
+    assert shards[-1] == {
+        "var_from": datetime(2024, 5, 3),
+        "to": datetime(2024, 5, 3, 12),
+        "source_group": "top100",
+        "language": "de",
+    }
+    assert plan_shards(datetime(2024, 5, 1), datetime(2024, 5, 2)) == [
+        {"var_from": datetime(2024, 5, 1), "to": datetime(2024, 5, 2)}
+    ]
+    with pytest.raises(ApiValueError):
+        plan_shards(datetime(2024, 5, 1), datetime(2024, 5, 2), timedelta(0))
+
+
+def test_leases_expire_and_failures_are_retried(tmp_path: Path) -> None:
+    path = str(tmp_path / "queue.db")
+    shards = plan_shards(datetime(2024, 5, 1), datetime(2024, 5, 3))
+    with ShardQueue(path, lease_time=60, max_attempts=2) as queue:
+        assert queue.add(shards) == 2
+        assert queue.add(shards) == 0
+
+        first, shard = _lease(queue, "a")
+        assert shard == shards[0]
+        second, _ = _lease(queue, "b")
+        assert second != first and queue.lease("c") is None
+
+        assert not queue.complete(first, "b", 10)
+        assert queue.complete(first, "a", 10)
+        assert queue.fail(second, "b", "boom")
+        assert queue.counts() == {"pending": 1, "leased": 0, "done": 1, "failed": 0}
+
+        # b's retry dies without reporting; its lease runs out
+        assert _lease(queue, "b")[0] == second
+        queue.lease_time = -1
+        assert queue.renew(second, "b")
+        assert queue.lease("c") is None
+        assert queue.errors() == {second: "lease expired"}
+
+        assert queue.retry_failed() == 1
+        assert _lease(queue, "c")[0] == second
+
+
+def test_work_runs_every_shard(mock_client: MockClient, tmp_path: Path) -> None:
+    seen: List[Tuple[str, str, str]] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        query = parse_qs(request.url.query.decode())
+        seen.append((query["from"][0], query["language"][0], query["q"][0]))
+        if query["language"][0] == "xx":
+            return httpx.Response(500, json={"status": 500})
+        articles = [{"articleId": f"{query['from'][0]}-{n}"} for n in range(3)]
+        return httpx.Response(
+            200, json={"status": 200, "numResults": 3, "articles": articles}
+        )
+
+    collected: Dict[Tuple[datetime, str], List[Any]] = {}
+
+    def sink(shard: Shard, articles: Iterator[Any]) -> int:
+        ids = [article.article_id for article in articles]
+        collected[(shard["var_from"], shard["language"])] = ids
+        return len(ids)
+
+    with ShardQueue(str(tmp_path / "queue.db"), max_attempts=2) as queue:
+        queue.add(
+            plan_shards(
+                datetime(2024, 5, 1), datetime(2024, 5, 4), languages=["en", "xx"]
+            )
+        )
+        api = V1Api(mock_client(handler))
+        assert work(queue, api, sink, q="AI", size=100) == 3
+        assert queue.counts()["failed"] == 3
+        assert "500" in next(iter(queue.errors().values()))
+
+    assert len(collected) == 3
+    assert collected[(datetime(2024, 5, 2), "en")][0] == "2024-05-02T00:00:00-0"
+    assert len(seen) == 3 + 3 * 2  # failed shards are tried twice
+    assert all(q == "AI" for _, _, q in seen)
+
+
+def test_coordinator_processes(local_server: str, tmp_path: Path) -> None:
+    path = str(tmp_path / "queue.db")
+    with ShardQueue(path) as queue:
+        queue.add(plan_shards(datetime(2024, 5, 1), datetime(2024, 5, 9)))
+
+    counts = Coordinator(
+        path,
+        api_keys=["k1", "k2"],
+        client_options={"base_url": local_server},
+        size=5,
+    ).run()
+
+    assert counts["done"] == 8 and counts["pending"] == counts["failed"] == 0
+
+
+def _crash_once(marker: str, shard: Shard, items: Iterator[Any]) -> int:
+    # The first worker to get here dies holding its lease
+    try:
+        os.close(os.open(marker, os.O_CREAT | os.O_EXCL))
+    except FileExistsError:
+        return sum(1 for _ in items)
+    os._exit(3)
+
+
+def test_coordinator_survives_a_dead_worker(local_server: str, tmp_path: Path) -> None:
+    path = str(tmp_path / "queue.db")
+    with ShardQueue(path) as queue:
+        queue.add(plan_shards(datetime(2024, 5, 1), datetime(2024, 5, 5)))
+
+    coordinator = Coordinator(
+        path,
+        api_keys=["k1", "k2"],
+        sink=partial(_crash_once, str(tmp_path / "crashed")),
+        lease_time=1.0,
+        client_options={"base_url": local_server},
+    )
+    with pytest.raises(ChildProcessError, match="exit code 3"):
+        coordinator.run()
+
+    # The survivor waited out the dead worker's lease and ran its shard
+    with ShardQueue(path) as queue:
+        assert queue.counts() == {"pending": 0, "leased": 0, "done": 4, "failed": 0}
@@ -0,0 +1,84 @@
+from datetime import datetime, timezone
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from perigon.exceptions import ApiValueError  # noqa: E402
+from perigon.models.stat_result import StatResult  # noqa: E402
+from perigon.stats import TimeSeries, decode_stats  # noqa: E402
+
+HOUR = 3600
+START = int(datetime(2024, 5, 1, tzinfo=timezone.utc).timestamp())
+
+
+def test_decode_stat_result() -> None:
+    result = StatResult(
+        status=200,
+        results=[
+            {"date": "2024-05-01T01:00:00.000+00:00", "count": 2},
+            {"date": "2024-05-01T00:00:00.000+00:00", "count": 5},
+            {"date": None, "count": 9},
+        ],
+    )
+    series = decode_stats(result)
+
+    assert series.epochs.dtype == np.int64 and series.counts.dtype == np.int64
+    assert series.epochs.tolist() == [START, START + HOUR]
+    assert series.counts.tolist() == [5, 2]
+    assert list(series)[0] == (datetime(2024, 5, 1, tzinfo=timezone.utc), 5)
+
+    millis = decode_stats([{"from": START * 1000, "numResults": 3}, {"from": 0}])
+    assert millis.epochs.tolist() == [0, START] and millis.counts.tolist() == [0, 3]
+    assert len(decode_stats(StatResult(status=200))) == 0
+    with pytest.raises(ApiValueError):
+        decode_stats([{"when": 1}])
+
+
+def test_decode_skips_null_timestamps_with_numeric_epochs() -> None:
+    series = decode_stats(
+        [{"from": START, "count": 1}, {"from": None, "count": 7}, {"from": START}]
+    )
+    assert series.epochs.tolist() == [START, START]
+    assert series.counts.tolist() == [1, 0]
+    assert len(decode_stats([{"date": None, "count": 3}])) == 0
+
+
+def test_sum_resample_fill_rolling() -> None:
+    hours = START + HOUR * np.array([0, 1, 5, 24, 25])
+    series = TimeSeries(hours, [1, 2, 3, 4, 5])
+
+    assert series.sum() == 15
+    assert series.resample("day") == TimeSeries([START, START + 86400], [6, 9])
+    assert series.resample("month").epochs.tolist() == [START]
+
+    filled = series.fill("hour")
+    assert len(filled) == 26 and filled.sum() == 15
+    assert filled.counts[2:5].tolist() == [0, 0, 0]
+
+
+def test_fill_sums_buckets_of_a_coarser_interval() -> None:
+    hours = START + HOUR * np.array([0, 1, 5, 49, 50])
+    series = TimeSeries(hours, [1, 2, 3, 4, 5])
+
+    assert series.fill("day") == TimeSeries(
+        [START, START + 86400, START + 2 * 86400], [6, 0, 9]
+    )
+    july = int(datetime(2024, 7, 3, tzinfo=timezone.utc).timestamp())
+    june = int(datetime(2024, 6, 1, tzinfo=timezone.utc).timestamp())
+    monthly = TimeSeries([START, START + HOUR, july], [1, 2, 3]).fill("month")
+    assert monthly.epochs.tolist() == [START, june, july - 2 * 86400]
+    assert monthly.counts.tolist() == [3, 0, 3]
+
+    assert series.rolling(2).counts.tolist() == [3, 5, 7, 9]
+    assert series.rolling(2, "mean").counts.tolist() == [1.5, 2.5, 3.5, 4.5]
+    assert len(series.rolling(6)) == 0
+
+
+def test_merge_sums_repeated_buckets() -> None:
+    a = TimeSeries([START, START + HOUR], [1, 2])
+    b = TimeSeries([START + HOUR, START + 2 * HOUR], [10, 20])
+    assert TimeSeries.merge([a, b]) == TimeSeries(
+        [START, START + HOUR, START + 2 * HOUR], [1, 12, 20]
+    )
+    assert a.between(START + 1) == TimeSeries([START + HOUR], [2])
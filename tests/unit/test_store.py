@@ -0,0 +1,116 @@
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import List, Optional
+from urllib.parse import parse_qs
+
+import httpx
+from conftest import MockClient
+
+from perigon.api.v1_api import V1Api
+from perigon.models.article import Article
+from perigon.store import ArticleStore
+
+
+def _article(
+    n: int,
+    cluster: str = "c1",
+    refresh: str = "r1",
+    day: int = 1,
+    source: str = "a.com",
+) -> Article:
+    return Article.model_validate(
+        {
+            "articleId": f"a{n}",
+            "clusterId": cluster,
+            "reprintGroupId": f"g{n % 2}",
+            "source": {"domain": source},
+            "pubDate": f"2024-05-{day:02d}T12:00:00+00:00",
+            "addDate": f"2024-05-{day:02d}T12:05:00+00:00",
+            "refreshDate": refresh,
+            "title": f"title {n}",
+        }
+    )
+
+
+def _title(article: Optional[Article]) -> Optional[str]:
+    assert article is not None
+    return article.title
+
+
+def test_lookups_range_scans_and_reopen(tmp_path: Path) -> None:
+    with ArticleStore(str(tmp_path)) as store:
+        added = store.extend(_article(n, day=n + 1) for n in range(5))
+        assert added == 5 and len(store) == 5
+        assert _title(store.get("a3")) == "title 3"
+        assert store.get("missing") is None
+        assert [a.article_id for a in store.by_reprint_group("g0")] == [
+            "a0",
+            "a2",
+            "a4",
+        ]
+        scan = store.between(datetime(2024, 5, 2), datetime(2024, 5, 4))
+        assert [a.article_id for a in scan] == ["a1", "a2"]
+
+    reopened = ArticleStore(str(tmp_path))
+    assert len(reopened) == 5 and "a4" in reopened
+    assert [a.article_id for a in reopened.by_source("a.com")][:2] == ["a0", "a1"]
+    assert reopened.watermark == int(
+        datetime(2024, 5, 5, 12, 5, tzinfo=timezone.utc).timestamp()
+    )
+    reopened.close()
+
+
+def test_updates_supersede_and_compact(tmp_path: Path) -> None:
+    store = ArticleStore(str(tmp_path))
+    store.extend([_article(1), _article(2, day=20)])
+    assert store.add(_article(1)) is False  # same refresh_date
+    assert store.add(_article(1, cluster="c2", refresh="r2")) is True
+
+    updated = store.get("a1")
+    assert updated is not None and updated.cluster_id == "c2"
+    assert [a.article_id for a in store.by_cluster("c1")] == ["a2"]
+    assert len(list(store)) == 2
+
+    dropped = store.compact(since=datetime(2024, 5, 10))
+    assert dropped == 2
+    assert list(store) == [_article(2, day=20)]
+    assert (tmp_path / "articles.dat").stat().st_size == len(
+        _article(2, day=20).model_dump_json(by_alias=True, exclude_none=True)
+    )
+    store.close()
+
+
+def test_torn_write_is_cut_before_appending(tmp_path: Path) -> None:
+    with ArticleStore(str(tmp_path)) as store:
+        store.extend([_article(1)])
+    with open(tmp_path / "articles.dat", "ab") as data:
+        data.write(b'{"articleId":"lost"')
+    with open(tmp_path / "keys.log", "a") as keys:
+        keys.write("[0,99999")  # interrupted write
+
+    with ArticleStore(str(tmp_path)) as store:
+        assert len(store) == 1
+        store.extend([_article(2)])
+    with ArticleStore(str(tmp_path)) as store:
+        assert _title(store.get("a2")) == "title 2"
+        assert [a.article_id for a in store] == ["a1", "a2"]
+
+
+def test_sync_resumes_from_watermark(tmp_path: Path, mock_client: MockClient) -> None:
+    seen: List[Optional[str]] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        query = parse_qs(request.url.query.decode())
+        seen.append(query.get("addDateFrom", [None])[0])
+        page = [_article(n, day=n + 1).to_dict() for n in range(3)]
+        return httpx.Response(
+            200, json={"status": 200, "numResults": 3, "articles": page}
+        )
+
+    api = V1Api(mock_client(handler))
+    store = ArticleStore(str(tmp_path))
+
+    assert store.sync(api.search_articles, q="AI", size=10) == 3
+    assert store.sync(api.search_articles, q="AI", size=10) == 0
+    assert seen == [None, "2024-05-03T11:55:00"]
+    store.close()
@@ -0,0 +1,90 @@
+import asyncio
+from datetime import datetime, timedelta, timezone
+from typing import Callable, Dict, List
+from urllib.parse import parse_qs
+
+import httpx
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from conftest import MockClient  # noqa: E402
+
+from perigon.api.v1_api import V1Api  # noqa: E402
+from perigon.story_counts import StoryCounts, bucket_ordinal, bucket_start  # noqa: E402
+
+UTC = timezone.utc
+DAY = 86400
+
+
+def _stats_handler(
+    calls: List[Dict[str, str]],
+) -> Callable[[httpx.Request], httpx.Response]:
+    """Daily buckets whose count is the day of the month."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        query = {k: v[0] for k, v in parse_qs(request.url.query.decode()).items()}
+        calls.append(query)
+        start = datetime.fromisoformat(query["from"]).replace(tzinfo=UTC)
+        end = datetime.fromisoformat(query["to"]).replace(tzinfo=UTC)
+        results = []
+        day = start
+        while day <= end:  # the API's ``to`` is inclusive
+            results.append({"date": day.isoformat(), "count": day.day})
+            day += timedelta(days=1)
+        return httpx.Response(200, json={"status": 200, "results": results})
+
+    return handler
+
+
+def test_bucket_grid() -> None:
+    monday = datetime(2024, 4, 29, tzinfo=UTC)
+    for split_by in ("HOUR", "DAY", "WEEK", "MONTH"):
+        ordinal = bucket_ordinal(datetime(2024, 5, 1, 13, 30), split_by)
+        assert bucket_start(ordinal, split_by) <= datetime(
+            2024, 5, 1, 13, 30, tzinfo=UTC
+        )
+    assert (
+        bucket_start(bucket_ordinal(monday + timedelta(days=6), "WEEK"), "WEEK")
+        == monday
+    )
+    assert bucket_start(bucket_ordinal(monday, "MONTH"), "MONTH") == datetime(
+        2024, 4, 1, tzinfo=UTC
+    )
+
+
+def test_fetch_splits_merges_and_caches(mock_client: MockClient) -> None:
+    calls: List[Dict[str, str]] = []
+    api = V1Api(mock_client(_stats_handler(calls)))
+    counts = StoryCounts(api, split_by="DAY", chunk_buckets=30)
+    start, end = datetime(2023, 1, 10), datetime(2023, 4, 10)
+
+    series = counts.fetch(start, end, q="AI")
+    times, totals = series.epochs, series.counts
+
+    assert len(calls) == 4 and all(c["splitBy"] == "DAY" for c in calls)
+    assert times[0] == int(datetime(2023, 1, 10, tzinfo=UTC).timestamp())
+    assert times[-1] == int(datetime(2023, 4, 9, tzinfo=UTC).timestamp())
+    assert np.all(np.diff(times) == DAY)  # one bucket per day, none doubled
+    assert totals[0] == 10 and totals[-1] == 9
+
+    again = counts.fetch(start + timedelta(days=5), end, q="AI")
+    assert len(calls) == 4 and counts.hits == 4
+    assert again.epochs[0] == times[5]
+
+    counts.fetch(start, end, q="markets")
+    assert len(calls) == 8
+
+
+def test_current_chunk_is_not_cached(mock_client: MockClient) -> None:
+    calls: List[Dict[str, str]] = []
+    api = V1Api(mock_client(_stats_handler(calls)))
+    counts = StoryCounts(api, split_by="DAY", chunk_buckets=7)
+    now = datetime.now(UTC)
+
+    asyncio.run(counts.fetch_async(now - timedelta(days=20), now))
+    fetched = len(calls)
+    counts.fetch(now - timedelta(days=20), now)
+
+    # only chunks that ended more than a day ago are served from the cache
+    assert len(calls) - fetched in (1, 2)
@@ -0,0 +1,159 @@
+import asyncio
+import json
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, List, Optional
+
+import httpx
+import pytest
+from conftest import MockClient
+
+from perigon.api.v1_api import V1Api
+from perigon.api_client import ApiClient
+from perigon.exceptions import ApiTypeError
+from perigon.instrumentation import CallReport, Observer
+from perigon.models.summary_body import SummaryBody
+from perigon.models.summary_search_result import SummarySearchResult
+from perigon.summary_cache import DiskBackend, SummaryCache, summary_key
+
+
+def _handler(
+    requests: List[httpx.Request], gate: Optional[threading.Event] = None
+) -> Callable[[httpx.Request], httpx.Response]:
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        if gate is not None:
+            gate.wait(5)
+        body = json.loads(request.content)
+        return httpx.Response(
+            200,
+            json={
+                "status": 200,
+                "numResults": 0,
+                "summary": f"summary {len(requests)} of {body.get('prompt')}",
+                "results": [],
+            },
+        )
+
+    return handler
+
+
+class Recorder(Observer):
+    def __init__(self) -> None:
+        self.reports: List[CallReport] = []
+
+    def on_end(self, report: CallReport) -> None:
+        self.reports.append(report)
+
+
+def test_key_is_canonical() -> None:
+    body = SummaryBody(prompt="p", temperature=0)
+    when = datetime(2024, 5, 1)
+    key = summary_key(body, q="AI", var_from=when, source=["a.com", "b.com"])
+    assert key == summary_key(
+        SummaryBody(temperature=0.0, prompt="p"),
+        source=["a.com", "b.com"],
+        var_from=when,
+        q="AI",
+        title=None,
+    )
+    assert key != summary_key(body, q="AI", var_from=when, source=["a.com"])
+    assert key != summary_key(
+        SummaryBody(prompt="p", temperature=0, model="gpt-4o"), q="AI"
+    )
+    with pytest.raises(ApiTypeError):
+        summary_key(body, bogus=1)
+
+
+def test_hits_and_observer_reports() -> None:
+    requests: List[httpx.Request] = []
+    recorder = Recorder()
+    client = ApiClient(
+        api_key="test",
+        transport=httpx.MockTransport(_handler(requests)),
+        observers=[recorder],
+    )
+    api = SummaryCache(V1Api(client))
+    body = SummaryBody(prompt="p", temperature=0)
+
+    first = api.search_summarizer(body, q="AI")
+    second = asyncio.run(api.search_summarizer_async(body, q="AI"))
+
+    assert len(requests) == 1 and second is first
+    assert (api.hits, api.misses) == (1, 1)
+    assert [r.cache_hit for r in recorder.reports] == [False, True]
+    assert [r.status for r in recorder.reports] == [200, None]
+    assert all(r.endpoint == "/v1/summarize" for r in recorder.reports)
+
+    api.search_summarizer(body, q="ML")
+    assert len(requests) == 2
+
+
+def test_sampled_policy(mock_client: MockClient) -> None:
+    requests: List[httpx.Request] = []
+    body = SummaryBody(prompt="p")  # temperature 0.7 by default
+
+    never = SummaryCache(V1Api(mock_client(_handler(requests))), sampled="never")
+    never.search_summarizer(body, q="AI")
+    never.search_summarizer(body, q="AI")
+    assert len(requests) == 2 and never.misses == 0
+
+    reuse = SummaryCache(V1Api(mock_client(_handler(requests))))
+    reuse.search_summarizer(body, q="AI")
+    reuse.search_summarizer(body, q="AI")
+    assert len(requests) == 3 and reuse.hits == 1
+
+    with pytest.raises(ValueError):
+        SummaryCache(reuse.api, sampled="sometimes")
+
+
+def test_coalesces_concurrent_calls(mock_client: MockClient) -> None:
+    requests: List[httpx.Request] = []
+    gate = threading.Event()
+    api = SummaryCache(V1Api(mock_client(_handler(requests, gate))), sampled="coalesce")
+    body = SummaryBody(prompt="p")
+    results: List[SummarySearchResult] = []
+
+    def call() -> None:
+        results.append(api.search_summarizer(body, q="AI"))
+
+    threads = [threading.Thread(target=call) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    while api.coalesced < 3:
+        time.sleep(0.001)
+    gate.set()
+    for thread in threads:
+        thread.join()
+
+    assert len(requests) == 1
+    assert len({id(r) for r in results}) == 1
+
+    # sampled results are not kept once the call is done
+    api.search_summarizer(body, q="AI")
+    assert len(requests) == 2
+
+
+def test_disk_backend_and_ttl(mock_client: MockClient, tmp_path: Path) -> None:
+    requests: List[httpx.Request] = []
+    body = SummaryBody(prompt="p", temperature=0)
+
+    api = SummaryCache(
+        V1Api(mock_client(_handler(requests))), backend=DiskBackend(str(tmp_path))
+    )
+    first = api.search_summarizer(body, q="AI")
+
+    other = SummaryCache(
+        V1Api(mock_client(_handler(requests))), backend=DiskBackend(str(tmp_path))
+    )
+    assert other.search_summarizer(body, q="AI") == first
+    assert len(requests) == 1
+
+    expired = SummaryCache(other.api, backend=other.backend, ttl=0)
+    expired.search_summarizer(body, q="AI")
+    assert len(requests) == 2
+
+    other.clear()
+    assert not list(tmp_path.glob("*/*.json"))
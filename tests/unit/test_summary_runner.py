@@ -0,0 +1,123 @@
+import asyncio
+import json
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Awaitable, Callable, List
+
+import httpx
+from conftest import MockClient
+
+from perigon.api.v1_api import V1Api
+from perigon.models.summary_body import SummaryBody
+from perigon.summary_runner import Slot, SummaryRunner
+
+
+def _handler(
+    requests: List[str], delay: float = 0.0
+) -> Callable[[httpx.Request], Awaitable[httpx.Response]]:
+    async def handler(request: httpx.Request) -> httpx.Response:
+        q = request.url.params["q"]
+        requests.append(q)
+        await asyncio.sleep(delay)
+        if q == "broken":
+            return httpx.Response(500, json={"status": 500})
+        return httpx.Response(
+            200,
+            json={
+                "status": 200,
+                "numResults": 0,
+                "summary": f"about {q}",
+                "results": [],
+            },
+        )
+
+    return handler
+
+
+async def _collect(runner: SummaryRunner) -> List[Slot]:
+    return [slot async for slot in runner.run()]
+
+
+def test_orders_by_priority_then_deadline(mock_client: MockClient) -> None:
+    requests: List[str] = []
+    api = V1Api(mock_client(_handler(requests)))
+    runner = SummaryRunner(api, max_concurrency=1)
+    soon = datetime.now(timezone.utc) + timedelta(hours=1)
+    body = SummaryBody(prompt="p")
+    runner.add("low", body, q="low", priority=0)
+    runner.add("late", body, q="late", priority=1, deadline=soon + timedelta(hours=1))
+    runner.add("soon", body, q="soon", priority=1, deadline=soon)
+    runner.add("past", body, q="past", priority=5, deadline=soon - timedelta(days=1))
+
+    slots = asyncio.run(_collect(runner))
+
+    assert requests == ["soon", "late", "low"]
+    assert [slot.name for slot in slots] == ["past", "soon", "late", "low"]
+    assert isinstance(slots[0].error, asyncio.TimeoutError)
+    assert slots[1].unwrap().summary == "about soon"
+    assert len(runner) == 0
+
+
+def test_waiting_jobs_fail_at_their_deadline(mock_client: MockClient) -> None:
+    requests: List[str] = []
+    api = V1Api(mock_client(_handler(requests, delay=0.5)))
+    runner = SummaryRunner(api, max_concurrency=1)
+    deadline = datetime.now(timezone.utc) + timedelta(seconds=0.1)
+    runner.add("slow", SummaryBody(), q="slow", priority=1)
+    runner.add("queued", SummaryBody(), q="queued", deadline=deadline)
+
+    async def first() -> Slot:
+        async for slot in runner.run():
+            return slot
+        raise AssertionError("no job finished")
+
+    started = time.monotonic()
+    slot = asyncio.run(first())
+
+    # Failed while "slow" still held the only worker, not once it was done
+    assert slot.name == "queued" and isinstance(slot.error, asyncio.TimeoutError)
+    assert time.monotonic() - started < 0.4
+    assert requests == ["slow"]
+
+
+def test_concurrency_cap_and_errors(mock_client: MockClient) -> None:
+    requests: List[str] = []
+    api = V1Api(mock_client(_handler(requests, delay=0.01)))
+    runner = SummaryRunner(api, max_concurrency=3)
+    for n in range(9):
+        runner.add(f"t{n}", SummaryBody(), q="broken" if n == 4 else f"t{n}")
+
+    slots = asyncio.run(_collect(runner))
+
+    assert len(slots) == 9 and len(requests) == 9
+    failed = [slot.name for slot in slots if not slot.ok]
+    assert failed == ["t4"]
+
+
+def test_checkpoint_skips_finished_jobs(
+    mock_client: MockClient, tmp_path: Path
+) -> None:
+    path = str(tmp_path / "summaries.jsonl")
+    requests: List[str] = []
+    api = V1Api(mock_client(_handler(requests)))
+
+    with SummaryRunner(api, checkpoint=path) as runner:
+        for name in ("a", "broken", "c"):
+            runner.add(name, SummaryBody(), q=name)
+        asyncio.run(_collect(runner))
+    with open(path, "a") as file:
+        file.write('{"name": "torn"')  # interrupted write
+
+    with SummaryRunner(api, checkpoint=path) as runner:
+        a = runner.add("a", SummaryBody(), q="a")
+        runner.add("broken", SummaryBody(), q="broken")
+        runner.add("c", SummaryBody(), q="changed")
+        slots = asyncio.run(_collect(runner))
+
+    assert a.done and a.unwrap().summary == "about a"
+    assert sorted(slot.name for slot in slots) == ["broken", "c"]
+    assert sorted(requests[3:]) == ["broken", "changed"]
+    with open(path) as file:
+        names = [json.loads(line)["name"] for line in file]
+    assert sorted(names) == ["a", "c", "c"]  # the torn line is gone
@@ -0,0 +1,107 @@
+from pathlib import Path
+from typing import Any, List, Tuple
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from perigon.models.article import Article  # noqa: E402
+from perigon.models.scored_data_article import ScoredDataArticle  # noqa: E402
+from perigon.models.vector_data import VectorData  # noqa: E402
+from perigon.vector_index import VectorIndex  # noqa: E402
+
+
+def _corpus(n: int = 500, dim: int = 32, seed: int = 1) -> Tuple[List[str], Any]:
+    rng = np.random.default_rng(seed)
+    return [f"a{i}" for i in range(n)], rng.standard_normal((n, dim)).astype("f4")
+
+
+def _brute_force(vectors: Any, query: Any, k: int) -> List[int]:
+    unit = vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+    return list(np.argsort(-(unit @ (query / np.linalg.norm(query))))[:k])
+
+
+def test_search_matches_brute_force_in_batches() -> None:
+    ids, vectors = _corpus()
+    index = VectorIndex()
+    index.add(ids[:250], vectors[:250])
+    index.add(ids[250:], vectors[250:])
+
+    results = index.search(vectors[:3], k=5)
+
+    assert len(results) == 3
+    for query, matches in zip(vectors[:3], results):
+        assert [m[0] for m in matches] == [
+            ids[i] for i in _brute_force(vectors, query, 5)
+        ]
+    assert results[0][0][0] == "a0" and results[0][0][1] == pytest.approx(1.0)
+
+
+def test_more_like_this_and_rerank() -> None:
+    ids, vectors = _corpus(n=50)
+    index = VectorIndex()
+    index.add(ids, vectors)
+
+    similar = index.more_like_this("a7", k=3)
+    assert len(similar) == 3 and "a7" not in [m[0] for m in similar]
+
+    reranked = index.rerank(vectors[7], ["a1", "a7", "missing", "a2"])
+    assert [m[0] for m in reranked][0] == "a7" and len(reranked) == 3
+
+
+def test_add_results_indexes_by_article_id_and_version() -> None:
+    results = [
+        ScoredDataArticle(
+            data=Article(articleId="x"),
+            vectors=[
+                VectorData(data=[0.0, 1.0], version=1),
+                VectorData(data=[1.0, 0.0], version=2),
+            ],
+        ),
+        ScoredDataArticle(data=Article(articleId="no-vectors")),
+    ]
+    index = VectorIndex(version=2)
+
+    assert index.add_results(results) == 1
+    assert "x" in index and "no-vectors" not in index
+    assert index.vector("x").tolist() == [1.0, 0.0]
+
+
+def test_ivf_recall_and_mmap_round_trip(tmp_path: Path) -> None:
+    ids, vectors = _corpus(n=2000)
+    index = VectorIndex()
+    index.add(ids, vectors)
+    index.build_ivf(nlist=20, nprobe=6)
+
+    hits = sum(
+        index.search(query, k=1)[0][0][0] == ids[i]
+        for i, query in enumerate(vectors[:100])
+    )
+    assert hits == 100  # every row is found in its own cell
+
+    index.save(str(tmp_path))
+    loaded = VectorIndex.load(str(tmp_path))
+    assert isinstance(loaded.vectors, np.memmap)
+    assert loaded.search(vectors[5], k=3) == index.search(vectors[5], k=3)
+
+    loaded.add(["new"], vectors[:1])
+    assert len(loaded) == 2001 and loaded.search(vectors[0], k=2)[0][0][0] in {
+        "a0",
+        "new",
+    }
+
+
+def test_flat_save_replaces_an_ivf_save(tmp_path: Path) -> None:
+    ids, vectors = _corpus(n=500)
+    ivf = VectorIndex()
+    ivf.add(ids, vectors)
+    ivf.build_ivf(nlist=10, nprobe=2)
+    ivf.save(str(tmp_path))
+
+    flat = VectorIndex()
+    flat.add(ids[:50], vectors[::10])
+    flat.save(str(tmp_path))
+
+    assert not list(tmp_path.glob("ivf_*"))
+    loaded = VectorIndex.load(str(tmp_path))
+    assert loaded.search(vectors[20], k=5) == flat.search(vectors[20], k=5)
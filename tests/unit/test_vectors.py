@@ -0,0 +1,75 @@
+from array import array
+from typing import Any
+
+import httpx
+import pytest
+from conftest import MockClient
+
+from perigon.api.v1_api import V1Api
+from perigon.api_client import ApiClient
+from perigon.exceptions import ApiValueError
+from perigon.models.article_search_params import ArticleSearchParams
+from perigon.models.scored_data_wiki_data import ScoredDataWikiData
+from perigon.models.vector_data import VectorData
+from perigon.models.wiki_data import WikiData
+from perigon.vectors import stack_vectors
+
+np = pytest.importorskip("numpy")
+
+PAGE = {
+    "status": 200,
+    "results": [
+        {
+            "score": 0.9,
+            "data": {"articleId": "a1", "title": "One"},
+            "vectors": [{"data": [0.5, 1, -2.25], "version": 1}],
+        },
+        {"score": 0.8, "data": {"articleId": "a2", "title": "Two"}},
+    ],
+}
+
+
+def _search(mock_client: MockClient, **options: Any) -> Any:
+    # Any: with ``vectors`` set, VectorData.data holds arrays, not lists
+    client = mock_client(lambda request: httpx.Response(200, json=PAGE))
+    client.vectors = options.get("vectors")
+    return V1Api(client).vector_search_articles(ArticleSearchParams(prompt="AI"))
+
+
+def test_numpy_vectors_skip_validation_but_keep_values(mock_client: MockClient) -> None:
+    plain = _search(mock_client)
+    fast = _search(mock_client, vectors="numpy")
+
+    vector = fast.results[0].vectors[0]
+    assert isinstance(vector.data, np.ndarray) and vector.data.dtype == np.float32
+    assert vector.data.tolist() == plain.results[0].vectors[0].data
+    assert vector.version == 1
+    assert fast.results[1].vectors is None
+    assert fast.results[0].data == plain.results[0].data
+
+
+def test_array_vectors(mock_client: MockClient) -> None:
+    fast = _search(mock_client, vectors="array")
+    assert fast.results[0].vectors[0].data == array("f", [0.5, 1, -2.25])
+
+
+def test_stack_vectors_for_articles_and_wiki_sections(mock_client: MockClient) -> None:
+    ids, matrix = stack_vectors(_search(mock_client, vectors="numpy").results)
+    assert ids == ["a1"] and matrix.shape == (1, 3) and matrix.dtype == np.float32
+
+    wiki = [
+        ScoredDataWikiData(
+            data=WikiData(sectionId="s1"),
+            vectors=[
+                VectorData(data=[1, 2], version=1),
+                VectorData(data=[3, 4], version=2),
+            ],
+        )
+    ]
+    ids, matrix = stack_vectors(wiki, version=2)
+    assert ids == ["s1"] and matrix.tolist() == [[3.0, 4.0]]
+
+
+def test_unknown_vector_format() -> None:
+    with pytest.raises(ApiValueError):
+        ApiClient(vectors="tensor")